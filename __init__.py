@@ -1,4 +1,41 @@
 from .common import *
-from .core import trades, router, accounts, hado
+from .core import trades, router, accounts, hado, instructions, layouts, addresses, ladders, lamports, quotes, orderbook, fees, state, columns
 from .market import admin, deposits, mutations, withdrawals
 from .api import *
+
+
+def __getattr__(name):
+    # HadeswapIDL is loaded on first access, see common.__getattr__
+    if name == 'HadeswapIDL':
+        return common.HadeswapIDL
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Public names of `from hadeswap import *`: the API of common and api; submodules stay attributes (hadeswap.router)
+__all__ = [
+    # Layouts, wallets and enums
+    'Creator', 'MetadataStruct', 'TokenExtensions', 'TokenInfo', 'TokenView', 'Wallet', 'NodeWallet',
+    'BondingCurveType', 'PairType', 'NftValidationWhitelistType', 'OrderType', 'SystemProgram', 'create_fake_wallet',
+    # PDA derivation and caching
+    'PdaCache', 'PDA_STORE_VERSION', 'PdaStore', 'pda_store_version', 'PDA_CACHE', 'enable_pda_store', 'disable_pda_store',
+    'find_program_address_cached', 'pda_cache_stats', 'find_sol_funds_vault_pda', 'find_nfts_owner_pda', 'find_fee_vault_pda',
+    'find_associated_token_address', 'find_rule_set_pda', 'find_token_record_pda', 'get_metaplex_edition_pda',
+    'get_metaplex_metadata', 'get_metaplex_metadata_pda', 'GetMetaplexEditionPda', 'PairAddressBook', 'resolve_pair_address_book',
+    # Connections, accounts and helpers
+    'create_connection', 'get_token_balance', 'create_associated_token_account_instruction', 'Publickey', 'load_json_idl',
+    'create_anchor_provider', 'anchor_raw_BNs_and_pubkeys_to_nums_and_strings', 'parse_raw_account', 'enum_to_anchor_enum',
+    'load_keypair_from_file', 'Metadata',
+    # Bonding curve pricing
+    'calculate_next_spot_price', 'derive_xyk_base_spot_price_from_current_spot_price', 'get_sum_of_orders_series',
+    'MAX_ORDERS_FOR_BUDGET', 'get_max_orders_for_budget', 'get_min_orders_for_target', 'calculate_prices_array',
+    'calculate_prices_total',
+    # Program ids, seeds and constants
+    'Hadeswap_IDL_PATH', 'SYSVAR_RENT_PUBKEY', 'SYS_PROGRAM_ID', 'METADATA_PROGRAM_PUBKEY', 'AUTHORIZATION_RULES_PROGRAM',
+    'METADATA_PREFIX', 'EDITION_PREFIX', 'FEE_PREFIX', 'TOKEN_RECORD', 'SOL_FUNDS_PREFIX', 'NFTS_OWNER_PREFIX',
+    'TOKEN_PROGRAM_ID', 'ASSOCIATED_TOKEN_PROGRAM_ID', 'ASSOCIATED_PROGRAM_ID', 'SYSVAR_INSTRUCTIONS_PUBKEY', 'EMPTY_PUBKEY',
+    'ENCODER', 'BASE_POINTS', 'NEW_DEVNET_PROGRAM',
+    # IDL and anchorpy Programs
+    'HadeswapIDL', 'get_hadeswap_idl', 'ReturnAnchorProgram', 'return_anchor_program', 'invalidate_anchor_program',
+    # api
+    'generate_initialize_pair_instructions', 'generate_deposit_sol_to_pair_instructions',
+]
@@ -0,0 +1,95 @@
+"""
+Compare the generated fixed-offset account decoders with anchorpy's generic coder.
+
+Decodes a synthetic full-program scan of nftSwapPair accounts both ways: anchorpy's
+AccountsCoder (the old get_specific_accounts path), alone and followed by the conversion to the
+decoded dict shape, and hadeswap.core.layouts. Run from the directory containing the hadeswap
+package:
+
+    python -m hadeswap.benchmarks.bench_account_decoders
+"""
+import dataclasses
+import os
+import struct
+import timeit
+
+from anchorpy.coder.accounts import _account_discriminator
+from solana.rpc.async_api import AsyncClient
+from solders.pubkey import Pubkey
+
+from hadeswap.common import NEW_DEVNET_PROGRAM, return_anchor_program
+from hadeswap.core.layouts import get_account_layout, idl_enum_variant_name
+
+ACCOUNTS = 20000
+ROUNDS = 3
+
+
+def synthetic_nft_swap_pairs(count):
+    layout = get_account_layout('nftSwapPair')
+    markets = [os.urandom(32) for _ in range(16)]
+    accounts = []
+    for index in range(count):
+        data = bytearray(layout.size)
+        data[:8] = layout.discriminator
+        for name, field in layout.fields.items():
+            if field.size == 32:
+                data[field.offset:field.offset + 32] = markets[index % 16] if name == 'hadoMarket' else os.urandom(32)
+            elif field.size == 8:
+                struct.pack_into('<Q', data, field.offset, index * 1000)
+        accounts.append((bytes(data), Pubkey(os.urandom(32))))
+    return accounts
+
+
+def anchorpy_to_dict(value):
+    """Convert an anchorpy-decoded value to the decoded dict shape: camelCase keys, base58 pubkeys, enum variant names."""
+    if isinstance(value, Pubkey):
+        return str(value)
+    if hasattr(value, '_sumtype_constructor_names'):
+        return idl_enum_variant_name(type(value).__name__)
+    if dataclasses.is_dataclass(value):
+        return {
+            _camel_case(field.name): anchorpy_to_dict(getattr(value, field.name))
+            for field in dataclasses.fields(value)
+        }
+    if isinstance(value, list):
+        return [anchorpy_to_dict(item) for item in value]
+    return value
+
+
+def _camel_case(name):
+    head, *tail = name.split('_')
+    return head + ''.join(word[:1].upper() + word[1:] for word in tail)
+
+
+def main():
+    accounts = synthetic_nft_swap_pairs(ACCOUNTS)
+    layout = get_account_layout('nftSwapPair')
+    coder = return_anchor_program(NEW_DEVNET_PROGRAM, AsyncClient('https://api.devnet.solana.com')).coder.accounts
+    # anchorpy hashes the IDL name as is ('account:nftSwapPair'), so its input carries its own discriminator
+    anchorpy_discriminator = _account_discriminator('nftSwapPair')
+    anchorpy_accounts = [(anchorpy_discriminator + data[8:], pubkey) for data, pubkey in accounts]
+
+    def anchorpy_decode():
+        return [coder.decode(data) for data, pubkey in anchorpy_accounts]
+
+    def anchorpy_scan():
+        return [{**anchorpy_to_dict(coder.decode(data)), 'publicKey': str(pubkey)} for data, pubkey in anchorpy_accounts]
+
+    def generated_scan():
+        return [layout.decode(data, str(pubkey)) for data, pubkey in accounts]
+
+    if anchorpy_scan()[:100] != generated_scan()[:100]:
+        raise AssertionError('anchorpy and the generated decoder disagree')
+
+    decode_time = min(timeit.repeat(anchorpy_decode, number=1, repeat=ROUNDS))
+    anchorpy_time = min(timeit.repeat(anchorpy_scan, number=1, repeat=ROUNDS))
+    generated_time = min(timeit.repeat(generated_scan, number=1, repeat=ROUNDS))
+
+    print(f'{ACCOUNTS} nftSwapPair accounts')
+    print(f'anchorpy coder only:     {decode_time * 1e3:9.1f} ms')
+    print(f'anchorpy coder + dicts:  {anchorpy_time * 1e3:9.1f} ms')
+    print(f'generated decoder:       {generated_time * 1e3:9.1f} ms ({anchorpy_time / generated_time:.1f}x faster, {decode_time / generated_time:.1f}x the coder alone)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""
+Compare the closed-form Linear pricing with the original step-by-step loops.
+
+Quotes the full depth of synthetic Linear pairs with large mathCounters both ways, and first
+checks on random inputs that both give identical results (value and type). Run from the
+directory containing the hadeswap package:
+
+    python -m hadeswap.benchmarks.bench_curve_pricing
+"""
+import random
+import timeit
+
+from hadeswap.common import BondingCurveType, OrderType, get_sum_of_orders_series
+
+PAIRS = 200
+ORDERS = 50
+ROUNDS = 3
+
+
+def loop_next_spot_price(order_type, spot_price, delta, counter):
+    current_price = spot_price
+    target_counter = counter + (1 if order_type == OrderType.Buy else -1)
+    for _ in range(abs(target_counter)):
+        current_price = current_price + delta if target_counter >= 0 else current_price - delta
+    return current_price
+
+
+def loop_sum_of_orders_series(amount_of_orders, order_type, spot_price, delta, counter):
+    series_sum = 0
+    current_spot_price = spot_price
+    new_counter = counter
+    for _ in range(amount_of_orders):
+        series_sum += current_spot_price
+        current_spot_price = loop_next_spot_price(order_type, current_spot_price, delta, new_counter)
+        new_counter = new_counter + 1 if order_type == OrderType.Buy else new_counter - 1
+    return series_sum
+
+
+def check_identical(samples=5000):
+    rng = random.Random(0)
+    for _ in range(samples):
+        spot_price, delta = rng.randint(0, 10 ** 9), rng.randint(0, 10 ** 6)
+        if rng.random() < 0.5:
+            spot_price, delta = float(spot_price), float(delta)
+        counter, amount = rng.randint(-100, 100), rng.randint(0, 30)
+        order_type = rng.choice([OrderType.Buy, OrderType.Sell])
+        expected = loop_sum_of_orders_series(amount, order_type, spot_price, delta, counter)
+        actual = get_sum_of_orders_series(amount, order_type, spot_price, delta, BondingCurveType.Linear, counter)
+        assert actual == expected and type(actual) is type(expected), (spot_price, delta, counter, amount, order_type)
+
+
+def main():
+    check_identical()
+
+    rng = random.Random(1)
+    pairs = [(rng.randint(10 ** 8, 10 ** 10), rng.randint(10 ** 5, 10 ** 7), rng.randint(500, 5000)) for _ in range(PAIRS)]
+
+    def loop_quotes():
+        return [loop_sum_of_orders_series(ORDERS, OrderType.Buy, spot, delta, counter) for spot, delta, counter in pairs]
+
+    def closed_form_quotes():
+        return [
+            get_sum_of_orders_series(ORDERS, OrderType.Buy, spot, delta, BondingCurveType.Linear, counter)
+            for spot, delta, counter in pairs
+        ]
+
+    assert loop_quotes() == closed_form_quotes()
+    loop_time = min(timeit.repeat(loop_quotes, number=1, repeat=ROUNDS))
+    closed_form_time = min(timeit.repeat(closed_form_quotes, number=1, repeat=ROUNDS))
+
+    print(f'{PAIRS} Linear pairs x {ORDERS} orders, mathCounter 500-5000 (results identical)')
+    print(f'step-by-step loop:  {loop_time * 1e3:9.1f} ms')
+    print(f'closed form:        {closed_form_time * 1e3:9.1f} ms ({loop_time / closed_form_time:.0f}x faster)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Guard the cold-start cost of `import hadeswap` and of the first IDL load.
+
+Each measurement runs in a fresh interpreter. A marshal snapshot is built into a temporary
+directory, and the first load_idl() is timed from that snapshot and from the JSON fallback.
+The script exits non-zero when the best `import hadeswap` time exceeds the budget, or when
+loading the snapshot is not faster than parsing the JSON, so it can be wired into CI as a
+regression check. Run from the directory containing the hadeswap package:
+
+    python -m hadeswap.benchmarks.bench_import_time [budget_ms]
+"""
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from hadeswap import idl
+
+ROUNDS = 7
+# About 1.2x the best cold import measured on a developer laptop (~490 ms)
+DEFAULT_IMPORT_BUDGET_MS = 600.0
+
+IMPORT_SNIPPET = 'import time; t = time.perf_counter(); import hadeswap; print((time.perf_counter() - t) * 1e3)'
+# load_idl() with IDL_SNAPSHOT_PATH pointed at argv[1]; json.loads is disabled when argv[2] is set, so a stale
+# snapshot fails the run instead of silently timing the JSON fallback. The collection the import leaves due is run
+# first, so it does not land in either timing
+LOAD_IDL_SNIPPET = (
+    'import gc, sys, time; from pathlib import Path; from hadeswap import idl; '
+    'idl.IDL_SNAPSHOT_PATH = Path(sys.argv[1]); '
+    'idl.json.loads = None if sys.argv[2] else idl.json.loads; '
+    'gc.collect(); t = time.perf_counter(); idl.load_idl(); print((time.perf_counter() - t) * 1e3)'
+)
+
+
+def best_of(snippet: str, *args: str) -> float:
+    timings = [
+        float(subprocess.run([sys.executable, '-c', snippet, *args], check=True, capture_output=True, text=True).stdout)
+        for _ in range(ROUNDS)
+    ]
+    return min(timings)
+
+
+def main():
+    budget_ms = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_IMPORT_BUDGET_MS
+
+    with tempfile.TemporaryDirectory() as directory:
+        snapshot_path = idl.build_idl_snapshot(Path(directory) / idl.IDL_SNAPSHOT_PATH.name)
+        import_ms = best_of(IMPORT_SNIPPET)
+        snapshot_ms = best_of(LOAD_IDL_SNIPPET, str(snapshot_path), 'snapshot')
+        json_ms = best_of(LOAD_IDL_SNIPPET, str(Path(directory) / 'missing.marshal'), '')
+
+    print(f'import hadeswap:              {import_ms:8.2f} ms (budget {budget_ms:.0f} ms)')
+    print(f'first load_idl(), snapshot:   {snapshot_ms:8.2f} ms')
+    print(f'first load_idl(), JSON:       {json_ms:8.2f} ms')
+
+    if import_ms > budget_ms:
+        sys.exit(f'import hadeswap regressed: {import_ms:.2f} ms > {budget_ms:.0f} ms')
+    if snapshot_ms >= json_ms:
+        sys.exit(f'the IDL snapshot is no faster than the JSON: {snapshot_ms:.2f} ms >= {json_ms:.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Compare the NumPy price ladders with calculate_prices_array called once per pair.
+
+Recomputes a synthetic market of pairs (mixed bonding curves and sides) both ways. Needs the
+optional numpy extra. Run from the directory containing the hadeswap package:
+
+    python -m hadeswap.benchmarks.bench_price_ladders
+"""
+import random
+import timeit
+
+from hadeswap.common import BondingCurveType, OrderType, calculate_prices_array
+from hadeswap.core.ladders import calculate_price_ladders
+
+PAIRS = 5000
+ORDERS = 20
+ROUNDS = 3
+
+
+def main():
+    rng = random.Random(0)
+    curves = [BondingCurveType.Linear, BondingCurveType.Exponential]
+    pairs = [
+        (rng.randint(10 ** 8, 10 ** 10), rng.randint(0, 2000), rng.choice(curves), rng.randint(-50, 50), rng.choice([OrderType.Buy, OrderType.Sell]))
+        for _ in range(PAIRS)
+    ]
+    columns = list(zip(*pairs))
+
+    def scalar_ladders():
+        return [calculate_prices_array(spot, delta, ORDERS, curve, order_type, counter) for spot, delta, curve, counter, order_type in pairs]
+
+    def numpy_ladders():
+        return calculate_price_ladders(*columns, amount=ORDERS)
+
+    def numpy_exact_ladders():
+        return calculate_price_ladders(*columns, amount=ORDERS, exact=True)
+
+    scalar_time = min(timeit.repeat(scalar_ladders, number=1, repeat=ROUNDS))
+    numpy_time = min(timeit.repeat(numpy_ladders, number=1, repeat=ROUNDS))
+    exact_time = min(timeit.repeat(numpy_exact_ladders, number=1, repeat=ROUNDS))
+
+    print(f'{PAIRS} pairs x {ORDERS} orders')
+    print(f'calculate_prices_array per pair:  {scalar_time * 1e3:9.1f} ms')
+    print(f'calculate_price_ladders:          {numpy_time * 1e3:9.1f} ms ({scalar_time / numpy_time:.0f}x faster)')
+    print(f'calculate_price_ladders(exact):   {exact_time * 1e3:9.1f} ms ({scalar_time / exact_time:.0f}x faster)')
+
+
+if __name__ == '__main__':
+    main()
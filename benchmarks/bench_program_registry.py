@@ -0,0 +1,38 @@
+"""
+Benchmark the cached Program registry behind return_anchor_program.
+
+Compares building a fresh Program per call (IDL parse + Provider + Program, the old behaviour)
+against the shared registry. Run from the directory containing the hadeswap package:
+
+    python -m hadeswap.benchmarks.bench_program_registry
+"""
+import timeit
+
+from anchorpy import Idl, Program
+from solana.rpc.async_api import AsyncClient
+
+from hadeswap import common
+from hadeswap.common import NEW_DEVNET_PROGRAM, create_anchor_provider, create_fake_wallet, load_idl_json
+
+ROUNDS = 200
+
+
+def build_uncached_program(connection):
+    provider = create_anchor_provider(connection, create_fake_wallet())
+    return Program(idl=Idl.from_json(load_idl_json()), program_id=NEW_DEVNET_PROGRAM, provider=provider)
+
+
+def main():
+    connection = AsyncClient('https://api.devnet.solana.com')
+    common.invalidate_anchor_program()
+
+    uncached = timeit.timeit(lambda: build_uncached_program(connection), number=ROUNDS) / ROUNDS
+    cached = timeit.timeit(lambda: common.return_anchor_program(NEW_DEVNET_PROGRAM, connection), number=ROUNDS) / ROUNDS
+
+    print(f'uncached Program build: {uncached * 1e6:10.1f} us/call')
+    print(f'registry lookup:        {cached * 1e6:10.1f} us/call')
+    print(f'saved per call:         {(uncached - cached) * 1e6:10.1f} us ({uncached / cached:.0f}x)')
+
+
+if __name__ == '__main__':
+    main()
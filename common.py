@@ -3,7 +3,7 @@ from solders.pubkey import Pubkey  # Equivalent to web3.Pubkey and @solana/web3.
 from solana.transaction import Transaction
 from solana.rpc.types import TxOpts  # Transaction options
 from solders.keypair import Keypair
-from solders.instruction import Instruction
+from solders.instruction import Instruction, AccountMeta
 
 # Define the ReturnAnchorProgram type
 # In Python, this could be represented as a function signature using type hints
@@ -28,8 +28,17 @@ from typing import Optional, List, Dict, Tuple
 import base58  # For base58 encoding/decoding
 
 from pathlib import Path
-
-from ._hadeswap_idl import Hadeswap as HadeswapIDL  # Import the IDL dictionary from the specified module
+from functools import lru_cache
+from collections import OrderedDict
+import threading
+import weakref
+import atexit
+import asyncio
+import base64
+import struct
+import sqlite3
+
+from .idl import load_idl, load_idl_json
 import json
 
 
@@ -193,11 +202,300 @@ def create_fake_wallet() -> NodeWallet:
     leaked_kp = Keypair.from_secret_key(bytes(secret_key))
     return NodeWallet(leaked_kp)
 
+class PdaCache:
+    """
+    Bounded LRU cache of program derived addresses and their bump seeds.
+
+    Deriving a PDA may take up to 255 SHA-256 bump attempts, while the same vault, metadata
+    and token-record addresses are requested over and over by the builders, so every
+    derivation helper in this module goes through the shared PDA_CACHE instance.
+    """
+    def __init__(self, maxsize: int = 65536, store: Optional["PdaStore"] = None):
+        self.maxsize = maxsize
+        self.store = store
+        self.hits = 0
+        self.misses = 0
+        self.store_hits = 0
+        self._entries: "OrderedDict[Tuple[bytes, Tuple[bytes, ...]], Tuple[Pubkey, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def find_program_address(self, seeds: List[bytes], program_id: Pubkey) -> Tuple[Pubkey, int]:
+        """
+        Return (pda, bump) for the seeds, deriving it only on a cache miss.
+
+        :param seeds: PDA seeds (list of bytes or Pubkey)
+        :param program_id: Owning program public key (Pubkey)
+        :return: Program derived address and its bump (tuple)
+        """
+        seeds = tuple(bytes(seed) for seed in seeds)
+        key = (bytes(program_id), seeds)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        # Read through the persistent store (if any) before paying for the bump search
+        store = self.store
+        entry = store.get(key) if store is not None else None
+        from_store = entry is not None
+        if entry is None:
+            entry = Pubkey.find_program_address(list(seeds), program_id)
+            if store is not None:
+                store.put(key, entry)
+
+        with self._lock:
+            self.store_hits += from_store
+            self._insert_locked(key, entry)
+        return entry
+
+    def update(self, entries):
+        """
+        Insert already derived addresses, e.g. the (key, entry) pairs of PdaStore.load(). The last
+        inserted entries count as the most recently used; the oldest are evicted beyond maxsize.
+
+        :param entries: ((program id bytes, tuple of seed bytes), (pda, bump)) pairs (iterable)
+        """
+        with self._lock:
+            for key, entry in entries:
+                self._insert_locked(key, entry)
+
+    def _insert_locked(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        """Return hit/miss counters, the hit rate and the current size of the cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hitRate': self.hits / lookups if lookups else 0.0,
+                'storeHits': self.store_hits,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+            }
+
+    def clear(self):
+        """Drop every cached address and reset the statistics (the persistent store is kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.store_hits = 0
+
+
+# Bump when the on-disk PDA store layout changes so old stores are wiped on open
+PDA_STORE_VERSION = 1
+
+
+class PdaStore:
+    """
+    Optional persistent SQLite store of derived addresses, shared across process restarts.
+
+    Entries are keyed by (program id, seeds), so an address derived for one program id can
+    never be served for another. The store also records a version string; opening it with a
+    different version (a new PDA_STORE_VERSION or a changed program id set, see
+    pda_store_version) drops every entry. New entries are buffered and written in batches.
+    """
+    def __init__(self, path, version: Optional[str] = None, flush_every: int = 1024):
+        self.path = Path(path)
+        self.version = version if version is not None else pda_store_version()
+        self.flush_every = flush_every
+        self._pending: Dict[Tuple[bytes, bytes], Tuple[bytes, int]] = {}
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS pdas ('
+            'program_id BLOB NOT NULL, seeds BLOB NOT NULL, address BLOB NOT NULL, bump INTEGER NOT NULL, '
+            'PRIMARY KEY (program_id, seeds)) WITHOUT ROWID'
+        )
+        row = self._connection.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is None or row[0] != self.version:
+            self._connection.execute('DELETE FROM pdas')
+            self._connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (self.version,))
+        self._connection.commit()
+
+    @staticmethod
+    def _seeds_blob(seeds: Tuple[bytes, ...]) -> bytes:
+        # Length-prefix each seed (seeds are at most 32 bytes) so different splits never collide
+        return b''.join(bytes([len(seed)]) + seed for seed in seeds)
+
+    def get(self, key: Tuple[bytes, Tuple[bytes, ...]]) -> Optional[Tuple[Pubkey, int]]:
+        """
+        Look up a derived address.
+
+        :param key: (program id bytes, tuple of seed bytes), as used by PdaCache (tuple)
+        :return: (pda, bump), or None when the address was never stored (tuple)
+        """
+        db_key = (key[0], self._seeds_blob(key[1]))
+        with self._lock:
+            row = self._pending.get(db_key)
+            if row is None:
+                row = self._connection.execute(
+                    'SELECT address, bump FROM pdas WHERE program_id = ? AND seeds = ?', db_key
+                ).fetchone()
+        if row is None:
+            return None
+        return Pubkey.from_bytes(bytes(row[0])), row[1]
+
+    def put(self, key: Tuple[bytes, Tuple[bytes, ...]], entry: Tuple[Pubkey, int]):
+        """Buffer a derived address for writing; flushes once flush_every entries are pending."""
+        with self._lock:
+            self._pending[(key[0], self._seeds_blob(key[1]))] = (bytes(entry[0]), entry[1])
+            if len(self._pending) >= self.flush_every:
+                self._flush_locked()
+
+    def flush(self):
+        """Write every pending entry to disk."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._pending:
+            return
+        self._connection.executemany(
+            'INSERT OR IGNORE INTO pdas (program_id, seeds, address, bump) VALUES (?, ?, ?, ?)',
+            [db_key + row for db_key, row in self._pending.items()],
+        )
+        self._connection.commit()
+        self._pending.clear()
+
+    def load(self, limit: Optional[int] = None) -> List[Tuple[Tuple[bytes, Tuple[bytes, ...]], Tuple[Pubkey, int]]]:
+        """
+        Read stored entries back as PdaCache (key, entry) pairs, e.g. to pre-warm the memory cache.
+
+        :param limit: Maximum number of entries to read (optional, int)
+        :return: List of (key, (pda, bump)) pairs (list)
+        """
+        self.flush()
+        query = 'SELECT program_id, seeds, address, bump FROM pdas'
+        with self._lock:
+            rows = self._connection.execute(query + ' LIMIT ?', (limit,)).fetchall() if limit else self._connection.execute(query).fetchall()
+        entries = []
+        for program_id, seeds_blob, address, bump in rows:
+            seeds, index = [], 0
+            while index < len(seeds_blob):
+                length = seeds_blob[index]
+                seeds.append(bytes(seeds_blob[index + 1:index + 1 + length]))
+                index += 1 + length
+            entries.append(((bytes(program_id), tuple(seeds)), (Pubkey.from_bytes(bytes(address)), bump)))
+        return entries
+
+    def purge_program(self, program_id: Pubkey) -> int:
+        """
+        Delete every entry derived for a program id, e.g. a retired devnet deployment.
+
+        :param program_id: Program public key (Pubkey)
+        :return: Number of deleted entries (int)
+        """
+        with self._lock:
+            self._flush_locked()
+            deleted = self._connection.execute('DELETE FROM pdas WHERE program_id = ?', (bytes(program_id),)).rowcount
+            self._connection.commit()
+        return deleted
+
+    def close(self):
+        """Flush pending entries and close the database."""
+        with self._lock:
+            self._flush_locked()
+            self._connection.close()
+
+
+def pda_store_version() -> str:
+    """
+    Version string of the persistent PDA store: the store layout version plus the program ids
+    the derivation helpers use, so changing any of them (e.g. NEW_DEVNET_PROGRAM) invalidates
+    every stored entry.
+    """
+    program_ids = (NEW_DEVNET_PROGRAM, METADATA_PROGRAM_PUBKEY, ASSOCIATED_TOKEN_PROGRAM_ID, TOKEN_PROGRAM_ID, AUTHORIZATION_RULES_PROGRAM)
+    return f"{PDA_STORE_VERSION}:" + ','.join(str(program_id) for program_id in program_ids)
+
+
+PDA_CACHE = PdaCache()
+
+
+def enable_pda_store(path, version: Optional[str] = None, preload: bool = False) -> PdaStore:
+    """
+    Back the shared PDA_CACHE with a persistent SQLite store so warm starts skip derivation.
+
+    :param path: SQLite database file (str or Path)
+    :param version: Store version; defaults to pda_store_version() (optional, str)
+    :param preload: Load up to PDA_CACHE.maxsize stored entries into memory right away (bool)
+    :return: The opened store (PdaStore)
+    """
+    disable_pda_store()
+    store = PdaStore(path, version)
+    if preload:
+        PDA_CACHE.update(store.load(PDA_CACHE.maxsize))
+    PDA_CACHE.store = store
+    atexit.register(store.flush)
+    return store
+
+
+def disable_pda_store():
+    """Detach and close the persistent store of the shared PDA_CACHE, if any."""
+    store, PDA_CACHE.store = PDA_CACHE.store, None
+    if store is not None:
+        atexit.unregister(store.flush)
+        store.close()
+
+
+def find_program_address_cached(seeds: List[bytes], program_id: Pubkey) -> Tuple[Pubkey, int]:
+    """Find a program derived address and its bump through the shared PDA_CACHE."""
+    return PDA_CACHE.find_program_address(seeds, program_id)
+
+
+def pda_cache_stats() -> dict:
+    """Return the hit-rate statistics of the shared PDA_CACHE."""
+    return PDA_CACHE.stats()
+
+
+def find_sol_funds_vault_pda(pair: Pubkey, program_id: Pubkey) -> Tuple[Pubkey, int]:
+    """
+    Find the SOL funds vault PDA of a pair.
+
+    :param pair: Pair public key (Pubkey)
+    :param program_id: Hadeswap program public key (Pubkey)
+    :return: Vault address and bump (tuple)
+    """
+    return find_program_address_cached([SOL_FUNDS_PREFIX.encode(ENCODER), bytes(pair)], program_id)
+
+
+def find_nfts_owner_pda(pair: Pubkey, program_id: Pubkey) -> Tuple[Pubkey, int]:
+    """
+    Find the NFTs owner PDA of a pair.
+
+    :param pair: Pair public key (Pubkey)
+    :param program_id: Hadeswap program public key (Pubkey)
+    :return: NFTs owner address and bump (tuple)
+    """
+    return find_program_address_cached([NFTS_OWNER_PREFIX.encode(ENCODER), bytes(pair)], program_id)
+
+
+def find_fee_vault_pda(pair: Pubkey, program_id: Pubkey) -> Tuple[Pubkey, int]:
+    """
+    Find the fee vault PDA of a pair.
+
+    :param pair: Pair public key (Pubkey)
+    :param program_id: Hadeswap program public key (Pubkey)
+    :return: Fee vault address and bump (tuple)
+    """
+    return find_program_address_cached([FEE_PREFIX.encode(ENCODER), bytes(pair)], program_id)
+
 async def find_associated_token_address(wallet_address: Pubkey, token_mint_address: Pubkey) -> Pubkey:
-    return (await Pubkey.find_program_address(
+    return find_program_address_cached(
         [bytes(wallet_address), bytes(TOKEN_PROGRAM_ID), bytes(token_mint_address)],
         ASSOCIATED_TOKEN_PROGRAM_ID
-    ))[0]
+    )[0]
 
 def create_connection(url: str) -> Client:
     """
@@ -265,7 +563,7 @@ def get_metaplex_edition_pda(mint_pubkey: Pubkey) -> Pubkey:
         mint_pubkey.__bytes__(),
         bytes(EDITION_PREFIX, 'utf-8'),
     ]
-    edition_pda = find_program_address_sync(seeds, METADATA_PROGRAM_PUBKEY)
+    edition_pda = find_program_address_cached(seeds, METADATA_PROGRAM_PUBKEY)
     return edition_pda[0]
 
 def anchor_raw_BNs_and_pubkeys_to_nums_and_strings(raw_account: dict) -> dict:
@@ -310,6 +608,12 @@ def calculate_next_spot_price(order_type, spot_price, delta, bonding_curve_type,
         current_price = spot_price
         target_counter = counter + (1 if order_type == OrderType.Buy else -1)
 
+        # O(1) when the result is provably identical to the step-by-step loop below
+        if target_counter == 0:
+            return spot_price
+        if _linear_closed_form_is_exact(spot_price, delta, counter, abs(spot_price) + abs(target_counter) * abs(delta)):
+            return type(spot_price)(int(spot_price) + target_counter * int(delta))
+
         if target_counter >= 0:
             for _ in range(abs(target_counter)):
                 current_price += delta
@@ -365,6 +669,11 @@ def get_sum_of_orders_series(amount_of_orders, order_type, spot_price, delta, bo
     :param counter: Initial counter value (int)
     :return: Sum of the series of orders (float)
     """
+    if bonding_curve_type == BondingCurveType.Linear and amount_of_orders > 0:
+        closed_form_sum = _linear_series_sum(amount_of_orders, order_type, spot_price, delta, counter)
+        if closed_form_sum is not None:
+            return closed_form_sum
+
     series_sum = 0
     current_spot_price = spot_price
 
@@ -383,6 +692,167 @@ def get_sum_of_orders_series(amount_of_orders, order_type, spot_price, delta, bo
 
     return series_sum
 
+# Upper bound on the orders the budget solvers consider when the caller gives none
+MAX_ORDERS_FOR_BUDGET = 10000
+
+
+def get_max_orders_for_budget(budget, order_type, spot_price, delta, bonding_curve_type, counter, max_orders=MAX_ORDERS_FOR_BUDGET):
+    """
+    Inverse of get_sum_of_orders_series: the largest number of orders whose series sum fits a budget,
+    e.g. how many NFTs X SOL buys from a pair.
+
+    The series ends at the first price that is not positive or cannot be computed (XYK pole,
+    exponential overflow); orders past it are never counted.
+
+    :param budget: Budget (float)
+    :param order_type: OrderType (Buy/Sell)
+    :param spot_price: Initial spot price (float)
+    :param delta: Delta value (float)
+    :param bonding_curve_type: BondingCurveType (Linear/Exponential/XYK)
+    :param counter: Initial counter value (int)
+    :param max_orders: Orders available, e.g. nftsCount (int)
+    :return: Largest n <= max_orders with get_sum_of_orders_series(n, ...) <= budget (int)
+    """
+    series_sum = _orders_series_sum_function(order_type, spot_price, delta, bonding_curve_type, counter, max_orders, budget)
+
+    def fits(amount):
+        amount_sum = series_sum(amount)
+        return amount_sum is not None and amount_sum <= budget
+
+    return _bisect_orders(fits, max_orders)
+
+
+def get_min_orders_for_target(target, order_type, spot_price, delta, bonding_curve_type, counter, max_orders=MAX_ORDERS_FOR_BUDGET):
+    """
+    The smallest number of orders whose series sum reaches a target, e.g. how many NFTs must be
+    sold to a pair to raise Y SOL. The series ends as in get_max_orders_for_budget.
+
+    :param target: Amount to reach (float)
+    :param order_type: OrderType (Buy/Sell)
+    :param spot_price: Initial spot price (float)
+    :param delta: Delta value (float)
+    :param bonding_curve_type: BondingCurveType (Linear/Exponential/XYK)
+    :param counter: Initial counter value (int)
+    :param max_orders: Orders available, e.g. buyOrdersQuantity (int)
+    :return: Smallest n <= max_orders with get_sum_of_orders_series(n, ...) >= target, None if unreachable (int)
+    """
+    if target <= 0:
+        return 0
+    series_sum = _orders_series_sum_function(order_type, spot_price, delta, bonding_curve_type, counter, max_orders, target)
+
+    def short(amount):
+        amount_sum = series_sum(amount)
+        return amount_sum is not None and amount_sum < target
+
+    amount = _bisect_orders(short, max_orders) + 1
+    return amount if amount <= max_orders and series_sum(amount) is not None else None
+
+
+def _bisect_orders(predicate, max_orders: int) -> int:
+    """Largest n in [0, max_orders] with predicate(n), for a predicate that holds up to some n and fails after."""
+    low, high = 0, max_orders
+    while low < high:
+        middle = (low + high + 1) // 2
+        if predicate(middle):
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _orders_series_sum_function(order_type, spot_price, delta, bonding_curve_type, counter, max_orders, bound):
+    """
+    amount -> get_sum_of_orders_series(amount, ...) for the budget solvers, None past the end of
+    the series (a non-positive or uncomputable price), in both cases non-decreasing up to it.
+
+    Linear series use the closed-form sum, and the positive prefix is found by bisection over the
+    closed-form k-th price, so every probe is O(1). Compounded Exponential and XYK series have no
+    closed form: their running sums are accumulated once, in the loop's order, and only until they
+    exceed `bound`; larger amounts cannot satisfy the solvers and report None.
+    """
+    if bonding_curve_type == BondingCurveType.Linear and _linear_series_sum(max_orders, order_type, spot_price, delta, counter) is not None:
+        sign = 1 if order_type == OrderType.Buy else -1
+        int_spot_price, int_delta = int(spot_price), int(delta)
+        # k-th price spot + delta * (k * counter +/- k(k+1)/2) is quadratic in k with its extremum next to this k
+        vertex = -sign * counter - 1
+
+        def price(k):
+            return int_spot_price + int_delta * (k * counter + sign * k * (k + 1) // 2)
+
+        def prices_positive(amount):
+            if amount == 0:
+                return True
+            last = amount - 1
+            return all(price(k) > 0 for k in {0, last, min(max(vertex, 0), last), min(max(vertex + 1, 0), last)})
+
+        length = _bisect_orders(prices_positive, max_orders)
+        return lambda amount: _linear_series_sum(amount, order_type, spot_price, delta, counter) if amount <= length else None
+
+    sums = [0]
+    current_spot_price, new_counter, ended = spot_price, counter, False
+
+    def series_sum(amount):
+        nonlocal current_spot_price, new_counter, ended
+        while len(sums) <= amount and not ended and sums[-1] <= bound:
+            if current_spot_price <= 0:
+                ended = True
+                break
+            sums.append(sums[-1] + current_spot_price)
+            try:
+                current_spot_price = calculate_next_spot_price(
+                    order_type=order_type,
+                    spot_price=current_spot_price,
+                    delta=delta,
+                    bonding_curve_type=bonding_curve_type,
+                    counter=new_counter
+                )
+            except (ZeroDivisionError, OverflowError):
+                ended = True
+            new_counter = new_counter + 1 if order_type == OrderType.Buy else new_counter - 1
+        return sums[amount] if amount < len(sums) else None
+
+    return series_sum
+
+
+# Every integer below 2**53 is exactly representable as a float, so float additions of
+# integral values below this bound are exact and independent of evaluation order
+_EXACT_FLOAT_LIMIT = 2 ** 53
+
+
+def _linear_closed_form_is_exact(spot_price, delta, counter, magnitude_bound) -> bool:
+    """
+    Whether the Linear closed forms reproduce the iterative loops exactly: spot price and delta
+    are both ints (exact at any size) or both integral floats whose every intermediate value,
+    bounded by magnitude_bound, stays below 2**53.
+    """
+    if type(counter) is not int:
+        return False
+    if type(spot_price) is int and type(delta) is int:
+        return True
+    return (
+        type(spot_price) is float and type(delta) is float
+        and spot_price.is_integer() and delta.is_integer()
+        and magnitude_bound < _EXACT_FLOAT_LIMIT
+    )
+
+
+def _linear_series_sum(amount_of_orders, order_type, spot_price, delta, counter):
+    """
+    Closed-form Linear get_sum_of_orders_series, or None when it might differ from the loop.
+
+    The loop adds (counter_k +/- 1) * delta to the running price before each next order, so for
+    k = 0..n-1 the k-th price is spot + delta * (k * counter +/- k(k+1)/2) and the series sums to
+    n * spot + delta * (counter * n(n-1)/2 +/- (n-1)n(n+1)/6), with + for buys and - for sells.
+    """
+    n = amount_of_orders
+    max_price = abs(spot_price) + abs(delta) * (n * abs(counter) + n * (n + 1) // 2)
+    if not _linear_closed_form_is_exact(spot_price, delta, counter, n * max_price):
+        return None
+    sign = 1 if order_type == OrderType.Buy else -1
+    series_sum = n * int(spot_price) + int(delta) * (counter * n * (n - 1) // 2 + sign * (n - 1) * n * (n + 1) // 6)
+    return type(spot_price)(series_sum)
+
+
 def calculate_prices_array(starting_spot_price, delta, amount, bonding_curve_type, order_type, counter):
     """
     Calculate an array of prices and the total sum based on the given parameters.
@@ -414,6 +884,39 @@ def calculate_prices_array(starting_spot_price, delta, amount, bonding_curve_typ
 
     return {'array': prices_array, 'total': total}
 
+def calculate_prices_total(starting_spot_price, delta, amount, bonding_curve_type, order_type, counter):
+    """
+    calculate_prices_array(...)['total'], i.e. the cost of `amount` orders against a pair.
+
+    Linear curves are summed in O(1): order k is priced at counter t_k = counter + 1 + k for buys and
+    counter - k for sells, so the total is n * spot + delta * sum(t_k), identical to the loop whenever
+    the Linear closed forms are exact. Exponential and XYK curves, and inexact Linear floats, sum
+    calculate_prices_array, since their closed forms only agree with the loop to rounding.
+
+    :param starting_spot_price: Starting spot price (float)
+    :param delta: Delta value (float)
+    :param amount: Number of orders (int)
+    :param bonding_curve_type: BondingCurveType (Linear/Exponential/XYK)
+    :param order_type: OrderType (Buy/Sell)
+    :param counter: Initial counter value (int)
+    :return: Total price of the orders (float)
+    """
+    n = amount
+    if n <= 0:
+        return 0
+    spot_price = starting_spot_price
+    sign = 1 if order_type == OrderType.Buy else -1
+    first_counter = counter + 1 if order_type == OrderType.Buy else counter
+
+    if bonding_curve_type == BondingCurveType.Linear:
+        last_counter = first_counter + sign * (n - 1)
+        max_price = abs(spot_price) + max(abs(first_counter), abs(last_counter)) * abs(delta)
+        if _linear_closed_form_is_exact(spot_price, delta, counter, n * max_price):
+            total = n * int(spot_price) + int(delta) * (n * first_counter + sign * n * (n - 1) // 2)
+            return type(spot_price)(total)
+
+    return sum(calculate_prices_array(starting_spot_price, delta, amount, bonding_curve_type, order_type, counter)['array'])
+
 async def find_rule_set_pda(payer: Pubkey, name: str) -> Pubkey:
     """
     Asynchronously find the rule set PDA for a given payer public key and name.
@@ -423,7 +926,7 @@ async def find_rule_set_pda(payer: Pubkey, name: str) -> Pubkey:
     :return: Rule set PDA (Pubkey)
     """
     seeds = [bytes('rule_set', 'utf-8'), payer.__bytes__(), bytes(name, 'utf-8')]
-    rule_set_pda, _ = await find_program_address(seeds, AUTHORIZATION_RULES_PROGRAM)
+    rule_set_pda, _ = find_program_address_cached(seeds, AUTHORIZATION_RULES_PROGRAM)
     return rule_set_pda
 
 def find_token_record_pda(mint: Pubkey, token: Pubkey) -> Pubkey:
@@ -441,7 +944,7 @@ def find_token_record_pda(mint: Pubkey, token: Pubkey) -> Pubkey:
         bytes(TOKEN_RECORD, 'utf-8'),
         token.__bytes__()
     ]
-    token_record_pda, _ = find_program_address_sync(seeds, METADATA_PROGRAM_PUBKEY)
+    token_record_pda, _ = find_program_address_cached(seeds, METADATA_PROGRAM_PUBKEY)
     return token_record_pda
 
 def get_metaplex_metadata(mint_pubkey: Pubkey) -> Pubkey:
@@ -456,9 +959,113 @@ def get_metaplex_metadata(mint_pubkey: Pubkey) -> Pubkey:
         METADATA_PROGRAM_PUBKEY.__bytes__(),
         mint_pubkey.__bytes__()
     ]
-    metadata, _ = find_program_address_sync(seeds, METADATA_PROGRAM_PUBKEY)
+    metadata, _ = find_program_address_cached(seeds, METADATA_PROGRAM_PUBKEY)
     return metadata
 
+get_metaplex_metadata_pda = get_metaplex_metadata
+
+
+class PairAddressBook:
+    """
+    Every address derived from one nftSwapPair, computed once and reused by the builders.
+
+    The pair vaults and their bumps are derived on construction; per-mint addresses (vault and
+    user token accounts, token records, metadata and edition) are derived on first request and
+    memoized, so repeated trades against the same pair do no address derivation at all.
+
+    Attributes:
+        pair (Pubkey): Pair public key.
+        program_id (Pubkey): Hadeswap program public key.
+        funds_sol_vault (Pubkey), funds_sol_vault_bump (int): SOL funds vault PDA and bump.
+        fee_sol_vault (Pubkey), fee_sol_vault_bump (int): Fee vault PDA and bump.
+        nfts_owner (Pubkey), nfts_owner_bump (int): NFTs owner PDA and bump.
+    """
+    __slots__ = (
+        'pair', 'program_id',
+        'funds_sol_vault', 'funds_sol_vault_bump',
+        'fee_sol_vault', 'fee_sol_vault_bump',
+        'nfts_owner', 'nfts_owner_bump',
+        '_derived',
+    )
+
+    def __init__(self, pair: Pubkey, program_id: Pubkey):
+        self.pair = pair
+        self.program_id = program_id
+        self.funds_sol_vault, self.funds_sol_vault_bump = find_sol_funds_vault_pda(pair, program_id)
+        self.fee_sol_vault, self.fee_sol_vault_bump = find_fee_vault_pda(pair, program_id)
+        self.nfts_owner, self.nfts_owner_bump = find_nfts_owner_pda(pair, program_id)
+        self._derived = {}
+
+    @classmethod
+    def from_pair_account(cls, pair_account: dict, program_id: Pubkey) -> "PairAddressBook":
+        """
+        Build the address book of a decoded nftSwapPair account.
+
+        :param pair_account: Decoded pair account with a 'publicKey' entry (dict)
+        :param program_id: Hadeswap program public key (Pubkey)
+        :return: The pair's address book (PairAddressBook)
+        """
+        return cls(Publickey(str(pair_account['publicKey'])), program_id)
+
+    def token_account(self, owner: Pubkey, mint: Pubkey) -> Pubkey:
+        """Return the associated token account of an owner for a mint."""
+        key = ('tokenAccount', bytes(owner), bytes(mint))
+        address = self._derived.get(key)
+        if address is None:
+            address = self._derived[key] = find_program_address_cached(
+                [bytes(owner), bytes(TOKEN_PROGRAM_ID), bytes(mint)], ASSOCIATED_TOKEN_PROGRAM_ID
+            )[0]
+        return address
+
+    def vault_token_account(self, mint: Pubkey) -> Pubkey:
+        """Return the pair's vault token account (owned by nftsOwner) for a mint."""
+        return self.token_account(self.nfts_owner, mint)
+
+    def token_record(self, mint: Pubkey, token_account: Pubkey) -> Pubkey:
+        """Return the token record PDA of a token account."""
+        key = ('tokenRecord', bytes(mint), bytes(token_account))
+        address = self._derived.get(key)
+        if address is None:
+            address = self._derived[key] = find_token_record_pda(mint, token_account)
+        return address
+
+    def vault_token_record(self, mint: Pubkey) -> Pubkey:
+        """Return the token record PDA of the pair's vault token account for a mint."""
+        return self.token_record(mint, self.vault_token_account(mint))
+
+    def metadata(self, mint: Pubkey) -> Pubkey:
+        """Return the Metaplex metadata PDA of a mint."""
+        key = ('metadata', bytes(mint))
+        address = self._derived.get(key)
+        if address is None:
+            address = self._derived[key] = get_metaplex_metadata(mint)
+        return address
+
+    def edition(self, mint: Pubkey) -> Pubkey:
+        """Return the Metaplex edition PDA of a mint."""
+        key = ('edition', bytes(mint))
+        address = self._derived.get(key)
+        if address is None:
+            address = self._derived[key] = get_metaplex_edition_pda(mint)
+        return address
+
+    def __repr__(self):
+        return f'PairAddressBook({self.pair})'
+
+
+def resolve_pair_address_book(pair: Pubkey, program_id: Pubkey, address_book: Optional[PairAddressBook] = None) -> PairAddressBook:
+    """
+    Return the given address book, or build one for the pair when none was passed.
+
+    :param pair: Pair public key (Pubkey)
+    :param program_id: Hadeswap program public key (Pubkey)
+    :param address_book: Prebuilt address book of the pair (optional, PairAddressBook)
+    :return: The pair's address book (PairAddressBook)
+    """
+    if address_book is not None:
+        return address_book
+    return PairAddressBook(pair, program_id)
+
 # Load Keypair from file
 def load_keypair_from_file(file_path):
     with Path(file_path).open(mode="r") as f:
@@ -483,6 +1090,7 @@ class Metadata:
             }
             for creator in creators
         ]
+        self.rule_set = None
 
     @staticmethod
     def parse(account_data):
@@ -512,8 +1120,102 @@ class Metadata:
 
         return metadata_account
 
+    @staticmethod
+    def from_bytes(raw_data: bytes) -> "Metadata":
+        """
+        Parse raw Token Metadata account data (Borsh layout), including the pNFT rule set.
+
+        :param raw_data: Account data as returned by get_account_info/get_multiple_accounts (bytes)
+        :return: Parsed metadata; `rule_set` is the programmable config rule set or None (Metadata)
+        """
+        reader = _BorshReader(raw_data)
+        metadata = Metadata.__new__(Metadata)
+        metadata.key = reader.u8()
+        metadata.update_authority = reader.pubkey()
+        metadata.mint = reader.pubkey()
+        metadata.name = reader.string()
+        metadata.symbol = reader.string()
+        metadata.uri = reader.string()
+        metadata.seller_fee_basis_points = reader.u16()
+        metadata.creators = []
+        if reader.u8():
+            for _ in range(reader.u32()):
+                metadata.creators.append({'address': reader.pubkey(), 'verified': bool(reader.u8()), 'share': reader.u8()})
+        metadata.rule_set = None
+        try:
+            reader.skip(2)  # primary_sale_happened, is_mutable
+            reader.skip_option(1)  # edition_nonce
+            reader.skip_option(1)  # token_standard
+            reader.skip_option(33)  # collection
+            reader.skip_option(17)  # uses
+            reader.skip_option(9)  # collection_details
+            if reader.u8():  # programmable_config: Some(V1 { rule_set })
+                reader.skip(1)
+                metadata.rule_set = reader.pubkey() if reader.u8() else None
+        except (IndexError, struct.error):
+            pass  # older accounts end before the programmable config
+        return metadata
+
+    @staticmethod
+    async def from_account_addresses(connection, account_addresses: List[Pubkey], chunk_size: int = 100) -> List[Optional["Metadata"]]:
+        """
+        Fetch and parse many metadata accounts with getMultipleAccounts (up to 100 per request, requests in parallel).
+
+        :param connection: Solana RPC connection (Client)
+        :param account_addresses: Metadata account addresses (list of Pubkey)
+        :param chunk_size: Accounts per getMultipleAccounts request (int)
+        :return: Parsed metadata per address, None for missing accounts (list)
+        """
+        chunks = [account_addresses[start:start + chunk_size] for start in range(0, len(account_addresses), chunk_size)]
+        responses = await asyncio.gather(*(connection.get_multiple_accounts(chunk, encoding='base64') for chunk in chunks))
+        return [
+            Metadata.from_bytes(bytes(account.data)) if account is not None else None
+            for response in responses for account in response.value
+        ]
+
+
+class _BorshReader:
+    """Sequential little-endian reader over raw Borsh-encoded bytes."""
+    def __init__(self, data: bytes):
+        self.data = data
+        self.offset = 0
+
+    def _unpack(self, struct_format: str, size: int):
+        value, = struct.unpack_from(struct_format, self.data, self.offset)
+        self.offset += size
+        return value
+
+    def u8(self) -> int:
+        return self._unpack('<B', 1)
+
+    def u16(self) -> int:
+        return self._unpack('<H', 2)
+
+    def u32(self) -> int:
+        return self._unpack('<I', 4)
 
-Hadeswap_IDL_PATH = "_hadeswap_idl.py"
+    def pubkey(self) -> Pubkey:
+        if self.offset + 32 > len(self.data):
+            raise IndexError('account data ends inside a public key')
+        value = Pubkey.from_bytes(bytes(self.data[self.offset:self.offset + 32]))
+        self.offset += 32
+        return value
+
+    def string(self) -> str:
+        length = self.u32()
+        value = bytes(self.data[self.offset:self.offset + length]).decode(ENCODER, errors='replace').rstrip('\x00')
+        self.offset += length
+        return value
+
+    def skip(self, size: int):
+        self.offset += size
+
+    def skip_option(self, size: int):
+        if self.u8():
+            self.offset += size
+
+
+Hadeswap_IDL_PATH = "__hadeswap_idl.json"
 
 GetMetaplexEditionPda = Callable[[Pubkey], Pubkey]
 
@@ -546,6 +1248,16 @@ SOL_FUNDS_PREFIX = 'sol_funds_vault'
 # NFTS_OWNER_PREFIX: Prefix for NFTs owner
 NFTS_OWNER_PREFIX = 'nfts_owner'
 
+# TOKEN_PROGRAM_ID: Pubkey instance for the SPL token program
+TOKEN_PROGRAM_ID = Publickey('TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA')
+
+# ASSOCIATED_TOKEN_PROGRAM_ID: Pubkey instance for the associated token account program
+ASSOCIATED_TOKEN_PROGRAM_ID = Publickey('ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL')
+ASSOCIATED_PROGRAM_ID = ASSOCIATED_TOKEN_PROGRAM_ID
+
+# SYSVAR_INSTRUCTIONS_PUBKEY: Pubkey instance for the instructions sysvar
+SYSVAR_INSTRUCTIONS_PUBKEY = Publickey('Sysvar1nstructions1111111111111111111111111')
+
 # EMPTY_PUBKEY: Pubkey instance representing an empty public key
 EMPTY_PUBKEY = Publickey('11111111111111111111111111111111')
 
@@ -561,3717 +1273,77 @@ ReturnAnchorProgram = Callable[[Pubkey, Client], Program]
 NEW_DEVNET_PROGRAM = Publickey('hadeK9DLv9eA7ya5KCTqSvSvRZeJC3JgD5a9Y3CNbvu')
 
 
-__HADESWAP_IDL = '''{
-   "version":"0.1.0",
-   "name":"hadeswap",
-   "instructions":[
-      {
-         "name":"initializePair",
-         "accounts":[
-            {
-               "name":"pair",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"hadoMarket",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"pairAuthorityAdapterProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"partialAdapterProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"partialAssetReceiver",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"feeSolVault",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"feeTokenAccount",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"fundsSolVault",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"fundsTokenAccount",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"assetReceiver",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"assetReceiverTokenAccount",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"nftsOwner",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            {
-               "name":"bumps",
-               "type":{
-                  "defined":"PairBumps"
-               }
-            },
-            {
-               "name":"params",
-               "type":{
-                  "defined":"PairParams"
-               }
-            },
-            {
-               "name":"bondingCurveType",
-               "type":{
-                  "defined":"BondingCurveType"
-               }
-            },
-            {
-               "name":"pairType",
-               "type":{
-                  "defined":"PairType"
-               }
-            }
-         ],
-         "returns":null
-      },
-      {
-         "name":"createClassicAuthorityAdapter",
-         "accounts":[
-            {
-               "name":"authorityAdapter",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"pair",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            
-         ],
-         "returns":null
-      },
-      {
-         "name":"depositSolToPair",
-         "accounts":[
-            {
-               "name":"pair",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"authorityAdapter",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"fundsSolVault",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            {
-               "name":"amountOfOrders",
-               "type":"u64"
-            }
-         ],
-         "returns":null
-      },
-      {
-         "name":"validateNft",
-         "accounts":[
-            {
-               "name":"nftValidationAdapter",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"validationWhitelist",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            
-         ],
-         "returns":null
-      },
-      {
-         "name":"depositNftToPair",
-         "accounts":[
-            {
-               "name":"nftPairBox",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"pair",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"authorityAdapter",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"nftValidationAdapter",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"nftsOwner",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"nftMint",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"nftUserTokenAccount",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"vaultTokenAccount",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"tokenProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"associatedTokenProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"metadataProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"metadataInfo",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"editionInfo",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"ownerTokenRecord",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"destTokenRecord",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"instructions",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"authorizationRulesProgram",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            {
-               "name":"proof",
-               "type":{
-                  "vec":{
-                     "array":[
-                        "u8",
-                        32
-                     ]
-                  }
-               }
-            },
-            {
-               "name":"authorizationData",
-               "type":{
-                  "option":{
-                     "defined":"AuthorizationDataLocal"
-                  }
-               }
-            }
-         ],
-         "returns":null
-      },
-      {
-         "name":"initializeHadoMarket",
-         "accounts":[
-            {
-               "name":"hadoMarket",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"validationAdapterProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"pairTokenMint",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            
-         ],
-         "returns":null
-      },
-      {
-         "name":"finishHadoMarket",
-         "accounts":[
-            {
-               "name":"hadoMarket",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            
-         ],
-         "returns":null
-      },
-      {
-         "name":"addClassicWhitelistToMarket",
-         "accounts":[
-            {
-               "name":"validationWhitelist",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"hadoMarket",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"whitelistedAddress",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            {
-               "name":"whitelistType",
-               "type":{
-                  "defined":"NftValidationWhitelistType"
-               }
-            }
-         ],
-         "returns":null
-      },
-      {
-         "name":"depositLiquidityToPair",
-         "accounts":[
-            {
-               "name":"nftPairBox",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"pair",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"authorityAdapter",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"nftValidationAdapter",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"fundsSolVault",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"nftsOwner",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"nftMint",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"nftUserTokenAccount",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"vaultTokenAccount",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"tokenProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"associatedTokenProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"metadataProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"metadataInfo",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"editionInfo",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"ownerTokenRecord",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"destTokenRecord",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"instructions",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"authorizationRulesProgram",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            {
-               "name":"proof",
-               "type":{
-                  "vec":{
-                     "array":[
-                        "u8",
-                        32
-                     ]
-                  }
-               }
-            },
-            {
-               "name":"authorizationData",
-               "type":{
-                  "option":{
-                     "defined":"AuthorizationDataLocal"
-                  }
-               }
-            }
-         ],
-         "returns":null
-      },
-      {
-         "name":"putPairOnMarket",
-         "accounts":[
-            {
-               "name":"pair",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"authorityAdapter",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            
-         ],
-         "returns":null
-      },
-      {
-         "name":"buyNftFromPair",
-         "accounts":[
-            {
-               "name":"nftPairBox",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"pair",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"fundsSolVault",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"nftsOwner",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"feeSolVault",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"nftMint",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"vaultNftTokenAccount",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"nftUserTokenAccount",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"assetReceiver",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"editionInfo",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"metadataInfo",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"ownerTokenRecord",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"destTokenRecord",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"instructions",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"authorizationRulesProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"protocolFeeReceiver",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"tokenProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"associatedTokenProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"metadataProgram",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            {
-               "name":"maxAmountToPay",
-               "type":"u64"
-            },
-            {
-               "name":"skipFailed",
-               "type":"bool"
-            },
-            {
-               "name":"authorizationData",
-               "type":{
-                  "option":{
-                     "defined":"AuthorizationDataLocal"
-                  }
-               }
-            }
-         ],
-         "returns":null
-      },
-      {
-         "name":"sellNftToTokenToNftPair",
-         "accounts":[
-            {
-               "name":"pair",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"nftValidationAdapter",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"nftMint",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"assetReceiverTokenAccount",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"nftUserTokenAccount",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"assetReceiver",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"fundsSolVault",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"protocolFeeReceiver",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"tokenProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"associatedTokenProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"metadataInfo",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"editionInfo",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"ownerTokenRecord",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"destTokenRecord",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"instructions",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"authorizationRulesProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"metadataProgram",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            {
-               "name":"minAmountToGet",
-               "type":"u64"
-            },
-            {
-               "name":"skipFailed",
-               "type":"bool"
-            },
-            {
-               "name":"proof",
-               "type":{
-                  "vec":{
-                     "array":[
-                        "u8",
-                        32
-                     ]
-                  }
-               }
-            },
-            {
-               "name":"authorizationData",
-               "type":{
-                  "option":{
-                     "defined":"AuthorizationDataLocal"
-                  }
-               }
-            }
-         ],
-         "returns":null
-      },
-      {
-         "name":"sellNftToLiquidityPair",
-         "accounts":[
-            {
-               "name":"nftPairBox",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"pair",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"nftValidationAdapter",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"nftMint",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"nftsOwner",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"feeSolVault",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"newVaultTokenAccount",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"nftUserTokenAccount",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"fundsSolVault",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"ownerTokenRecord",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"destTokenRecord",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"instructions",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"authorizationRulesProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"protocolFeeReceiver",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"tokenProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"associatedTokenProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"metadataInfo",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"editionInfo",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"metadataProgram",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            {
-               "name":"minAmountToGet",
-               "type":"u64"
-            },
-            {
-               "name":"skipFailed",
-               "type":"bool"
-            },
-            {
-               "name":"proof",
-               "type":{
-                  "vec":{
-                     "array":[
-                        "u8",
-                        32
-                     ]
-                  }
-               }
-            },
-            {
-               "name":"authorizationData",
-               "type":{
-                  "option":{
-                     "defined":"AuthorizationDataLocal"
-                  }
-               }
-            }
-         ],
-         "returns":null
-      },
-      {
-         "name":"withdrawSolFromPair",
-         "accounts":[
-            {
-               "name":"pair",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"authorityAdapter",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"fundsSolVault",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            {
-               "name":"quantityOfOrders",
-               "type":"u64"
-            }
-         ],
-         "returns":null
-      },
-      {
-         "name":"withdrawNftFromPair",
-         "accounts":[
-            {
-               "name":"nftPairBox",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"authorityAdapter",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"pair",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"nftsOwner",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"nftMint",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"vaultNftTokenAccount",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"nftUserTokenAccount",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"editionInfo",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"metadataInfo",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"ownerTokenRecord",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"destTokenRecord",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"instructions",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"authorizationRulesProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"tokenProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"associatedTokenProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"metadataProgram",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            {
-               "name":"authorizationData",
-               "type":{
-                  "option":{
-                     "defined":"AuthorizationDataLocal"
-                  }
-               }
-            }
-         ],
-         "returns":null
-      },
-      {
-         "name":"withdrawLiquidityFromBalancedPair",
-         "accounts":[
-            {
-               "name":"nftPairBox",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"authorityAdapter",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"pair",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"fundsSolVault",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"feeSolVault",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"nftsOwner",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"nftMint",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"vaultNftTokenAccount",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"editionInfo",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"metadataInfo",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"ownerTokenRecord",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"destTokenRecord",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"instructions",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"authorizationRulesProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"nftUserTokenAccount",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"tokenProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"associatedTokenProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"metadataProgram",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            {
-               "name":"authorizationData",
-               "type":{
-                  "option":{
-                     "defined":"AuthorizationDataLocal"
-                  }
-               }
-            }
-         ],
-         "returns":null
-      },
-      {
-         "name":"modifyPair",
-         "accounts":[
-            {
-               "name":"pair",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"authorityAdapter",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"fundsSolVault",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            {
-               "name":"params",
-               "type":{
-                  "defined":"PairParams"
-               }
-            }
-         ],
-         "returns":null
-      },
-      {
-         "name":"withdrawLiquidityFromBuyOrdersPair",
-         "accounts":[
-            {
-               "name":"authorityAdapter",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"pair",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"fundsSolVault",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"feeSolVault",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            
-         ],
-         "returns":null
-      },
-      {
-         "name":"withdrawLiquidityFromSellOrdersPair",
-         "accounts":[
-            {
-               "name":"nftPairBoxFirst",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"nftMintFirst",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"vaultNftTokenAccountFirst",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"nftUserTokenAccountFirst",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"nftPairBoxSecond",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"editionInfoFirst",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"metadataInfoFirst",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"ownerTokenRecordFirst",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"destTokenRecordFirst",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"editionInfoSecond",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"metadataInfoSecond",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"ownerTokenRecordSecond",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"destTokenRecordSecond",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"instructions",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"authorizationRulesProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"nftMintSecond",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"vaultNftTokenAccountSecond",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"nftUserTokenAccountSecond",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"authorityAdapter",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"pair",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"nftsOwner",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"feeSolVault",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"tokenProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"associatedTokenProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"metadataProgram",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            
-         ],
-         "returns":null
-      },
-      {
-         "name":"withdrawLiquidityOrderVirtualFees",
-         "accounts":[
-            {
-               "name":"liquidityProvisionOrder",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"pair",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"authorityAdapter",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"feeSolVault",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            
-         ],
-         "returns":null
-      },
-      {
-         "name":"closeVirtualNftSwapPair",
-         "accounts":[
-            {
-               "name":"pair",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"authorityAdapter",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"fundsSolVault",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"feeSolVault",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            
-         ],
-         "returns":null
-      },
-      {
-         "name":"withdrawVirtualFees",
-         "accounts":[
-            {
-               "name":"pair",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"authorityAdapter",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"feeSolVault",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            
-         ],
-         "returns":null
-      },
-      {
-         "name":"closeNftPairBox",
-         "accounts":[
-            {
-               "name":"nftPairBox",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"admin",
-               "isMut":true,
-               "isSigner":true
-            }
-         ],
-         "args":[
-            
-         ],
-         "returns":null
-      },
-      {
-         "name":"closeLiquidityProvisionOrder",
-         "accounts":[
-            {
-               "name":"liquidityProvisionOrder",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"admin",
-               "isMut":true,
-               "isSigner":true
-            }
-         ],
-         "args":[
-            
-         ],
-         "returns":null
-      },
-      {
-         "name":"customValidateNft",
-         "accounts":[
-            {
-               "name":"nftValidationAdapter",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"hadoMarket",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"pair",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"whitelistedAddress",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"adapterProgramSigner",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            {
-               "name":"duration",
-               "type":"u64"
-            },
-            {
-               "name":"nftValidationWhitelistType",
-               "type":{
-                  "defined":"NftValidationWhitelistType"
-               }
-            }
-         ],
-         "returns":null
-      },
-      {
-         "name":"modifyHadoMarket",
-         "accounts":[
-            {
-               "name":"hadoMarket",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"validationAdapterProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            
-         ],
-         "returns":null
-      },
-      {
-         "name":"addMerkleTreeWhitelist",
-         "accounts":[
-            {
-               "name":"nftValidationAdapter",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"hadoMarket",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            {
-               "name":"root",
-               "type":{
-                  "array":[
-                     "u8",
-                     32
-                  ]
-               }
-            }
-         ],
-         "returns":null
-      },
-      {
-         "name":"closeNftValidationAdapter",
-         "accounts":[
-            {
-               "name":"nftValidationAdapter",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"admin",
-               "isMut":true,
-               "isSigner":true
-            }
-         ],
-         "args":[
-            
-         ],
-         "returns":null
-      },
-      {
-         "name":"closeClassicWhitelist",
-         "accounts":[
-            {
-               "name":"validationWhitelist",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"admin",
-               "isMut":true,
-               "isSigner":true
-            }
-         ],
-         "args":[
-            
-         ],
-         "returns":null
-      },
-      {
-         "name":"closeNftValidationAdapterV2",
-         "accounts":[
-            {
-               "name":"nftValidationAdapterV2",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"admin",
-               "isMut":true,
-               "isSigner":true
-            }
-         ],
-         "args":[
-            
-         ],
-         "returns":null
-      },
-      {
-         "name":"withdrawOutstandingTokensByAdmin",
-         "accounts":[
-            {
-               "name":"pair",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"nftsOwner",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"nftMint",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"vaultNftTokenAccount",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"nftUserTokenAccount",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"tokenProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"editionInfo",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"metadataInfo",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"ownerTokenRecord",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"destTokenRecord",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"instructions",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"authorizationRulesProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"associatedTokenProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            {
-               "name":"authorizationData",
-               "type":{
-                  "option":{
-                     "defined":"AuthorizationDataLocal"
-                  }
-               }
-            }
-         ],
-         "returns":null
-      },
-      {
-         "name":"depositLiquidityOnlyBuyOrders",
-         "accounts":[
-            {
-               "name":"pair",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"authorityAdapter",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"fundsSolVault",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            {
-               "name":"quantityOfOrders",
-               "type":"u64"
-            }
-         ],
-         "returns":null
-      },
-      {
-         "name":"withdrawLiquidityOnlyBuyOrders",
-         "accounts":[
-            {
-               "name":"authorityAdapter",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"pair",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"fundsSolVault",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"feeSolVault",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            {
-               "name":"quantityOfOrders",
-               "type":"u64"
-            }
-         ],
-         "returns":null
-      },
-      {
-         "name":"depositLiquiditySingleSellToPair",
-         "accounts":[
-            {
-               "name":"nftPairBox",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"pair",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"authorityAdapter",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"nftValidationAdapter",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"fundsSolVault",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"nftsOwner",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"nftMint",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"nftUserTokenAccount",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"vaultTokenAccount",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"tokenProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"associatedTokenProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"metadataProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"ownerTokenRecord",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"destTokenRecord",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"instructions",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"authorizationRulesProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"metadataInfo",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"editionInfo",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            {
-               "name":"proof",
-               "type":{
-                  "vec":{
-                     "array":[
-                        "u8",
-                        32
-                     ]
-                  }
-               }
-            },
-            {
-               "name":"authorizationData",
-               "type":{
-                  "option":{
-                     "defined":"AuthorizationDataLocal"
-                  }
-               }
-            }
-         ],
-         "returns":null
-      },
-      {
-         "name":"withdrawLiquiditySingleSellOrder",
-         "accounts":[
-            {
-               "name":"nftPairBox",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"nftMint",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"vaultNftTokenAccount",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"nftUserTokenAccount",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"authorityAdapter",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"pair",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"user",
-               "isMut":true,
-               "isSigner":true
-            },
-            {
-               "name":"nftsOwner",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"feeSolVault",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"fundsSolVault",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"editionInfo",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"metadataInfo",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"ownerTokenRecord",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"destTokenRecord",
-               "isMut":true,
-               "isSigner":false
-            },
-            {
-               "name":"instructions",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"authorizationRulesProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"tokenProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"associatedTokenProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"systemProgram",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"rent",
-               "isMut":false,
-               "isSigner":false
-            },
-            {
-               "name":"metadataProgram",
-               "isMut":false,
-               "isSigner":false
-            }
-         ],
-         "args":[
-            {
-               "name":"authorizationData",
-               "type":{
-                  "option":{
-                     "defined":"AuthorizationDataLocal"
-                  }
-               }
-            }
-         ],
-         "returns":null
-      }
-   ],
-   "accounts":[
-      {
-         "name":"adapterWhitelist",
-         "type":{
-            "kind":"struct",
-            "fields":[
-               {
-                  "name":"whitelistedAdapterProgram",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"adapterType",
-                  "type":{
-                     "defined":"AdapterType"
-                  }
-               }
-            ]
-         }
-      },
-      {
-         "name":"authorityAdapter",
-         "type":{
-            "kind":"struct",
-            "fields":[
-               {
-                  "name":"pair",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"authorityAdapterProgram",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"authorityOwner",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"authorityType",
-                  "type":{
-                     "defined":"AuthorityAdapterType"
-                  }
-               },
-               {
-                  "name":"expiringAt",
-                  "type":"u64"
-               },
-               {
-                  "name":"authorityState",
-                  "type":{
-                     "defined":"AuthorityState"
-                  }
-               }
-            ]
-         }
-      },
-      {
-         "name":"classicValidationWhitelist",
-         "type":{
-            "kind":"struct",
-            "fields":[
-               {
-                  "name":"hadoMarket",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"pair",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"whitelistType",
-                  "type":{
-                     "defined":"NftValidationWhitelistType"
-                  }
-               },
-               {
-                  "name":"whitelistedAddress",
-                  "type":"publicKey"
-               }
-            ]
-         }
-      },
-      {
-         "name":"hadoMarket",
-         "type":{
-            "kind":"struct",
-            "fields":[
-               {
-                  "name":"marketAuthority",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"marketState",
-                  "type":{
-                     "defined":"MarketState"
-                  }
-               },
-               {
-                  "name":"marketTrustType",
-                  "type":{
-                     "defined":"MarketTrustType"
-                  }
-               },
-               {
-                  "name":"pairValidationType",
-                  "type":{
-                     "defined":"PairValidationType"
-                  }
-               },
-               {
-                  "name":"validationAdapterProgram",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"pairTokenType",
-                  "type":{
-                     "defined":"PairTokenType"
-                  }
-               },
-               {
-                  "name":"pairTokenMint",
-                  "type":"publicKey"
-               }
-            ]
-         }
-      },
-      {
-         "name":"liquidityProvisionOrder",
-         "type":{
-            "kind":"struct",
-            "fields":[
-               {
-                  "name":"nftSwapPair",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"lpOrderState",
-                  "type":{
-                     "defined":"LpOrderState"
-                  }
-               },
-               {
-                  "name":"orderACounter",
-                  "type":"i64"
-               },
-               {
-                  "name":"orderBCounter",
-                  "type":"i64"
-               },
-               {
-                  "name":"accumulatedFee",
-                  "type":"u64"
-               },
-               {
-                  "name":"lpTokenMint",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"liquidityFeeBump",
-                  "type":"u8"
-               },
-               {
-                  "name":"createdAt",
-                  "type":"u64"
-               }
-            ]
-         }
-      },
-      {
-         "name":"nftPairBox",
-         "type":{
-            "kind":"struct",
-            "fields":[
-               {
-                  "name":"pair",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"nftMint",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"nftMetadata",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"nftBoxType",
-                  "type":{
-                     "defined":"NftBoxType"
-                  }
-               },
-               {
-                  "name":"vaultTokenAccount",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"status",
-                  "type":{
-                     "defined":"NftBoxState"
-                  }
-               }
-            ]
-         }
-      },
-      {
-         "name":"nftSwapPair",
-         "type":{
-            "kind":"struct",
-            "fields":[
-               {
-                  "name":"hadoMarket",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"pairType",
-                  "type":{
-                     "defined":"PairType"
-                  }
-               },
-               {
-                  "name":"pairState",
-                  "type":{
-                     "defined":"PairState"
-                  }
-               },
-               {
-                  "name":"pairAuthorityType",
-                  "type":{
-                     "defined":"PairAuthorityType"
-                  }
-               },
-               {
-                  "name":"pairAuthorityAdapterProgram",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"lpTokensMint",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"lpTokensInCirculation",
-                  "type":"u64"
-               },
-               {
-                  "name":"bondingCurve",
-                  "type":{
-                     "defined":"BondingCurve"
-                  }
-               },
-               {
-                  "name":"baseSpotPrice",
-                  "type":"u64"
-               },
-               {
-                  "name":"fee",
-                  "type":"u64"
-               },
-               {
-                  "name":"mathCounter",
-                  "type":"i64"
-               },
-               {
-                  "name":"currentSpotPrice",
-                  "type":"u64"
-               },
-               {
-                  "name":"feeTokenAccount",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"feeVaultSeed",
-                  "type":"u8"
-               },
-               {
-                  "name":"solOrTokenFeeAmount",
-                  "type":"u64"
-               },
-               {
-                  "name":"fundsTokenAccount",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"fundsSolVaultSeed",
-                  "type":"u8"
-               },
-               {
-                  "name":"fundsSolOrTokenBalance",
-                  "type":"u64"
-               },
-               {
-                  "name":"initialFundsSolOrTokenBalance",
-                  "type":"u64"
-               },
-               {
-                  "name":"buyOrdersQuantity",
-                  "type":"u64"
-               },
-               {
-                  "name":"nftsSeed",
-                  "type":"u8"
-               },
-               {
-                  "name":"nftsCount",
-                  "type":"u64"
-               },
-               {
-                  "name":"lastTransactedAt",
-                  "type":"u64"
-               },
-               {
-                  "name":"concentrationIndex",
-                  "type":"u64"
-               },
-               {
-                  "name":"assetReceiver",
-                  "type":"publicKey"
-               }
-            ]
-         }
-      },
-      {
-         "name":"nftValidationAdapterV2",
-         "type":{
-            "kind":"struct",
-            "fields":[
-               {
-                  "name":"hadoMarket",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"scopeType",
-                  "type":{
-                     "defined":"ScopeType"
-                  }
-               },
-               {
-                  "name":"pair",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"nftValidationProgram",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"nftValidationWhitelistType",
-                  "type":{
-                     "defined":"NftValidationWhitelistTypeV2"
-                  }
-               },
-               {
-                  "name":"whitelistedAddress",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"root",
-                  "type":{
-                     "array":[
-                        "u8",
-                        32
-                     ]
-                  }
-               },
-               {
-                  "name":"nftValidationDurationType",
-                  "type":{
-                     "defined":"NftValidationDurationType"
-                  }
-               },
-               {
-                  "name":"validUntil",
-                  "type":"u64"
-               }
-            ]
-         }
-      },
-      {
-         "name":"nftValidationAdapter",
-         "type":{
-            "kind":"struct",
-            "fields":[
-               {
-                  "name":"hadoMarket",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"scopeType",
-                  "type":{
-                     "defined":"ScopeType"
-                  }
-               },
-               {
-                  "name":"pair",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"nftValidationProgram",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"nftValidationWhitelistType",
-                  "type":{
-                     "defined":"NftValidationWhitelistType"
-                  }
-               },
-               {
-                  "name":"whitelistedAddress",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"nftValidationDurationType",
-                  "type":{
-                     "defined":"NftValidationDurationType"
-                  }
-               },
-               {
-                  "name":"validUntil",
-                  "type":"u64"
-               }
-            ]
-         }
-      },
-      {
-         "name":"protocolAdminMultisig",
-         "type":{
-            "kind":"struct",
-            "fields":[
-               {
-                  "name":"protocolSettings",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"admin",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"weight",
-                  "type":"u64"
-               }
-            ]
-         }
-      },
-      {
-         "name":"protocolSettingsV1",
-         "type":{
-            "kind":"struct",
-            "fields":[
-               {
-                  "name":"protocolFee",
-                  "type":"u64"
-               },
-               {
-                  "name":"protocolFeeMultiplier",
-                  "type":"u64"
-               },
-               {
-                  "name":"maxFee",
-                  "type":"u64"
-               },
-               {
-                  "name":"protocolFeeReceiver",
-                  "type":"publicKey"
-               },
-               {
-                  "name":"adminThresholdAmountMultisig",
-                  "type":"u64"
-               }
-            ]
-         }
-      }
-   ],
-   "types":[
-      {
-         "name":"PairParams",
-         "type":{
-            "kind":"struct",
-            "fields":[
-               {
-                  "name":"delta",
-                  "type":"u64"
-               },
-               {
-                  "name":"spotPrice",
-                  "type":"u64"
-               },
-               {
-                  "name":"fee",
-                  "type":"u64"
-               }
-            ]
-         }
-      },
-      {
-         "name":"PairBumps",
-         "type":{
-            "kind":"struct",
-            "fields":[
-               {
-                  "name":"fundsSolVaultSeed",
-                  "type":"u8"
-               },
-               {
-                  "name":"feeVaultSeed",
-                  "type":"u8"
-               },
-               {
-                  "name":"nftsSeed",
-                  "type":"u8"
-               }
-            ]
-         }
-      },
-      {
-         "name":"BondingCurve",
-         "type":{
-            "kind":"struct",
-            "fields":[
-               {
-                  "name":"delta",
-                  "type":"u64"
-               },
-               {
-                  "name":"bondingType",
-                  "type":{
-                     "defined":"BondingCurveType"
-                  }
-               }
-            ]
-         }
-      },
-      {
-         "name":"AuthorizationDataLocal",
-         "type":{
-            "kind":"struct",
-            "fields":[
-               {
-                  "name":"payload",
-                  "type":{
-                     "vec":{
-                        "defined":"TaggedPayload"
-                     }
-                  }
-               }
-            ]
-         }
-      },
-      {
-         "name":"TaggedPayload",
-         "type":{
-            "kind":"struct",
-            "fields":[
-               {
-                  "name":"name",
-                  "type":"string"
-               },
-               {
-                  "name":"payload",
-                  "type":{
-                     "defined":"PayloadTypeLocal"
-                  }
-               }
-            ]
-         }
-      },
-      {
-         "name":"SeedsVecLocal",
-         "type":{
-            "kind":"struct",
-            "fields":[
-               {
-                  "name":"seeds",
-                  "type":{
-                     "vec":"bytes"
-                  }
-               }
-            ]
-         }
-      },
-      {
-         "name":"ProofInfoLocal",
-         "type":{
-            "kind":"struct",
-            "fields":[
-               {
-                  "name":"proof",
-                  "type":{
-                     "vec":{
-                        "array":[
-                           "u8",
-                           32
-                        ]
-                     }
-                  }
-               }
-            ]
-         }
-      },
-      {
-         "name":"AdapterType",
-         "type":{
-            "kind":"enum",
-            "variants":[
-               {
-                  "name":"Validation"
-               },
-               {
-                  "name":"Authority"
-               },
-               {
-                  "name":"Partial"
-               }
-            ]
-         }
-      },
-      {
-         "name":"AuthorityAdapterType",
-         "type":{
-            "kind":"enum",
-            "variants":[
-               {
-                  "name":"OneTime"
-               },
-               {
-                  "name":"Persistent"
-               }
-            ]
-         }
-      },
-      {
-         "name":"AuthorityState",
-         "type":{
-            "kind":"enum",
-            "variants":[
-               {
-                  "name":"Active"
-               },
-               {
-                  "name":"Used"
-               },
-               {
-                  "name":"Expired"
-               },
-               {
-                  "name":"Revoked"
-               }
-            ]
-         }
-      },
-      {
-         "name":"MarketTrustType",
-         "type":{
-            "kind":"enum",
-            "variants":[
-               {
-                  "name":"Unverified"
-               },
-               {
-                  "name":"Verified"
-               }
-            ]
-         }
-      },
-      {
-         "name":"MarketState",
-         "type":{
-            "kind":"enum",
-            "variants":[
-               {
-                  "name":"Initializing"
-               },
-               {
-                  "name":"Available"
-               }
-            ]
-         }
-      },
-      {
-         "name":"PairValidationType",
-         "type":{
-            "kind":"enum",
-            "variants":[
-               {
-                  "name":"ClassicValidation"
-               },
-               {
-                  "name":"CustomValidation"
-               }
-            ]
-         }
-      },
-      {
-         "name":"PairTokenType",
-         "type":{
-            "kind":"enum",
-            "variants":[
-               {
-                  "name":"NativeSol"
-               },
-               {
-                  "name":"Spl"
-               }
-            ]
-         }
-      },
-      {
-         "name":"LpOrderState",
-         "type":{
-            "kind":"enum",
-            "variants":[
-               {
-                  "name":"Virtual"
-               },
-               {
-                  "name":"Tokenized"
-               },
-               {
-                  "name":"WithdrawnVirtual"
-               },
-               {
-                  "name":"WithdrawnTokenized"
-               }
-            ]
-         }
-      },
-      {
-         "name":"NftBoxState",
-         "type":{
-            "kind":"enum",
-            "variants":[
-               {
-                  "name":"Closed"
-               },
-               {
-                  "name":"Active"
-               }
-            ]
-         }
-      },
-      {
-         "name":"NftBoxType",
-         "type":{
-            "kind":"enum",
-            "variants":[
-               {
-                  "name":"Escrow"
-               },
-               {
-                  "name":"Escrowless"
-               }
-            ]
-         }
-      },
-      {
-         "name":"PairType",
-         "type":{
-            "kind":"enum",
-            "variants":[
-               {
-                  "name":"TokenForNft"
-               },
-               {
-                  "name":"NftForToken"
-               },
-               {
-                  "name":"LiquidityProvision"
-               }
-            ]
-         }
-      },
-      {
-         "name":"PairState",
-         "type":{
-            "kind":"enum",
-            "variants":[
-               {
-                  "name":"Initializing"
-               },
-               {
-                  "name":"OnMarketVirtual"
-               },
-               {
-                  "name":"OnMarketTokenized"
-               },
-               {
-                  "name":"Frozen"
-               }
-            ]
-         }
-      },
-      {
-         "name":"PairAuthorityType",
-         "type":{
-            "kind":"enum",
-            "variants":[
-               {
-                  "name":"ClassicAuthority"
-               },
-               {
-                  "name":"CustomAuthority"
-               }
-            ]
-         }
-      },
-      {
-         "name":"PartialSettings",
-         "type":{
-            "kind":"enum",
-            "variants":[
-               {
-                  "name":"None"
-               },
-               {
-                  "name":"CustomPartial"
-               }
-            ]
-         }
-      },
-      {
-         "name":"BondingCurveType",
-         "type":{
-            "kind":"enum",
-            "variants":[
-               {
-                  "name":"Linear"
-               },
-               {
-                  "name":"Exponential"
-               },
-               {
-                  "name":"XYK"
-               }
-            ]
-         }
-      },
-      {
-         "name":"NftValidationWhitelistTypeV2",
-         "type":{
-            "kind":"enum",
-            "variants":[
-               {
-                  "name":"Creator"
-               },
-               {
-                  "name":"Nft"
-               },
-               {
-                  "name":"MerkleTree"
-               }
-            ]
-         }
-      },
-      {
-         "name":"ScopeType",
-         "type":{
-            "kind":"enum",
-            "variants":[
-               {
-                  "name":"Market"
-               },
-               {
-                  "name":"Pair"
-               }
-            ]
-         }
-      },
-      {
-         "name":"NftValidationDurationType",
-         "type":{
-            "kind":"enum",
-            "variants":[
-               {
-                  "name":"Finite"
-               },
-               {
-                  "name":"Infinite"
-               }
-            ]
-         }
-      },
-      {
-         "name":"NftValidationWhitelistType",
-         "type":{
-            "kind":"enum",
-            "variants":[
-               {
-                  "name":"Creator"
-               },
-               {
-                  "name":"Nft"
-               }
-            ]
-         }
-      },
-      {
-         "name":"PayloadTypeLocal",
-         "type":{
-            "kind":"enum",
-            "variants":[
-               {
-                  "name":"Pubkey",
-                  "fields":[
-                     "publicKey"
-                  ]
-               },
-               {
-                  "name":"Seeds",
-                  "fields":[
-                     {
-                        "defined":"SeedsVecLocal"
-                     }
-                  ]
-               },
-               {
-                  "name":"MerkleProof",
-                  "fields":[
-                     {
-                        "defined":"ProofInfoLocal"
-                     }
-                  ]
-               },
-               {
-                  "name":"Number",
-                  "fields":[
-                     "u64"
-                  ]
-               }
-            ]
-         }
-      }
-   ],
-   "errors":[
-      {
-         "code":6000,
-         "name":"MetadataDoesntExist",
-         "msg":"MetadataDoesntExist"
-      },
-      {
-         "code":6001,
-         "name":"DerivedKeyInvalid",
-         "msg":"DerivedKeyInvalid"
-      },
-      {
-         "code":6002,
-         "name":"InvalidCollectionDetails",
-         "msg":"InvalidCollectionDetails"
-      },
-      {
-         "code":6003,
-         "name":"InvalidCollection",
-         "msg":"InvalidCollection"
-      },
-      {
-         "code":6004,
-         "name":"InvalidCollectionMint",
-         "msg":"InvalidCollectionMint"
-      },
-      {
-         "code":6005,
-         "name":"NftNotVerified",
-         "msg":"NftNotVerified"
-      },
-      {
-         "code":6006,
-         "name":"InvalidOwner",
-         "msg":"InvalidOwner"
-      },
-      {
-         "code":6007,
-         "name":"InvalidDelta",
-         "msg":"InvalidDelta"
-      },
-      {
-         "code":6008,
-         "name":"InvalidFee",
-         "msg":"InvalidFee"
-      },
-      {
-         "code":6009,
-         "name":"InvalidPairType",
-         "msg":"InvalidPairType"
-      },
-      {
-         "code":6010,
-         "name":"NotEnoughInTokenAccount",
-         "msg":"NotEnoughInTokenAccount"
-      },
-      {
-         "code":6011,
-         "name":"InvalidMint",
-         "msg":"InvalidMint"
-      },
-      {
-         "code":6012,
-         "name":"InvalidSolVault",
-         "msg":"InvalidSolVault"
-      },
-      {
-         "code":6013,
-         "name":"InvalidFundingAmount",
-         "msg":"InvalidFundingAmount"
-      },
-      {
-         "code":6014,
-         "name":"NotEnoughLamports",
-         "msg":"NotEnoughLamports"
-      },
-      {
-         "code":6015,
-         "name":"InvalidJpegOwner",
-         "msg":"InvalidJpegOwner"
-      },
-      {
-         "code":6016,
-         "name":"InvalidTokenAccount",
-         "msg":"InvalidTokenAccount"
-      },
-      {
-         "code":6017,
-         "name":"InvalidPayer",
-         "msg":"InvalidPayer"
-      },
-      {
-         "code":6018,
-         "name":"ShouldBeActive",
-         "msg":"ShouldBeActive"
-      },
-      {
-         "code":6019,
-         "name":"CantMakeZeroOrders",
-         "msg":"Can't make 0 orders"
-      },
-      {
-         "code":6020,
-         "name":"OnlyClassicAuthority",
-         "msg":"OnlyClassicAuthority"
-      },
-      {
-         "code":6021,
-         "name":"NotValidAuthorityAdapter",
-         "msg":"NotValidAuthorityAdapter"
-      },
-      {
-         "code":6022,
-         "name":"UserDoesntHaveAuthority",
-         "msg":"UserDoesntHaveAuthority"
-      },
-      {
-         "code":6023,
-         "name":"WrongSeed",
-         "msg":"WrongSeed"
-      },
-      {
-         "code":6024,
-         "name":"CanDepositSolOnlyToTokenToNft",
-         "msg":"CanDepositSolOnlyToTokenToNft"
-      },
-      {
-         "code":6025,
-         "name":"MaxAmountOfOrdersSucceeded",
-         "msg":"MaxAmountOfOrdersSucceeded"
-      },
-      {
-         "code":6026,
-         "name":"CanDepositNftOnlyToNftToToken",
-         "msg":"CanDepositNftOnlyToNftToToken"
-      },
-      {
-         "code":6027,
-         "name":"TokenAccountDoesntContainNft",
-         "msg":"TokenAccountDoesntContainNft"
-      },
-      {
-         "code":6028,
-         "name":"MarketAuthorityIncorrect",
-         "msg":"MarketAuthorityIncorrect"
-      },
-      {
-         "code":6029,
-         "name":"CanAddWhitelistOnlyToInitializingMarket",
-         "msg":"CanAddWhitelistOnlyToInitializingMarket"
-      },
-      {
-         "code":6030,
-         "name":"CanPutPairsOnlyToAvailableMarkets",
-         "msg":"CanPutPairsOnlyToAvailableMarkets"
-      },
-      {
-         "code":6031,
-         "name":"PairAndNftValidationMarketDoesntMatch",
-         "msg":"PairAndNftValidationMarketDoesntMatch"
-      },
-      {
-         "code":6032,
-         "name":"OnlyMarketScopeSupported",
-         "msg":"OnlyMarketScopeSupported"
-      },
-      {
-         "code":6033,
-         "name":"NotWhitelistedNftForThisMarket",
-         "msg":"NotWhitelistedNftForThisMarket"
-      },
-      {
-         "code":6034,
-         "name":"CanDepositOnlyToLiquidityProvision",
-         "msg":"CanDepositOnlyToLiquidityProvision"
-      },
-      {
-         "code":6035,
-         "name":"NftBoxDoesntMatchPair",
-         "msg":"NftBoxDoesntMatchPair"
-      },
-      {
-         "code":6036,
-         "name":"NftBoxShouldBeActive",
-         "msg":"NftBoxShouldBeActive"
-      },
-      {
-         "code":6037,
-         "name":"NftBoxDoesntMatchMint",
-         "msg":"NftBoxDoesntMatchMint"
-      },
-      {
-         "code":6038,
-         "name":"CantBuyNftFromTokenForNft",
-         "msg":"CantBuyNftFromTokenForNft"
-      },
-      {
-         "code":6039,
-         "name":"OnlyTokenForNftIsEligibleForThisSell",
-         "msg":"OnlyTokenForNftIsEligibleForThisSell"
-      },
-      {
-         "code":6040,
-         "name":"NoBuyOrdersOnThisPair",
-         "msg":"NoBuyOrdersOnThisPair"
-      },
-      {
-         "code":6041,
-         "name":"OnlyLiquidityProvisionIsEligibleForThisSell",
-         "msg":"OnlyLiquidityProvisionIsEligibleForThisSell"
-      },
-      {
-         "code":6042,
-         "name":"OnlyTokenForNftIsEligibleForThisWithdrawal",
-         "msg":"OnlyTokenForNftIsEligibleForThisWithdrawal"
-      },
-      {
-         "code":6043,
-         "name":"OnlyNftForTokenIsEligibleForThisWithdrawal",
-         "msg":"OnlyNftForTokenIsEligibleForThisWithdrawal"
-      },
-      {
-         "code":6044,
-         "name":"OnlyLiquidityProvisionIsEligibleForThisWithdrawal",
-         "msg":"OnlyLiquidityProvisionIsEligibleForThisWithdrawal"
-      },
-      {
-         "code":6045,
-         "name":"InstructionIsNotSupported",
-         "msg":"InstructionIsNotSupported"
-      },
-      {
-         "code":6046,
-         "name":"CanTradeOnlyWithPairsOnMarket",
-         "msg":"CanTradeOnlyWithPairsOnMarket"
-      },
-      {
-         "code":6047,
-         "name":"NoLiquidityFeesToWithdraw",
-         "msg":"NoLiquidityFeesToWithdraw"
-      },
-      {
-         "code":6048,
-         "name":"MaxAmountToPayExceeded",
-         "msg":"MaxAmountToPayExceeded"
-      },
-      {
-         "code":6049,
-         "name":"GettingLessThanMinAmountToGet",
-         "msg":"GettingLessThanMinAmountToGet"
-      },
-      {
-         "code":6050,
-         "name":"UserDoesntHaveHadomarketAuthority",
-         "msg":"UserDoesntHaveHadomarketAuthority"
-      },
-      {
-         "code":6051,
-         "name":"HadomarketAlreadyFinished",
-         "msg":"HadomarketAlreadyFinished"
-      },
-      {
-         "code":6052,
-         "name":"CanDepositLiqudityOnlyToVirtualOrInitializingPairs",
-         "msg":"CanDepositLiqudityOnlyToVirtualOrInitializingPairs"
-      },
-      {
-         "code":6053,
-         "name":"CanModifyOnlyToVirtualOrInitializingPairs",
-         "msg":"CanModifyOnlyToVirtualOrInitializingPairs"
-      },
-      {
-         "code":6054,
-         "name":"LiquidityProvisionOrderPairDoesntMatch",
-         "msg":"LiquidityProvisionOrderPairDoesntMatch"
-      },
-      {
-         "code":6055,
-         "name":"OnlyVirtualLpOrdersCanBeWithdrawnByThisFunction",
-         "msg":"OnlyVirtualLpOrdersCanBeWithdrawnByThisFunction"
-      },
-      {
-         "code":6056,
-         "name":"OnlyVirtualOrTokenizedLpOrdersCanBeReplacedByThisFunction",
-         "msg":"OnlyVirtualOrTokenizedLpOrdersCanBeReplacedByThisFunction"
-      },
-      {
-         "code":6057,
-         "name":"LiquidityProvisionOrderNotEdge",
-         "msg":"LiquidityProvisionOrderNotEdge"
-      },
-      {
-         "code":6058,
-         "name":"NftPairBoxNotParsingFromRemaining",
-         "msg":"NftPairBoxNotParsingFromRemaining"
-      },
-      {
-         "code":6059,
-         "name":"VaultNftTokenAccountNotParsingFromRemaining",
-         "msg":"VaultNftTokenAccountNotParsingFromRemaining"
-      },
-      {
-         "code":6060,
-         "name":"UserTokenAccountNotParsingFromRemaining",
-         "msg":"UserTokenAccountNotParsingFromRemaining"
-      },
-      {
-         "code":6061,
-         "name":"WithdrawingOnlyAtLeastOneBuyAndOneSellPairs",
-         "msg":"WithdrawingOnlyAtLeastOneBuyAndOneSellPairs"
-      },
-      {
-         "code":6062,
-         "name":"VaultDoesntMatchBox",
-         "msg":"VaultDoesntMatchBox"
-      },
-      {
-         "code":6063,
-         "name":"WithdrawingOnlyBuyOrdersPairs",
-         "msg":"WithdrawingOnlyBuyOrdersPairs"
-      },
-      {
-         "code":6064,
-         "name":"WithdrawingOnlySellOrdersPairs",
-         "msg":"WithdrawingOnlySellOrdersPairs"
-      },
-      {
-         "code":6065,
-         "name":"LiquidityProvisionOrderIsWithdrawn",
-         "msg":"LiquidityProvisionOrderIsWithdrawn"
-      },
-      {
-         "code":6066,
-         "name":"LiquidityProvisionOrderIsNotCorrectOrderForPair",
-         "msg":"LiquidityProvisionOrderIsNotCorrectOrderForPair"
-      },
-      {
-         "code":6067,
-         "name":"OnlyMarketVirtualPairsCanBeTokenized",
-         "msg":"OnlyMarketVirtualPairsCanBeTokenized"
-      },
-      {
-         "code":6068,
-         "name":"OnlyLiquidityProvisionPairsCanBeTokenized",
-         "msg":"OnlyLiquidityProvisionPairsCanBeTokenized"
-      },
-      {
-         "code":6069,
-         "name":"OnlyInitializingPairsCanBePutOnMarket",
-         "msg":"OnlyInitializingPairsCanBePutOnMarket"
-      },
-      {
-         "code":6070,
-         "name":"CanMakeLpOrderTokenizedOnlyFromTokenizedPair",
-         "msg":"CanMakeLpOrderTokenizedOnlyFromTokenizedPair"
-      },
-      {
-         "code":6071,
-         "name":"OnlyVirtualLpOrderCanBeTokenized",
-         "msg":"OnlyVirtualLpOrderCanBeTokenized"
-      },
-      {
-         "code":6072,
-         "name":"OnlyTokenizedLpOrdersCanWithdrawFees",
-         "msg":"OnlyTokenizedLpOrdersCanWithdrawFees"
-      },
-      {
-         "code":6073,
-         "name":"UserLpTokenAccountDoesntContainNft",
-         "msg":"UserLpTokenAccountDoesntContainNft"
-      },
-      {
-         "code":6074,
-         "name":"OnlyTokenizedLpOrdersCanBeWithdrawnByThisFunction",
-         "msg":"OnlyTokenizedLpOrdersCanBeWithdrawnByThisFunction"
-      },
-      {
-         "code":6075,
-         "name":"LpTokenMintDoesntMatchOrder",
-         "msg":"LpTokenMintDoesntMatchOrder"
-      },
-      {
-         "code":6076,
-         "name":"CanCloseVirtualPoolOnlyIfNoLiquidityLeft",
-         "msg":"CanCloseVirtualPoolOnlyIfNoLiquidityLeft"
-      },
-      {
-         "code":6077,
-         "name":"NftIsNotMasterEdition",
-         "msg":"NftIsNotMasterEdition"
-      },
-      {
-         "code":6078,
-         "name":"NftPairBoxNotClosed",
-         "msg":"NftPairBoxNotClosed"
-      },
-      {
-         "code":6079,
-         "name":"WrongAdmin",
-         "msg":"WrongAdmin"
-      },
-      {
-         "code":6080,
-         "name":"PairScopeValidationNotSupportedForNow",
-         "msg":"PairScopeValidationNotSupportedForNow"
-      },
-      {
-         "code":6081,
-         "name":"CustomValidationAdapterProgramDoesntMatchUser",
-         "msg":"CustomValidationAdapterProgramDoesntMatchUser"
-      },
-      {
-         "code":6082,
-         "name":"ClassicAuthorityWorksIfValidationProgramIsHadeswap",
-         "msg":"ClassicAuthorityWorksIfValidationProgramIsHadeswap"
-      },
-      {
-         "code":6083,
-         "name":"NftValidationAdapterV2CanWhitelistOnlyMerkleTree",
-         "msg":"NftValidationAdapterV2CanWhitelistOnlyMerkleTree"
-      },
-      {
-         "code":6084,
-         "name":"BadRuleSet",
-         "msg":"BadRuleSet"
-      },
-      {
-         "code":6085,
-         "name":"WrongCreatorInRemainingAccounts",
-         "msg":"WrongCreatorInRemainingAccounts"
-      }
-   ]
-}'''
+# Connection -> {program_id: shared Program}; entries go away with their connections, see return_anchor_program
+_ANCHOR_PROGRAMS = weakref.WeakKeyDictionary()
+_ANCHOR_PROGRAMS_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def get_hadeswap_idl() -> Idl:
+    """Parse the Hadeswap IDL once per process and return the shared Idl instance."""
+    return Idl.from_json(load_idl_json())
 
 
 def return_anchor_program(program_id: Pubkey, connection: Client) -> Program:
-    """Create and return an AnchorPy Program instance for the Hadeswap program."""
-    fake_wallet = create_fake_wallet()
-    provider = create_anchor_provider(connection, fake_wallet)
-    return Program(idl=Idl.from_json(__HADESWAP_IDL), program_id=program_id, provider=provider)
+    """
+    Return the AnchorPy Program instance for the Hadeswap program.
+
+    Programs are cached process-wide per (program_id, connection) pair, so the IDL is parsed
+    and the Provider/Program are built only on the first call. The registry holds connections
+    weakly: the Programs of a connection are dropped once nothing else references it, and a
+    Program's provider reaches its connection through a weak proxy, so callers keep the
+    connection alive for as long as they use the Program. invalidate_anchor_program drops
+    entries explicitly.
+
+    :param program_id: Hadeswap program public key (Pubkey)
+    :param connection: Solana RPC connection (Client)
+    :return: Shared Program instance (Program)
+    """
+    programs = _ANCHOR_PROGRAMS.get(connection)
+    program = programs.get(program_id) if programs is not None else None
+    if program is not None:
+        return program
+
+    with _ANCHOR_PROGRAMS_LOCK:
+        programs = _ANCHOR_PROGRAMS.get(connection)
+        if programs is None:
+            programs = _ANCHOR_PROGRAMS[connection] = {}
+        program = programs.get(program_id)
+        if program is None:
+            fake_wallet = create_fake_wallet()
+            # A strong reference from the registry's own value would keep the key alive forever
+            provider = create_anchor_provider(weakref.proxy(connection), fake_wallet)
+            program = programs[program_id] = Program(idl=get_hadeswap_idl(), program_id=program_id, provider=provider)
+    return program
+
+
+def invalidate_anchor_program(program_id: Optional[Pubkey] = None, connection: Optional[Client] = None) -> int:
+    """
+    Drop cached Program instances created by return_anchor_program.
+
+    With no arguments the whole registry is cleared; otherwise only the entries matching the
+    given program_id and/or connection are removed.
+
+    :param program_id: Only drop Programs for this program id (optional, Pubkey)
+    :param connection: Only drop Programs bound to this connection (optional, Client)
+    :return: Number of dropped Programs (int)
+    """
+    with _ANCHOR_PROGRAMS_LOCK:
+        connections = list(_ANCHOR_PROGRAMS.keys()) if connection is None else [connection]
+        dropped = 0
+        for registered_connection in connections:
+            programs = _ANCHOR_PROGRAMS.get(registered_connection, {})
+            stale_ids = [key for key in programs if program_id is None or key == program_id]
+            for key in stale_ids:
+                del programs[key]
+            dropped += len(stale_ids)
+            if not programs:
+                _ANCHOR_PROGRAMS.pop(registered_connection, None)
+    return dropped
+
+
+def __getattr__(name):
+    # HadeswapIDL used to be an eagerly imported dict literal; it is now loaded on first access
+    if name == 'HadeswapIDL':
+        return load_idl()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,65 +1,413 @@
 from ..common import *
-
-
-async def get_specific_accounts(account_id: str, program_id: Pubkey, connection: Client):
-    program = await return_anchor_program(program_id, connection)
-
-    # Retrieve specific accounts based on the account identifier
-    any_accounts_raw = await getattr(program.account, account_id).all()
-    any_accounts = [anchor_raw_BNs_and_pubkeys_to_nums_and_strings(acc) for acc in any_accounts_raw]
+from .layouts import get_account_layout, get_account_projection, encode_account_field, decode_account, ACCOUNT_DISCRIMINATOR_SIZE
+
+import collections
+import weakref
+
+from solana.rpc.types import MemcmpOpts, DataSliceOpts
+
+# nftSwapPair fields the pricing helpers read (pair_buy_price, pair_sell_price, the budget solvers)
+PAIR_PRICING_FIELDS = (
+    'bondingCurve', 'baseSpotPrice', 'mathCounter', 'currentSpotPrice',
+    'fundsSolOrTokenBalance', 'buyOrdersQuantity', 'nftsCount',
+)
+
+
+def account_filters(account_id: str, fields: Optional[dict] = None) -> List[MemcmpOpts]:
+    """
+    getProgramAccounts filters selecting accounts of one type whose fields equal the given values.
+
+    Offsets come from the IDL layout, so any fixed-position field can be filtered on.
+
+    :param account_id: IDL account name, e.g. 'nftSwapPair' (str)
+    :param fields: Field name or dotted path -> value, e.g. {'hadoMarket': market, 'pairType': 'nftForToken'} (optional, dict)
+    :return: Discriminator filter followed by one memcmp filter per field (list of MemcmpOpts)
+    """
+    layout = get_account_layout(account_id)
+    filters = [MemcmpOpts(offset=0, bytes=base58.b58encode(layout.discriminator).decode())]
+    for path, value in (fields or {}).items():
+        offset, encoded = encode_account_field(account_id, path, value)
+        filters.append(MemcmpOpts(offset=offset, bytes=base58.b58encode(encoded).decode()))
+    return filters
+
+
+async def get_specific_accounts(account_id: str, program_id: Pubkey, connection: Client, fields: Optional[dict] = None, projection: Optional[Tuple[str, ...]] = None):
+    """
+    Fetch and decode every account of one type, optionally only those matching field values.
+
+    :param account_id: IDL account name, e.g. 'nftSwapPair' (str)
+    :param program_id: Hadeswap program public key (Pubkey)
+    :param connection: Solana RPC connection (Client)
+    :param fields: Server-side memcmp filters, field -> value, see account_filters (optional, dict)
+    :param projection: Only download (dataSlice) and decode these top-level fields, e.g. PAIR_PRICING_FIELDS (optional, tuple of str)
+    :return: Decoded accounts, with only the projected fields and 'publicKey' under a projection (list of dict)
+    """
+    return await _scan_accounts(account_id, program_id, connection, account_filters(account_id, fields), projection)
+
+async def _scan_accounts(account_id: str, program_id: Pubkey, connection: Client, filters: List[MemcmpOpts], projection: Optional[Tuple[str, ...]]):
+    decoder = get_account_projection(account_id, tuple(projection)) if projection else get_account_layout(account_id)
+
+    # Scan raw accounts of this type by discriminator (and field filters) and decode them with the generated fixed-offset decoder
+    response = await connection.get_program_accounts(
+        program_id,
+        encoding='base64',
+        data_slice=DataSliceOpts(offset=decoder.offset, length=decoder.length) if projection else None,
+        filters=filters,
+    )
+    any_accounts = [decoder.decode(keyed_account.account.data, str(keyed_account.pubkey)) for keyed_account in response.value]
 
     return any_accounts
 
-async def get_all_program_accounts(program_id: Pubkey, connection: Client):
-    program = await return_anchor_program(program_id, connection)
-
-    # Retrieve and process all program accounts
-    hado_markets_raw = await program.account.hadoMarket.all()
-    hado_markets = [anchor_raw_BNs_and_pubkeys_to_nums_and_strings(acc) for acc in hado_markets_raw]
-
-    nft_swap_pairs_raw = await program.account.nftSwapPair.all()
-    nft_swap_pairs = [anchor_raw_BNs_and_pubkeys_to_nums_and_strings(acc) for acc in nft_swap_pairs_raw]
-
-    classic_validation_whitelists_raw = await program.account.classicValidationWhitelist.all()
-    classic_validation_whitelists = [anchor_raw_BNs_and_pubkeys_to_nums_and_strings(acc) for acc in classic_validation_whitelists_raw]
-
-    nft_validation_adapters_raw = await program.account.nftValidationAdapter.all()
-    nft_validation_adapters = [anchor_raw_BNs_and_pubkeys_to_nums_and_strings(acc) for acc in nft_validation_adapters_raw]
-
-    nft_validation_adapters_v2_raw = await program.account.nftValidationAdapterV2.all()
-    nft_validation_adapters_v2 = [anchor_raw_BNs_and_pubkeys_to_nums_and_strings(acc) for acc in nft_validation_adapters_v2_raw]
-
-    authority_adapters_raw = await program.account.authorityAdapter.all()
-    authority_adapters = [anchor_raw_BNs_and_pubkeys_to_nums_and_strings(acc) for acc in authority_adapters_raw]
-
-    nft_pair_boxes_raw = await program.account.nftPairBox.all()
-    nft_pair_boxes = [anchor_raw_BNs_and_pubkeys_to_nums_and_strings(acc) for acc in nft_pair_boxes_raw]
-
-    adapter_whitelists_raw = await program.account.adapterWhitelist.all()
-    adapter_whitelists = [anchor_raw_BNs_and_pubkeys_to_nums_and_strings(acc) for acc in adapter_whitelists_raw]
-
-    protocol_settings_v1_raw = await program.account.protocolSettingsV1.all()
-    protocol_settings_v1 = [anchor_raw_BNs_and_pubkeys_to_nums_and_strings(acc) for acc in protocol_settings_v1_raw]
-
-    protocol_admin_multisigs_raw = await program.account.protocolAdminMultisig.all()
-    protocol_admin_multisigs = [anchor_raw_BNs_and_pubkeys_to_nums_and_strings(acc) for acc in protocol_admin_multisigs_raw]
-
-    liquidity_provision_orders_raw = await program.account.liquidityProvisionOrder.all()
-    liquidity_provision_orders = [anchor_raw_BNs_and_pubkeys_to_nums_and_strings(acc) for acc in liquidity_provision_orders_raw]
+# Shards of a sharded scan, one per value of the shard field's leading byte; must be a power of 256
+DEFAULT_SCAN_SHARDS = 256
+
+# Shard scans a sharded scan runs at once
+DEFAULT_SHARD_CONCURRENCY = 16
+
+def shard_prefixes(shards: int) -> List[bytes]:
+    """
+    Leading-byte prefixes splitting uniformly distributed pubkeys into `shards` disjoint, covering ranges.
+
+    memcmp filters match whole bytes, so the shard count is a power of 256: 1 (no sharding), 256 or 65536.
+
+    :param shards: Number of shards (int)
+    :return: One prefix per shard (list of bytes)
+    """
+    prefix_length = 0
+    while 256 ** prefix_length < shards:
+        prefix_length += 1
+    if 256 ** prefix_length != shards:
+        raise ValueError(f"memcmp shards split on whole bytes, so their count must be 1, 256 or 65536, not {shards}")
+    return [value.to_bytes(prefix_length, 'big') for value in range(shards)]
+
+async def get_sharded_accounts(
+    account_id: str,
+    program_id: Pubkey,
+    connection: Client,
+    shard_field: str,
+    fields: Optional[dict] = None,
+    projection: Optional[Tuple[str, ...]] = None,
+    shards: int = DEFAULT_SCAN_SHARDS,
+    max_concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+    timeout=None,
+):
+    """
+    Fetch every account of one type as many small getProgramAccounts scans, one per leading byte of a pubkey field, run concurrently.
+
+    Each shard adds a memcmp filter on the first byte(s) of `shard_field` (e.g. nftPairBox 'pair' or 'nftMint'); pubkeys
+    are uniformly distributed, so every shard returns about 1/`shards` of the accounts and no single response is huge.
+
+    :param account_id: IDL account name, e.g. 'nftPairBox' (str)
+    :param program_id: Hadeswap program public key (Pubkey)
+    :param connection: Solana RPC connection (Client)
+    :param shard_field: Pubkey field to shard on, e.g. 'pair' (str)
+    :param fields: Server-side memcmp filters, field -> value, see account_filters (optional, dict)
+    :param projection: Only download and decode these top-level fields, see get_specific_accounts (optional, tuple of str)
+    :param shards: Number of shard scans, see shard_prefixes (int)
+    :param max_concurrency: Maximum number of shard scans in flight (int)
+    :param timeout: Seconds allowed per shard scan (optional, float)
+    :return: Decoded accounts, shard by shard (list of dict)
+    """
+    shard_layout = get_account_layout(account_id).field(shard_field)
+    if shard_layout.idl_type != 'publicKey':
+        raise ValueError(f"{account_id}.{shard_field} is not a pubkey field and cannot be sharded on")
+    filters = account_filters(account_id, fields)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def scan(prefix):
+        shard_filters = [MemcmpOpts(offset=shard_layout.offset, bytes=base58.b58encode(prefix).decode())] if prefix else []
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(_scan_accounts(account_id, program_id, connection, filters + shard_filters, projection), timeout)
+            except asyncio.TimeoutError:
+                raise asyncio.TimeoutError(f'getProgramAccounts for {account_id} shard {prefix.hex()} timed out after {timeout}s') from None
+
+    results = await asyncio.gather(*(scan(prefix) for prefix in shard_prefixes(shards)))
+
+    return [account for accounts in results for account in accounts]
+
+async def get_accounts_by_address(account_id: str, addresses: List[Pubkey], connection: Client, projection: Optional[Tuple[str, ...]] = None, chunk_size: int = 100):
+    """
+    Fetch and decode known accounts of one type with getMultipleAccounts (up to 100 per request, requests in parallel).
+
+    :param account_id: IDL account name, e.g. 'nftSwapPair' (str)
+    :param addresses: Account addresses (list of Pubkey)
+    :param connection: Solana RPC connection (Client)
+    :param projection: Only download (dataSlice) and decode these top-level fields; the discriminator is then not checked (optional, tuple of str)
+    :param chunk_size: Accounts per getMultipleAccounts request (int)
+    :return: Decoded account per address, None for missing accounts or accounts of another type (list)
+    """
+    layout = get_account_layout(account_id)
+    projected = get_account_projection(account_id, tuple(projection)) if projection else None
+    data_slice = DataSliceOpts(offset=projected.offset, length=projected.length) if projected else None
+
+    chunks = [addresses[start:start + chunk_size] for start in range(0, len(addresses), chunk_size)]
+    responses = await asyncio.gather(*(
+        connection.get_multiple_accounts(chunk, encoding='base64', data_slice=data_slice) for chunk in chunks
+    ))
+
+    decoded = []
+    for address, account in zip(addresses, (account for response in responses for account in response.value)):
+        if account is None:
+            decoded.append(None)
+        elif projected:
+            decoded.append(projected.decode(account.data, str(address)))
+        elif bytes(account.data[:ACCOUNT_DISCRIMINATOR_SIZE]) == layout.discriminator:
+            decoded.append(layout.decode(account.data, str(address)))
+        else:
+            decoded.append(None)
+    return decoded
+
+# getMultipleAccounts chunks a stream keeps in flight, including the one its consumer waits for
+DEFAULT_STREAM_PREFETCH = 2
+
+async def iter_specific_accounts(
+    account_id: str,
+    program_id: Pubkey,
+    connection: Client,
+    fields: Optional[dict] = None,
+    projection: Optional[Tuple[str, ...]] = None,
+    chunk_size: int = 100,
+    prefetch: int = DEFAULT_STREAM_PREFETCH,
+):
+    """
+    Stream every account of one type in decoded chunks, in roughly constant memory.
+
+    A zero-length dataSlice getProgramAccounts lists the matching addresses only (32 bytes each); the accounts are then
+    fetched with getMultipleAccounts, `chunk_size` at a time, with at most `prefetch` chunks in flight.
+
+    :param account_id: IDL account name, e.g. 'nftPairBox' (str)
+    :param program_id: Hadeswap program public key (Pubkey)
+    :param connection: Solana RPC connection (Client)
+    :param fields: Server-side memcmp filters, field -> value, see account_filters (optional, dict)
+    :param projection: Only download and decode these top-level fields, see get_specific_accounts (optional, tuple of str)
+    :param chunk_size: Accounts per getMultipleAccounts request and per yielded chunk, at most 100 (int)
+    :param prefetch: Chunks in flight at once, including the one the consumer waits for, at least 1 (int)
+    :return: Async generator of decoded account chunks; accounts closed since the listing are left out (list of dict)
+    """
+    response = await connection.get_program_accounts(
+        program_id,
+        encoding='base64',
+        data_slice=DataSliceOpts(offset=0, length=0),
+        filters=account_filters(account_id, fields),
+    )
+    addresses = [keyed_account.pubkey for keyed_account in response.value]
+    del response
+
+    pending = collections.deque()
+    next_start = 0
+    try:
+        while pending or next_start < len(addresses):
+            while next_start < len(addresses) and len(pending) < max(prefetch, 1):
+                chunk = addresses[next_start:next_start + chunk_size]
+                pending.append(asyncio.ensure_future(get_accounts_by_address(account_id, chunk, connection, projection, chunk_size)))
+                next_start += chunk_size
+            accounts = [account for account in await pending.popleft() if account is not None]
+            if accounts:
+                yield accounts
+    finally:
+        for task in pending:
+            task.cancel()
+
+async def get_hado_market_pairs(program_id: Pubkey, connection: Client, hado_market: Pubkey):
+    """Fetch the nftSwapPairs of one hadoMarket only."""
+    return await get_specific_accounts('nftSwapPair', program_id, connection, {'hadoMarket': hado_market})
+
+async def get_pair_nft_boxes(program_id: Pubkey, connection: Client, pair: Pubkey):
+    """Fetch the nftPairBoxes of one pair only."""
+    return await get_specific_accounts('nftPairBox', program_id, connection, {'pair': pair})
+
+async def get_pair_liquidity_provision_orders(program_id: Pubkey, connection: Client, pair: Pubkey):
+    """Fetch the liquidityProvisionOrders of one pair only."""
+    return await get_specific_accounts('liquidityProvisionOrder', program_id, connection, {'nftSwapPair': pair})
+
+async def get_owner_authority_adapters(program_id: Pubkey, connection: Client, authority_owner: Pubkey):
+    """Fetch the authorityAdapters owned by one authority only."""
+    return await get_specific_accounts('authorityAdapter', program_id, connection, {'authorityOwner': authority_owner})
+
+# Seconds an AccountFetchBatcher waits for more fetches before sending a batch
+DEFAULT_FETCH_WINDOW = 0.01
+
+# Keys per getMultipleAccounts request (the RPC limit)
+MAX_MULTIPLE_ACCOUNTS = 100
+
+
+class AccountFetchBatcher:
+    """
+    Coalesces single-account fetches into getMultipleAccounts calls.
+
+    fetch() queues a pubkey and returns a future at once. Fetches issued within `window` seconds,
+    from any number of concurrent callers, are deduplicated by pubkey and sent as getMultipleAccounts
+    requests of up to 100 keys; every caller's future is resolved with its own decoded account.
+
+    Attributes:
+        connection (Client): Solana RPC connection; None once garbage collected for the shared batchers of
+            get_account_fetch_batcher, which only hold it weakly.
+        window (float): Seconds to collect fetches before sending them.
+        requests (int): Fetches queued so far.
+        rpc_calls (int): getMultipleAccounts requests sent so far.
+    """
+    __slots__ = ('_connection', 'window', 'chunk_size', 'requests', 'rpc_calls', '_pending', '_flush_task')
+
+    def __init__(self, connection: Client, window: float = DEFAULT_FETCH_WINDOW, chunk_size: int = MAX_MULTIPLE_ACCOUNTS):
+        self._connection = connection
+        self.window = window
+        self.chunk_size = chunk_size
+        self.requests = 0
+        self.rpc_calls = 0
+        self._pending = {}
+        self._flush_task = None
+
+    @property
+    def connection(self) -> Optional[Client]:
+        connection = self._connection
+        return connection() if isinstance(connection, weakref.ref) else connection
+
+    def fetch(self, account_id: str, pubkey) -> asyncio.Future:
+        """
+        Queue the fetch of one account; must be called from a running event loop.
+
+        :param account_id: IDL account name the account is decoded as (str)
+        :param pubkey: Account address (Pubkey or str)
+        :return: Future resolving to the decoded account, or failing with ValueError if it is missing or of another type, or with the RPC or decoding error (asyncio.Future)
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(str(pubkey), []).append((account_id, future))
+        self.requests += 1
+        if self._flush_task is None:
+            self._flush_task = loop.create_task(self._flush_after_window())
+        return future
+
+    async def _flush_after_window(self):
+        await asyncio.sleep(self.window)
+        pending, self._pending, self._flush_task = self._pending, {}, None
+        keys = list(pending)
+        chunks = [keys[start:start + self.chunk_size] for start in range(0, len(keys), self.chunk_size)]
+        await asyncio.gather(*(self._fetch_chunk(chunk, pending) for chunk in chunks))
+
+    async def _fetch_chunk(self, keys: List[str], pending: dict):
+        try:
+            connection = self.connection
+            if connection is None:
+                raise ValueError("The batcher's connection was garbage collected")
+            self.rpc_calls += 1
+            response = await connection.get_multiple_accounts([Publickey(key) for key in keys], encoding='base64')
+            accounts = response.value
+            if len(accounts) != len(keys):
+                raise ValueError(f"getMultipleAccounts returned {len(accounts)} accounts for {len(keys)} keys")
+        except Exception as error:
+            for key in keys:
+                for _, future in pending[key]:
+                    if not future.done():
+                        future.set_exception(error)
+            return
+
+        for key, account in zip(keys, accounts):
+            for account_id, future in pending[key]:
+                if future.done():
+                    continue
+                if account is None:
+                    future.set_exception(ValueError(f"Account {key} does not exist"))
+                    continue
+                # Any decoding error (struct.error, IndexError on short data, ...) fails this future only
+                try:
+                    future.set_result(decode_account(account_id, account.data, key))
+                except Exception as error:
+                    future.set_exception(error)
+
+
+# Connection -> its shared batcher; entries go away with their connections
+_FETCH_BATCHERS = weakref.WeakKeyDictionary()
+
+
+def get_account_fetch_batcher(connection: Client) -> AccountFetchBatcher:
+    """
+    Shared AccountFetchBatcher of a connection, so fetches of all concurrent parsers coalesce.
+
+    :param connection: Solana RPC connection (Client)
+    :return: The connection's batcher (AccountFetchBatcher)
+    """
+    batcher = _FETCH_BATCHERS.get(connection)
+    if batcher is None:
+        batcher = _FETCH_BATCHERS[connection] = AccountFetchBatcher(connection)
+        # A strong reference from the registry's own value would keep the key alive forever
+        batcher._connection = weakref.ref(connection)
+    return batcher
+
+# Result key of every account type in a get_all_program_accounts snapshot
+PROGRAM_ACCOUNT_TYPES = {
+    'hadoMarket': 'hadoMarkets',
+    'nftSwapPair': 'nftSwapPairs',
+    'nftPairBox': 'nftPairBoxes',
+    'classicValidationWhitelist': 'classicValidationWhitelists',
+    'nftValidationAdapter': 'nftValidationAdapters',
+    'nftValidationAdapterV2': 'nftValidationAdaptersV2',
+    'authorityAdapter': 'authorityAdapters',
+    'adapterWhitelist': 'adapterWhitelists',
+    'protocolSettingsV1': 'protocolSettingsV1',
+    'protocolAdminMultisig': 'protocolAdminMultisigs',
+    'liquidityProvisionOrder': 'liquidityProvisionOrders',
+}
 
-    return {
-        'hadoMarkets': hado_markets,
-        'nftSwapPairs': nft_swap_pairs,
-        'nftPairBoxes': nft_pair_boxes,
-        'classicValidationWhitelists': classic_validation_whitelists,
-        'nftValidationAdapters': nft_validation_adapters,
-        'nftValidationAdaptersV2': nft_validation_adapters_v2,
-        'authorityAdapters': authority_adapters,
-        'adapterWhitelists': adapter_whitelists,
-        'protocolSettingsV1': protocol_settings_v1,
-        'protocolAdminMultisigs': protocol_admin_multisigs,
-        'liquidityProvisionOrders': liquidity_provision_orders
-    }
+# getProgramAccounts scans a snapshot runs at once; by default all of them, lower it for rate-limited RPCs
+DEFAULT_SCAN_CONCURRENCY = len(PROGRAM_ACCOUNT_TYPES)
+
+async def get_all_program_accounts(
+    program_id: Pubkey,
+    connection: Client,
+    account_types: Optional[List[str]] = None,
+    max_concurrency: int = DEFAULT_SCAN_CONCURRENCY,
+    timeout=None,
+    shard_fields: Optional[dict] = None,
+    shards=DEFAULT_SCAN_SHARDS,
+    shard_concurrency=DEFAULT_SHARD_CONCURRENCY,
+):
+    """
+    Fetch every account of the program, one getProgramAccounts scan per account type, run concurrently.
+
+    A full snapshot takes about as long as the slowest scan (with enough concurrency) instead of the sum of all.
+    Types listed in `shard_fields` are fetched with get_sharded_accounts instead of one scan, split into `shards` shard
+    scans with at most `shard_concurrency` of them in flight.
+
+    :param program_id: Hadeswap program public key (Pubkey)
+    :param connection: Solana RPC connection (Client)
+    :param account_types: Only fetch these IDL account types, e.g. ['hadoMarket', 'nftSwapPair'] (optional, list of str)
+    :param max_concurrency: Maximum number of scans in flight (int)
+    :param timeout: Seconds allowed per scan, one value for all types or a dict per type; per shard for sharded types (optional, float or dict)
+    :param shard_fields: IDL account type -> pubkey field to shard its scan on, e.g. {'nftPairBox': 'pair'} (optional, dict)
+    :param shards: Shard scans per sharded type, see shard_prefixes; one value for all types or a dict per type (int or dict)
+    :param shard_concurrency: Maximum number of shard scans in flight per sharded type; one value for all types or a dict per type (int or dict)
+    :return: Result key (e.g. 'nftSwapPairs') -> decoded accounts, for the requested types only (dict)
+    """
+    account_types = list(PROGRAM_ACCOUNT_TYPES) if account_types is None else list(account_types)
+    for account_type in account_types:
+        if account_type not in PROGRAM_ACCOUNT_TYPES:
+            raise ValueError(f"Unknown Hadeswap account type: {account_type}")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def scan(account_type):
+        type_timeout = timeout.get(account_type) if isinstance(timeout, dict) else timeout
+        if shard_fields and account_type in shard_fields:
+            type_shards = shards.get(account_type, DEFAULT_SCAN_SHARDS) if isinstance(shards, dict) else shards
+            type_shard_concurrency = (
+                shard_concurrency.get(account_type, DEFAULT_SHARD_CONCURRENCY) if isinstance(shard_concurrency, dict) else shard_concurrency
+            )
+            async with semaphore:
+                return await get_sharded_accounts(
+                    account_type, program_id, connection, shard_fields[account_type],
+                    shards=type_shards, max_concurrency=type_shard_concurrency, timeout=type_timeout,
+                )
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(get_specific_accounts(account_type, program_id, connection), type_timeout)
+            except asyncio.TimeoutError:
+                raise asyncio.TimeoutError(f'getProgramAccounts for {account_type} timed out after {type_timeout}s') from None
+
+    results = await asyncio.gather(*(scan(account_type) for account_type in account_types))
+
+    return {PROGRAM_ACCOUNT_TYPES[account_type]: accounts for account_type, accounts in zip(account_types, results)}
 
 async def on_accounts_change(program_id: Pubkey, timeout_of_calls: int,from_this_signature: str,connection: Client,on_accounts_change_callback):
     print('onAccountsChange')
@@ -85,36 +433,53 @@ async def on_accounts_change(program_id: Pubkey, timeout_of_calls: int,from_this
                 await asyncio.sleep(0.2)
                 continue
 
-            for signature_info in reversed(new_signature_infos):
-                await asyncio.sleep(0.1)
-                current_transaction_info = await connection.get_parsed_transaction(
-                    signature_info['signature'], 'confirmed')
-
-                if not current_transaction_info:
-                    last_signature = signature_info['signature']
-                    await asyncio.sleep(0.1)
-                    continue
-
-                if not current_transaction_info['meta'] or current_transaction_info['meta']['err'] is not None:
-                    last_signature = signature_info['signature']
-                    await asyncio.sleep(0.1)
-                    continue
-
-                instruction_log = current_transaction_info['meta']['logMessages'][1]
-                if instruction_log in TRANSACTION_ACCOUNT_PARSERS:
-                    try:
-                        await on_accounts_change_callback(
-                            await TRANSACTION_ACCOUNT_PARSERS[instruction_log](
-                                {'transaction': current_transaction_info, 'programId': program_id, 'connection': connection}
-                            ),
-                            instruction_log
-                        )
-                        last_signature = signature_info['signature']
-                    except Exception as err:
-                        last_signature = signature_info['signature']
-                        print('onAccountsChange Error in', instruction_log, ':', err)
+            # Parsers start as soon as their transaction is known and run concurrently, so their account
+            # fetches share getMultipleAccounts batches. Changes are still reported, and last_signature advanced,
+            # in signature order, so it never moves back to an older signature than one already handled
+            handled = []
+            read_error = None
+            try:
+                try:
+                    for signature_info in reversed(new_signature_infos):
                         await asyncio.sleep(0.1)
-                        continue
+                        current_transaction_info = await connection.get_parsed_transaction(
+                            signature_info['signature'], 'confirmed')
+
+                        if not current_transaction_info:
+                            handled.append((signature_info['signature'], None, None))
+                            await asyncio.sleep(0.1)
+                            continue
+
+                        if not current_transaction_info['meta'] or current_transaction_info['meta']['err'] is not None:
+                            handled.append((signature_info['signature'], None, None))
+                            await asyncio.sleep(0.1)
+                            continue
+
+                        instruction_log = current_transaction_info['meta']['logMessages'][1]
+                        parser = TRANSACTION_ACCOUNT_PARSERS.get(instruction_log)
+                        handled.append((signature_info['signature'], instruction_log, parser and asyncio.ensure_future(
+                            parser(current_transaction_info, program_id, connection)
+                        )))
+                except Exception as err:
+                    # Report the transactions read before the failure, then let the outer handler reset
+                    read_error = err
+
+                for signature, instruction_log, parsed_accounts in handled:
+                    if parsed_accounts is not None:
+                        try:
+                            await on_accounts_change_callback(await parsed_accounts, instruction_log)
+                        except Exception as err:
+                            print('onAccountsChange Error in', instruction_log, ':', err)
+                            await asyncio.sleep(0.1)
+                    last_signature = signature
+            finally:
+                # Only left pending when the loop itself is cancelled
+                for _, _, parsed_accounts in handled:
+                    if parsed_accounts is not None:
+                        parsed_accounts.cancel()
+
+            if read_error is not None:
+                raise read_error
         except Exception as err:
             latest_confirmed_signatures = await connection.get_signatures_for_address(
                 program_id, {'limit': 1}, 'confirmed')
@@ -125,11 +490,12 @@ async def on_accounts_change(program_id: Pubkey, timeout_of_calls: int,from_this
 
 async def initialize_pair_parser(transaction, program_id: Pubkey, connection: Client):
     await asyncio.sleep(0.15)
-    program = await return_anchor_program(program_id, connection)
+    batcher = get_account_fetch_batcher(connection)
 
     pair_pubkey = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][0])
-    pair_account = await program.account.nftSwapPair.fetch(pair_pubkey)
-    pair = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': pair_account, 'publicKey': pair_pubkey})
+    pair_request = batcher.fetch('nftSwapPair', pair_pubkey)
+
+    pair = await pair_request
 
     return {
         'hadoMarkets': [],
@@ -146,11 +512,12 @@ async def initialize_pair_parser(transaction, program_id: Pubkey, connection: Cl
 
 async def validate_nft_parser(transaction, program_id: Pubkey, connection: Client):
     await asyncio.sleep(0.15)
-    program = await return_anchor_program(program_id, connection)
+    batcher = get_account_fetch_batcher(connection)
 
     nft_validation_adapter_pubkey = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][0])
-    nft_validation_adapter_account = await program.account.nftValidationAdapter.fetch(nft_validation_adapter_pubkey)
-    nft_validation_adapter = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': nft_validation_adapter_account, 'publicKey': nft_validation_adapter_pubkey})
+    nft_validation_adapter_request = batcher.fetch('nftValidationAdapter', nft_validation_adapter_pubkey)
+
+    nft_validation_adapter = await nft_validation_adapter_request
 
     return {
         'hadoMarkets': [],
@@ -167,11 +534,12 @@ async def validate_nft_parser(transaction, program_id: Pubkey, connection: Clien
 
 async def create_classic_authority_adapter_parser(transaction, program_id: Pubkey, connection: Client):
     await asyncio.sleep(0.15)
-    program = await return_anchor_program(program_id, connection)
+    batcher = get_account_fetch_batcher(connection)
 
     authority_adapter_pubkey = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][0])
-    authority_adapter_account = await program.account.authorityAdapter.fetch(authority_adapter_pubkey)
-    authority_adapter = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': authority_adapter_account, 'publicKey': authority_adapter_pubkey})
+    authority_adapter_request = batcher.fetch('authorityAdapter', authority_adapter_pubkey)
+
+    authority_adapter = await authority_adapter_request
 
     return {
         'hadoMarkets': [],
@@ -188,16 +556,17 @@ async def create_classic_authority_adapter_parser(transaction, program_id: Pubke
 
 async def deposit_sol_to_pair_parser(transaction, program_id: Pubkey, connection: Client):
     await asyncio.sleep(0.15)
-    program = await return_anchor_program(program_id, connection)
+    batcher = get_account_fetch_batcher(connection)
 
     pair_pubkey = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][0])
-    pair_account = await program.account.nftSwapPair.fetch(pair_pubkey)
-    pair = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': pair_account, 'publicKey': pair_pubkey})
+    pair_request = batcher.fetch('nftSwapPair', pair_pubkey)
+
+    pair = await pair_request
 
     return {
         'hadoMarkets': [],
-        'nftSwapPairs': [],
-        'nftPairBoxes': [pair],
+        'nftSwapPairs': [pair],
+        'nftPairBoxes': [],
         'classicValidationWhitelists': [],
         'nftValidationAdapters': [],
         'authorityAdapters': [],
@@ -209,15 +578,15 @@ async def deposit_sol_to_pair_parser(transaction, program_id: Pubkey, connection
 
 async def deposit_nft_to_pair_parser(transaction, program_id: Pubkey, connection: Client):
     await asyncio.sleep(0.15)
-    program = await return_anchor_program(program_id, connection)
+    batcher = get_account_fetch_batcher(connection)
 
     nft_pair_box_pubkey = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][0])
-    nft_pair_box_account = await program.account.nftPairBox.fetch(nft_pair_box_pubkey)
-    nft_pair_box = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': nft_pair_box_account, 'publicKey': nft_pair_box_pubkey})
+    nft_pair_box_request = batcher.fetch('nftPairBox', nft_pair_box_pubkey)
 
     pair_pubkey = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][1])
-    pair_account = await program.account.nftSwapPair.fetch(pair_pubkey)
-    pair = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': pair_account, 'publicKey': pair_pubkey})
+    pair_request = batcher.fetch('nftSwapPair', pair_pubkey)
+
+    nft_pair_box, pair = await asyncio.gather(nft_pair_box_request, pair_request)
 
     return {
         'hadoMarkets': [],
@@ -234,11 +603,12 @@ async def deposit_nft_to_pair_parser(transaction, program_id: Pubkey, connection
 
 async def initialize_hado_market_parser(transaction, program_id: Pubkey, connection: Client):
     await asyncio.sleep(0.15)
-    program = await return_anchor_program(program_id, connection)
+    batcher = get_account_fetch_batcher(connection)
 
     hado_market_pubkey = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][0])
-    hado_market_account = await program.account.hadoMarket.fetch(hado_market_pubkey)
-    hado_market = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': hado_market_account, 'publicKey': hado_market_pubkey})
+    hado_market_request = batcher.fetch('hadoMarket', hado_market_pubkey)
+
+    hado_market = await hado_market_request
 
     return {
         'hadoMarkets': [hado_market],
@@ -255,11 +625,12 @@ async def initialize_hado_market_parser(transaction, program_id: Pubkey, connect
 
 async def finish_hado_market_parser(transaction, program_id: Pubkey, connection: Client):
     await asyncio.sleep(0.15)
-    program = await return_anchor_program(program_id, connection)
+    batcher = get_account_fetch_batcher(connection)
 
     hado_market_pubkey = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][0])
-    hado_market_account = await program.account.hadoMarket.fetch(hado_market_pubkey)
-    hado_market = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': hado_market_account, 'publicKey': hado_market_pubkey})
+    hado_market_request = batcher.fetch('hadoMarket', hado_market_pubkey)
+
+    hado_market = await hado_market_request
 
     return {
         'hadoMarkets': [hado_market],
@@ -276,11 +647,12 @@ async def finish_hado_market_parser(transaction, program_id: Pubkey, connection:
 
 async def add_classic_whitelist_to_market_parser(transaction, program_id: Pubkey, connection: Client):
     await asyncio.sleep(0.15)
-    program = await return_anchor_program(program_id, connection)
+    batcher = get_account_fetch_batcher(connection)
 
     classic_validation_whitelist_pubkey = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][0])
-    classic_validation_whitelist_account = await program.account.classicValidationWhitelist.fetch(classic_validation_whitelist_pubkey)
-    classic_validation_whitelist = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': classic_validation_whitelist_account, 'publicKey': classic_validation_whitelist_pubkey})
+    classic_validation_whitelist_request = batcher.fetch('classicValidationWhitelist', classic_validation_whitelist_pubkey)
+
+    classic_validation_whitelist = await classic_validation_whitelist_request
 
     return {
         'hadoMarkets': [],
@@ -297,19 +669,18 @@ async def add_classic_whitelist_to_market_parser(transaction, program_id: Pubkey
 
 async def deposit_liquidity_to_pair_parser(transaction, program_id: Pubkey, connection: Client):
     await asyncio.sleep(0.15)
-    program = await return_anchor_program(program_id, connection)
+    batcher = get_account_fetch_batcher(connection)
 
     liquidity_provision_order_pubkey = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][0])
-    liquidity_provision_order_account = await program.account.liquidityProvisionOrder.fetch(liquidity_provision_order_pubkey)
-    liquidity_provision_order = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': liquidity_provision_order_account, 'publicKey': liquidity_provision_order_pubkey})
+    liquidity_provision_order_request = batcher.fetch('liquidityProvisionOrder', liquidity_provision_order_pubkey)
 
     nft_pair_box_pubkey = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][1])
-    nft_pair_box_account = await program.account.nftPairBox.fetch(nft_pair_box_pubkey)
-    nft_pair_box = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': nft_pair_box_account, 'publicKey': nft_pair_box_pubkey})
+    nft_pair_box_request = batcher.fetch('nftPairBox', nft_pair_box_pubkey)
 
     pair_pubkey = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][2])
-    pair_account = await program.account.nftSwapPair.fetch(pair_pubkey)
-    pair = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': pair_account, 'publicKey': pair_pubkey})
+    pair_request = batcher.fetch('nftSwapPair', pair_pubkey)
+
+    liquidity_provision_order, nft_pair_box, pair = await asyncio.gather(liquidity_provision_order_request, nft_pair_box_request, pair_request)
 
     return {
         'hadoMarkets': [],
@@ -326,11 +697,12 @@ async def deposit_liquidity_to_pair_parser(transaction, program_id: Pubkey, conn
 
 async def put_pair_on_market_parser(transaction, program_id: Pubkey, connection: Client):
     await asyncio.sleep(0.15)
-    program = await return_anchor_program(program_id, connection)
+    batcher = get_account_fetch_batcher(connection)
 
     pair_pubkey = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][0])
-    pair_account = await program.account.nftSwapPair.fetch(pair_pubkey)
-    pair = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': pair_account, 'publicKey': pair_pubkey})
+    pair_request = batcher.fetch('nftSwapPair', pair_pubkey)
+
+    pair = await pair_request
 
     return {
         'hadoMarkets': [],
@@ -347,15 +719,15 @@ async def put_pair_on_market_parser(transaction, program_id: Pubkey, connection:
 
 async def buy_nft_from_pair_parser(transaction, program_id: Pubkey, connection: Client):
     await asyncio.sleep(0.15)
-    program = await return_anchor_program(program_id, connection)
+    batcher = get_account_fetch_batcher(connection)
 
     nft_pair_box_pubkey = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][0])
-    nft_pair_box_account = await program.account.nftPairBox.fetch(nft_pair_box_pubkey)
-    nft_pair_box = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': nft_pair_box_account, 'publicKey': nft_pair_box_pubkey})
+    nft_pair_box_request = batcher.fetch('nftPairBox', nft_pair_box_pubkey)
 
     pair_pubkey = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][1])
-    pair_account = await program.account.nftSwapPair.fetch(pair_pubkey)
-    pair = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': pair_account, 'publicKey': pair_pubkey})
+    pair_request = batcher.fetch('nftSwapPair', pair_pubkey)
+
+    nft_pair_box, pair = await asyncio.gather(nft_pair_box_request, pair_request)
 
     return {
         'hadoMarkets': [],
@@ -372,11 +744,12 @@ async def buy_nft_from_pair_parser(transaction, program_id: Pubkey, connection:
 
 async def sell_nft_to_token_to_nft_pair_parser(transaction, program_id: Pubkey, connection: Client):
     await asyncio.sleep(0.15)
-    program = await return_anchor_program(program_id, connection)
+    batcher = get_account_fetch_batcher(connection)
 
     pair_pubkey = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][0])
-    pair_account = await program.account.nftSwapPair.fetch(pair_pubkey)
-    pair = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': pair_account, 'publicKey': pair_pubkey})
+    pair_request = batcher.fetch('nftSwapPair', pair_pubkey)
+
+    pair = await pair_request
 
     return {
         'hadoMarkets': [],
@@ -393,15 +766,15 @@ async def sell_nft_to_token_to_nft_pair_parser(transaction, program_id: Pubkey,
 
 async def sell_nft_to_liquidity_pair_parser(transaction, program_id: Pubkey, connection: Client):
     await asyncio.sleep(0.15)
-    program = await return_anchor_program(program_id, connection)
+    batcher = get_account_fetch_batcher(connection)
 
     nft_pair_box_pubkey = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][0])
-    nft_pair_box_account = await program.account.nftPairBox.fetch(nft_pair_box_pubkey)
-    nft_pair_box = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': nft_pair_box_account, 'publicKey': nft_pair_box_pubkey})
+    nft_pair_box_request = batcher.fetch('nftPairBox', nft_pair_box_pubkey)
 
     pair_pubkey = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][1])
-    pair_account = await program.account.nftSwapPair.fetch(pair_pubkey)
-    pair = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': pair_account, 'publicKey': pair_pubkey})
+    pair_request = batcher.fetch('nftSwapPair', pair_pubkey)
+
+    nft_pair_box, pair = await asyncio.gather(nft_pair_box_request, pair_request)
 
     return {
         'hadoMarkets': [],
@@ -418,11 +791,12 @@ async def sell_nft_to_liquidity_pair_parser(transaction, program_id: Pubkey, con
 
 async def withdraw_sol_from_pair_parser(transaction, program_id: Pubkey, connection: Client):
     await asyncio.sleep(0.15)
-    program = await return_anchor_program(program_id, connection)
+    batcher = get_account_fetch_batcher(connection)
 
     pair_pubkey = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][0])
-    pair_account = await program.account.nftSwapPair.fetch(pair_pubkey)
-    pair = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': pair_account, 'publicKey': pair_pubkey})
+    pair_request = batcher.fetch('nftSwapPair', pair_pubkey)
+
+    pair = await pair_request
 
     return {
         'hadoMarkets': [],
@@ -439,15 +813,15 @@ async def withdraw_sol_from_pair_parser(transaction, program_id: Pubkey, connect
 
 async def withdraw_nft_from_pair_parser(transaction, program_id: Pubkey, connection: Client):
     await asyncio.sleep(0.15)
-    program = await return_anchor_program(program_id, connection)
+    batcher = get_account_fetch_batcher(connection)
 
     nft_pair_box_pubkey = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][0])
-    nft_pair_box_account = await program.account.nftPairBox.fetch(nft_pair_box_pubkey)
-    nft_pair_box = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': nft_pair_box_account, 'publicKey': nft_pair_box_pubkey})
+    nft_pair_box_request = batcher.fetch('nftPairBox', nft_pair_box_pubkey)
 
     pair_pubkey = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][2])
-    pair_account = await program.account.nftSwapPair.fetch(pair_pubkey)
-    pair = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': pair_account, 'publicKey': pair_pubkey})
+    pair_request = batcher.fetch('nftSwapPair', pair_pubkey)
+
+    nft_pair_box, pair = await asyncio.gather(nft_pair_box_request, pair_request)
 
     return {
         'hadoMarkets': [],
@@ -464,22 +838,21 @@ async def withdraw_nft_from_pair_parser(transaction, program_id: Pubkey, connect
 
 async def withdraw_liquidity_from_balanced_pair_parser(transaction, program_id: Pubkey, connection: Client):
     await asyncio.sleep(0.15)
-    program = await return_anchor_program(program_id, connection)
+    batcher = get_account_fetch_batcher(connection)
 
     pair_pubkey = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][4])
-    pair_account = await program.account.nftSwapPair.fetch(pair_pubkey)
-    pair = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': pair_account, 'publicKey': pair_pubkey})
+    pair_request = batcher.fetch('nftSwapPair', pair_pubkey)
 
     liquidity_provision_order_pubkey_first = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][0])
-    liquidity_provision_order_first_account = await program.account.liquidityProvisionOrder.fetch(liquidity_provision_order_pubkey_first)
-    liquidity_provision_order_first = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': liquidity_provision_order_first_account, 'publicKey': liquidity_provision_order_pubkey_first})
+    liquidity_provision_order_first_request = batcher.fetch('liquidityProvisionOrder', liquidity_provision_order_pubkey_first)
 
     liquidity_provision_order_pubkey_second = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][1])
-    liquidity_provision_order_second_account = await program.account.liquidityProvisionOrder.fetch(liquidity_provision_order_pubkey_second)
-    liquidity_provision_order_second = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': liquidity_provision_order_second_account, 'publicKey': liquidity_provision_order_pubkey_second})
+    liquidity_provision_order_second_request = batcher.fetch('liquidityProvisionOrder', liquidity_provision_order_pubkey_second)
 
     nft_pair_box_pubkey_first = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][2])
 
+    pair, liquidity_provision_order_first, liquidity_provision_order_second = await asyncio.gather(pair_request, liquidity_provision_order_first_request, liquidity_provision_order_second_request)
+
     return {
         'hadoMarkets': [],
         'nftSwapPairs': [pair],
@@ -495,11 +868,12 @@ async def withdraw_liquidity_from_balanced_pair_parser(transaction, program_id:
 
 async def modify_pair_parser(transaction, program_id: Pubkey, connection: Client):
     await asyncio.sleep(0.15)
-    program = await return_anchor_program(program_id, connection)
+    batcher = get_account_fetch_batcher(connection)
 
     pair_pubkey = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][0])
-    pair_account = await program.account.nftSwapPair.fetch(pair_pubkey)
-    pair = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': pair_account, 'publicKey': pair_pubkey})
+    pair_request = batcher.fetch('nftSwapPair', pair_pubkey)
+
+    pair = await pair_request
 
     return {
         'hadoMarkets': [],
@@ -516,19 +890,18 @@ async def modify_pair_parser(transaction, program_id: Pubkey, connection: Client
 
 async def withdraw_liquidity_from_buy_orders_pair_parser(transaction, program_id: Pubkey, connection: Client):
     await asyncio.sleep(0.15)
-    program = await return_anchor_program(program_id, connection)
+    batcher = get_account_fetch_batcher(connection)
 
     pair_pubkey = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][3])
-    pair_account = await program.account.nftSwapPair.fetch(pair_pubkey)
-    pair = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': pair_account, 'publicKey': pair_pubkey})
+    pair_request = batcher.fetch('nftSwapPair', pair_pubkey)
 
     liquidity_provision_order_pubkey_first = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][0])
-    liquidity_provision_order_first_account = await program.account.liquidityProvisionOrder.fetch(liquidity_provision_order_pubkey_first)
-    liquidity_provision_order_first = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': liquidity_provision_order_first_account, 'publicKey': liquidity_provision_order_pubkey_first})
+    liquidity_provision_order_first_request = batcher.fetch('liquidityProvisionOrder', liquidity_provision_order_pubkey_first)
 
     liquidity_provision_order_pubkey_second = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][1])
-    liquidity_provision_order_second_account = await program.account.liquidityProvisionOrder.fetch(liquidity_provision_order_pubkey_second)
-    liquidity_provision_order_second = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': liquidity_provision_order_second_account, 'publicKey': liquidity_provision_order_pubkey_second})
+    liquidity_provision_order_second_request = batcher.fetch('liquidityProvisionOrder', liquidity_provision_order_pubkey_second)
+
+    pair, liquidity_provision_order_first, liquidity_provision_order_second = await asyncio.gather(pair_request, liquidity_provision_order_first_request, liquidity_provision_order_second_request)
 
     return {
         'hadoMarkets': [],
@@ -545,27 +918,24 @@ async def withdraw_liquidity_from_buy_orders_pair_parser(transaction, program_id
 
 async def withdraw_liquidity_from_sell_orders_pair_parser(transaction, program_id: Pubkey, connection: Client):
     await asyncio.sleep(0.15)
-    program = await return_anchor_program(program_id, connection)
+    batcher = get_account_fetch_batcher(connection)
 
     pair_pubkey = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][11])
-    pair_account = await program.account.nftSwapPair.fetch(pair_pubkey)
-    pair = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': pair_account, 'publicKey': pair_pubkey})
+    pair_request = batcher.fetch('nftSwapPair', pair_pubkey)
 
     liquidity_provision_order_pubkey_first = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][0])
-    liquidity_provision_order_first_account = await program.account.liquidityProvisionOrder.fetch(liquidity_provision_order_pubkey_first)
-    liquidity_provision_order_first = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': liquidity_provision_order_first_account, 'publicKey': liquidity_provision_order_pubkey_first})
+    liquidity_provision_order_first_request = batcher.fetch('liquidityProvisionOrder', liquidity_provision_order_pubkey_first)
 
     liquidity_provision_order_pubkey_second = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][1])
-    liquidity_provision_order_second_account = await program.account.liquidityProvisionOrder.fetch(liquidity_provision_order_pubkey_second)
-    liquidity_provision_order_second = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': liquidity_provision_order_second_account, 'publicKey': liquidity_provision_order_pubkey_second})
+    liquidity_provision_order_second_request = batcher.fetch('liquidityProvisionOrder', liquidity_provision_order_pubkey_second)
 
     nft_pair_box_pubkey_first = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][2])
-    nft_pair_box_first_account = await program.account.nftPairBox.fetch(nft_pair_box_pubkey_first)
-    nft_pair_box_first = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': nft_pair_box_first_account, 'publicKey': nft_pair_box_pubkey_first})
+    nft_pair_box_first_request = batcher.fetch('nftPairBox', nft_pair_box_pubkey_first)
 
     nft_pair_box_pubkey_second = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][3])
-    nft_pair_box_second_account = await program.account.nftPairBox.fetch(nft_pair_box_pubkey_second)
-    nft_pair_box_second = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': nft_pair_box_second_account, 'publicKey': nft_pair_box_pubkey_second})
+    nft_pair_box_second_request = batcher.fetch('nftPairBox', nft_pair_box_pubkey_second)
+
+    pair, liquidity_provision_order_first, liquidity_provision_order_second, nft_pair_box_first, nft_pair_box_second = await asyncio.gather(pair_request, liquidity_provision_order_first_request, liquidity_provision_order_second_request, nft_pair_box_first_request, nft_pair_box_second_request)
 
     return {
         'hadoMarkets': [],
@@ -582,11 +952,12 @@ async def withdraw_liquidity_from_sell_orders_pair_parser(transaction, program_i
 
 async def withdraw_liquidity_order_virtual_fees_parser(transaction, program_id: Pubkey, connection: Client):
     await asyncio.sleep(0.15)
-    program = await return_anchor_program(program_id, connection)
+    batcher = get_account_fetch_batcher(connection)
 
     liquidity_provision_order_pubkey = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][0])
-    liquidity_provision_order_account = await program.account.liquidityProvisionOrder.fetch(liquidity_provision_order_pubkey)
-    liquidity_provision_order = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': liquidity_provision_order_account, 'publicKey': liquidity_provision_order_pubkey})
+    liquidity_provision_order_request = batcher.fetch('liquidityProvisionOrder', liquidity_provision_order_pubkey)
+
+    liquidity_provision_order = await liquidity_provision_order_request
 
     return {
         'hadoMarkets': [],
@@ -622,11 +993,12 @@ async def close_virtual_nft_swap_pair_parser(transaction, program_id: Pubkey, co
 
 async def withdraw_virtual_fees_parser(transaction, program_id: Pubkey, connection: Client):
     await asyncio.sleep(0.15)
-    program = await return_anchor_program(program_id, connection)
+    batcher = get_account_fetch_batcher(connection)
 
     pair_pubkey = Pubkey(transaction['transaction']['message']['instructions'][0]['accounts'][0])
-    pair_account = await program.account.nftSwapPair.fetch(pair_pubkey)
-    pair = anchor_raw_BNs_and_pubkeys_to_nums_and_strings({'account': pair_account, 'publicKey': pair_pubkey})
+    pair_request = batcher.fetch('nftSwapPair', pair_pubkey)
+
+    pair = await pair_request
 
     return {
         'hadoMarkets': [],
@@ -0,0 +1,125 @@
+"""
+Bulk derivation of per-mint Metaplex and token addresses.
+
+Bootstrapping a market needs the metadata, edition, associated token account and token
+record addresses of tens of thousands of NFT mints. derive_mint_addresses derives them in
+chunks spread over a process pool and stores the results in a MintAddressTable, which keeps
+each address column in one contiguous bytearray (32 bytes per mint) instead of lists of
+Pubkey objects.
+"""
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+from ..common import *
+
+PUBKEY_SIZE = 32
+
+MINT_ADDRESS_COLUMNS = ('metadata', 'edition', 'tokenAccount', 'tokenRecord')
+
+# Below this many mints the derivation runs in-process; pool start-up would dominate
+MIN_PARALLEL_MINTS = 4096
+
+
+class MintAddressTable:
+    """
+    Array-backed table of derived addresses, one row per mint.
+
+    Attributes:
+        mints (bytes): Concatenated 32-byte mint keys.
+        owners (bytes): Concatenated 32-byte owner keys the token accounts were derived for.
+        columns (dict): Column name (see MINT_ADDRESS_COLUMNS) -> bytearray of 32-byte addresses.
+    """
+    __slots__ = ('mints', 'owners', 'columns', '_index')
+
+    def __init__(self, mints: bytes, owners: bytes, columns: dict):
+        self.mints = mints
+        self.owners = owners
+        self.columns = columns
+        self._index = None
+
+    def __len__(self):
+        return len(self.mints) // PUBKEY_SIZE
+
+    def raw(self, column: str, row: int) -> bytes:
+        """Return the raw 32-byte address of one cell."""
+        start = row * PUBKEY_SIZE
+        return bytes(self.columns[column][start:start + PUBKEY_SIZE])
+
+    def get(self, column: str, row: int) -> Pubkey:
+        """Return one derived address as a Pubkey."""
+        return Pubkey.from_bytes(self.raw(column, row))
+
+    def row_of(self, mint: Pubkey) -> int:
+        """Return the row of a mint; the mint -> row index is built on first use."""
+        if self._index is None:
+            self._index = {self.mints[start:start + PUBKEY_SIZE]: start // PUBKEY_SIZE for start in range(0, len(self.mints), PUBKEY_SIZE)}
+        return self._index[bytes(mint)]
+
+    def addresses_for(self, mint: Pubkey) -> dict:
+        """Return every derived address of a mint as Pubkeys keyed by column name."""
+        row = self.row_of(mint)
+        return {column: self.get(column, row) for column in self.columns}
+
+
+def derive_mint_addresses(
+    mints: List[Pubkey],
+    owners,
+    max_workers: Optional[int] = None,
+    chunk_size: int = 2048,
+    executor: Optional[Executor] = None,
+) -> MintAddressTable:
+    """
+    Derive metadata, edition, associated token account and token record addresses for many mints.
+
+    :param mints: NFT mint public keys (list of Pubkey)
+    :param owners: Token account owner per mint, or a single owner for all mints (list of Pubkey or Pubkey)
+    :param max_workers: Process pool size when no executor is given (optional, int)
+    :param chunk_size: Mints per worker task (int)
+    :param executor: Existing executor to run the chunks on (optional, Executor)
+    :return: Derived addresses (MintAddressTable)
+    """
+    mint_bytes = b''.join(bytes(mint) for mint in mints)
+    if isinstance(owners, Pubkey):
+        owner_bytes = bytes(owners) * len(mints)
+    else:
+        if len(owners) != len(mints):
+            raise ValueError("owners must be a single Pubkey or have one entry per mint")
+        owner_bytes = b''.join(bytes(owner) for owner in owners)
+
+    step = chunk_size * PUBKEY_SIZE
+    chunks = [(mint_bytes[start:start + step], owner_bytes[start:start + step]) for start in range(0, len(mint_bytes), step)]
+
+    if executor is not None:
+        results = list(executor.map(_derive_chunk, *zip(*chunks))) if chunks else []
+    elif len(mints) < MIN_PARALLEL_MINTS or max_workers == 1:
+        results = [_derive_chunk(chunk_mints, chunk_owners) for chunk_mints, chunk_owners in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(_derive_chunk, *zip(*chunks)))
+
+    columns = {column: bytearray() for column in MINT_ADDRESS_COLUMNS}
+    for result in results:
+        for column, column_bytes in zip(MINT_ADDRESS_COLUMNS, result):
+            columns[column] += column_bytes
+    return MintAddressTable(mint_bytes, owner_bytes, columns)
+
+
+def _derive_chunk(mint_bytes: bytes, owner_bytes: bytes) -> tuple:
+    """Worker: derive every column for a chunk of mints; returns one bytes blob per column."""
+    metadata_program = bytes(METADATA_PROGRAM_PUBKEY)
+    token_program = bytes(TOKEN_PROGRAM_ID)
+    metadata_prefix = METADATA_PREFIX.encode(ENCODER)
+    edition_prefix = EDITION_PREFIX.encode(ENCODER)
+    token_record_prefix = TOKEN_RECORD.encode(ENCODER)
+    find = Pubkey.find_program_address
+
+    columns = tuple(bytearray() for _ in MINT_ADDRESS_COLUMNS)
+    metadata_column, edition_column, token_account_column, token_record_column = columns
+    for start in range(0, len(mint_bytes), PUBKEY_SIZE):
+        mint = mint_bytes[start:start + PUBKEY_SIZE]
+        owner = owner_bytes[start:start + PUBKEY_SIZE]
+        token_account = bytes(find([owner, token_program, mint], ASSOCIATED_TOKEN_PROGRAM_ID)[0])
+        metadata_column += bytes(find([metadata_prefix, metadata_program, mint], METADATA_PROGRAM_PUBKEY)[0])
+        edition_column += bytes(find([metadata_prefix, metadata_program, mint, edition_prefix], METADATA_PROGRAM_PUBKEY)[0])
+        token_account_column += token_account
+        token_record_column += bytes(find([metadata_prefix, metadata_program, mint, token_record_prefix, token_account], METADATA_PROGRAM_PUBKEY)[0])
+    return tuple(bytes(column) for column in columns)
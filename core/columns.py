@@ -0,0 +1,268 @@
+"""
+Columnar NumPy views of Hadeswap accounts (requires the optional `numpy` extra).
+
+Every Hadeswap account type is fixed size, so its IDL layout maps onto a NumPy structured dtype
+with the same offsets. AccountColumns lays the raw data of many accounts side by side and reads
+it with a single np.frombuffer, without building a dict per account: pubkeys stay 32-byte 'V32'
+fields, enums stay their u8 variant index, u128/i128 stay 'V16'. Filters and aggregations over
+a whole market then run as vectorized operations:
+
+    pairs = await get_account_columns('nftSwapPair', program_id, connection)
+    buy_side = pairs[pairs.mask({'hadoMarket': hado_market, 'pairType': PairType.TokenForNFT})]
+    liquidity = buy_side['fundsSolOrTokenBalance'].sum()
+    funds_by_market = pairs.sum_by('hadoMarket', 'fundsSolOrTokenBalance')
+"""
+from functools import lru_cache
+
+from ..common import *
+from .layouts import get_account_layout, idl_enum_variant_name, pubkey_bytes_to_base58, ACCOUNT_DISCRIMINATOR_SIZE
+from .accounts import account_filters
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError("Columnar accounts need NumPy: pip install 'pyhadeswap[numpy]'") from error
+    return numpy
+
+
+# Fixed-size IDL primitives -> NumPy field types; pubkeys and 128-bit integers are kept as raw bytes
+_PRIMITIVE_DTYPES = {
+    'bool': '?',
+    'u8': 'u1',
+    'i8': 'i1',
+    'u16': '<u2',
+    'i16': '<i2',
+    'u32': '<u4',
+    'i32': '<i4',
+    'u64': '<u8',
+    'i64': '<i8',
+    'u128': 'V16',
+    'i128': 'V16',
+    'publicKey': 'V32',
+}
+
+
+class AccountDtype:
+    """
+    NumPy structured dtype of one account type, with the enum variants of its enum fields.
+
+    Attributes:
+        name (str): IDL account name.
+        dtype (numpy.dtype): Structured dtype covering the whole account, discriminator included.
+        enums (dict): Dotted field path -> variant names as decoded (e.g. 'tokenForNft'), indexed by their u8 code.
+    """
+    def __init__(self, name, dtype, enums):
+        self.name = name
+        self.dtype = dtype
+        self.enums = enums
+
+    def __repr__(self):
+        return f'AccountDtype({self.name!r}, itemsize={self.dtype.itemsize})'
+
+
+@lru_cache(maxsize=None)
+def get_account_dtype(account_id: str) -> AccountDtype:
+    """
+    Build the structured dtype of an account type from its IDL layout.
+
+    :param account_id: IDL account name, e.g. 'nftSwapPair' (str)
+    :return: The dtype and its enum variants (AccountDtype)
+    """
+    np = _import_numpy()
+    layout = get_account_layout(account_id)
+    types = {idl_type['name']: idl_type['type'] for idl_type in load_idl().get('types', [])}
+    enums = {}
+
+    def field_dtype(idl_type, path):
+        if isinstance(idl_type, str):
+            return _PRIMITIVE_DTYPES[idl_type]
+        if 'array' in idl_type:
+            item_type, length = idl_type['array']
+            return (field_dtype(item_type, path), (length,))
+        defined = types[idl_type['defined']]
+        if defined['kind'] == 'enum':
+            enums[path] = tuple(idl_enum_variant_name(variant['name']) for variant in defined['variants'])
+            return 'u1'
+        return struct_dtype(defined['fields'], path + '.')
+
+    def struct_dtype(idl_fields, prefix):
+        names, formats, offsets = [], [], []
+        offset = 0
+        for idl_field in idl_fields:
+            names.append(idl_field['name'])
+            formats.append(np.dtype(field_dtype(idl_field['type'], prefix + idl_field['name'])))
+            offsets.append(offset)
+            offset += formats[-1].itemsize
+        return np.dtype({'names': names, 'formats': formats, 'offsets': offsets, 'itemsize': offset})
+
+    field_layouts = list(layout.fields.values())
+    dtype = np.dtype({
+        'names': ['discriminator'] + [field_layout.name for field_layout in field_layouts],
+        'formats': [f'V{ACCOUNT_DISCRIMINATOR_SIZE}'] + [
+            np.dtype(field_dtype(field_layout.idl_type, field_layout.name)) for field_layout in field_layouts
+        ],
+        'offsets': [0] + [field_layout.offset for field_layout in field_layouts],
+        'itemsize': layout.size,
+    })
+    return AccountDtype(account_id, dtype, enums)
+
+
+class AccountColumns:
+    """
+    Many accounts of one type as a NumPy structured array.
+
+    Indexing with a field name or dotted path returns that column, e.g. columns['bondingCurve.delta'];
+    indexing with a boolean mask, slice or index array returns the selected accounts as AccountColumns.
+
+    Attributes:
+        account_id (str): IDL account name.
+        records (numpy.ndarray): One record per account, see get_account_dtype.
+        public_keys (numpy.ndarray): Account addresses as 'V32'.
+    """
+    __slots__ = ('account_id', 'records', 'public_keys')
+
+    def __init__(self, account_id: str, records, public_keys):
+        self.account_id = account_id
+        self.records = records
+        self.public_keys = public_keys
+
+    @classmethod
+    def from_raw(cls, account_id: str, datas: List[bytes], public_keys: List) -> "AccountColumns":
+        """
+        Lay out raw account data side by side and read it with one np.frombuffer.
+
+        :param account_id: IDL account name (str)
+        :param datas: Raw account data, discriminator included (list of bytes)
+        :param public_keys: Account addresses, in the same order (list of Pubkey or str)
+        :return: The columns (AccountColumns)
+        """
+        np = _import_numpy()
+        layout = get_account_layout(account_id)
+        account_dtype = get_account_dtype(account_id)
+        buffer = b''.join(bytes(data[:layout.size]) for data in datas)
+        if len(buffer) != layout.size * len(datas):
+            raise ValueError(f"Some accounts are shorter than a {account_id} account ({layout.size} bytes)")
+
+        records = np.frombuffer(buffer, dtype=account_dtype.dtype)
+        wrong_type = records['discriminator'] != np.void(layout.discriminator)
+        if wrong_type.any():
+            raise ValueError(f"Account {public_keys[int(np.argmax(wrong_type))]} is not a {account_id} account")
+
+        keys = np.frombuffer(
+            b''.join(bytes(key if isinstance(key, Pubkey) else Pubkey.from_string(str(key))) for key in public_keys),
+            dtype='V32',
+        )
+        return cls(account_id, records, keys)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __repr__(self):
+        return f'AccountColumns({self.account_id!r}, {len(self)} accounts)'
+
+    def __getitem__(self, selection):
+        if isinstance(selection, str):
+            column = self.records
+            for name in selection.split('.'):
+                if column.dtype.names is None or name not in column.dtype.names:
+                    raise ValueError(f"{self.account_id} has no field {selection!r}")
+                column = column[name]
+            return column
+        return AccountColumns(self.account_id, self.records[selection], self.public_keys[selection])
+
+    def enum_code(self, path: str, variant: str) -> int:
+        """
+        u8 code of an enum variant, as stored in its column.
+
+        :param path: Enum field name or dotted path, e.g. 'pairType' (str)
+        :param variant: Variant name as decoded, e.g. PairType.TokenForNFT (str)
+        :return: Variant index (int)
+        """
+        variants = get_account_dtype(self.account_id).enums.get(path)
+        if variants is None:
+            raise ValueError(f"{self.account_id}.{path} is not an enum field")
+        if variant not in variants:
+            raise ValueError(f"{variant!r} is not a variant of {self.account_id}.{path}, expected one of {variants}")
+        return variants.index(variant)
+
+    def column_value(self, path: str, value):
+        """Convert a decoded value (base58 pubkey, enum variant name, number) to the form stored in a column."""
+        np = _import_numpy()
+        if path in get_account_dtype(self.account_id).enums:
+            return self.enum_code(path, value)
+        if self[path].dtype == np.dtype('V32'):
+            return np.void(bytes(value if isinstance(value, Pubkey) else Pubkey.from_string(str(value))))
+        return value
+
+    def mask(self, fields: dict):
+        """
+        Accounts whose fields equal the given values, like account_filters does server-side.
+
+        :param fields: Field name or dotted path -> decoded value, e.g. {'hadoMarket': market, 'pairType': 'nftForToken'} (dict)
+        :return: Boolean mask over the accounts (numpy.ndarray)
+        """
+        np = _import_numpy()
+        selected = np.ones(len(self), dtype=bool)
+        for path, value in fields.items():
+            selected &= self[path] == self.column_value(path, value)
+        return selected
+
+    def sum_by(self, key_path: str, value_path: str) -> dict:
+        """
+        Sum one column per distinct value of another, e.g. the funds of every hadoMarket.
+
+        :param key_path: Grouping field, e.g. 'hadoMarket' (str)
+        :param value_path: Numeric field to sum, e.g. 'fundsSolOrTokenBalance' (str)
+        :return: Decoded key (base58 for pubkeys, variant name for enums) -> sum (dict)
+        """
+        np = _import_numpy()
+        keys, inverse = np.unique(self[key_path], return_inverse=True)
+        values = self[value_path]
+        # Integer columns are summed exactly in their own dtype; bincount would go through float64
+        sums = np.zeros(len(keys), dtype=values.dtype if values.dtype.kind in 'iu' else np.float64)
+        np.add.at(sums, inverse.reshape(-1), values)
+        return {self._decode_value(key_path, key): total for key, total in zip(keys, sums.tolist())}
+
+    def _decode_value(self, path: str, value):
+        variants = get_account_dtype(self.account_id).enums.get(path)
+        if variants is not None:
+            return variants[int(value)]
+        if value.dtype.kind == 'V' and value.dtype.itemsize == 32:
+            return pubkey_bytes_to_base58(value.tobytes())
+        return value.item()
+
+    def public_key_strings(self) -> List[str]:
+        """Account addresses as base58 strings."""
+        return [pubkey_bytes_to_base58(key.tobytes()) for key in self.public_keys]
+
+    def to_dicts(self) -> List[dict]:
+        """Decode the accounts into the usual dicts, e.g. after narrowing them down with a mask."""
+        decode = get_account_layout(self.account_id).decode
+        return [
+            decode(record.tobytes(), public_key)
+            for record, public_key in zip(self.records, self.public_key_strings())
+        ]
+
+
+async def get_account_columns(account_id: str, program_id: Pubkey, connection: Client, fields: Optional[dict] = None) -> AccountColumns:
+    """
+    Fetch every account of one type straight into AccountColumns, without decoding them into dicts.
+
+    :param account_id: IDL account name, e.g. 'nftSwapPair' (str)
+    :param program_id: Hadeswap program public key (Pubkey)
+    :param connection: Solana RPC connection (Client)
+    :param fields: Server-side memcmp filters, field -> value, see account_filters (optional, dict)
+    :return: The columns (AccountColumns)
+    """
+    response = await connection.get_program_accounts(
+        program_id,
+        encoding='base64',
+        filters=account_filters(account_id, fields),
+    )
+    return AccountColumns.from_raw(
+        account_id,
+        [keyed_account.account.data for keyed_account in response.value],
+        [keyed_account.pubkey for keyed_account in response.value],
+    )
@@ -0,0 +1,157 @@
+"""
+All-in quotes: curve price plus protocol fee, LP fee and royalties, in lamports.
+
+For every order i of a quote, with p_i the lamport price of that order from core/lamports.py
+(prices_array_lamports on the pair's base spot price, delta and mathCounter), all rates in basis
+points of BASE_POINTS and every division truncating toward zero like the program's integer math:
+
+    protocol_i  = p_i * protocolFee // BASE_POINTS                (protocolSettingsV1)
+    lp_i        = p_i * fee // BASE_POINTS                        (pair fee, LiquidityProvision pairs only)
+    share_i     = lp_i * protocolFeeMultiplier // BASE_POINTS     (protocol's share of the LP fee)
+    royalty_i   = p_i * seller_fee_basis_points // BASE_POINTS    (Metadata of the NFT)
+
+The quote reports protocolFee = sum(protocol_i + share_i), lpFee = sum(lp_i - share_i) and
+royalties = sum(royalty_i). A buyer pays gross + protocolFee + lpFee + royalties; a seller
+receives gross - protocolFee - lpFee - royalties.
+
+The program source is not part of this package: the formula follows the field names of the
+nftSwapPair and protocolSettingsV1 accounts and has not been checked against the on-chain fee
+computation, so treat the fees as an estimate until it is.
+
+QuoteInputsCache keeps protocolSettingsV1 and per-mint royalties in a TTL cache shared across
+calls, so a quote only touches the RPC when an input is missing or expired.
+"""
+import time
+
+from ..common import *
+from .accounts import get_specific_accounts
+from .lamports import _div, prices_array_lamports
+
+# Seconds cached quote inputs stay fresh
+DEFAULT_QUOTE_INPUTS_TTL = 30.0
+
+
+def all_in_quote(pair: dict, amount: int, order_type: str, protocol_settings: dict, royalty_bps: int = 0) -> dict:
+    """
+    Fee- and royalty-inclusive cost of trading `amount` NFTs with one pair, without any RPC calls.
+
+    :param pair: Decoded nftSwapPair account (dict)
+    :param amount: Number of NFTs (int)
+    :param order_type: OrderType.Buy to buy from the pair, OrderType.Sell to sell to it (str)
+    :param protocol_settings: Decoded protocolSettingsV1 account (dict)
+    :param royalty_bps: Royalty of the NFTs in basis points, Metadata seller_fee_basis_points (int)
+    :return: {'gross', 'protocolFee', 'lpFee', 'royalties', 'total', 'prices'} in lamports; 'total' is what
+        a buyer pays or a seller receives (dict)
+    """
+    prices = prices_array_lamports(
+        int(pair['baseSpotPrice']), int(pair['bondingCurve']['delta']), amount, pair['bondingCurve']['bondingType'],
+        order_type, pair['mathCounter'],
+    )['array']
+    lp_fee_bps = pair['fee'] if pair['pairType'] == PairType.LiquidityProvision else 0
+
+    protocol_fee = lp_fee = royalties = 0
+    for price in prices:
+        order_lp_fee = _div(price * lp_fee_bps, BASE_POINTS)
+        protocol_share = _div(order_lp_fee * protocol_settings['protocolFeeMultiplier'], BASE_POINTS)
+        protocol_fee += _div(price * protocol_settings['protocolFee'], BASE_POINTS) + protocol_share
+        lp_fee += order_lp_fee - protocol_share
+        royalties += _div(price * royalty_bps, BASE_POINTS)
+
+    gross = sum(prices)
+    fees = protocol_fee + lp_fee + royalties
+    return {
+        'gross': gross,
+        'protocolFee': protocol_fee,
+        'lpFee': lp_fee,
+        'royalties': royalties,
+        'total': gross + fees if order_type == OrderType.Buy else gross - fees,
+        'prices': prices,
+    }
+
+
+class QuoteInputsCache:
+    """
+    TTL cache of the inputs of all-in quotes: protocolSettingsV1 and the royalty of each mint.
+
+    Attributes:
+        program_id (Pubkey): Hadeswap program public key.
+        connection (Client): Solana RPC connection used on misses.
+        ttl (float): Seconds an entry stays fresh.
+        hits (int), misses (int): Lookup counters.
+    """
+    __slots__ = ('program_id', 'connection', 'ttl', 'clock', 'hits', 'misses', '_protocol_settings', '_royalties')
+
+    def __init__(self, program_id: Pubkey, connection: Client, ttl: float = DEFAULT_QUOTE_INPUTS_TTL, clock=time.monotonic):
+        self.program_id = program_id
+        self.connection = connection
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._protocol_settings = None
+        self._royalties = {}
+
+    def _fresh(self, entry) -> bool:
+        fresh = entry is not None and self.clock() - entry[0] < self.ttl
+        if fresh:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return fresh
+
+    async def protocol_settings(self) -> dict:
+        """
+        The protocolSettingsV1 account, fetched only when missing or expired.
+
+        :return: Decoded protocolSettingsV1 account (dict)
+        """
+        if not self._fresh(self._protocol_settings):
+            settings = await get_specific_accounts('protocolSettingsV1', self.program_id, self.connection)
+            if not settings:
+                raise ValueError(f'No protocolSettingsV1 account for program {self.program_id}')
+            self._protocol_settings = (self.clock(), settings[0])
+        return self._protocol_settings[1]
+
+    async def protocol_fee_receiver(self) -> Pubkey:
+        """Protocol fee receiver from the cached protocol settings, as the router builders expect it."""
+        return Publickey(str((await self.protocol_settings())['protocolFeeReceiver']))
+
+    async def royalty_bps(self, nft_mints: List) -> List[int]:
+        """
+        seller_fee_basis_points of many mints; missing or expired ones are fetched in batched getMultipleAccounts calls.
+
+        :param nft_mints: NFT mints (list of Pubkey or str)
+        :return: Royalty in basis points per mint, 0 for mints without metadata (list of int)
+        """
+        stale = list({str(mint) for mint in nft_mints if not self._fresh(self._royalties.get(str(mint)))})
+        if stale:
+            metadata_accounts = await Metadata.from_account_addresses(
+                self.connection, [get_metaplex_metadata(Publickey(mint)) for mint in stale]
+            )
+            now = self.clock()
+            for mint, metadata_account in zip(stale, metadata_accounts):
+                self._royalties[mint] = (now, metadata_account.seller_fee_basis_points if metadata_account is not None else 0)
+        return [self._royalties[str(mint)][1] for mint in nft_mints]
+
+    async def quote(self, pair: dict, amount: int, order_type: str = OrderType.Buy, nft_mint=None) -> dict:
+        """
+        All-in quote with cached inputs; no RPC calls while they are fresh.
+
+        :param pair: Decoded nftSwapPair account (dict)
+        :param amount: Number of NFTs (int)
+        :param order_type: OrderType.Buy or OrderType.Sell (str)
+        :param nft_mint: Mint whose royalty applies; no royalties without it (optional, Pubkey or str)
+        :return: Same as all_in_quote (dict)
+        """
+        protocol_settings = await self.protocol_settings()
+        royalty_bps = (await self.royalty_bps([nft_mint]))[0] if nft_mint is not None else 0
+        return all_in_quote(pair, amount, order_type, protocol_settings, royalty_bps)
+
+    def invalidate(self):
+        """Drop every cached input."""
+        self._protocol_settings = None
+        self._royalties.clear()
+
+    def stats(self) -> dict:
+        """Lookup counters and the number of cached royalties."""
+        return {'hits': self.hits, 'misses': self.misses, 'royalties': len(self._royalties)}
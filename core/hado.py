@@ -1,19 +1,18 @@
 from ..common import *
+from .instructions import get_instruction_encoder
 
 
 async def validate_nft(program_id: Pubkey, connection: Client, user_pubkey: Pubkey, classic_validation_whitelist: Pubkey, send_txn):
-    program = await return_anchor_program(program_id, connection)
     instructions = []
     nft_validation_adapter = Keypair()
 
-    # Assuming the `validateNft` method is implemented in the Python version of the anchor program
-    validate_nft_instruction = program.validateNft().accounts_strict({
+    validate_nft_instruction = get_instruction_encoder('validateNft').encode(program_id, {}, {
         'nftValidationAdapter': nft_validation_adapter.pubkey(),
         'validationWhitelist': classic_validation_whitelist,
         'user': user_pubkey,
         'systemProgram': SYS_PROGRAM_ID,
         'rent': SYSVAR_RENT_PUBKEY,
-    }).instruction()
+    })
 
     instructions.append(validate_nft_instruction)
     
@@ -26,17 +25,15 @@ async def validate_nft(program_id: Pubkey, connection: Client, user_pubkey: Pubk
     return {'account': nft_validation_adapter.pubkey(), 'instructions': instructions, 'signers': signers}
 
 async def modify_hado_market(program_id: Pubkey, connection: Client, user_pubkey: Pubkey, hado_market: Pubkey, validation_adapter_authority: Pubkey, send_txn):
-    program = await return_anchor_program(program_id, connection)
     instructions = []
 
-    # Assuming the `modifyHadoMarket` method is implemented in the Python version of the anchor program
-    modify_hado_market_instruction = program.modifyHadoMarket().accounts_strict({
+    modify_hado_market_instruction = get_instruction_encoder('modifyHadoMarket').encode(program_id, {}, {
         'hadoMarket': hado_market,
         'user': user_pubkey,
         'validationAdapterProgram': validation_adapter_authority,
         'systemProgram': SYS_PROGRAM_ID,
         'rent': SYSVAR_RENT_PUBKEY,
-    }).instruction()
+    })
 
     instructions.append(modify_hado_market_instruction)
     
@@ -49,19 +46,17 @@ async def modify_hado_market(program_id: Pubkey, connection: Client, user_pubkey
     return {'account': None, 'instructions': instructions, 'signers': signers}
 
 async def initialize_hado_market(program_id: Pubkey, connection: Client, user_pubkey: Pubkey, validation_adapter_program: Pubkey, send_txn):
-    program = await return_anchor_program(program_id, connection)
     instructions = []
     hado_market = Keypair()
 
-    # Assuming the `initializeHadoMarket` method is implemented in the Python version of the anchor program
-    initialize_hado_market_instruction = program.initializeHadoMarket().accounts_strict({
+    initialize_hado_market_instruction = get_instruction_encoder('initializeHadoMarket').encode(program_id, {}, {
         'hadoMarket': hado_market.pubkey(),
         'user': user_pubkey,
         'validationAdapterProgram': validation_adapter_program,
         'pairTokenMint': EMPTY_PUBKEY,
         'systemProgram': SYS_PROGRAM_ID,
         'rent': SYSVAR_RENT_PUBKEY,
-    }).instruction()
+    })
 
     instructions.append(initialize_hado_market_instruction)
     
@@ -74,16 +69,14 @@ async def initialize_hado_market(program_id: Pubkey, connection: Client, user_pu
     return {'account': hado_market.pubkey(), 'instructions': instructions, 'signers': signers}
 
 async def finish_hado_market(program_id: Pubkey, connection: Client, user_pubkey: Pubkey, hado_market: Pubkey, send_txn):
-    program = await return_anchor_program(program_id, connection)
     instructions = []
 
-    # Assuming the `finishHadoMarket` method is implemented in the Python version of the anchor program
-    finish_hado_market_instruction = program.finishHadoMarket().accounts_strict({
+    finish_hado_market_instruction = get_instruction_encoder('finishHadoMarket').encode(program_id, {}, {
         'hadoMarket': hado_market,
         'user': user_pubkey,
         'systemProgram': SYS_PROGRAM_ID,
         'rent': SYSVAR_RENT_PUBKEY,
-    }).instruction()
+    })
 
     instructions.append(finish_hado_market_instruction)
     
@@ -96,18 +89,16 @@ async def finish_hado_market(program_id: Pubkey, connection: Client, user_pubkey
     return {'account': None, 'instructions': instructions, 'signers': signers}
 
 async def create_merkle_tree_whitelist(program_id: Pubkey, connection: Client, user_pubkey: Pubkey, hado_market: Pubkey, root: bytes, send_txn):
-    program = await return_anchor_program(program_id, connection)
     instructions = []
     nft_validation_adapter_v2 = Keypair()
 
-    # Assuming the `addMerkleTreeWhitelist` method is implemented in the Python version of the anchor program
-    add_merkle_tree_whitelist_instruction = program.addMerkleTreeWhitelist(list(root)).accounts_strict({
+    add_merkle_tree_whitelist_instruction = get_instruction_encoder('addMerkleTreeWhitelist').encode(program_id, {'root': root}, {
         'nftValidationAdapter': nft_validation_adapter_v2.pubkey(),
         'hadoMarket': hado_market,
         'user': user_pubkey,
         'systemProgram': SYS_PROGRAM_ID,
         'rent': SYSVAR_RENT_PUBKEY,
-    }).instruction()
+    })
 
     instructions.append(add_merkle_tree_whitelist_instruction)
     
@@ -120,22 +111,19 @@ async def create_merkle_tree_whitelist(program_id: Pubkey, connection: Client, u
     return {'account': nft_validation_adapter_v2.pubkey(), 'instructions': instructions, 'signers': signers}
 
 async def add_classic_whitelist_to_market(program_id: Pubkey, connection: Client, user_pubkey: Pubkey, hado_market: Pubkey, whitelisted_address: Pubkey, whitelist_type: NftValidationWhitelistType, send_txn):
-    program = await return_anchor_program(program_id, connection)
     instructions = []
     validation_whitelist = Keypair()
 
-    # Convert Python enum to a format suitable for the Anchor program
-    anchor_enum_whitelist_type = enum_to_anchor_enum(whitelist_type)
-
-    # Assuming the `addClassicWhitelistToMarket` method is implemented in the Python version of the anchor program
-    add_classic_whitelist_to_market_instruction = program.addClassicWhitelistToMarket(anchor_enum_whitelist_type).accounts_strict({
+    add_classic_whitelist_to_market_instruction = get_instruction_encoder('addClassicWhitelistToMarket').encode(program_id, {
+        'whitelistType': enum_to_anchor_enum(whitelist_type),
+    }, {
         'validationWhitelist': validation_whitelist.pubkey(),
         'hadoMarket': hado_market,
         'user': user_pubkey,
         'whitelistedAddress': whitelisted_address,
         'systemProgram': SYS_PROGRAM_ID,
         'rent': SYSVAR_RENT_PUBKEY,
-    }).instruction()
+    })
 
     instructions.append(add_classic_whitelist_to_market_instruction)
     
@@ -0,0 +1,229 @@
+"""
+Static instruction encoders generated from the Hadeswap IDL.
+
+Each IDL instruction is compiled once into an InstructionEncoder holding its precomputed
+8-byte discriminator, a Borsh serializer for its arguments and the ordered AccountMeta
+template, so building an instruction is a flat serialize + list-building step with no
+anchorpy method/namespace dispatch on the hot path.
+"""
+import hashlib
+import re
+import struct
+from functools import lru_cache
+
+from ..common import *
+
+INSTRUCTION_DISCRIMINATOR_SIZE = 8
+
+_PRIMITIVE_STRUCTS = {
+    'u8': struct.Struct('<B'),
+    'i8': struct.Struct('<b'),
+    'u16': struct.Struct('<H'),
+    'i16': struct.Struct('<h'),
+    'u32': struct.Struct('<I'),
+    'i32': struct.Struct('<i'),
+    'u64': struct.Struct('<Q'),
+    'i64': struct.Struct('<q'),
+    'f32': struct.Struct('<f'),
+    'f64': struct.Struct('<d'),
+}
+_U32 = _PRIMITIVE_STRUCTS['u32']
+
+
+def instruction_discriminator(instruction_name: str) -> bytes:
+    """
+    Compute the Anchor discriminator of an instruction.
+
+    :param instruction_name: IDL instruction name, e.g. 'buyNftFromPair' (str)
+    :return: First 8 bytes of sha256('global:<snake_case_name>') (bytes)
+    """
+    snake_name = re.sub(r'(?<!^)(?=[A-Z])', '_', instruction_name).lower()
+    return hashlib.sha256(f'global:{snake_name}'.encode(ENCODER)).digest()[:INSTRUCTION_DISCRIMINATOR_SIZE]
+
+
+class InstructionEncoder:
+    """
+    Precompiled encoder of one Hadeswap instruction.
+
+    Attributes:
+        name (str): IDL instruction name.
+        discriminator (bytes): Anchor 8-byte instruction discriminator.
+        args (tuple): Ordered (arg name, serializer) pairs.
+        accounts (tuple): Ordered (account name, is_signer, is_writable) template.
+    """
+    __slots__ = ('name', 'discriminator', 'args', 'accounts')
+
+    def __init__(self, name, discriminator, args, accounts):
+        self.name = name
+        self.discriminator = discriminator
+        self.args = args
+        self.accounts = accounts
+
+    def encode_data(self, args: dict) -> bytes:
+        """
+        Serialize instruction data: discriminator followed by the Borsh-encoded arguments.
+
+        :param args: Argument values keyed by IDL arg name (dict)
+        :return: Instruction data (bytes)
+        """
+        return self.discriminator + b''.join(serialize(args[arg_name]) for arg_name, serialize in self.args)
+
+    def encode(self, program_id: Pubkey, args: dict, accounts: dict, remaining_accounts: list = ()) -> Instruction:
+        """
+        Build the instruction.
+
+        :param program_id: Hadeswap program public key (Pubkey)
+        :param args: Argument values keyed by IDL arg name (dict)
+        :param accounts: Account public keys keyed by IDL account name (dict)
+        :param remaining_accounts: Extra AccountMetas or {'pubkey', 'isSigner', 'isWritable'} dicts (list)
+        :return: The instruction (Instruction)
+        """
+        metas = [
+            AccountMeta(pubkey=_to_pubkey(accounts[account_name]), is_signer=is_signer, is_writable=is_writable)
+            for account_name, is_signer, is_writable in self.accounts
+        ]
+        metas.extend(_to_account_meta(account) for account in remaining_accounts)
+        return Instruction(program_id, self.encode_data(args), metas)
+
+    def __repr__(self):
+        return f'InstructionEncoder({self.name!r})'
+
+
+@lru_cache(maxsize=1)
+def get_instruction_encoders() -> dict:
+    """
+    Compile an encoder for every instruction in the Hadeswap IDL.
+
+    :return: IDL instruction name -> InstructionEncoder (dict)
+    """
+    idl = load_idl()
+    types = {idl_type['name']: idl_type['type'] for idl_type in idl.get('types', [])}
+    return {
+        instruction['name']: InstructionEncoder(
+            name=instruction['name'],
+            discriminator=instruction_discriminator(instruction['name']),
+            args=tuple((arg['name'], _compile_serializer(arg['type'], types)) for arg in instruction['args']),
+            accounts=tuple((account['name'], account['isSigner'], account['isMut']) for account in instruction['accounts']),
+        )
+        for instruction in idl['instructions']
+    }
+
+
+def get_instruction_encoder(instruction_name: str) -> InstructionEncoder:
+    """
+    Return the encoder of a single instruction.
+
+    :param instruction_name: IDL instruction name, e.g. 'depositNftToPair' (str)
+    :return: The instruction encoder (InstructionEncoder)
+    """
+    encoders = get_instruction_encoders()
+    if instruction_name not in encoders:
+        raise ValueError(f"Unknown Hadeswap instruction: {instruction_name}")
+    return encoders[instruction_name]
+
+
+def _to_pubkey(value) -> Pubkey:
+    return value if isinstance(value, Pubkey) else Publickey(str(value))
+
+
+def _to_account_meta(account) -> AccountMeta:
+    if isinstance(account, AccountMeta):
+        return account
+    return AccountMeta(
+        pubkey=_to_pubkey(account['pubkey']),
+        is_signer=account.get('isSigner', account.get('is_signer', False)),
+        is_writable=account.get('isWritable', account.get('is_writable', False)),
+    )
+
+
+def _compile_serializer(idl_type, types):
+    """Build a value -> bytes Borsh serializer for an IDL type."""
+    if isinstance(idl_type, str):
+        if idl_type in _PRIMITIVE_STRUCTS:
+            return _PRIMITIVE_STRUCTS[idl_type].pack
+        if idl_type == 'bool':
+            return lambda value: b'\x01' if value else b'\x00'
+        if idl_type == 'publicKey':
+            return lambda value: bytes(_to_pubkey(value))
+        if idl_type in ('u128', 'i128'):
+            signed = idl_type == 'i128'
+            return lambda value: int(value).to_bytes(16, 'little', signed=signed)
+        if idl_type == 'string':
+            return lambda value: _U32.pack(len(value.encode(ENCODER))) + value.encode(ENCODER)
+        if idl_type == 'bytes':
+            return lambda value: _U32.pack(len(value)) + bytes(value)
+        raise ValueError(f"Unsupported IDL type: {idl_type!r}")
+
+    if 'vec' in idl_type:
+        serialize_item = _compile_serializer(idl_type['vec'], types)
+        return lambda value: _U32.pack(len(value)) + b''.join(serialize_item(item) for item in value)
+
+    if 'option' in idl_type:
+        serialize_item = _compile_serializer(idl_type['option'], types)
+        return lambda value: b'\x00' if value is None else b'\x01' + serialize_item(value)
+
+    if 'array' in idl_type:
+        item_type, length = idl_type['array']
+        if item_type == 'u8':
+            return lambda value: _check_array_length(bytes(value), length)
+        serialize_item = _compile_serializer(item_type, types)
+        return lambda value: b''.join(serialize_item(item) for item in _check_array_length(value, length))
+
+    if 'defined' in idl_type:
+        defined = types[idl_type['defined']]
+        if defined['kind'] == 'struct':
+            fields = tuple((field['name'], _compile_serializer(field['type'], types)) for field in defined['fields'])
+            return lambda value: b''.join(serialize(value[field_name]) for field_name, serialize in fields)
+        return _compile_enum_serializer(idl_type['defined'], defined['variants'], types)
+
+    raise ValueError(f"Unsupported IDL type: {idl_type!r}")
+
+
+def _compile_enum_serializer(enum_name, variants, types):
+    """
+    Enum values may be given as a variant name ('linear', 'Linear') or in anchor form
+    ({'linear': {}}, {'pubkey': [Pubkey]}), which is what enum_to_anchor_enum produces.
+    """
+    variant_serializers = {}
+    for index, variant in enumerate(variants):
+        field_types = variant.get('fields', [])
+        if field_types and isinstance(field_types[0], dict) and 'name' in field_types[0]:
+            named_fields = tuple((field['name'], _compile_serializer(field['type'], types)) for field in field_types)
+            serialize_fields = _named_fields_serializer(named_fields)
+        else:
+            serialize_fields = _tuple_fields_serializer(tuple(_compile_serializer(field, types) for field in field_types))
+        entry = (bytes([index]), serialize_fields)
+        variant_serializers[variant['name']] = entry
+        variant_serializers[variant['name'][0].lower() + variant['name'][1:]] = entry
+        variant_serializers[variant['name'].lower()] = entry
+
+    def serialize(value):
+        if isinstance(value, str):
+            variant_name, variant_value = value, None
+        else:
+            (variant_name, variant_value), = value.items()
+        if variant_name not in variant_serializers:
+            raise ValueError(f"Unknown {enum_name} variant: {variant_name!r}")
+        tag, serialize_fields = variant_serializers[variant_name]
+        return tag + serialize_fields(variant_value)
+
+    return serialize
+
+
+def _named_fields_serializer(named_fields):
+    return lambda value: b''.join(serialize(value[field_name]) for field_name, serialize in named_fields)
+
+
+def _tuple_fields_serializer(field_serializers):
+    if not field_serializers:
+        return lambda value: b''
+    if len(field_serializers) == 1:
+        serialize_single = field_serializers[0]
+        return lambda value: serialize_single(value[0] if isinstance(value, (list, tuple)) else value)
+    return lambda value: b''.join(serialize(item) for serialize, item in zip(field_serializers, value))
+
+
+def _check_array_length(value, length):
+    if len(value) != length:
+        raise ValueError(f"Expected an array of {length} items, got {len(value)}")
+    return value
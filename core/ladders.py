@@ -0,0 +1,108 @@
+"""
+Vectorized price ladders for many pairs at once (requires the optional `numpy` extra).
+
+calculate_price_ladders evaluates the same prices as calculate_prices_array, one row per pair
+and one column per order, for thousands of pairs in a single NumPy pass instead of a Python
+loop per pair and per order. Prices are computed in float64 with the same operation order as
+the scalar helpers, so Linear and XYK prices match them exactly while the intermediate values
+stay below 2**53. Exponential prices use NumPy's vectorized pow, which may differ from the
+platform libm pow used by the scalar helpers in the last bit; pass exact=True to evaluate
+those powers with math.pow and get bit-identical results at some cost.
+"""
+import math
+
+from ..common import *
+
+BONDING_CURVE_CODES = {BondingCurveType.Linear: 0, BondingCurveType.Exponential: 1, BondingCurveType.XYK: 2}
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError("Price ladders need NumPy: pip install 'pyhadeswap[numpy]'") from error
+    return numpy
+
+
+def calculate_price_ladders(spot_prices, deltas, bonding_curve_types, counters, order_types, amount: int, depths=None, exact: bool = False) -> dict:
+    """
+    Calculate the next `amount` prices and their running totals for many pairs.
+
+    Row i equals calculate_prices_array(spot_prices[i], deltas[i], amount, bonding_curve_types[i],
+    order_types[i], counters[i])['array'].
+
+    :param spot_prices: Base spot price per pair (sequence or array)
+    :param deltas: Curve delta per pair (sequence or array)
+    :param bonding_curve_types: BondingCurveType per pair (sequence of str)
+    :param counters: mathCounter per pair (sequence or array)
+    :param order_types: OrderType per pair, or one OrderType for all pairs (sequence of str or str)
+    :param amount: Number of orders per ladder (int)
+    :param depths: Orders actually available per pair; later prices become NaN and stop adding to the totals (optional, sequence or array)
+    :param exact: Evaluate exponential powers with math.pow so every price is bit-identical to calculate_prices_array (bool)
+    :return: {'prices': (pairs, amount) float64 array, 'totals': running sums of 'prices' (pairs, amount) float64 array}
+    """
+    np = _import_numpy()
+    spot_prices = np.asarray(spot_prices, dtype=np.float64)[:, None]
+    deltas = np.asarray(deltas, dtype=np.float64)[:, None]
+    counters = np.asarray(counters, dtype=np.int64)[:, None]
+    curve_codes = np.fromiter((BONDING_CURVE_CODES[curve] for curve in bonding_curve_types), dtype=np.int8, count=len(spot_prices))[:, None]
+    if isinstance(order_types, str):
+        is_buy = np.full((len(spot_prices), 1), order_types == OrderType.Buy)
+    else:
+        is_buy = np.fromiter((order_type == OrderType.Buy for order_type in order_types), dtype=bool, count=len(spot_prices))[:, None]
+
+    # Counter passed to calculate_next_spot_price for order i, and the counter it moves to
+    steps = np.arange(amount, dtype=np.int64)[None, :]
+    order_counters = np.where(is_buy, counters + steps, counters + 1 - steps)
+    target_counters = order_counters + np.where(is_buy, 1, -1)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        linear = spot_prices + target_counters * deltas
+
+        ratio = (deltas + 1e4) / 1e4
+        bases = np.where(target_counters > 0, ratio, 1 / ratio)
+        exponents = np.abs(target_counters).astype(np.float64)
+        if exact:
+            rows = (curve_codes == 1)[:, 0]
+            powers = np.ones_like(bases)
+            powers[rows] = np.frompyfunc(math.pow, 2, 1)(bases[rows], exponents[rows]).astype(np.float64)
+        else:
+            powers = bases ** exponents
+        exponential = spot_prices * powers
+
+        nft_tokens_balance = deltas * spot_prices
+        counters_updated = np.where(is_buy, order_counters, order_counters - 1)
+        current_deltas = deltas + 1 - counters_updated
+        new_nft_tokens_balance = nft_tokens_balance + (counters_updated * nft_tokens_balance) / current_deltas
+        xyk = new_nft_tokens_balance / np.where(is_buy, current_deltas - 1, current_deltas + 1)
+
+    prices = np.select([curve_codes == 0, curve_codes == 1, curve_codes == 2], [linear, exponential, xyk], default=0.0)
+
+    if depths is not None:
+        available = steps < np.asarray(depths, dtype=np.int64)[:, None]
+        prices = np.where(available, prices, np.nan)
+    with np.errstate(invalid='ignore'):
+        totals = np.cumsum(prices if depths is None else np.where(available, prices, 0.0), axis=1)
+
+    return {'prices': prices, 'totals': totals}
+
+
+def price_ladders_from_pairs(pairs: List[dict], order_type: str, amount: int, depth_key: Optional[str] = None) -> dict:
+    """
+    Calculate price ladders straight from decoded nftSwapPair accounts.
+
+    :param pairs: Decoded nftSwapPair accounts, as returned by get_specific_accounts (list of dict)
+    :param order_type: OrderType of every ladder (str)
+    :param amount: Number of orders per ladder (int)
+    :param depth_key: Pair field limiting each ladder, e.g. 'nftsCount' or 'buyOrdersQuantity' (optional, str)
+    :return: Same as calculate_price_ladders, rows in the order of `pairs` (dict)
+    """
+    return calculate_price_ladders(
+        [pair['baseSpotPrice'] for pair in pairs],
+        [pair['bondingCurve']['delta'] for pair in pairs],
+        [pair['bondingCurve']['bondingType'] for pair in pairs],
+        [pair['mathCounter'] for pair in pairs],
+        order_type,
+        amount,
+        depths=[pair[depth_key] for pair in pairs] if depth_key else None,
+    )
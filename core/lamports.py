@@ -0,0 +1,165 @@
+"""
+Integer lamport pricing for bonding curves.
+
+The float helpers in common.py (calculate_next_spot_price, get_sum_of_orders_series, ...)
+evaluate the curves in double precision, e.g. exponential steps as `(delta + 1e4) / 1e4`, and
+drift from the lamport amounts the program works with. The functions here evaluate the same
+formulas on Python integers with truncating integer division (the semantics of Rust u64/u128
+arithmetic), taking delta for exponential curves in basis points of BASE_POINTS:
+
+- Linear:       spot + target_counter * delta
+- Exponential:  spot * (BASE_POINTS + delta)^t // BASE_POINTS^t for t >= 0,
+                spot * BASE_POINTS^|t| // (BASE_POINTS + delta)^|t| for t < 0
+- XYK:          the constant product formula of calculate_next_spot_price, one division at a time
+
+price_ladders_lamports is the batched mode: it shares the power tables between pairs and
+orders, so each exponential price costs one multiply and one divide.
+"""
+from ..common import *
+
+
+def _div(numerator: int, denominator: int) -> int:
+    """Integer division truncating toward zero, like Rust's `/` on integers."""
+    quotient = abs(numerator) // abs(denominator)
+    return quotient if (numerator >= 0) == (denominator > 0) else -quotient
+
+
+class _PowerTable:
+    """Lazily extended table of base**k for one integer base."""
+    __slots__ = ('powers',)
+
+    def __init__(self, base: int):
+        self.powers = [1, base]
+
+    def __getitem__(self, exponent: int) -> int:
+        powers = self.powers
+        while len(powers) <= exponent:
+            powers.append(powers[-1] * powers[1])
+        return powers[exponent]
+
+
+def _exponential_price(spot_price: int, target_counter: int, growth: _PowerTable, base: _PowerTable) -> int:
+    if target_counter >= 0:
+        return _div(spot_price * growth[target_counter], base[target_counter])
+    return _div(spot_price * base[-target_counter], growth[-target_counter])
+
+
+def _xyk_price(order_type, spot_price: int, delta: int, counter: int) -> int:
+    nft_tokens_balance = delta * spot_price
+    counter_updated = counter if order_type == OrderType.Buy else counter - 1
+    current_delta = delta + 1 - counter_updated
+    new_nft_tokens_balance = nft_tokens_balance + _div(counter_updated * nft_tokens_balance, current_delta)
+    return _div(new_nft_tokens_balance, current_delta - 1 if order_type == OrderType.Buy else current_delta + 1)
+
+
+def next_spot_price_lamports(order_type, spot_price: int, delta: int, bonding_curve_type, counter: int) -> int:
+    """
+    Integer counterpart of calculate_next_spot_price.
+
+    :param order_type: OrderType (Buy/Sell)
+    :param spot_price: Current spot price in lamports (int)
+    :param delta: Delta in lamports (Linear), basis points (Exponential) or NFT count (XYK) (int)
+    :param bonding_curve_type: BondingCurveType (Linear/Exponential/XYK)
+    :param counter: Current counter value (int)
+    :return: Next spot price in lamports (int)
+    """
+    target_counter = counter + (1 if order_type == OrderType.Buy else -1)
+    if bonding_curve_type == BondingCurveType.Linear:
+        return spot_price + target_counter * delta
+    if bonding_curve_type == BondingCurveType.Exponential:
+        return _exponential_price(spot_price, target_counter, _PowerTable(BASE_POINTS + delta), _PowerTable(BASE_POINTS))
+    if bonding_curve_type == BondingCurveType.XYK:
+        return _xyk_price(order_type, spot_price, delta, counter)
+    return 0
+
+
+def derive_xyk_base_spot_price_lamports(current_spot_price: int, delta: int, counter: int) -> int:
+    """
+    Integer counterpart of derive_xyk_base_spot_price_from_current_spot_price.
+
+    :param current_spot_price: Current spot price in lamports (int)
+    :param delta: Delta value (int)
+    :param counter: Current counter value (int)
+    :return: Base spot price in lamports (int)
+    """
+    if delta == 0:
+        return current_spot_price
+    corrected_counter = counter - 1
+    delta_corrected = delta - corrected_counter
+    if delta_corrected + 1 == 0:
+        raise ZeroDivisionError("XYK counter is at the curve's pole")
+    # delta + corrected_counter * delta / (delta_corrected + 1) == delta * (delta + 1) / (delta_corrected + 1), so a
+    # single truncating division suffices; truncating that inner quotient first skewed the result by up to 1 / delta
+    return _div(current_spot_price * delta_corrected * (delta_corrected + 1), delta * (delta + 1))
+
+
+def sum_of_orders_series_lamports(amount_of_orders: int, order_type, spot_price: int, delta: int, bonding_curve_type, counter: int) -> int:
+    """
+    Integer counterpart of get_sum_of_orders_series.
+
+    :param amount_of_orders: Number of orders in the series (int)
+    :param order_type: OrderType (Buy/Sell)
+    :param spot_price: Initial spot price in lamports (int)
+    :param delta: Delta value (int)
+    :param bonding_curve_type: BondingCurveType (Linear/Exponential/XYK)
+    :param counter: Initial counter value (int)
+    :return: Sum of the series in lamports (int)
+    """
+    step = 1 if order_type == OrderType.Buy else -1
+    if bonding_curve_type == BondingCurveType.Linear and amount_of_orders > 0:
+        n = amount_of_orders
+        return n * spot_price + delta * (counter * n * (n - 1) // 2 + step * (n - 1) * n * (n + 1) // 6)
+
+    growth, base = _PowerTable(BASE_POINTS + delta), _PowerTable(BASE_POINTS)
+    series_sum = 0
+    current_spot_price = spot_price
+    for _ in range(amount_of_orders):
+        series_sum += current_spot_price
+        if bonding_curve_type == BondingCurveType.Exponential:
+            current_spot_price = _exponential_price(current_spot_price, counter + step, growth, base)
+        else:
+            current_spot_price = next_spot_price_lamports(order_type, current_spot_price, delta, bonding_curve_type, counter)
+        counter += step
+    return series_sum
+
+
+def prices_array_lamports(starting_spot_price: int, delta: int, amount: int, bonding_curve_type, order_type, counter: int) -> dict:
+    """
+    Integer counterpart of calculate_prices_array.
+
+    :return: {'array': prices in lamports (list of int), 'total': their sum (int)}
+    """
+    prices = price_ladders_lamports([(starting_spot_price, delta, bonding_curve_type, counter, order_type)], amount)[0]
+    return {'array': prices, 'total': sum(prices)}
+
+
+def price_ladders_lamports(pairs, amount: int) -> List[List[int]]:
+    """
+    Batched prices_array_lamports for many pairs.
+
+    Power tables are shared between all pairs with the same exponential delta, so a ladder
+    costs one big-int multiply and divide per exponential price.
+
+    :param pairs: (spot price, delta, BondingCurveType, counter, OrderType) per pair (iterable of tuple)
+    :param amount: Number of orders per ladder (int)
+    :return: One list of lamport prices per pair (list of list of int)
+    """
+    base = _PowerTable(BASE_POINTS)
+    growth_tables = {}
+    ladders = []
+    for spot_price, delta, bonding_curve_type, counter, order_type in pairs:
+        step = 1 if order_type == OrderType.Buy else -1
+        order_counter = counter + 1 if order_type == OrderType.Sell else counter
+        if bonding_curve_type == BondingCurveType.Linear:
+            ladder = [spot_price + (order_counter + step * (index + 1)) * delta for index in range(amount)]
+        elif bonding_curve_type == BondingCurveType.Exponential:
+            growth = growth_tables.get(delta)
+            if growth is None:
+                growth = growth_tables[delta] = _PowerTable(BASE_POINTS + delta)
+            ladder = [_exponential_price(spot_price, order_counter + step * (index + 1), growth, base) for index in range(amount)]
+        elif bonding_curve_type == BondingCurveType.XYK:
+            ladder = [_xyk_price(order_type, spot_price, delta, order_counter + step * index) for index in range(amount)]
+        else:
+            ladder = [0] * amount
+        ladders.append(ladder)
+    return ladders
@@ -0,0 +1,345 @@
+"""
+Fixed-offset account layouts and decoders generated from the Hadeswap IDL.
+
+Every Hadeswap account type is fixed size, so each one maps onto a single little-endian
+`struct.Struct`. On first use the IDL `accounts` section is compiled into one decoder
+function per account type that unpacks the whole account in a single call (straight from a
+bytes/memoryview buffer) and returns the same shape as
+`anchor_raw_BNs_and_pubkeys_to_nums_and_strings`: camelCase keys, integers as ints, pubkeys as
+base58 strings and enums as their camelCase variant names.
+"""
+import hashlib
+import struct
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from ..common import *
+
+ACCOUNT_DISCRIMINATOR_SIZE = 8
+
+_PRIMITIVE_FORMATS = {
+    'bool': '?',
+    'u8': 'B',
+    'i8': 'b',
+    'u16': 'H',
+    'i16': 'h',
+    'u32': 'I',
+    'i32': 'i',
+    'u64': 'Q',
+    'i64': 'q',
+    'u128': '16s',
+    'i128': '16s',
+    'publicKey': '32s',
+}
+
+
+@dataclass(frozen=True)
+class FieldLayout:
+    """Position of one account field; offsets are absolute, i.e. include the discriminator."""
+    name: str
+    offset: int
+    size: int
+    idl_type: object
+    fields: dict = field(default_factory=dict)
+
+
+class AccountLayout:
+    """
+    Byte layout and generated decoder of one Hadeswap account type.
+
+    Attributes:
+        name (str): IDL account name, e.g. 'nftSwapPair'.
+        discriminator (bytes): Anchor 8-byte account discriminator.
+        size (int): Account data size in bytes, discriminator included.
+        fields (dict): Field name -> FieldLayout, in IDL order.
+        source (str): Generated Python source of the decoder.
+    """
+    def __init__(self, name, discriminator, size, fields, source, decode):
+        self.name = name
+        self.discriminator = discriminator
+        self.size = size
+        self.fields = fields
+        self.source = source
+        self.decode = decode
+
+    def __repr__(self):
+        return f'AccountLayout({self.name!r}, size={self.size})'
+
+    def field(self, path: str) -> FieldLayout:
+        """
+        Look up a field, nested struct fields by dotted path (e.g. 'bondingCurve.delta').
+
+        :param path: Field name or dotted path (str)
+        :return: The field layout, with its absolute offset (FieldLayout)
+        """
+        fields = self.fields
+        field_layout = None
+        for name in path.split('.'):
+            if name not in fields:
+                raise ValueError(f"{self.name} has no field {path!r}")
+            field_layout = fields[name]
+            fields = field_layout.fields
+        return field_layout
+
+
+def account_discriminator(account_name: str) -> bytes:
+    """
+    Compute the Anchor discriminator of an account type.
+
+    :param account_name: IDL account name, e.g. 'nftSwapPair' (str)
+    :return: First 8 bytes of sha256('account:<PascalCaseName>') (bytes)
+    """
+    pascal_name = account_name[0].upper() + account_name[1:]
+    return hashlib.sha256(f'account:{pascal_name}'.encode(ENCODER)).digest()[:ACCOUNT_DISCRIMINATOR_SIZE]
+
+
+def idl_enum_variant_name(variant_name: str) -> str:
+    """Convert an IDL enum variant name to the camelCase form used by Anchor clients ('XYK' -> 'xyk')."""
+    if variant_name.isupper():
+        return variant_name.lower()
+    return variant_name[0].lower() + variant_name[1:]
+
+
+@lru_cache(maxsize=65536)
+def pubkey_bytes_to_base58(raw_pubkey: bytes) -> str:
+    """Base58-encode a raw 32-byte pubkey; cached because market/pair keys repeat across accounts."""
+    return str(Pubkey.from_bytes(raw_pubkey))
+
+
+@lru_cache(maxsize=1)
+def get_account_layouts() -> dict:
+    """
+    Compile the layouts and decoders of every account type in the Hadeswap IDL.
+
+    :return: IDL account name -> AccountLayout (dict)
+    """
+    idl = load_idl()
+    types = {idl_type['name']: idl_type['type'] for idl_type in idl.get('types', [])}
+    return {
+        account['name']: _compile_account_layout(account['name'], account['type']['fields'], types)
+        for account in idl['accounts']
+    }
+
+
+def get_account_layout(account_id: str) -> AccountLayout:
+    """
+    Return the layout of a single account type.
+
+    :param account_id: IDL account name, e.g. 'nftPairBox' (str)
+    :return: The account layout (AccountLayout)
+    """
+    layouts = get_account_layouts()
+    if account_id not in layouts:
+        raise ValueError(f"Unknown Hadeswap account type: {account_id}")
+    return layouts[account_id]
+
+
+def decode_account(account_id: str, data: bytes, public_key: str) -> dict:
+    """
+    Decode raw account data after checking its discriminator.
+
+    :param account_id: IDL account name (str)
+    :param data: Raw account data including the discriminator (bytes)
+    :param public_key: Base58 address of the account (str)
+    :return: Decoded account (dict)
+    """
+    layout = get_account_layout(account_id)
+    if bytes(data[:ACCOUNT_DISCRIMINATOR_SIZE]) != layout.discriminator:
+        raise ValueError(f"Account {public_key} is not a {account_id} account")
+    return layout.decode(data, public_key)
+
+
+class AccountProjection:
+    """
+    Decoder for a subset of an account's fields, reading only the byte range that covers them.
+
+    Attributes:
+        name (str): IDL account name.
+        fields (tuple): Projected field names.
+        offset (int): Absolute offset of the covered byte range, for dataSlice.
+        length (int): Length of the covered byte range, for dataSlice.
+        source (str): Generated Python source of the decoder.
+    """
+    def __init__(self, name, fields, offset, length, source, decode):
+        self.name = name
+        self.fields = fields
+        self.offset = offset
+        self.length = length
+        self.source = source
+        self.decode = decode
+
+    def __repr__(self):
+        return f'AccountProjection({self.name!r}, {self.fields!r}, offset={self.offset}, length={self.length})'
+
+
+@lru_cache(maxsize=256)
+def get_account_projection(account_id: str, fields: Tuple[str, ...]) -> AccountProjection:
+    """
+    Compile a decoder for some top-level fields of an account type.
+
+    The decoder takes the data of the covered byte range only (as returned for a dataSlice of
+    `offset`/`length`) and returns the projected fields plus 'publicKey'.
+
+    :param account_id: IDL account name, e.g. 'nftSwapPair' (str)
+    :param fields: Top-level field names (tuple of str)
+    :return: The projection (AccountProjection)
+    """
+    layout = get_account_layout(account_id)
+    if not fields:
+        raise ValueError('A projection needs at least one field')
+    field_layouts = sorted((layout.field(name) for name in fields), key=lambda field_layout: field_layout.offset)
+    for field_layout in field_layouts:
+        if field_layout.name not in layout.fields:
+            raise ValueError(f'Only top-level fields can be projected, not {field_layout.name!r}')
+
+    types = {idl_type['name']: idl_type['type'] for idl_type in load_idl().get('types', [])}
+    builder = _DecoderBuilder(types)
+    start = field_layouts[0].offset
+    position = start
+    items = []
+    for field_layout in field_layouts:
+        if field_layout.offset > position:
+            builder.pad(field_layout.offset - position)
+        expression, size, _ = builder.add(field_layout.idl_type, field_layout.offset)
+        items.append(f'{field_layout.name!r}: {expression}')
+        position = field_layout.offset + size
+    unpacker = struct.Struct('<' + ''.join(builder.formats))
+    builder.namespace['_unpack_from'] = unpacker.unpack_from
+
+    items.append("'publicKey': public_key")
+    source = (
+        f'def decode_{account_id}_projection(data, public_key):\n'
+        f'    v = _unpack_from(data, 0)\n'
+        f"    return {{{', '.join(items)}}}\n"
+    )
+    exec(compile(source, f'<hadeswap projection {account_id}>', 'exec'), builder.namespace)
+
+    return AccountProjection(
+        name=account_id,
+        fields=tuple(field_layout.name for field_layout in field_layouts),
+        offset=start,
+        length=position - start,
+        source=source,
+        decode=builder.namespace[f'decode_{account_id}_projection'],
+    )
+
+
+def encode_account_field(account_id: str, path: str, value) -> Tuple[int, bytes]:
+    """
+    Encode a field value the way it is stored in the account, e.g. for memcmp filters.
+
+    :param account_id: IDL account name (str)
+    :param path: Field name or dotted path (str)
+    :param value: Pubkey (Pubkey or base58 str), integer, bool or enum variant name as decoded (e.g. 'nftForToken')
+    :return: Absolute offset of the field and its bytes (tuple)
+    """
+    field_layout = get_account_layout(account_id).field(path)
+    idl_type = field_layout.idl_type
+    if isinstance(idl_type, str) and idl_type == 'publicKey':
+        encoded = bytes(value if isinstance(value, Pubkey) else Pubkey.from_string(str(value)))
+    elif isinstance(idl_type, str) and idl_type in _PRIMITIVE_FORMATS:
+        if idl_type in ('u128', 'i128'):
+            encoded = int(value).to_bytes(16, 'little', signed=idl_type == 'i128')
+        else:
+            encoded = struct.pack('<' + _PRIMITIVE_FORMATS[idl_type], value)
+    elif isinstance(idl_type, dict) and 'defined' in idl_type and not field_layout.fields:
+        types = {idl_type_entry['name']: idl_type_entry['type'] for idl_type_entry in load_idl().get('types', [])}
+        variants = [idl_enum_variant_name(variant['name']) for variant in types[idl_type['defined']]['variants']]
+        if value not in variants:
+            raise ValueError(f"{value!r} is not a {idl_type['defined']} variant, expected one of {variants}")
+        encoded = bytes([variants.index(value)])
+    else:
+        raise ValueError(f"{account_id}.{path} is not a single value; filter on one of its fields instead")
+    return field_layout.offset, encoded
+
+
+class _DecoderBuilder:
+    """Accumulates struct format codes and the matching Python expressions for one account."""
+    def __init__(self, types):
+        self.types = types
+        self.formats = []
+        self.values = 0
+        self.namespace = {'_pk': pubkey_bytes_to_base58}
+
+    def add(self, idl_type, offset):
+        """Register one value; returns (python expression, size in bytes, nested FieldLayouts)."""
+        if isinstance(idl_type, str):
+            if idl_type not in _PRIMITIVE_FORMATS:
+                raise ValueError(f"IDL type {idl_type!r} is not fixed size")
+            slot = self._slot(_PRIMITIVE_FORMATS[idl_type])
+            size = struct.calcsize('<' + _PRIMITIVE_FORMATS[idl_type])
+            if idl_type == 'publicKey':
+                return f'_pk({slot})', size, {}
+            if idl_type in ('u128', 'i128'):
+                return f"int.from_bytes({slot}, 'little', signed={idl_type == 'i128'})", size, {}
+            return slot, size, {}
+
+        if 'array' in idl_type:
+            item_type, length = idl_type['array']
+            if item_type == 'u8':
+                return f'list({self._slot(f"{length}s")})', length, {}
+            items = []
+            item_offset = offset
+            for _ in range(length):
+                item_expression, item_size, _ = self.add(item_type, item_offset)
+                items.append(item_expression)
+                item_offset += item_size
+            return '[' + ', '.join(items) + ']', item_offset - offset, {}
+
+        if 'defined' in idl_type:
+            defined = self.types[idl_type['defined']]
+            if defined['kind'] == 'enum':
+                if any('fields' in variant for variant in defined['variants']):
+                    raise ValueError(f"IDL enum {idl_type['defined']!r} carries data and is not fixed size")
+                variants_name = f"_enum_{idl_type['defined']}"
+                self.namespace[variants_name] = tuple(
+                    idl_enum_variant_name(variant['name']) for variant in defined['variants']
+                )
+                return f'{variants_name}[{self._slot("B")}]', 1, {}
+            return self.add_struct(defined['fields'], offset)
+
+        raise ValueError(f"IDL type {idl_type!r} is not fixed size")
+
+    def add_struct(self, fields, offset):
+        expressions = []
+        layouts = {}
+        size = 0
+        for idl_field in fields:
+            expression, field_size, nested = self.add(idl_field['type'], offset + size)
+            expressions.append(f"{idl_field['name']!r}: {expression}")
+            layouts[idl_field['name']] = FieldLayout(idl_field['name'], offset + size, field_size, idl_field['type'], nested)
+            size += field_size
+        return '{' + ', '.join(expressions) + '}', size, layouts
+
+    def pad(self, size):
+        """Skip bytes that are not decoded."""
+        self.formats.append(f'{size}x')
+
+    def _slot(self, struct_format):
+        self.formats.append(struct_format)
+        self.values += 1
+        return f'v[{self.values - 1}]'
+
+
+def _compile_account_layout(account_name, fields, types):
+    builder = _DecoderBuilder(types)
+    expression, size, field_layouts = builder.add_struct(fields, ACCOUNT_DISCRIMINATOR_SIZE)
+    unpacker = struct.Struct('<' + ''.join(builder.formats))
+    builder.namespace['_unpack_from'] = unpacker.unpack_from
+
+    items = [expression[1:-1], "'publicKey': public_key"] if field_layouts else ["'publicKey': public_key"]
+    source = (
+        f'def decode_{account_name}(data, public_key):\n'
+        f'    v = _unpack_from(data, {ACCOUNT_DISCRIMINATOR_SIZE})\n'
+        f"    return {{{', '.join(items)}}}\n"
+    )
+    exec(compile(source, f'<hadeswap decoder {account_name}>', 'exec'), builder.namespace)
+
+    return AccountLayout(
+        name=account_name,
+        discriminator=account_discriminator(account_name),
+        size=ACCOUNT_DISCRIMINATOR_SIZE + size,
+        fields=field_layouts,
+        source=source,
+        decode=builder.namespace[f'decode_{account_name}'],
+    )
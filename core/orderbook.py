@@ -0,0 +1,212 @@
+"""
+Incrementally maintained order-book depth of one hadoMarket.
+
+MarketOrderBook keeps, per price level, how many NFTs are bid (users can sell) and asked (users
+can buy) across all pairs of a market, plus each pair's own ladder. When one nftSwapPair changes,
+only that pair's old ladder is subtracted and its new one added, so an update costs O(levels of
+one pair) instead of rescanning the market and calling calculate_prices_array for every pair.
+The depth arrays stay sorted (bisect insert and remove), and an update only rewrites their
+cumulative quantities from the first price level it changed onward.
+
+It plugs straight into on_accounts_change:
+
+    book = MarketOrderBook.from_pairs(hado_market, await get_hado_market_pairs(program_id, connection, hado_market))
+    await on_accounts_change(program_id, 5, None, connection, book.on_accounts_change_callback)
+"""
+from bisect import bisect_left
+from collections import Counter
+
+from ..common import *
+from .quotes import is_buy_side_pair, is_sell_side_pair, pair_buy_price, pair_sell_price
+
+# Orders per pair and side kept in the book
+DEFAULT_DEPTH_LEVELS = 50
+
+
+def pair_bid_ladder(pair: dict, levels: int) -> List[float]:
+    """
+    Prices a pair pays for the next NFTs sold to it, as far as its buy orders and funds go.
+
+    :param pair: Decoded nftSwapPair account (dict)
+    :param levels: Maximum number of orders (int)
+    :return: Non-increasing bid prices (list of float)
+    """
+    ladder = []
+    funds = pair['fundsSolOrTokenBalance']
+    for unit in range(min(levels, pair['buyOrdersQuantity'])):
+        price = pair_sell_price(pair, unit)
+        if price <= 0 or price > funds:
+            break
+        funds -= price
+        ladder.append(price)
+    return ladder
+
+
+def pair_ask_ladder(pair: dict, levels: int) -> List[float]:
+    """
+    Prices of the next NFTs bought from a pair, as far as its NFTs go.
+
+    :param pair: Decoded nftSwapPair account (dict)
+    :param levels: Maximum number of orders (int)
+    :return: Non-decreasing ask prices (list of float)
+    """
+    return [pair_buy_price(pair, unit) for unit in range(min(levels, pair['nftsCount']))]
+
+
+class _DepthSide:
+    """Price levels of one book side, best price first, with their cumulative quantities kept in place."""
+    __slots__ = ('descending', 'keys', 'levels')
+
+    def __init__(self, descending: bool):
+        self.descending = descending
+        # Ascending sort keys for bisect: -price for bids, price for asks
+        self.keys = []
+        # (price, quantity, cumulative quantity) per level, best price first
+        self.levels = []
+
+    def apply(self, deltas: dict):
+        """Add order count deltas per price, then rewrite the cumulative quantities from the first changed level."""
+        keys, levels = self.keys, self.levels
+        first = len(levels)
+        for price, delta in deltas.items():
+            if not delta:
+                continue
+            key = -price if self.descending else price
+            index = bisect_left(keys, key)
+            if index < len(keys) and keys[index] == key:
+                quantity = levels[index][1] + delta
+                if quantity:
+                    levels[index] = (price, quantity, 0)
+                else:
+                    del keys[index]
+                    del levels[index]
+            else:
+                keys.insert(index, key)
+                levels.insert(index, (price, delta, 0))
+            first = min(first, index)
+
+        cumulative = levels[first - 1][2] if first else 0
+        for index in range(first, len(levels)):
+            price, quantity, _ = levels[index]
+            cumulative += quantity
+            levels[index] = (price, quantity, cumulative)
+
+
+def _ladder_deltas(old: List[float], new: List[float]) -> Counter:
+    deltas = Counter(new)
+    deltas.subtract(old)
+    return deltas
+
+
+class MarketOrderBook:
+    """
+    Bid and ask depth of one hadoMarket, updated one pair at a time.
+
+    Attributes:
+        hado_market (str): Market public key.
+        levels (int): Orders per pair and side kept in the book.
+        ladders (dict): Pair public key -> (bid ladder, ask ladder) currently counted in the book.
+    """
+    __slots__ = ('hado_market', 'levels', 'ladders', '_bids', '_asks')
+
+    def __init__(self, hado_market, levels: int = DEFAULT_DEPTH_LEVELS):
+        self.hado_market = str(hado_market)
+        self.levels = levels
+        self.ladders = {}
+        self._bids = _DepthSide(descending=True)
+        self._asks = _DepthSide(descending=False)
+
+    @classmethod
+    def from_pairs(cls, hado_market, pairs: List[dict], levels: int = DEFAULT_DEPTH_LEVELS) -> "MarketOrderBook":
+        """
+        Build the book from decoded nftSwapPair accounts; pairs of other markets are ignored.
+
+        :param hado_market: Market public key (Pubkey or str)
+        :param pairs: Decoded nftSwapPair accounts (list of dict)
+        :param levels: Orders per pair and side kept in the book (int)
+        :return: The order book (MarketOrderBook)
+        """
+        book = cls(hado_market, levels)
+        for pair in pairs:
+            book.update_pair(pair)
+        return book
+
+    def remove_pair(self, public_key) -> bool:
+        """
+        Take a pair's orders out of the book.
+
+        :param public_key: Pair public key (Pubkey or str)
+        :return: Whether the pair was in the book (bool)
+        """
+        ladders = self.ladders.pop(str(public_key), None)
+        if ladders is None:
+            return False
+        self._bids.apply(_ladder_deltas(ladders[0], []))
+        self._asks.apply(_ladder_deltas(ladders[1], []))
+        return True
+
+    def update_pair(self, pair: dict) -> bool:
+        """
+        Replace a pair's contribution with the ladders of its new state.
+
+        Pairs of other markets, or no longer trading, are removed.
+
+        :param pair: Decoded nftSwapPair account (dict)
+        :return: Whether the book changed (bool)
+        """
+        if pair['hadoMarket'] != self.hado_market:
+            return self.remove_pair(pair['publicKey'])
+        bids = pair_bid_ladder(pair, self.levels) if is_buy_side_pair(pair) else []
+        asks = pair_ask_ladder(pair, self.levels) if is_sell_side_pair(pair) else []
+        old_bids, old_asks = self.ladders.get(pair['publicKey'], ([], []))
+        if (old_bids, old_asks) == (bids, asks):
+            return False
+        if bids or asks:
+            self.ladders[pair['publicKey']] = (bids, asks)
+        else:
+            del self.ladders[pair['publicKey']]
+        self._bids.apply(_ladder_deltas(old_bids, bids))
+        self._asks.apply(_ladder_deltas(old_asks, asks))
+        return True
+
+    def apply_changes(self, changes: dict) -> int:
+        """
+        Apply the changed accounts reported by an on_accounts_change parser.
+
+        Entries holding only 'publicKey', under any result key (close_virtual_nft_swap_pair_parser
+        reports closed pairs under 'nftPairBoxes'), remove that pair from the book.
+
+        :param changes: Parser result; its 'nftSwapPairs' and publicKey-only entries are used (dict)
+        :return: Number of pairs that changed the book (int)
+        """
+        changed = 0
+        for result_key, accounts in changes.items():
+            for account in accounts:
+                if account.keys() == {'publicKey'}:
+                    changed += self.remove_pair(account['publicKey'])
+                elif result_key == 'nftSwapPairs':
+                    changed += self.update_pair(account)
+        return changed
+
+    async def on_accounts_change_callback(self, changes: dict, instruction_log: str):
+        """Callback for on_accounts_change keeping the book up to date."""
+        self.apply_changes(changes)
+
+    def depth(self) -> dict:
+        """
+        Aggregated depth, best price first.
+
+        :return: {'bids': [(price, quantity, cumulative quantity)], 'asks': [...]}; the lists are the book's own,
+            kept up to date in place, and must not be modified (dict)
+        """
+        return {'bids': self._bids.levels, 'asks': self._asks.levels}
+
+    def best_bid(self):
+        """Highest bid in the book, None if there is none."""
+        bids = self._bids.levels
+        return bids[0][0] if bids else None
+
+    def best_ask(self):
+        """Lowest ask in the book, None if there is none."""
+        asks = self._asks.levels
+        return asks[0][0] if asks else None
@@ -0,0 +1,300 @@
+"""
+Market-wide quotes across all pairs of a hadoMarket.
+
+quote_buy_from_pairs answers "what does it cost to buy N NFTs right now": it merges the
+bonding curves of every sell-side pair with a heap-based k-way merge and returns the cheapest
+fill plan, i.e. which pair supplies which unit at what price, in O(N log P) for N units over
+P pairs. Each pair's price after k units is one O(1) calculate_next_spot_price call, so no
+full ladder is ever materialized.
+
+quote_sell_to_pairs is the mirror image for liquidating an inventory: a max-heap over the bids
+of every bid-side pair, capped by each pair's buyOrdersQuantity and fundsSolOrTokenBalance.
+"""
+import heapq
+
+from ..common import *
+from .accounts import get_hado_market_pairs
+
+# Pair states in which a pair trades with users
+ON_MARKET_PAIR_STATES = ('onMarketVirtual', 'onMarketTokenized')
+
+# Pair types that hold NFTs for sale (users buy from them)
+SELL_SIDE_PAIR_TYPES = (PairType.NftForToken, PairType.LiquidityProvision)
+
+# Pair types that bid for NFTs (users sell to them)
+BUY_SIDE_PAIR_TYPES = (PairType.TokenForNFT, PairType.LiquidityProvision)
+
+
+def is_sell_side_pair(pair: dict, hado_market: Optional[str] = None) -> bool:
+    """
+    Whether users can buy NFTs from a decoded nftSwapPair right now.
+
+    :param pair: Decoded nftSwapPair account (dict)
+    :param hado_market: Only accept pairs of this market (optional, str)
+    :return: True for on-market NftForToken/LiquidityProvision pairs holding NFTs (bool)
+    """
+    return (
+        pair['pairType'] in SELL_SIDE_PAIR_TYPES
+        and pair['pairState'] in ON_MARKET_PAIR_STATES
+        and pair['nftsCount'] > 0
+        and (hado_market is None or pair['hadoMarket'] == str(hado_market))
+    )
+
+
+def pair_buy_price(pair: dict, units_bought: int):
+    """
+    Price of the next NFT bought from a pair after `units_bought` NFTs were already bought from it.
+
+    :param pair: Decoded nftSwapPair account (dict)
+    :param units_bought: NFTs already taken from the pair in this plan (int)
+    :return: Price in lamports (float)
+    """
+    return calculate_next_spot_price(
+        order_type=OrderType.Buy,
+        spot_price=pair['baseSpotPrice'],
+        delta=pair['bondingCurve']['delta'],
+        bonding_curve_type=pair['bondingCurve']['bondingType'],
+        counter=pair['mathCounter'] + units_bought,
+    )
+
+
+def is_buy_side_pair(pair: dict, hado_market: Optional[str] = None) -> bool:
+    """
+    Whether users can sell NFTs to a decoded nftSwapPair right now.
+
+    :param pair: Decoded nftSwapPair account (dict)
+    :param hado_market: Only accept pairs of this market (optional, str)
+    :return: True for on-market TokenForNFT/LiquidityProvision pairs with open buy orders (bool)
+    """
+    return (
+        pair['pairType'] in BUY_SIDE_PAIR_TYPES
+        and pair['pairState'] in ON_MARKET_PAIR_STATES
+        and pair['buyOrdersQuantity'] > 0
+        and (hado_market is None or pair['hadoMarket'] == str(hado_market))
+    )
+
+
+def pair_sell_price(pair: dict, units_sold: int):
+    """
+    Price a pair pays for the next NFT after `units_sold` NFTs were already sold to it.
+
+    :param pair: Decoded nftSwapPair account (dict)
+    :param units_sold: NFTs already sold to the pair in this plan (int)
+    :return: Price in lamports (float)
+    """
+    return calculate_next_spot_price(
+        order_type=OrderType.Sell,
+        spot_price=pair['baseSpotPrice'],
+        delta=pair['bondingCurve']['delta'],
+        bonding_curve_type=pair['bondingCurve']['bondingType'],
+        counter=pair['mathCounter'] + 1 - units_sold,
+    )
+
+
+def quote_buy_from_pairs(pairs: List[dict], amount: int, hado_market: Optional[str] = None, budget=None) -> dict:
+    """
+    Cheapest plan to buy `amount` NFTs from a set of pairs.
+
+    Every pair's buy ladder is non-decreasing, so repeatedly taking the cheapest head of all
+    ladders from a min-heap yields the optimal plan. Ties go to the pair listed first.
+
+    :param pairs: Decoded nftSwapPair accounts; pairs users cannot buy from are skipped (list of dict)
+    :param amount: Number of NFTs to buy (int)
+    :param hado_market: Only use pairs of this market (optional, str)
+    :param budget: Stop before the total would exceed this; cheapest-first also maximizes the count bought (optional, float)
+    :return: {
+        'fills': [{'pair', 'unit', 'price'}] in execution order (list of dict),
+        'byPair': pair -> {'amount', 'total', 'maxPrice'} (dict),
+        'filled': number of NFTs the market can supply, at most `amount` (int),
+        'total': sum of all fill prices (float),
+    }
+    """
+    eligible = [pair for pair in pairs if is_sell_side_pair(pair, hado_market)]
+    heap = [(pair_buy_price(pair, 0), index, 0) for index, pair in enumerate(eligible)]
+    heapq.heapify(heap)
+
+    fills = []
+    by_pair = {}
+    total = 0
+    while heap and len(fills) < amount:
+        price, index, unit = heap[0]
+        if budget is not None and total + price > budget:
+            break
+        pair = eligible[index]
+        fills.append({'pair': pair['publicKey'], 'unit': unit, 'price': price})
+        total += price
+
+        pair_fills = by_pair.setdefault(pair['publicKey'], {'amount': 0, 'total': 0, 'maxPrice': price})
+        pair_fills['amount'] += 1
+        pair_fills['total'] += price
+        pair_fills['maxPrice'] = price
+
+        if unit + 1 < pair['nftsCount']:
+            heapq.heapreplace(heap, (pair_buy_price(pair, unit + 1), index, unit + 1))
+        else:
+            heapq.heappop(heap)
+
+    return {'fills': fills, 'byPair': by_pair, 'filled': len(fills), 'total': total}
+
+
+async def quote_buy_from_market(program_id: Pubkey, connection: Client, hado_market: Pubkey, amount: int) -> dict:
+    """
+    Fetch the nftSwapPairs of one hadoMarket and quote buying `amount` NFTs from it.
+
+    :param program_id: Hadeswap program public key (Pubkey)
+    :param connection: Solana RPC connection (Client)
+    :param hado_market: Market public key (Pubkey)
+    :param amount: Number of NFTs to buy (int)
+    :return: Same as quote_buy_from_pairs (dict)
+    """
+    pairs = await get_hado_market_pairs(program_id, connection, hado_market)
+    return quote_buy_from_pairs(pairs, amount, str(hado_market))
+
+
+def quote_sell_to_pairs(pairs: List[dict], amount: int, hado_market: Optional[str] = None, target=None) -> dict:
+    """
+    Best plan to sell `amount` NFTs to a set of pairs.
+
+    Every pair's bid ladder is non-increasing, so repeatedly taking the highest head of all
+    ladders from a max-heap yields the plan with the highest proceeds. A pair takes NFTs while
+    it has buy orders left and its funds cover the next bid. Ties go to the pair listed first.
+
+    :param pairs: Decoded nftSwapPair accounts; pairs users cannot sell to are skipped (list of dict)
+    :param amount: Number of NFTs to sell (int)
+    :param hado_market: Only use pairs of this market (optional, str)
+    :param target: Stop once the total reaches this; highest-first also minimizes the count sold (optional, float)
+    :return: Same shape as quote_buy_from_pairs, with 'byPair' holding 'minPrice' instead of 'maxPrice'
+        and 'filled' being the number of NFTs the market can absorb (dict)
+    """
+    eligible = [pair for pair in pairs if is_buy_side_pair(pair, hado_market)]
+    heap = [(-pair_sell_price(pair, 0), index, 0) for index, pair in enumerate(eligible)]
+    heapq.heapify(heap)
+    spent = [0] * len(eligible)
+
+    fills = []
+    by_pair = {}
+    total = 0
+    while heap and len(fills) < amount and (target is None or total < target):
+        price, index, unit = heapq.heappop(heap)
+        price = -price
+        pair = eligible[index]
+        if price <= 0 or spent[index] + price > pair['fundsSolOrTokenBalance']:
+            continue
+        spent[index] += price
+        fills.append({'pair': pair['publicKey'], 'unit': unit, 'price': price})
+        total += price
+
+        pair_fills = by_pair.setdefault(pair['publicKey'], {'amount': 0, 'total': 0, 'minPrice': price})
+        pair_fills['amount'] += 1
+        pair_fills['total'] += price
+        pair_fills['minPrice'] = price
+
+        if unit + 1 < pair['buyOrdersQuantity']:
+            heapq.heappush(heap, (-pair_sell_price(pair, unit + 1), index, unit + 1))
+
+    return {'fills': fills, 'byPair': by_pair, 'filled': len(fills), 'total': total}
+
+
+def quote_buy_for_budget(pairs: List[dict], budget, hado_market: Optional[str] = None) -> dict:
+    """
+    How many NFTs a budget buys across a set of pairs, and from which pairs.
+
+    :param pairs: Decoded nftSwapPair accounts (list of dict)
+    :param budget: Amount to spend in lamports (float)
+    :param hado_market: Only use pairs of this market (optional, str)
+    :return: Same as quote_buy_from_pairs; 'filled' is the maximal quantity (dict)
+    """
+    supply = sum(pair['nftsCount'] for pair in pairs if is_sell_side_pair(pair, hado_market))
+    return quote_buy_from_pairs(pairs, supply, hado_market, budget=budget)
+
+
+def quote_sell_for_target(pairs: List[dict], target, hado_market: Optional[str] = None) -> dict:
+    """
+    How many NFTs must be sold to a set of pairs to raise a target amount, and to which pairs.
+
+    :param pairs: Decoded nftSwapPair accounts (list of dict)
+    :param target: Amount to raise in lamports (float)
+    :param hado_market: Only use pairs of this market (optional, str)
+    :return: Same as quote_sell_to_pairs; 'filled' is the minimal quantity, and 'total' stays below
+        `target` when the market's bids cannot raise it (dict)
+    """
+    demand = sum(pair['buyOrdersQuantity'] for pair in pairs if is_buy_side_pair(pair, hado_market))
+    return quote_sell_to_pairs(pairs, demand, hado_market, target=target)
+
+
+async def quote_sell_to_market(program_id: Pubkey, connection: Client, hado_market: Pubkey, amount: int) -> dict:
+    """
+    Fetch the nftSwapPairs of one hadoMarket and quote selling `amount` NFTs to it.
+
+    :param program_id: Hadeswap program public key (Pubkey)
+    :param connection: Solana RPC connection (Client)
+    :param hado_market: Market public key (Pubkey)
+    :param amount: Number of NFTs to sell (int)
+    :return: Same as quote_sell_to_pairs (dict)
+    """
+    pairs = await get_hado_market_pairs(program_id, connection, hado_market)
+    return quote_sell_to_pairs(pairs, amount, str(hado_market))
+
+
+def assign_nft_pair_boxes(quote: dict, pairs: List[dict], nft_pair_boxes: List[dict]) -> List[dict]:
+    """
+    Turn a buy quote into per-NFT fills by picking an active nftPairBox of each pair for every unit.
+
+    :param quote: Result of quote_buy_from_pairs (dict)
+    :param pairs: Decoded nftSwapPair accounts the quote was made from (list of dict)
+    :param nft_pair_boxes: Decoded nftPairBox accounts of those pairs (list of dict)
+    :return: {'pair', 'nftPairBox', 'nftMint', 'vaultNftTokenAccount', 'assetReceiver', 'price'} per fill,
+        as taken by router.sweep_buy_from_pairs; fills without an available box are dropped (list of dict)
+    """
+    pairs_by_key = {pair['publicKey']: pair for pair in pairs}
+    boxes_by_pair = {}
+    for box in nft_pair_boxes:
+        if box['status'] == 'active':
+            boxes_by_pair.setdefault(box['pair'], []).append(box)
+
+    fills = []
+    for fill in quote['fills']:
+        boxes = boxes_by_pair.get(fill['pair'])
+        if not boxes:
+            continue
+        box = boxes.pop()
+        fills.append({
+            'pair': fill['pair'],
+            'nftPairBox': box['publicKey'],
+            'nftMint': box['nftMint'],
+            'vaultNftTokenAccount': box['vaultTokenAccount'],
+            'assetReceiver': pairs_by_key[fill['pair']]['assetReceiver'],
+            'price': fill['price'],
+        })
+    return fills
+
+
+def assign_nfts_to_bids(quote: dict, pairs: List[dict], nfts: List[dict], validation_adapters: Optional[dict] = None) -> List[dict]:
+    """
+    Turn a sell quote into per-NFT fills by handing out the inventory, in order, to the best bids.
+
+    :param quote: Result of quote_sell_to_pairs (dict)
+    :param pairs: Decoded nftSwapPair accounts the quote was made from (list of dict)
+    :param nfts: NFTs to sell: {'nftMint'} plus optional per-NFT 'proof' (list of dict)
+    :param validation_adapters: Pair public key -> its nftValidationAdapter, or a dict {'nftValidationAdapter',
+        'nftValidationAdapterV2'} for pairs with both (optional, dict)
+    :return: {'pair', 'pairType', 'nftMint', 'assetReceiver', 'price', ...} per fill, plus the pair's
+        'nftValidationAdapter' (and 'nftValidationAdapterV2') from `validation_adapters`, as taken by
+        router.sweep_sell_to_pairs; extra NFT keys are kept (list of dict)
+    """
+    pairs_by_key = {pair['publicKey']: pair for pair in pairs}
+    fills = []
+    for fill, nft in zip(quote['fills'], nfts):
+        pair = pairs_by_key[fill['pair']]
+        adapters = (validation_adapters or {}).get(str(fill['pair']))
+        if adapters is not None and not isinstance(adapters, dict):
+            adapters = {'nftValidationAdapter': adapters}
+        fills.append({
+            **nft,
+            'pair': fill['pair'],
+            'pairType': pair['pairType'],
+            'assetReceiver': pair['assetReceiver'],
+            'price': fill['price'],
+            **(adapters or {}),
+        })
+    return fills
@@ -1,77 +1,41 @@
+import math
+
+from solders.compute_budget import set_compute_unit_limit
+
 from ..common import *
+from .instructions import get_instruction_encoder
+
+# Legacy transaction size limit in bytes, and the compute budget a transaction may request
+MAX_TRANSACTION_SIZE = 1232
+MAX_TRANSACTION_COMPUTE_UNITS = 1_400_000
+
+# Compute units budgeted per buyNftFromPair/sell instruction (pNFT transfers with royalties are the expensive case)
+BUY_NFT_COMPUTE_UNITS = 250_000
+SELL_NFT_COMPUTE_UNITS = 250_000
 
 
 async def buy_nft_from_pair(program_id: Pubkey,connection: Client,args: dict,accounts: dict,send_txn):
-    program = return_anchor_program(program_id, connection)
     instructions = []
 
-    # Finding program addresses
-    sol_funds_vault, _ = await Pubkey.find_program_address(
-        [ENCODER.encode(SOL_FUNDS_PREFIX), accounts['pair']], program_id
-    )
-    nfts_owner, _ = await Pubkey.find_program_address(
-        [ENCODER.encode(NFTS_OWNER_PREFIX), accounts['pair']], program_id
-    )
-    fee_sol_vault, _ = await Pubkey.find_program_address(
-        [ENCODER.encode(FEE_PREFIX), accounts['pair']], program_id
-    )
-
-    # Finding associated token addresses and PDAs
-    user_nft_token_account = await find_associated_token_address(accounts['userPubkey'], accounts['nftMint'])
-    owner_token_record = find_token_record_pda(accounts['nftMint'], accounts['vaultNftTokenAccount'])
-    dest_token_record = find_token_record_pda(accounts['nftMint'], user_nft_token_account)
-    edition_info = get_metaplex_edition_pda(accounts['nftMint'])
-    metadata_info = get_metaplex_metadata(accounts['nftMint'])
-    metadata_account = await Metadata.from_account_address(connection, metadata_info)
+    # Pair vaults and per-mint addresses, memoized on the pair's address book
+    book = resolve_pair_address_book(accounts['pair'], program_id, accounts.get('addressBook'))
+    metadata_info = book.metadata(accounts['nftMint'])
+    metadata_account, = await Metadata.from_account_addresses(connection, [metadata_info])
 
     # Determining the rule set
     rule_set = METADATA_PROGRAM_PUBKEY
     if args.get('pnft'):
         if args['pnft'].get('payerRuleSet') and args['pnft'].get('nameForRuleSet'):
             rule_set = await find_rule_set_pda(args['pnft']['payerRuleSet'], args['pnft']['nameForRuleSet'])
-        elif metadata_account.programmable_config:
-            rule_set = metadata_account.programmable_config.rule_set
-
-    # Handling creators
-    creators = metadata_account.data.creators if metadata_account.data else None
-    creator_account_metas = [
-        AccountMeta(pubkey=creator.address, is_signer=False, is_writable=True)
-        for creator in creators if creator.share > 0
-    ] if creators else []
-
-    # Modify compute units instruction (adjust units as needed)
-    modify_compute_units = AccountMeta(pubkey=Pubkey('ComputeBudget111111111111111111111111111111'), is_signer=False, is_writable=False)
+        elif metadata_account is not None and metadata_account.rule_set:
+            rule_set = metadata_account.rule_set
+
+    # Compute budget for the pNFT transfer and royalty payouts
+    modify_compute_units = set_compute_unit_limit(BUY_NFT_COMPUTE_UNITS)
     instructions.append(modify_compute_units)
 
     # Construct the buyNftFromPair instruction
-    buy_nft_instruction = await program.buy_nft_from_pair(
-        args['maxAmountToPay'], args['skipFailed'], None
-    ).accounts_strict({
-        'nftPairBox': accounts['nftPairBox'],
-        'pair': accounts['pair'],
-        'user': accounts['userPubkey'],
-        'fundsSolVault': sol_funds_vault,
-        'nftsOwner': nfts_owner,
-        'feeSolVault': fee_sol_vault,
-        'nftMint': accounts['nftMint'],
-        'vaultNftTokenAccount': accounts['vaultNftTokenAccount'],
-        'nftUserTokenAccount': user_nft_token_account,
-        'assetReceiver': accounts['assetReceiver'],
-        'protocolFeeReceiver': accounts['protocolFeeReceiver'],
-        'tokenProgram': TOKEN_PROGRAM_ID,
-        'associatedTokenProgram': ASSOCIATED_PROGRAM_ID,
-        'instructions': SYSVAR_INSTRUCTIONS_PUBKEY,
-        'metadataInfo': metadata_info,
-        'ownerTokenRecord': owner_token_record,
-        'destTokenRecord': dest_token_record,
-        'editionInfo': edition_info,
-        'authorizationRulesProgram': AUTHORIZATION_RULES_PROGRAM,
-        'systemProgram': SYS_PROGRAM_ID,
-        'rent': SYSVAR_RENT_PUBKEY,
-        'metadataProgram': METADATA_PROGRAM_PUBKEY,
-    }).remaining_accounts([
-        {'pubkey': rule_set or METADATA_PROGRAM_PUBKEY, 'isSigner': False, 'isWritable': False}
-    ] + creator_account_metas).instruction()
+    buy_nft_instruction = build_buy_nft_from_pair_instruction(program_id, args, accounts, metadata_account, rule_set, book)
 
     # Add the instruction to the instructions list
     instructions.append(buy_nft_instruction)
@@ -91,72 +55,24 @@ async def buy_nft_from_pair(program_id: Pubkey,connection: Client,args: dict,acc
     return {'account': None, 'instructions': transaction.instructions, 'signers': signers}
 
 async def sell_nft_to_liquidity_pair(program_id: Pubkey,connection: Client,args: dict,accounts: dict,send_txn):
-    program = return_anchor_program(program_id, connection)
     nft_pair_box = Keypair()
 
-    user_nft_token_account = await find_associated_token_address(accounts['userPubkey'], accounts['nftMint'])
-
-    nfts_owner, _ = await Pubkey.find_program_address(
-        [ENCODER.encode(NFTS_OWNER_PREFIX), accounts['pair']], program_id
-    )
-    fee_sol_vault, _ = await Pubkey.find_program_address(
-        [ENCODER.encode(FEE_PREFIX), accounts['pair']], program_id
-    )
-    sol_funds_vault, _ = await Pubkey.find_program_address(
-        [ENCODER.encode(SOL_FUNDS_PREFIX), accounts['pair']], program_id
-    )
-
-    new_vault_token_account = await find_associated_token_address(nfts_owner, accounts['nftMint'])
-    owner_token_record = find_token_record_pda(accounts['nftMint'], user_nft_token_account)
-    dest_token_record = find_token_record_pda(accounts['nftMint'], new_vault_token_account)
-    edition_info = get_metaplex_edition_pda(accounts['nftMint'])
-    metadata_info = get_metaplex_metadata_pda(accounts['nftMint'])
-    metadata_account = await Metadata.from_account_address(connection, metadata_info)
+    # Pair vaults and per-mint addresses, memoized on the pair's address book
+    book = resolve_pair_address_book(accounts['pair'], program_id, accounts.get('addressBook'))
+    metadata_info = book.metadata(accounts['nftMint'])
+    metadata_account, = await Metadata.from_account_addresses(connection, [metadata_info])
 
     rule_set = METADATA_PROGRAM_PUBKEY
     if args.get('pnft'):
         if args['pnft'].get('payerRuleSet') and args['pnft'].get('nameForRuleSet'):
             rule_set = await find_rule_set_pda(args['pnft']['payerRuleSet'], args['pnft']['nameForRuleSet'])
-        elif metadata_account.programmable_config:
-            rule_set = metadata_account.programmable_config.rule_set
+        elif metadata_account is not None and metadata_account.rule_set:
+            rule_set = metadata_account.rule_set
 
-    creators = metadata_account.data.creators if metadata_account.data else None
-    creator_account_metas = [
-        AccountMeta(pubkey=creator.address, is_signer=False, is_writable=True)
-        for creator in creators if creator.share > 0
-    ] if creators else []
-
-    modify_compute_units = AccountMeta(pubkey=Pubkey('ComputeBudget111111111111111111111111111111'), is_signer=False, is_writable=False)
+    modify_compute_units = set_compute_unit_limit(SELL_NFT_COMPUTE_UNITS)
 
     # Construct the sellNftToLiquidityPair instruction
-    sell_nft_instruction = await program.sell_nft_to_liquidity_pair(
-        args['minAmountToGet'], args['skipFailed'], args.get('proof', []), None
-    ).accounts_strict({
-        'nftPairBox': nft_pair_box.pubkey(),
-        'nftValidationAdapter': accounts['nftValidationAdapter'],
-        'pair': accounts['pair'],
-        'user': accounts['userPubkey'],
-        'nftMint': accounts['nftMint'],
-        'nftUserTokenAccount': user_nft_token_account,
-        'tokenProgram': TOKEN_PROGRAM_ID,
-        'nftsOwner': nfts_owner,
-        'feeSolVault': fee_sol_vault,
-        'newVaultTokenAccount': new_vault_token_account,
-        'protocolFeeReceiver': accounts['protocolFeeReceiver'],
-        'associatedTokenProgram': ASSOCIATED_PROGRAM_ID,
-        'fundsSolVault': sol_funds_vault,
-        'systemProgram': SYS_PROGRAM_ID,
-        'rent': SYSVAR_RENT_PUBKEY,
-        'instructions': SYSVAR_INSTRUCTIONS_PUBKEY,
-        'metadataInfo': metadata_info,
-        'ownerTokenRecord': owner_token_record,
-        'destTokenRecord': dest_token_record,
-        'editionInfo': edition_info,
-        'authorizationRulesProgram': AUTHORIZATION_RULES_PROGRAM,
-        'metadataProgram': METADATA_PROGRAM_PUBKEY,
-    }).remaining_accounts(
-        [{'pubkey': accounts.get('nftValidationAdapterV2', rule_set), 'isSigner': False, 'isWritable': False}] + creator_account_metas
-    ).instruction()
+    sell_nft_instruction = build_sell_nft_to_liquidity_pair_instruction(program_id, args, accounts, metadata_account, rule_set, book, nft_pair_box.pubkey())
 
     # Create and populate the transaction
     transaction = Transaction()
@@ -173,65 +89,25 @@ async def sell_nft_to_liquidity_pair(program_id: Pubkey,connection: Client,args:
     return {'account': nft_pair_box.pubkey(), 'instructions': transaction.instructions, 'signers': signers}
 
 async def sell_nft_to_token_to_nft_pair(program_id: Pubkey,connection: Client,args: dict,accounts: dict,send_txn):
-    program = return_anchor_program(program_id, connection)
     instructions = []
 
-    user_nft_token_account = await find_associated_token_address(accounts['userPubkey'], accounts['nftMint'])
-    asset_receiver_token_account = await find_associated_token_address(accounts['assetReceiver'], accounts['nftMint'])
-
-    sol_funds_vault, _ = await Pubkey.find_program_address(
-        [ENCODER.encode(SOL_FUNDS_PREFIX), accounts['pair']], program_id
-    )
-
-    owner_token_record = find_token_record_pda(accounts['nftMint'], user_nft_token_account)
-    dest_token_record = find_token_record_pda(accounts['nftMint'], asset_receiver_token_account)
-    edition_info = get_metaplex_edition_pda(accounts['nftMint'])
-    metadata_info = get_metaplex_metadata_pda(accounts['nftMint'])
-    metadata_account = await Metadata.from_account_address(connection, metadata_info)
+    # Pair vaults and per-mint addresses, memoized on the pair's address book
+    book = resolve_pair_address_book(accounts['pair'], program_id, accounts.get('addressBook'))
+    metadata_info = book.metadata(accounts['nftMint'])
+    metadata_account, = await Metadata.from_account_addresses(connection, [metadata_info])
 
     rule_set = METADATA_PROGRAM_PUBKEY
     if args.get('pnft'):
         if args['pnft'].get('payerRuleSet') and args['pnft'].get('nameForRuleSet'):
             rule_set = await find_rule_set_pda(args['pnft']['payerRuleSet'], args['pnft']['nameForRuleSet'])
-        elif metadata_account.programmable_config:
-            rule_set = metadata_account.programmable_config.rule_set
+        elif metadata_account is not None and metadata_account.rule_set:
+            rule_set = metadata_account.rule_set
 
-    creators = metadata_account.data.creators if metadata_account.data else None
-    creator_account_metas = [
-        AccountMeta(pubkey=creator.address, is_signer=False, is_writable=True)
-        for creator in creators if creator.share > 0
-    ] if creators else []
-
-    modify_compute_units = AccountMeta(pubkey=Pubkey('ComputeBudget111111111111111111111111111111'), is_signer=False, is_writable=False)
+    modify_compute_units = set_compute_unit_limit(SELL_NFT_COMPUTE_UNITS)
     instructions.append(modify_compute_units)
 
     # Construct the sellNftToTokenToNftPair instruction
-    sell_nft_instruction = await program.sell_nft_to_token_to_nft_pair(
-        args['minAmountToGet'], args['skipFailed'], args.get('proof', []), None
-    ).accounts_strict({
-        'nftValidationAdapter': accounts['nftValidationAdapter'],
-        'pair': accounts['pair'],
-        'user': accounts['userPubkey'],
-        'nftMint': accounts['nftMint'],
-        'nftUserTokenAccount': user_nft_token_account,
-        'tokenProgram': TOKEN_PROGRAM_ID,
-        'assetReceiver': accounts['assetReceiver'],
-        'protocolFeeReceiver': accounts['protocolFeeReceiver'],
-        'assetReceiverTokenAccount': asset_receiver_token_account,
-        'associatedTokenProgram': ASSOCIATED_PROGRAM_ID,
-        'fundsSolVault': sol_funds_vault,
-        'instructions': SYSVAR_INSTRUCTIONS_PUBKEY,
-        'metadataInfo': metadata_info,
-        'ownerTokenRecord': owner_token_record,
-        'destTokenRecord': dest_token_record,
-        'editionInfo': edition_info,
-        'authorizationRulesProgram': AUTHORIZATION_RULES_PROGRAM,
-        'systemProgram': SYS_PROGRAM_ID,
-        'rent': SYSVAR_RENT_PUBKEY,
-        'metadataProgram': METADATA_PROGRAM_PUBKEY,
-    }).remaining_accounts(
-        [{'pubkey': accounts.get('nftValidationAdapterV2', rule_set), 'isSigner': False, 'isWritable': False}] + creator_account_metas
-    ).instruction()
+    sell_nft_instruction = build_sell_nft_to_token_to_nft_pair_instruction(program_id, args, accounts, metadata_account, rule_set, book)
 
     # Add the instruction to the instructions list
     instructions.append(sell_nft_instruction)
@@ -251,3 +127,394 @@ async def sell_nft_to_token_to_nft_pair(program_id: Pubkey,connection: Client,ar
     return {'account': None, 'instructions': transaction.instructions, 'signers': signers}
 
 
+
+
+def build_buy_nft_from_pair_instruction(program_id: Pubkey, args: dict, accounts: dict, metadata_account, rule_set: Pubkey, book: PairAddressBook) -> Instruction:
+    """
+    Build one buyNftFromPair instruction without any RPC calls.
+
+    :param program_id: Hadeswap program public key (Pubkey)
+    :param args: {'maxAmountToPay', 'skipFailed'} (dict)
+    :param accounts: {'nftPairBox', 'pair', 'userPubkey', 'nftMint', 'vaultNftTokenAccount', 'assetReceiver', 'protocolFeeReceiver'} (dict)
+    :param metadata_account: Parsed metadata of the NFT; its creators are passed as remaining accounts (Metadata)
+    :param rule_set: pNFT rule set, METADATA_PROGRAM_PUBKEY when there is none (Pubkey)
+    :param book: Address book of the pair (PairAddressBook)
+    :return: The instruction (Instruction)
+    """
+    nft_mint = accounts['nftMint']
+    user_nft_token_account = book.token_account(accounts['userPubkey'], nft_mint)
+
+    return get_instruction_encoder('buyNftFromPair').encode(program_id, {
+        'maxAmountToPay': args['maxAmountToPay'],
+        'skipFailed': args['skipFailed'],
+        'authorizationData': None,
+    }, {
+        'nftPairBox': accounts['nftPairBox'],
+        'pair': accounts['pair'],
+        'user': accounts['userPubkey'],
+        'fundsSolVault': book.funds_sol_vault,
+        'nftsOwner': book.nfts_owner,
+        'feeSolVault': book.fee_sol_vault,
+        'nftMint': nft_mint,
+        'vaultNftTokenAccount': accounts['vaultNftTokenAccount'],
+        'nftUserTokenAccount': user_nft_token_account,
+        'assetReceiver': accounts['assetReceiver'],
+        'protocolFeeReceiver': accounts['protocolFeeReceiver'],
+        'tokenProgram': TOKEN_PROGRAM_ID,
+        'associatedTokenProgram': ASSOCIATED_PROGRAM_ID,
+        'instructions': SYSVAR_INSTRUCTIONS_PUBKEY,
+        'metadataInfo': book.metadata(nft_mint),
+        'ownerTokenRecord': book.token_record(nft_mint, accounts['vaultNftTokenAccount']),
+        'destTokenRecord': book.token_record(nft_mint, user_nft_token_account),
+        'editionInfo': book.edition(nft_mint),
+        'authorizationRulesProgram': AUTHORIZATION_RULES_PROGRAM,
+        'systemProgram': SYS_PROGRAM_ID,
+        'rent': SYSVAR_RENT_PUBKEY,
+        'metadataProgram': METADATA_PROGRAM_PUBKEY,
+    }, [
+        {'pubkey': rule_set or METADATA_PROGRAM_PUBKEY, 'isSigner': False, 'isWritable': False}
+    ] + _creator_account_metas(metadata_account))
+
+
+def _creator_account_metas(metadata_account) -> List[AccountMeta]:
+    """Royalty-receiving creators of an NFT, passed as writable remaining accounts."""
+    if metadata_account is None:
+        return []
+    return [
+        AccountMeta(pubkey=creator['address'], is_signer=False, is_writable=True)
+        for creator in metadata_account.creators if creator['share'] > 0
+    ]
+
+
+def build_sell_nft_to_liquidity_pair_instruction(program_id: Pubkey, args: dict, accounts: dict, metadata_account, rule_set: Pubkey, book: PairAddressBook, nft_pair_box: Pubkey) -> Instruction:
+    """
+    Build one sellNftToLiquidityPair instruction without any RPC calls.
+
+    :param program_id: Hadeswap program public key (Pubkey)
+    :param args: {'minAmountToGet', 'skipFailed'}, optionally 'proof' (dict)
+    :param accounts: {'pair', 'userPubkey', 'nftMint', 'nftValidationAdapter', 'protocolFeeReceiver'}, optionally 'nftValidationAdapterV2' (dict)
+    :param metadata_account: Parsed metadata of the NFT; its creators are passed as remaining accounts (Metadata)
+    :param rule_set: pNFT rule set, METADATA_PROGRAM_PUBKEY when there is none (Pubkey)
+    :param book: Address book of the pair (PairAddressBook)
+    :param nft_pair_box: Public key of the new nftPairBox, whose keypair must sign (Pubkey)
+    :return: The instruction (Instruction)
+    """
+    nft_mint = accounts['nftMint']
+    user_nft_token_account = book.token_account(accounts['userPubkey'], nft_mint)
+
+    return get_instruction_encoder('sellNftToLiquidityPair').encode(program_id, {
+        'minAmountToGet': args['minAmountToGet'],
+        'skipFailed': args['skipFailed'],
+        'proof': args.get('proof', []),
+        'authorizationData': None,
+    }, {
+        'nftPairBox': nft_pair_box,
+        'nftValidationAdapter': accounts['nftValidationAdapter'],
+        'pair': accounts['pair'],
+        'user': accounts['userPubkey'],
+        'nftMint': nft_mint,
+        'nftUserTokenAccount': user_nft_token_account,
+        'tokenProgram': TOKEN_PROGRAM_ID,
+        'nftsOwner': book.nfts_owner,
+        'feeSolVault': book.fee_sol_vault,
+        'newVaultTokenAccount': book.vault_token_account(nft_mint),
+        'protocolFeeReceiver': accounts['protocolFeeReceiver'],
+        'associatedTokenProgram': ASSOCIATED_PROGRAM_ID,
+        'fundsSolVault': book.funds_sol_vault,
+        'systemProgram': SYS_PROGRAM_ID,
+        'rent': SYSVAR_RENT_PUBKEY,
+        'instructions': SYSVAR_INSTRUCTIONS_PUBKEY,
+        'metadataInfo': book.metadata(nft_mint),
+        'ownerTokenRecord': book.token_record(nft_mint, user_nft_token_account),
+        'destTokenRecord': book.vault_token_record(nft_mint),
+        'editionInfo': book.edition(nft_mint),
+        'authorizationRulesProgram': AUTHORIZATION_RULES_PROGRAM,
+        'metadataProgram': METADATA_PROGRAM_PUBKEY,
+    }, [
+        {'pubkey': accounts.get('nftValidationAdapterV2', rule_set), 'isSigner': False, 'isWritable': False}
+    ] + _creator_account_metas(metadata_account))
+
+
+def build_sell_nft_to_token_to_nft_pair_instruction(program_id: Pubkey, args: dict, accounts: dict, metadata_account, rule_set: Pubkey, book: PairAddressBook) -> Instruction:
+    """
+    Build one sellNftToTokenToNftPair instruction without any RPC calls.
+
+    :param program_id: Hadeswap program public key (Pubkey)
+    :param args: {'minAmountToGet', 'skipFailed'}, optionally 'proof' (dict)
+    :param accounts: {'pair', 'userPubkey', 'nftMint', 'assetReceiver', 'nftValidationAdapter', 'protocolFeeReceiver'}, optionally 'nftValidationAdapterV2' (dict)
+    :param metadata_account: Parsed metadata of the NFT; its creators are passed as remaining accounts (Metadata)
+    :param rule_set: pNFT rule set, METADATA_PROGRAM_PUBKEY when there is none (Pubkey)
+    :param book: Address book of the pair (PairAddressBook)
+    :return: The instruction (Instruction)
+    """
+    nft_mint = accounts['nftMint']
+    user_nft_token_account = book.token_account(accounts['userPubkey'], nft_mint)
+    asset_receiver_token_account = book.token_account(accounts['assetReceiver'], nft_mint)
+
+    return get_instruction_encoder('sellNftToTokenToNftPair').encode(program_id, {
+        'minAmountToGet': args['minAmountToGet'],
+        'skipFailed': args['skipFailed'],
+        'proof': args.get('proof', []),
+        'authorizationData': None,
+    }, {
+        'nftValidationAdapter': accounts['nftValidationAdapter'],
+        'pair': accounts['pair'],
+        'user': accounts['userPubkey'],
+        'nftMint': nft_mint,
+        'nftUserTokenAccount': user_nft_token_account,
+        'tokenProgram': TOKEN_PROGRAM_ID,
+        'assetReceiver': accounts['assetReceiver'],
+        'protocolFeeReceiver': accounts['protocolFeeReceiver'],
+        'assetReceiverTokenAccount': asset_receiver_token_account,
+        'associatedTokenProgram': ASSOCIATED_PROGRAM_ID,
+        'fundsSolVault': book.funds_sol_vault,
+        'instructions': SYSVAR_INSTRUCTIONS_PUBKEY,
+        'metadataInfo': book.metadata(nft_mint),
+        'ownerTokenRecord': book.token_record(nft_mint, user_nft_token_account),
+        'destTokenRecord': book.token_record(nft_mint, asset_receiver_token_account),
+        'editionInfo': book.edition(nft_mint),
+        'authorizationRulesProgram': AUTHORIZATION_RULES_PROGRAM,
+        'systemProgram': SYS_PROGRAM_ID,
+        'rent': SYSVAR_RENT_PUBKEY,
+        'metadataProgram': METADATA_PROGRAM_PUBKEY,
+    }, [
+        {'pubkey': accounts.get('nftValidationAdapterV2', rule_set), 'isSigner': False, 'isWritable': False}
+    ] + _creator_account_metas(metadata_account))
+
+
+def _shortvec_size(value: int) -> int:
+    """Bytes taken by a compact-u16 length prefix."""
+    return 1 if value < 0x80 else 2 if value < 0x4000 else 3
+
+
+def estimate_transaction_size(instructions: List[Instruction], payer: Pubkey) -> int:
+    """
+    Serialized size of a legacy transaction holding `instructions`, signatures included.
+
+    :param instructions: Instructions of the transaction (list of Instruction)
+    :param payer: Fee payer public key (Pubkey)
+    :return: Size in bytes (int)
+    """
+    account_keys = {bytes(payer)}
+    signers = {bytes(payer)}
+    instructions_size = 0
+    for instruction in instructions:
+        account_keys.add(bytes(instruction.program_id))
+        for account in instruction.accounts:
+            account_keys.add(bytes(account.pubkey))
+            if account.is_signer:
+                signers.add(bytes(account.pubkey))
+        instructions_size += (
+            1 + _shortvec_size(len(instruction.accounts)) + len(instruction.accounts)
+            + _shortvec_size(len(instruction.data)) + len(instruction.data)
+        )
+    message_size = (
+        3 + _shortvec_size(len(account_keys)) + 32 * len(account_keys) + 32
+        + _shortvec_size(len(instructions)) + instructions_size
+    )
+    return _shortvec_size(len(signers)) + 64 * len(signers) + message_size
+
+
+def pack_instructions(
+    instructions: List[Instruction],
+    payer: Pubkey,
+    compute_units_per_instruction: int,
+    max_transaction_size: int = MAX_TRANSACTION_SIZE,
+    max_compute_units: int = MAX_TRANSACTION_COMPUTE_UNITS,
+) -> List[List[Instruction]]:
+    """
+    Greedily pack instructions into as few transactions as fit under the size and compute limits.
+
+    Each group starts with a set_compute_unit_limit instruction sized for the instructions it holds.
+
+    :param instructions: Instructions to pack, kept in order (list of Instruction)
+    :param payer: Fee payer public key (Pubkey)
+    :param compute_units_per_instruction: Compute units budgeted per instruction (int)
+    :param max_transaction_size: Size limit in bytes (int)
+    :param max_compute_units: Compute unit limit per transaction (int)
+    :return: Instruction groups, one per transaction (list of list of Instruction)
+    """
+    max_per_transaction = max(1, max_compute_units // compute_units_per_instruction)
+    groups = []
+    current = []
+    for instruction in instructions:
+        candidate = current + [instruction]
+        budget = set_compute_unit_limit(min(max_compute_units, compute_units_per_instruction * len(candidate)))
+        if current and (len(candidate) > max_per_transaction or estimate_transaction_size([budget] + candidate, payer) > max_transaction_size):
+            groups.append(current)
+            candidate = [instruction]
+        current = candidate
+    if current:
+        groups.append(current)
+    return [
+        [set_compute_unit_limit(min(max_compute_units, compute_units_per_instruction * len(group)))] + group
+        for group in groups
+    ]
+
+
+def _address_books_for_fills(fills: List[dict], program_id: Pubkey) -> dict:
+    """One PairAddressBook per distinct pair of a fill plan, reusing the fills' own books."""
+    books = {}
+    for fill in fills:
+        pair_key = str(fill['pair'])
+        if pair_key not in books:
+            books[pair_key] = fill.get('addressBook') or PairAddressBook(Publickey(pair_key), program_id)
+    return books
+
+
+async def _fetch_metadata_by_mint(connection: Client, fills: List[dict]) -> dict:
+    """Metadata of every distinct mint of a fill plan, fetched in batched getMultipleAccounts calls."""
+    mints = list({str(fill['nftMint']): Publickey(str(fill['nftMint'])) for fill in fills}.values())
+    metadata_accounts = await Metadata.from_account_addresses(connection, [get_metaplex_metadata(mint) for mint in mints])
+    return dict(zip((str(mint) for mint in mints), metadata_accounts))
+
+
+async def _send_instruction_groups(instruction_groups: List[List[Instruction]], signers: List[Keypair], send_txn, max_concurrency: int) -> dict:
+    """Send one transaction per instruction group concurrently, each signed by the extra signers it references."""
+    signers_by_pubkey = {bytes(signer.pubkey()): signer for signer in signers}
+    transactions = []
+    transaction_signers = []
+    for group in instruction_groups:
+        transaction = Transaction()
+        for instruction in group:
+            transaction.add(instruction)
+        transactions.append(transaction)
+        transaction_signers.append([
+            signers_by_pubkey[bytes(account.pubkey)]
+            for instruction in group for account in instruction.accounts
+            if account.is_signer and bytes(account.pubkey) in signers_by_pubkey
+        ])
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def send(transaction, extra_signers):
+        async with semaphore:
+            return await send_txn(transaction, extra_signers)
+
+    results = await asyncio.gather(*(send(*entry) for entry in zip(transactions, transaction_signers)), return_exceptions=True)
+
+    return {'transactions': transactions, 'instructions': instruction_groups, 'results': list(results), 'signers': transaction_signers}
+
+
+async def sweep_buy_from_pairs(
+    program_id: Pubkey,
+    connection: Client,
+    fills: List[dict],
+    accounts: dict,
+    send_txn,
+    slippage_bps: int = 0,
+    max_concurrency: int = 8,
+    compute_units_per_buy: int = BUY_NFT_COMPUTE_UNITS,
+):
+    """
+    Buy many NFTs across pairs: one batched Metadata fetch, packed transactions, concurrent sends.
+
+    Every buyNftFromPair is built with skipFailed set, so an NFT bought by someone else in the
+    meantime does not fail the rest of its transaction.
+
+    :param program_id: Hadeswap program public key (Pubkey)
+    :param connection: Solana RPC connection (Client)
+    :param fills: One entry per NFT: {'pair', 'nftPairBox', 'nftMint', 'vaultNftTokenAccount', 'assetReceiver', 'price'},
+        optionally 'maxAmountToPay' and 'addressBook'; see assign_nft_pair_boxes in core.quotes (list of dict)
+    :param accounts: {'userPubkey', 'protocolFeeReceiver'} (dict)
+    :param send_txn: Coroutine function sending (transaction, signers) (callable)
+    :param slippage_bps: Allowed price increase over each fill's quoted price, in basis points (int)
+    :param max_concurrency: Maximum number of transactions in flight (int)
+    :param compute_units_per_buy: Compute units budgeted per buyNftFromPair (int)
+    :return: {'transactions', 'instructions', 'results', 'signers'}, one entry per transaction in each; results holds send_txn's
+        result or the raised exception (dict)
+    """
+    books = _address_books_for_fills(fills, program_id)
+    metadata_by_mint = await _fetch_metadata_by_mint(connection, fills)
+
+    buy_instructions = []
+    for fill in fills:
+        metadata_account = metadata_by_mint[str(fill['nftMint'])]
+        max_amount_to_pay = fill.get('maxAmountToPay') or math.ceil(fill['price'] * (BASE_POINTS + slippage_bps) / BASE_POINTS)
+        buy_instructions.append(build_buy_nft_from_pair_instruction(
+            program_id,
+            {'maxAmountToPay': int(max_amount_to_pay), 'skipFailed': True},
+            {
+                'nftPairBox': Publickey(str(fill['nftPairBox'])),
+                'pair': Publickey(str(fill['pair'])),
+                'userPubkey': accounts['userPubkey'],
+                'nftMint': Publickey(str(fill['nftMint'])),
+                'vaultNftTokenAccount': Publickey(str(fill['vaultNftTokenAccount'])),
+                'assetReceiver': Publickey(str(fill['assetReceiver'])),
+                'protocolFeeReceiver': accounts['protocolFeeReceiver'],
+            },
+            metadata_account,
+            metadata_account.rule_set if metadata_account is not None and metadata_account.rule_set else METADATA_PROGRAM_PUBKEY,
+            books[str(fill['pair'])],
+        ))
+
+    instruction_groups = pack_instructions(buy_instructions, accounts['userPubkey'], compute_units_per_buy)
+    return await _send_instruction_groups(instruction_groups, [], send_txn, max_concurrency)
+
+
+async def sweep_sell_to_pairs(
+    program_id: Pubkey,
+    connection: Client,
+    fills: List[dict],
+    accounts: dict,
+    send_txn,
+    slippage_bps: int = 0,
+    max_concurrency: int = 8,
+    compute_units_per_sell: int = SELL_NFT_COMPUTE_UNITS,
+):
+    """
+    Sell many NFTs into the bids of many pairs: one batched Metadata fetch, packed transactions, concurrent sends.
+
+    LiquidityProvision pairs get a sellNftToLiquidityPair (with a fresh nftPairBox keypair, signing
+    the transaction it lands in), TokenForNFT pairs a sellNftToTokenToNftPair. Every instruction is
+    built with skipFailed set, so a bid filled by someone else does not fail the rest of its transaction.
+
+    :param program_id: Hadeswap program public key (Pubkey)
+    :param connection: Solana RPC connection (Client)
+    :param fills: One entry per NFT: {'pair', 'pairType', 'nftMint', 'assetReceiver', 'price', 'nftValidationAdapter'},
+        optionally 'nftValidationAdapterV2', 'minAmountToGet', 'proof' and 'addressBook'; validation adapters belong to
+        the fill's pair, see assign_nfts_to_bids in core.quotes (list of dict)
+    :param accounts: {'userPubkey', 'protocolFeeReceiver'} (dict)
+    :param send_txn: Coroutine function sending (transaction, signers) (callable)
+    :param slippage_bps: Allowed price decrease under each fill's quoted price, in basis points (int)
+    :param max_concurrency: Maximum number of transactions in flight (int)
+    :param compute_units_per_sell: Compute units budgeted per sell instruction (int)
+    :return: Same as sweep_buy_from_pairs; 'signers' holds the nftPairBox keypairs per transaction (dict)
+    """
+    for fill in fills:
+        if not fill.get('nftValidationAdapter'):
+            raise ValueError(f"Fill of pair {fill['pair']} has no nftValidationAdapter")
+    books = _address_books_for_fills(fills, program_id)
+    metadata_by_mint = await _fetch_metadata_by_mint(connection, fills)
+
+    sell_instructions = []
+    nft_pair_boxes = []
+    for fill in fills:
+        metadata_account = metadata_by_mint[str(fill['nftMint'])]
+        min_amount_to_get = fill.get('minAmountToGet') or math.floor(fill['price'] * (BASE_POINTS - slippage_bps) / BASE_POINTS)
+        args = {'minAmountToGet': int(min_amount_to_get), 'skipFailed': True, 'proof': fill.get('proof', [])}
+        fill_accounts = {
+            'userPubkey': accounts['userPubkey'],
+            'protocolFeeReceiver': accounts['protocolFeeReceiver'],
+            'pair': Publickey(str(fill['pair'])),
+            'nftMint': Publickey(str(fill['nftMint'])),
+            'assetReceiver': Publickey(str(fill['assetReceiver'])),
+            'nftValidationAdapter': Publickey(str(fill['nftValidationAdapter'])),
+        }
+        if fill.get('nftValidationAdapterV2'):
+            fill_accounts['nftValidationAdapterV2'] = Publickey(str(fill['nftValidationAdapterV2']))
+        rule_set = metadata_account.rule_set if metadata_account is not None and metadata_account.rule_set else METADATA_PROGRAM_PUBKEY
+        book = books[str(fill['pair'])]
+        if fill['pairType'] == PairType.LiquidityProvision:
+            nft_pair_box = Keypair()
+            nft_pair_boxes.append(nft_pair_box)
+            sell_instructions.append(build_sell_nft_to_liquidity_pair_instruction(
+                program_id, args, fill_accounts, metadata_account, rule_set, book, nft_pair_box.pubkey(),
+            ))
+        else:
+            sell_instructions.append(build_sell_nft_to_token_to_nft_pair_instruction(
+                program_id, args, fill_accounts, metadata_account, rule_set, book,
+            ))
+
+    instruction_groups = pack_instructions(sell_instructions, accounts['userPubkey'], compute_units_per_sell)
+    return await _send_instruction_groups(instruction_groups, nft_pair_boxes, send_txn, max_concurrency)
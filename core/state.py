@@ -0,0 +1,182 @@
+"""
+In-memory mirror of all Hadeswap program accounts.
+
+StateStore is seeded from a get_all_program_accounts snapshot and patched with the changes the
+on_accounts_change parsers report. Besides the pubkey index it maintains the relations the
+router and quote engines look up, each in O(1):
+
+- hadoMarket -> nftSwapPairs
+- nftSwapPair -> nftPairBoxes and liquidityProvisionOrders
+- nftMint -> nftPairBox
+
+A change entry holding only 'publicKey' (as close_virtual_nft_swap_pair_parser reports closed
+pairs) removes that account, whatever its type.
+
+    store = await StateStore.from_program(program_id, connection)
+    asyncio.create_task(on_accounts_change(program_id, 5, None, connection, store.on_accounts_change_callback))
+    quote = quote_buy_from_pairs(store.market_pairs(hado_market), 10)
+"""
+from ..common import *
+from .accounts import get_all_program_accounts, PROGRAM_ACCOUNT_TYPES
+
+# (result key, field) -> secondary index name, for the relations kept up to date
+_INDEXED_FIELDS = (
+    ('nftSwapPairs', 'hadoMarket', 'pairs_by_market'),
+    ('nftPairBoxes', 'pair', 'boxes_by_pair'),
+    ('nftPairBoxes', 'nftMint', 'box_by_mint'),
+    ('liquidityProvisionOrders', 'nftSwapPair', 'orders_by_pair'),
+)
+
+
+class StateStore:
+    """
+    Indexed in-memory state of the Hadeswap program.
+
+    Attributes:
+        accounts (dict): Account pubkey -> decoded account.
+        account_types (dict): Account pubkey -> result key of its type, e.g. 'nftSwapPairs'.
+        by_type (dict): Result key -> {pubkey: account}.
+        pairs_by_market (dict): hadoMarket -> {pair pubkey: nftSwapPair}.
+        boxes_by_pair (dict): nftSwapPair -> {box pubkey: nftPairBox}.
+        orders_by_pair (dict): nftSwapPair -> {order pubkey: liquidityProvisionOrder}.
+        box_by_mint (dict): nftMint -> {box pubkey: nftPairBox}.
+    """
+    __slots__ = ('accounts', 'account_types', 'by_type', 'pairs_by_market', 'boxes_by_pair', 'orders_by_pair', 'box_by_mint')
+
+    def __init__(self):
+        self.accounts = {}
+        self.account_types = {}
+        self.by_type = {result_key: {} for result_key in PROGRAM_ACCOUNT_TYPES.values()}
+        self.pairs_by_market = {}
+        self.boxes_by_pair = {}
+        self.orders_by_pair = {}
+        self.box_by_mint = {}
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict) -> "StateStore":
+        """
+        Build a store from a get_all_program_accounts result.
+
+        :param snapshot: Result key -> decoded accounts (dict)
+        :return: The store (StateStore)
+        """
+        store = cls()
+        store.apply_changes(snapshot)
+        return store
+
+    @classmethod
+    async def from_program(cls, program_id: Pubkey, connection: Client, **snapshot_options) -> "StateStore":
+        """
+        Build a store from a fresh get_all_program_accounts snapshot.
+
+        :param program_id: Hadeswap program public key (Pubkey)
+        :param connection: Solana RPC connection (Client)
+        :param snapshot_options: Passed on to get_all_program_accounts, e.g. max_concurrency or timeout
+        :return: The store (StateStore)
+        """
+        return cls.from_snapshot(await get_all_program_accounts(program_id, connection, **snapshot_options))
+
+    def _index(self, result_key: str, account: dict, sign: int):
+        for indexed_key, field_name, index_name in _INDEXED_FIELDS:
+            if indexed_key != result_key:
+                continue
+            index = getattr(self, index_name)
+            related = account.get(field_name)
+            if related is None:
+                continue
+            if sign > 0:
+                index.setdefault(related, {})[account['publicKey']] = account
+            else:
+                entries = index.get(related)
+                if entries is not None:
+                    entries.pop(account['publicKey'], None)
+                    if not entries:
+                        del index[related]
+
+    def remove(self, public_key) -> bool:
+        """
+        Drop an account and its index entries.
+
+        :param public_key: Account pubkey (Pubkey or str)
+        :return: Whether the account was in the store (bool)
+        """
+        public_key = str(public_key)
+        account = self.accounts.pop(public_key, None)
+        if account is None:
+            return False
+        result_key = self.account_types.pop(public_key)
+        del self.by_type[result_key][public_key]
+        self._index(result_key, account, -1)
+        return True
+
+    def upsert(self, result_key: str, account: dict):
+        """
+        Insert or replace one account.
+
+        :param result_key: Result key of its type, e.g. 'nftSwapPairs' (str)
+        :param account: Decoded account with 'publicKey' (dict)
+        """
+        if result_key not in self.by_type:
+            raise ValueError(f"Unknown account result key: {result_key}")
+        public_key = str(account['publicKey'])
+        self.remove(public_key)
+        self.accounts[public_key] = account
+        self.account_types[public_key] = result_key
+        self.by_type[result_key][public_key] = account
+        self._index(result_key, account, 1)
+
+    def apply_changes(self, changes: dict) -> int:
+        """
+        Apply a snapshot or the changes reported by an on_accounts_change parser.
+
+        :param changes: Result key -> decoded accounts; entries with only 'publicKey' are removals (dict)
+        :return: Number of upserted or removed accounts (int)
+        """
+        applied = 0
+        for result_key, accounts in changes.items():
+            for account in accounts:
+                if account.keys() == {'publicKey'}:
+                    applied += self.remove(account['publicKey'])
+                else:
+                    self.upsert(result_key, account)
+                    applied += 1
+        return applied
+
+    async def on_accounts_change_callback(self, changes: dict, instruction_log: str):
+        """Callback for on_accounts_change keeping the store up to date."""
+        self.apply_changes(changes)
+
+    def get(self, public_key) -> Optional[dict]:
+        """Account by pubkey, None if unknown."""
+        return self.accounts.get(str(public_key))
+
+    def accounts_of(self, result_key: str) -> List[dict]:
+        """Every account of one type, e.g. store.accounts_of('hadoMarkets')."""
+        return list(self.by_type[result_key].values())
+
+    def market_pairs(self, hado_market) -> List[dict]:
+        """nftSwapPairs of a hadoMarket."""
+        return list(self.pairs_by_market.get(str(hado_market), {}).values())
+
+    def pair_nft_boxes(self, pair) -> List[dict]:
+        """nftPairBoxes of a pair."""
+        return list(self.boxes_by_pair.get(str(pair), {}).values())
+
+    def pair_liquidity_provision_orders(self, pair) -> List[dict]:
+        """liquidityProvisionOrders of a pair."""
+        return list(self.orders_by_pair.get(str(pair), {}).values())
+
+    def nft_pair_box(self, nft_mint) -> Optional[dict]:
+        """nftPairBox holding a mint; the active one if closed boxes of the same mint linger."""
+        boxes = self.box_by_mint.get(str(nft_mint))
+        if not boxes:
+            return None
+        return next((box for box in boxes.values() if box['status'] == 'active'), next(iter(boxes.values())))
+
+    def protocol_settings(self) -> Optional[dict]:
+        """The protocolSettingsV1 account, None if not loaded."""
+        return next(iter(self.by_type['protocolSettingsV1'].values()), None)
+
+    def stats(self) -> dict:
+        """Number of accounts per type."""
+        return {result_key: len(accounts) for result_key, accounts in self.by_type.items()}
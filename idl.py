@@ -0,0 +1,62 @@
+"""
+Lazy access to the Hadeswap IDL.
+
+`__hadeswap_idl.json` is the single canonical IDL source. At build time it is pre-serialized
+with marshal into `__hadeswap_idl.marshal` (run `python idl.py`), which loads faster
+than parsing the JSON. Nothing is read until the IDL is first requested. Freshness is checked
+from file metadata only, like make: the snapshot is used while its format version and the JSON
+size it recorded match and the JSON is not newer than it; otherwise the JSON file is parsed.
+"""
+import json
+import marshal
+import os
+from functools import lru_cache
+from pathlib import Path
+
+IDL_JSON_PATH = Path(__file__).with_name('__hadeswap_idl.json')
+IDL_SNAPSHOT_PATH = Path(__file__).with_name('__hadeswap_idl.marshal')
+
+# Bump when the snapshot layout changes so old snapshots are ignored
+IDL_SNAPSHOT_VERSION = 3
+
+
+@lru_cache(maxsize=1)
+def load_idl_json() -> str:
+    """Return the raw JSON text of the Hadeswap IDL."""
+    return IDL_JSON_PATH.read_text(encoding='utf-8')
+
+
+@lru_cache(maxsize=1)
+def load_idl() -> dict:
+    """
+    Return the Hadeswap IDL as a dictionary, loaded once per process.
+
+    :return: The parsed IDL (dict)
+    """
+    try:
+        with IDL_SNAPSHOT_PATH.open('rb') as snapshot_file:
+            json_stat = os.stat(IDL_JSON_PATH)
+            if json_stat.st_mtime_ns <= os.fstat(snapshot_file.fileno()).st_mtime_ns:
+                version, json_size, idl = marshal.loads(snapshot_file.read())
+                if version == IDL_SNAPSHOT_VERSION and json_size == json_stat.st_size:
+                    return idl
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    return json.loads(load_idl_json())
+
+
+def build_idl_snapshot(snapshot_path: Path = IDL_SNAPSHOT_PATH) -> Path:
+    """
+    Pre-serialize the canonical JSON IDL into a marshal snapshot.
+
+    :param snapshot_path: Where to write the snapshot (Path)
+    :return: The written snapshot path (Path)
+    """
+    json_text = IDL_JSON_PATH.read_bytes()
+    with Path(snapshot_path).open('wb') as snapshot_file:
+        marshal.dump((IDL_SNAPSHOT_VERSION, len(json_text), json.loads(json_text)), snapshot_file)
+    return Path(snapshot_path)
+
+
+if __name__ == '__main__':
+    print(f'Wrote {build_idl_snapshot()}')
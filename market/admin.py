@@ -1,14 +1,14 @@
 from ..common import *
+from ..core.instructions import get_instruction_encoder
 
 
 async def close_classic_whitelist(program_id: Pubkey, connection: Client, validation_whitelist: Pubkey, admin: Pubkey, send_txn):
-    program = await return_anchor_program(program_id, connection)
     instructions = []
 
-    close_classic_whitelist_instruction = program.closeClassicWhitelist().accounts_strict({
+    close_classic_whitelist_instruction = get_instruction_encoder('closeClassicWhitelist').encode(program_id, {}, {
         'validationWhitelist': validation_whitelist,
         'admin': admin,
-    }).instruction()
+    })
 
     instructions.append(close_classic_whitelist_instruction)
     
@@ -21,13 +21,12 @@ async def close_classic_whitelist(program_id: Pubkey, connection: Client, valida
     return {'account': None, 'instructions': instructions, 'signers': signers}
 
 async def close_liquidity_provision_order(program_id: Pubkey, connection: Client, liquidity_provision_order: Pubkey, admin: Pubkey, send_txn):
-    program = await return_anchor_program(program_id, connection)
     instructions = []
 
-    close_liquidity_provision_order_instruction = program.closeLiquidityProvisionOrder().accounts_strict({
+    close_liquidity_provision_order_instruction = get_instruction_encoder('closeLiquidityProvisionOrder').encode(program_id, {}, {
         'liquidityProvisionOrder': liquidity_provision_order,
         'admin': admin,
-    }).instruction()
+    })
 
     instructions.append(close_liquidity_provision_order_instruction)
     
@@ -40,13 +39,12 @@ async def close_liquidity_provision_order(program_id: Pubkey, connection: Client
     return {'account': None, 'instructions': instructions, 'signers': signers}
 
 async def close_nft_pair_box(program_id: Pubkey, connection: Client, nft_pair_box: Pubkey, admin: Pubkey, send_txn):
-    program = await return_anchor_program(program_id, connection)
     instructions = []
 
-    close_nft_pair_box_instruction = program.closeNftPairBox().accounts_strict({
+    close_nft_pair_box_instruction = get_instruction_encoder('closeNftPairBox').encode(program_id, {}, {
         'nftPairBox': nft_pair_box,
         'admin': admin,
-    }).instruction()
+    })
 
     instructions.append(close_nft_pair_box_instruction)
     
@@ -59,13 +57,12 @@ async def close_nft_pair_box(program_id: Pubkey, connection: Client, nft_pair_bo
     return {'account': None, 'instructions': instructions, 'signers': signers}
 
 async def close_nft_validation_adapter(program_id: Pubkey, connection: Client, nft_validation_adapter: Pubkey, admin: Pubkey, send_txn):
-    program = await return_anchor_program(program_id, connection)
     instructions = []
 
-    close_nft_validation_adapter_instruction = program.closeNftValidationAdapter().accounts_strict({
+    close_nft_validation_adapter_instruction = get_instruction_encoder('closeNftValidationAdapter').encode(program_id, {}, {
         'nftValidationAdapter': nft_validation_adapter,
         'admin': admin,
-    }).instruction()
+    })
 
     instructions.append(close_nft_validation_adapter_instruction)
     
@@ -78,13 +75,12 @@ async def close_nft_validation_adapter(program_id: Pubkey, connection: Client, n
     return {'account': None, 'instructions': instructions, 'signers': signers}
 
 async def close_nft_validation_adapter_v2(program_id: Pubkey, connection: Client, nft_validation_adapter_v2: Pubkey, admin: Pubkey, send_txn):
-    program = await return_anchor_program(program_id, connection)
     instructions = []
 
-    close_nft_validation_adapter_v2_instruction = program.closeNftValidationAdapterV2().accounts_strict({
+    close_nft_validation_adapter_v2_instruction = get_instruction_encoder('closeNftValidationAdapterV2').encode(program_id, {}, {
         'nftValidationAdapterV2': nft_validation_adapter_v2,
         'admin': admin,
-    }).instruction()
+    })
 
     instructions.append(close_nft_validation_adapter_v2_instruction)
     
@@ -96,23 +92,24 @@ async def close_nft_validation_adapter_v2(program_id: Pubkey, connection: Client
     await send_txn(transaction, signers)
     return {'account': None, 'instructions': instructions, 'signers': signers}
 
-async def withdraw_outstanding_tokens_by_admin(program_id: Pubkey, connection: Client, pair: Pubkey, admin: Pubkey, token_mint: Pubkey, payer_rule_set: Pubkey, name_for_rule_set: str, send_txn):
-    program = await return_anchor_program(program_id, connection)
+async def withdraw_outstanding_tokens_by_admin(program_id: Pubkey, connection: Client, pair: Pubkey, admin: Pubkey, token_mint: Pubkey, payer_rule_set: Pubkey, name_for_rule_set: str, send_txn, address_book: Optional[PairAddressBook] = None):
     instructions = []
 
-    nfts_owner_seed = [ENCODER.encode(NFTS_OWNER_PREFIX), pair]
-    nfts_owner = await Pubkey.find_program_address(nfts_owner_seed, program.program_id)
+    book = resolve_pair_address_book(pair, program_id, address_book)
+    nfts_owner = book.nfts_owner
 
-    admin_token_account = await find_associated_token_address(admin, token_mint)
-    pair_token_account = await find_associated_token_address(nfts_owner, token_mint)
+    admin_token_account = book.token_account(admin, token_mint)
+    pair_token_account = book.vault_token_account(token_mint)
 
-    edition_id = get_metaplex_edition_pda(token_mint)
-    metadata_info = get_metaplex_metadata(token_mint)
-    owner_token_record = find_token_record_pda(token_mint, pair_token_account)
-    dest_token_record = find_token_record_pda(token_mint, admin_token_account)
+    edition_id = book.edition(token_mint)
+    metadata_info = book.metadata(token_mint)
+    owner_token_record = book.token_record(token_mint, pair_token_account)
+    dest_token_record = book.token_record(token_mint, admin_token_account)
     rule_set = await find_rule_set_pda(payer_rule_set, name_for_rule_set)
 
-    withdraw_outstanding_tokens_instruction = program.withdrawOutstandingTokensByAdmin(None).accounts_strict({
+    withdraw_outstanding_tokens_instruction = get_instruction_encoder('withdrawOutstandingTokensByAdmin').encode(program_id, {
+        'authorizationData': None,
+    }, {
         'pair': pair,
         'nftsOwner': nfts_owner,
         'nftMint': token_mint,
@@ -129,11 +126,11 @@ async def withdraw_outstanding_tokens_by_admin(program_id: Pubkey, connection: C
         'associatedTokenProgram': ASSOCIATED_PROGRAM_ID,
         'systemProgram': SYS_PROGRAM_ID,
         'rent': SYSVAR_RENT_PUBKEY,
-    }).remaining_accounts([{
+    }, [{
         'pubkey': rule_set,
         'isSigner': False,
         'isWritable': False,
-    }]).instruction()
+    }])
 
     instructions.append(withdraw_outstanding_tokens_instruction)
     
@@ -1,25 +1,22 @@
 from ..common import *
+from ..core.instructions import get_instruction_encoder
 
 
 async def withdraw_liquidity_from_balanced_pair(program_id: Pubkey, connection: Client, args, accounts, send_txn):
-    program = await return_anchor_program(program_id, connection)
     instructions = []
 
-    sol_funds_vault_seed = [ENCODER.encode(SOL_FUNDS_PREFIX), accounts['pair'].to_bytes()]
-    nfts_owner_seed = [ENCODER.encode(NFTS_OWNER_PREFIX), accounts['pair'].to_bytes()]
-    fee_sol_vault_seed = [ENCODER.encode(FEE_PREFIX), accounts['pair'].to_bytes()]
+    book = resolve_pair_address_book(accounts['pair'], program_id, accounts.get('address_book'))
+    sol_funds_vault = book.funds_sol_vault
+    nfts_owner = book.nfts_owner
+    fee_sol_vault = book.fee_sol_vault
 
-    sol_funds_vault = await Pubkey.find_program_address(sol_funds_vault_seed, program.program_id)
-    nfts_owner = await Pubkey.find_program_address(nfts_owner_seed, program.program_id)
-    fee_sol_vault = await Pubkey.find_program_address(fee_sol_vault_seed, program.program_id)
+    user_nft_token_account = book.token_account(accounts['user_pubkey'], accounts['nft_mint'])
+    vault_nft_token_account = book.vault_token_account(accounts['nft_mint'])
 
-    user_nft_token_account = await find_associated_token_address(accounts['user_pubkey'], accounts['nft_mint'])
-    vault_nft_token_account = await find_associated_token_address(nfts_owner, accounts['nft_mint'])
-
-    edition_id = get_metaplex_edition_pda(accounts['nft_mint'])
-    metadata_info = get_metaplex_metadata_pda(accounts['nft_mint'])
-    owner_token_record = find_token_record_pda(accounts['nft_mint'], vault_nft_token_account)
-    dest_token_record = find_token_record_pda(accounts['nft_mint'], user_nft_token_account)
+    edition_id = book.edition(accounts['nft_mint'])
+    metadata_info = book.metadata(accounts['nft_mint'])
+    owner_token_record = book.token_record(accounts['nft_mint'], vault_nft_token_account)
+    dest_token_record = book.token_record(accounts['nft_mint'], user_nft_token_account)
     rule_set = METADATA_PROGRAM_PUBKEY
     if args.get('pnft') and args['pnft'].get('payer_rule_set') and args['pnft'].get('name_for_rule_set'):
         rule_set = await find_rule_set_pda(args['pnft']['payer_rule_set'], args['pnft']['name_for_rule_set'])
@@ -27,9 +24,9 @@ async def withdraw_liquidity_from_balanced_pair(program_id: Pubkey, connection:
     modify_compute_units = ComputeBudgetProgram.set_compute_unit_limit(units=400000)
     instructions.append(modify_compute_units)
 
-    withdraw_instruction = await program.withdraw_liquidity_from_balanced_pair(
-        None
-    ).accounts_strict({
+    withdraw_instruction = get_instruction_encoder('withdrawLiquidityFromBalancedPair').encode(program_id, {
+        'authorizationData': None,
+    }, {
         'nftPairBox': accounts['nft_pair_box'],
         'pair': accounts['pair'],
         'authorityAdapter': accounts['authority_adapter'],
@@ -51,7 +48,7 @@ async def withdraw_liquidity_from_balanced_pair(program_id: Pubkey, connection:
         'systemProgram': SYS_PROGRAM_ID,
         'rent': SYSVAR_RENT_PUBKEY,
         'metadataProgram': METADATA_PROGRAM_PUBKEY,
-    }).remaining_accounts([{'pubkey': rule_set, 'is_signer': False, 'is_writable': False}]).instruction()
+    }, [{'pubkey': rule_set, 'is_signer': False, 'is_writable': False}])
     instructions.append(withdraw_instruction)
 
     transaction = Transaction()
@@ -62,19 +59,16 @@ async def withdraw_liquidity_from_balanced_pair(program_id: Pubkey, connection:
     return {'account': None, 'instructions': instructions}
 
 async def withdraw_liquidity_from_buy_orders_pair(program_id: Pubkey, connection: Client, accounts, send_txn):
-    program = await return_anchor_program(program_id, connection)
     instructions = []
 
-    sol_funds_vault_seed = [ENCODER.encode(SOL_FUNDS_PREFIX), accounts['pair'].to_bytes()]
-    fee_sol_vault_seed = [ENCODER.encode(FEE_PREFIX), accounts['pair'].to_bytes()]
-
-    sol_funds_vault = await Pubkey.find_program_address(sol_funds_vault_seed, program.program_id)
-    fee_sol_vault = await Pubkey.find_program_address(fee_sol_vault_seed, program.program_id)
+    book = resolve_pair_address_book(accounts['pair'], program_id, accounts.get('address_book'))
+    sol_funds_vault = book.funds_sol_vault
+    fee_sol_vault = book.fee_sol_vault
 
     modify_compute_units = ComputeBudgetProgram.set_compute_unit_limit(units=400000)
     instructions.append(modify_compute_units)
 
-    withdraw_instruction = await program.withdraw_liquidity_from_buy_orders_pair().accounts_strict({
+    withdraw_instruction = get_instruction_encoder('withdrawLiquidityFromBuyOrdersPair').encode(program_id, {}, {
         'pair': accounts['pair'],
         'authorityAdapter': accounts['authority_adapter'],
         'user': accounts['user_pubkey'],
@@ -82,7 +76,7 @@ async def withdraw_liquidity_from_buy_orders_pair(program_id: Pubkey, connection
         'feeSolVault': fee_sol_vault,
         'systemProgram': SYS_PROGRAM_ID,
         'rent': SYSVAR_RENT_PUBKEY
-    }).remaining_accounts([{'pubkey': Keypair().pubkey(), 'is_signer': False, 'is_writable': False}]).instruction()
+    }, [{'pubkey': Keypair().pubkey(), 'is_signer': False, 'is_writable': False}])
     instructions.append(withdraw_instruction)
 
     transaction = Transaction()
@@ -93,35 +87,32 @@ async def withdraw_liquidity_from_buy_orders_pair(program_id: Pubkey, connection
     return {'account': None, 'instructions': instructions}
 
 async def withdraw_liquidity_from_sell_orders_pair(program_id: Pubkey, connection: Client, accounts, send_txn):
-    program = await return_anchor_program(program_id, connection)
     instructions = []
 
-    nfts_owner_seed = [ENCODER.encode(NFTS_OWNER_PREFIX), accounts['pair'].to_bytes()]
-    fee_sol_vault_seed = [ENCODER.encode(FEE_PREFIX), accounts['pair'].to_bytes()]
-
-    nfts_owner = await Pubkey.find_program_address(nfts_owner_seed, program.program_id)
-    fee_sol_vault = await Pubkey.find_program_address(fee_sol_vault_seed, program.program_id)
+    book = resolve_pair_address_book(accounts['pair'], program_id, accounts.get('address_book'))
+    nfts_owner = book.nfts_owner
+    fee_sol_vault = book.fee_sol_vault
 
-    user_nft_token_account_first = await find_associated_token_address(accounts['user_pubkey'], accounts['nft_mint_first'])
-    vault_nft_token_account_first = await find_associated_token_address(nfts_owner, accounts['nft_mint_first'])
+    user_nft_token_account_first = book.token_account(accounts['user_pubkey'], accounts['nft_mint_first'])
+    vault_nft_token_account_first = book.vault_token_account(accounts['nft_mint_first'])
 
-    user_nft_token_account_second = await find_associated_token_address(accounts['user_pubkey'], accounts['nft_mint_second'])
-    vault_nft_token_account_second = await find_associated_token_address(nfts_owner, accounts['nft_mint_second'])
+    user_nft_token_account_second = book.token_account(accounts['user_pubkey'], accounts['nft_mint_second'])
+    vault_nft_token_account_second = book.vault_token_account(accounts['nft_mint_second'])
 
-    metadata_info_first = get_metaplex_metadata_pda(accounts['nft_mint_first'])
-    edition_info_first = get_metaplex_edition_pda(accounts['nft_mint_first'])
-    owner_token_record_first = find_token_record_pda(accounts['nft_mint_first'], vault_nft_token_account_first)
-    dest_token_record_first = find_token_record_pda(accounts['nft_mint_first'], user_nft_token_account_first)
+    metadata_info_first = book.metadata(accounts['nft_mint_first'])
+    edition_info_first = book.edition(accounts['nft_mint_first'])
+    owner_token_record_first = book.token_record(accounts['nft_mint_first'], vault_nft_token_account_first)
+    dest_token_record_first = book.token_record(accounts['nft_mint_first'], user_nft_token_account_first)
 
-    metadata_info_second = get_metaplex_metadata_pda(accounts['nft_mint_second'])
-    edition_info_second = get_metaplex_edition_pda(accounts['nft_mint_second'])
-    owner_token_record_second = find_token_record_pda(accounts['nft_mint_second'], vault_nft_token_account_second)
-    dest_token_record_second = find_token_record_pda(accounts['nft_mint_second'], user_nft_token_account_second)
+    metadata_info_second = book.metadata(accounts['nft_mint_second'])
+    edition_info_second = book.edition(accounts['nft_mint_second'])
+    owner_token_record_second = book.token_record(accounts['nft_mint_second'], vault_nft_token_account_second)
+    dest_token_record_second = book.token_record(accounts['nft_mint_second'], user_nft_token_account_second)
 
     modify_compute_units = ComputeBudgetProgram.set_compute_unit_limit(units=400000)
     instructions.append(modify_compute_units)
 
-    withdraw_instruction = await program.withdraw_liquidity_from_sell_orders_pair().accounts_strict({
+    withdraw_instruction = get_instruction_encoder('withdrawLiquidityFromSellOrdersPair').encode(program_id, {}, {
         'pair': accounts['pair'],
         'authorityAdapter': accounts['authority_adapter'],
         'user': accounts['user_pubkey'],
@@ -150,7 +141,7 @@ async def withdraw_liquidity_from_sell_orders_pair(program_id: Pubkey, connectio
         'systemProgram': SYS_PROGRAM_ID,
         'rent': SYSVAR_RENT_PUBKEY,
         'metadataProgram': METADATA_PROGRAM_PUBKEY
-    }).instruction()
+    })
     instructions.append(withdraw_instruction)
 
     transaction = Transaction()
@@ -161,19 +152,18 @@ async def withdraw_liquidity_from_sell_orders_pair(program_id: Pubkey, connectio
     return {'account': None, 'instructions': instructions}
 
 async def withdraw_liquidity_only_buy_orders(program_id: Pubkey, connection: Client, accounts, args, send_txn):
-    program = await return_anchor_program(program_id, connection)
     instructions = []
 
-    sol_funds_vault_seed = [ENCODER.encode(SOL_FUNDS_PREFIX), accounts['pair'].to_bytes()]
-    fee_sol_vault_seed = [ENCODER.encode(FEE_PREFIX), accounts['pair'].to_bytes()]
-
-    sol_funds_vault = await Pubkey.find_program_address(sol_funds_vault_seed, program.program_id)
-    fee_sol_vault = await Pubkey.find_program_address(fee_sol_vault_seed, program.program_id)
+    book = resolve_pair_address_book(accounts['pair'], program_id, accounts.get('address_book'))
+    sol_funds_vault = book.funds_sol_vault
+    fee_sol_vault = book.fee_sol_vault
 
     modify_compute_units = ComputeBudgetProgram.set_compute_unit_limit(units=400000)
     instructions.append(modify_compute_units)
 
-    withdraw_instruction = await program.withdraw_liquidity_only_buy_orders(BN(args['amount_of_orders'])).accounts_strict({
+    withdraw_instruction = get_instruction_encoder('withdrawLiquidityOnlyBuyOrders').encode(program_id, {
+        'quantityOfOrders': args['amount_of_orders'],
+    }, {
         'pair': accounts['pair'],
         'authorityAdapter': accounts['authority_adapter'],
         'user': accounts['user_pubkey'],
@@ -181,7 +171,7 @@ async def withdraw_liquidity_only_buy_orders(program_id: Pubkey, connection: Cli
         'feeSolVault': fee_sol_vault,
         'systemProgram': SYS_PROGRAM_ID,
         'rent': SYSVAR_RENT_PUBKEY
-    }).remaining_accounts([{'pubkey': Keypair().pubkey(), 'is_signer': False, 'is_writable': False}]).instruction()
+    }, [{'pubkey': Keypair().pubkey(), 'is_signer': False, 'is_writable': False}])
     instructions.append(withdraw_instruction)
 
     transaction = Transaction()
@@ -192,16 +182,15 @@ async def withdraw_liquidity_only_buy_orders(program_id: Pubkey, connection: Cli
     return {'account': None, 'instructions': instructions}
 
 async def withdraw_liquidity_order_virtual_fees(program_id: Pubkey, connection: Client, accounts, send_txn):
-    program = await return_anchor_program(program_id, connection)
     instructions = []
 
-    fee_sol_vault_seed = [ENCODER.encode(FEE_PREFIX), accounts['pair'].to_bytes()]
-    fee_sol_vault = await Pubkey.find_program_address(fee_sol_vault_seed, program.program_id)
+    book = resolve_pair_address_book(accounts['pair'], program_id, accounts.get('address_book'))
+    fee_sol_vault = book.fee_sol_vault
 
     modify_compute_units = ComputeBudgetProgram.set_compute_unit_limit(units=400000)
     instructions.append(modify_compute_units)
 
-    withdraw_instruction = await program.withdraw_liquidity_order_virtual_fees().accounts_strict({
+    withdraw_instruction = get_instruction_encoder('withdrawLiquidityOrderVirtualFees').encode(program_id, {}, {
         'liquidityProvisionOrder': accounts['liquidity_provision_order'],
         'pair': accounts['pair'],
         'authorityAdapter': accounts['authority_adapter'],
@@ -209,7 +198,7 @@ async def withdraw_liquidity_order_virtual_fees(program_id: Pubkey, connection:
         'feeSolVault': fee_sol_vault,
         'systemProgram': SYS_PROGRAM_ID,
         'rent': SYSVAR_RENT_PUBKEY
-    }).instruction()
+    })
     instructions.append(withdraw_instruction)
 
     transaction = Transaction()
@@ -220,30 +209,28 @@ async def withdraw_liquidity_order_virtual_fees(program_id: Pubkey, connection:
     return {'account': None, 'instructions': instructions}
 
 async def withdraw_liquidity_single_sell_order(program_id: Pubkey, connection: Client, accounts, args, send_txn):
-    program = await return_anchor_program(program_id, connection)
     instructions = []
 
-    sol_funds_vault_seed = [ENCODER.encode(SOL_FUNDS_PREFIX), accounts['pair'].to_bytes()]
-    nfts_owner_seed = [ENCODER.encode(NFTS_OWNER_PREFIX), accounts['pair'].to_bytes()]
-    fee_sol_vault_seed = [ENCODER.encode(FEE_PREFIX), accounts['pair'].to_bytes()]
-
-    sol_funds_vault = await Pubkey.find_program_address(sol_funds_vault_seed, program.program_id)
-    nfts_owner = await Pubkey.find_program_address(nfts_owner_seed, program.program_id)
-    fee_sol_vault = await Pubkey.find_program_address(fee_sol_vault_seed, program.program_id)
+    book = resolve_pair_address_book(accounts['pair'], program_id, accounts.get('address_book'))
+    sol_funds_vault = book.funds_sol_vault
+    nfts_owner = book.nfts_owner
+    fee_sol_vault = book.fee_sol_vault
 
-    user_nft_token_account = await find_associated_token_address(accounts['user_pubkey'], accounts['nft_mint'])
-    vault_nft_token_account = await find_associated_token_address(nfts_owner, accounts['nft_mint'])
+    user_nft_token_account = book.token_account(accounts['user_pubkey'], accounts['nft_mint'])
+    vault_nft_token_account = book.vault_token_account(accounts['nft_mint'])
 
-    metadata_info = get_metaplex_metadata_pda(accounts['nft_mint'])
-    edition_info = get_metaplex_edition_pda(accounts['nft_mint'])
-    owner_token_record = find_token_record_pda(accounts['nft_mint'], vault_nft_token_account)
-    dest_token_record = find_token_record_pda(accounts['nft_mint'], user_nft_token_account)
+    metadata_info = book.metadata(accounts['nft_mint'])
+    edition_info = book.edition(accounts['nft_mint'])
+    owner_token_record = book.token_record(accounts['nft_mint'], vault_nft_token_account)
+    dest_token_record = book.token_record(accounts['nft_mint'], user_nft_token_account)
     rule_set = await find_rule_set_pda(args['pnft']['payer_rule_set'], args['pnft']['name_for_rule_set']) if args.get('pnft') else METADATA_PROGRAM_PUBKEY
 
     modify_compute_units = ComputeBudgetProgram.set_compute_unit_limit(units=400000)
     instructions.append(modify_compute_units)
 
-    withdraw_instruction = await program.withdraw_liquidity_single_sell_order(None).accounts_strict({
+    withdraw_instruction = get_instruction_encoder('withdrawLiquiditySingleSellOrder').encode(program_id, {
+        'authorizationData': None,
+    }, {
         'nftPairBox': accounts['nft_pair_box'],
         'pair': accounts['pair'],
         'authorityAdapter': accounts['authority_adapter'],
@@ -265,9 +252,9 @@ async def withdraw_liquidity_single_sell_order(program_id: Pubkey, connection: C
         'systemProgram': SYS_PROGRAM_ID,
         'rent': SYSVAR_RENT_PUBKEY,
         'metadataProgram': METADATA_PROGRAM_PUBKEY
-    }).remaining_accounts([
+    }, [
         {'pubkey': rule_set, 'is_signer': False, 'is_writable': False}
-    ]).instruction()
+    ])
     instructions.append(withdraw_instruction)
 
     transaction = Transaction()
@@ -278,25 +265,26 @@ async def withdraw_liquidity_single_sell_order(program_id: Pubkey, connection: C
     return {'account': None, 'instructions': instructions}
 
 async def withdraw_nft_from_pair(program_id: Pubkey, connection: Client, args, accounts, send_txn):
-    program = await return_anchor_program(program_id, connection)
     instructions = []
 
-    nfts_owner_seed = [ENCODER.encode(NFTS_OWNER_PREFIX), accounts['pair'].to_bytes()]
-    nfts_owner = await Pubkey.find_program_address(nfts_owner_seed, program.program_id)
+    book = resolve_pair_address_book(accounts['pair'], program_id, accounts.get('address_book'))
+    nfts_owner = book.nfts_owner
 
-    user_nft_token_account = await find_associated_token_address(accounts['user_pubkey'], accounts['nft_mint'])
-    vault_nft_token_account = await find_associated_token_address(nfts_owner, accounts['nft_mint'])
+    user_nft_token_account = book.token_account(accounts['user_pubkey'], accounts['nft_mint'])
+    vault_nft_token_account = book.vault_token_account(accounts['nft_mint'])
 
-    owner_token_record = find_token_record_pda(accounts['nft_mint'], vault_nft_token_account)
-    dest_token_record = find_token_record_pda(accounts['nft_mint'], user_nft_token_account)
-    edition_info = get_metaplex_edition_pda(accounts['nft_mint'])
-    metadata_info = get_metaplex_metadata_pda(accounts['nft_mint'])
+    owner_token_record = book.token_record(accounts['nft_mint'], vault_nft_token_account)
+    dest_token_record = book.token_record(accounts['nft_mint'], user_nft_token_account)
+    edition_info = book.edition(accounts['nft_mint'])
+    metadata_info = book.metadata(accounts['nft_mint'])
     rule_set = await find_rule_set_pda(args['pnft']['payer_rule_set'], args['pnft']['name_for_rule_set']) if args.get('pnft') else METADATA_PROGRAM_PUBKEY
 
     modify_compute_units = ComputeBudgetProgram.set_compute_unit_limit(units=400000)
     instructions.append(modify_compute_units)
 
-    withdraw_instruction = await program.withdraw_nft_from_pair(None).accounts_strict({
+    withdraw_instruction = get_instruction_encoder('withdrawNftFromPair').encode(program_id, {
+        'authorizationData': None,
+    }, {
         'nftPairBox': accounts['nft_pair_box'],
         'pair': accounts['pair'],
         'authorityAdapter': accounts['authority_adapter'],
@@ -316,9 +304,9 @@ async def withdraw_nft_from_pair(program_id: Pubkey, connection: Client, args, a
         'systemProgram': SYS_PROGRAM_ID,
         'rent': SYSVAR_RENT_PUBKEY,
         'metadataProgram': METADATA_PROGRAM_PUBKEY
-    }).remaining_accounts([
+    }, [
         {'pubkey': rule_set, 'is_signer': False, 'is_writable': False}
-    ]).instruction()
+    ])
     instructions.append(withdraw_instruction)
 
     transaction = Transaction()
@@ -329,11 +317,10 @@ async def withdraw_nft_from_pair(program_id: Pubkey, connection: Client, args, a
     return {'account': None, 'instructions': instructions}
 
 async def withdraw_sol_from_pair(program_id: Pubkey, connection: Client, accounts, args, send_txn):
-    program = await return_anchor_program(program_id, connection)
     instructions = []
 
-    sol_funds_vault_seed = [ENCODER.encode(SOL_FUNDS_PREFIX), accounts['pair'].to_bytes()]
-    sol_funds_vault = await Pubkey.find_program_address(sol_funds_vault_seed, program.program_id)
+    book = resolve_pair_address_book(accounts['pair'], program_id, accounts.get('address_book'))
+    sol_funds_vault = book.funds_sol_vault
 
     modify_compute_units = ComputeBudgetProgram.set_compute_unit_limit(units=round(100000000))
     add_priority_fee = ComputeBudgetProgram.set_compute_unit_price(micro_lamports=1)
@@ -341,14 +328,16 @@ async def withdraw_sol_from_pair(program_id: Pubkey, connection: Client, account
     instructions.append(modify_compute_units)
     instructions.append(add_priority_fee)
 
-    withdraw_instruction = await program.withdraw_sol_from_pair(BN(args['amount_of_orders'])).accounts_strict({
+    withdraw_instruction = get_instruction_encoder('withdrawSolFromPair').encode(program_id, {
+        'quantityOfOrders': args['amount_of_orders'],
+    }, {
         'pair': accounts['pair'],
         'authorityAdapter': accounts['authority_adapter'],
         'user': accounts['user_pubkey'],
         'fundsSolVault': sol_funds_vault,
         'systemProgram': SYS_PROGRAM_ID,
         'rent': SYSVAR_RENT_PUBKEY
-    }).instruction()
+    })
     instructions.append(withdraw_instruction)
 
     transaction = Transaction()
@@ -359,20 +348,19 @@ async def withdraw_sol_from_pair(program_id: Pubkey, connection: Client, account
     return {'account': None, 'instructions': instructions}
 
 async def withdraw_virtual_fees(program_id: Pubkey, connection: Client, accounts, send_txn):
-    program = await return_anchor_program(program_id, connection)
     instructions = []
 
-    fee_sol_vault_seed = [ENCODER.encode(FEE_PREFIX), accounts['pair'].to_bytes()]
-    fee_sol_vault = await Pubkey.find_program_address(fee_sol_vault_seed, program.program_id)
+    book = resolve_pair_address_book(accounts['pair'], program_id, accounts.get('address_book'))
+    fee_sol_vault = book.fee_sol_vault
 
-    withdraw_instruction = await program.withdraw_virtual_fees().accounts_strict({
+    withdraw_instruction = get_instruction_encoder('withdrawVirtualFees').encode(program_id, {}, {
         'pair': accounts['pair'],
         'authorityAdapter': accounts['authority_adapter'],
         'user': accounts['user_pubkey'],
         'feeSolVault': fee_sol_vault,
         'systemProgram': SYS_PROGRAM_ID,
         'rent': SYSVAR_RENT_PUBKEY
-    }).instruction()
+    })
     instructions.append(withdraw_instruction)
 
     transaction = Transaction()
@@ -0,0 +1,111 @@
+"""
+AccountColumns against the dict decoder: columns, masks and sum_by over random accounts give what the same
+filters and sums over the decoded dicts give.
+"""
+import asyncio
+import random
+from types import SimpleNamespace
+
+import pytest
+from solders.pubkey import Pubkey
+
+from ..common import NEW_DEVNET_PROGRAM, PairType
+from ..core.layouts import get_account_layout, get_account_layouts
+from .test_account_filters import leaf_paths, random_accounts, value_at
+
+np = pytest.importorskip('numpy')
+
+from ..core.columns import AccountColumns, get_account_columns  # noqa: E402
+
+MARKETS = [str(Pubkey(bytes([index]) * 32)) for index in range(1, 4)]
+
+
+def random_pairs(count, seed):
+    """Raw nftSwapPairs spread over a few markets, with their addresses and decoded dicts."""
+    rng = random.Random(seed)
+    layout = get_account_layout('nftSwapPair')
+    offset = layout.field('hadoMarket').offset
+    datas = []
+    for data in random_accounts('nftSwapPair', count, rng):
+        data = bytearray(data)
+        data[offset:offset + 32] = bytes(Pubkey.from_string(rng.choice(MARKETS)))
+        datas.append(bytes(data))
+    public_keys = [Pubkey(rng.randbytes(32)) for _ in range(count)]
+    return datas, public_keys, [layout.decode(data, str(public_key)) for data, public_key in zip(datas, public_keys)]
+
+
+@pytest.mark.parametrize('account_name', sorted(get_account_layouts()))
+def test_columns_hold_the_decoded_values(account_name):
+    rng = random.Random(account_name)
+    layout = get_account_layout(account_name)
+    datas = random_accounts(account_name, 50, rng)
+    public_keys = [Pubkey(rng.randbytes(32)) for _ in datas]
+    decoded = [layout.decode(data, str(public_key)) for data, public_key in zip(datas, public_keys)]
+    columns = AccountColumns.from_raw(account_name, datas, public_keys)
+
+    assert columns.to_dicts() == decoded
+    assert columns.public_key_strings() == [account['publicKey'] for account in decoded]
+    for path, field_layout in leaf_paths(layout.fields):
+        if field_layout.idl_type in ('bool', 'u8', 'i8', 'u16', 'i16', 'u32', 'i32', 'u64', 'i64'):
+            assert columns[path].tolist() == [value_at(account, path) for account in decoded]
+
+
+def test_masks_match_filtering_the_dicts():
+    datas, public_keys, decoded = random_pairs(400, 1)
+    columns = AccountColumns.from_raw('nftSwapPair', datas, public_keys)
+
+    for fields in (
+        {},
+        {'hadoMarket': MARKETS[0]},
+        {'hadoMarket': Pubkey.from_string(MARKETS[1]), 'pairType': PairType.TokenForNFT},
+        {'bondingCurve.bondingType': 'xyk', 'pairState': 'onMarketVirtual'},
+    ):
+        expected = [account for account in decoded if all(value_at(account, path) == str(value) for path, value in fields.items())]
+        assert columns[columns.mask(fields)].to_dicts() == expected
+        assert fields == {} or 0 < len(expected) < len(decoded)
+
+    with pytest.raises(ValueError):
+        columns.mask({'pairType': 'NftForToken'})
+    with pytest.raises(ValueError):
+        columns.mask({'noSuchField': 1})
+
+
+def wrap(total, dtype):
+    """An exact sum as the column's own integer dtype holds it, two's complement for signed types."""
+    bits = 8 * dtype.itemsize
+    total %= 2 ** bits
+    return total - 2 ** bits if dtype.kind == 'i' and total >= 2 ** (bits - 1) else total
+
+
+def test_sum_by_matches_summing_the_dicts():
+    datas, public_keys, decoded = random_pairs(400, 2)
+    columns = AccountColumns.from_raw('nftSwapPair', datas, public_keys)
+
+    for key_path, value_path in (
+        ('hadoMarket', 'fundsSolOrTokenBalance'),
+        ('pairType', 'nftsCount'),
+        ('bondingCurve.bondingType', 'mathCounter'),
+    ):
+        expected = {}
+        for account in decoded:
+            key = value_at(account, key_path)
+            expected[key] = expected.get(key, 0) + value_at(account, value_path)
+        dtype = columns[value_path].dtype
+        assert columns.sum_by(key_path, value_path) == {key: wrap(total, dtype) for key, total in expected.items()}
+
+
+def test_fetched_columns_and_wrong_types():
+    datas, public_keys, decoded = random_pairs(30, 3)
+
+    class Connection:
+        async def get_program_accounts(self, program_id, encoding=None, data_slice=None, filters=None):
+            return SimpleNamespace(value=[
+                SimpleNamespace(pubkey=public_key, account=SimpleNamespace(data=data)) for data, public_key in zip(datas, public_keys)
+            ])
+
+    assert asyncio.run(get_account_columns('nftSwapPair', NEW_DEVNET_PROGRAM, Connection())).to_dicts() == decoded
+
+    with pytest.raises(ValueError):
+        AccountColumns.from_raw('nftPairBox', datas, public_keys)
+    with pytest.raises(ValueError):
+        AccountColumns.from_raw('nftSwapPair', [datas[0][:-1]], public_keys[:1])
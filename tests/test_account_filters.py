@@ -0,0 +1,114 @@
+"""
+encode_account_field and the memcmp filters built from it: every single-value field of every account type is
+encoded at the offset and with the bytes anchorpy decodes it from, and filtered scans return what filtering the
+decoded accounts would.
+"""
+import asyncio
+import random
+from types import SimpleNamespace
+
+import base58
+import pytest
+from anchorpy.coder.accounts import AccountsCoder, _account_discriminator
+from solders.pubkey import Pubkey
+
+from ..common import NEW_DEVNET_PROGRAM, get_hadeswap_idl, PairType
+from ..core.accounts import account_filters, get_specific_accounts
+from ..core.layouts import encode_account_field, get_account_layout, get_account_layouts
+from ..idl import load_idl
+from .test_account_layouts import random_value_bytes, anchorpy_to_dict
+
+SAMPLES = 20
+
+
+def leaf_paths(fields, prefix=''):
+    for name, field_layout in fields.items():
+        if field_layout.fields:
+            yield from leaf_paths(field_layout.fields, f'{prefix}{name}.')
+        else:
+            yield f'{prefix}{name}', field_layout
+
+
+def random_accounts(account_name, count, rng):
+    idl = load_idl()
+    types = {idl_type['name']: idl_type['type'] for idl_type in idl['types']}
+    fields, = [account['type']['fields'] for account in idl['accounts'] if account['name'] == account_name]
+    layout = get_account_layout(account_name)
+    return [layout.discriminator + b''.join(random_value_bytes(rng, field['type'], types) for field in fields) for _ in range(count)]
+
+
+def value_at(decoded, path):
+    for name in path.split('.'):
+        decoded = decoded[name]
+    return decoded
+
+
+@pytest.mark.parametrize('account_name', sorted(get_account_layouts()))
+def test_encoded_fields_are_the_bytes_anchorpy_decodes(account_name):
+    coder = AccountsCoder(get_hadeswap_idl())
+    layout = get_account_layout(account_name)
+    for data in random_accounts(account_name, SAMPLES, random.Random(account_name)):
+        decoded = anchorpy_to_dict(coder.decode(_account_discriminator(account_name) + data[8:]))
+        for path, field_layout in leaf_paths(layout.fields):
+            value = value_at(decoded, path)
+            if isinstance(field_layout.idl_type, dict) and 'array' in field_layout.idl_type:
+                with pytest.raises(ValueError):
+                    encode_account_field(account_name, path, value)
+                continue
+            offset, encoded = encode_account_field(account_name, path, value)
+            assert (offset, len(encoded)) == (field_layout.offset, field_layout.size)
+            assert data[offset:offset + len(encoded)] == encoded
+
+
+def test_invalid_filters_are_rejected():
+    with pytest.raises(ValueError):
+        encode_account_field('nftSwapPair', 'bondingCurve', {'delta': 1, 'bondingType': 'linear'})
+    with pytest.raises(ValueError):
+        encode_account_field('nftSwapPair', 'pairType', 'NftForToken')
+    with pytest.raises(ValueError):
+        encode_account_field('nftSwapPair', 'noSuchField', 1)
+
+
+class MemcmpConnection:
+    """Applies memcmp filters the way an RPC node does."""
+
+    def __init__(self, accounts):
+        self.accounts = accounts
+
+    async def get_program_accounts(self, program_id, encoding=None, data_slice=None, filters=None):
+        return SimpleNamespace(value=[
+            SimpleNamespace(pubkey=pubkey, account=SimpleNamespace(data=data))
+            for pubkey, data in self.accounts
+            if all(data[memcmp.offset:].startswith(base58.b58decode(memcmp.bytes)) for memcmp in filters)
+        ])
+
+
+def test_filtered_scans_match_filtering_the_decoded_accounts():
+    rng = random.Random(7)
+    layout = get_account_layout('nftSwapPair')
+    markets = [Pubkey(rng.randbytes(32)) for _ in range(3)]
+    accounts = []
+    offset = layout.field('hadoMarket').offset
+    for data in random_accounts('nftSwapPair', 300, rng):
+        data = bytearray(data)
+        data[offset:offset + 32] = bytes(rng.choice(markets))
+        accounts.append((Pubkey(rng.randbytes(32)), bytes(data)))
+    # Other account types never match a nftSwapPair scan
+    accounts += [(Pubkey(rng.randbytes(32)), data) for data in random_accounts('nftPairBox', 20, rng)]
+    decoded = [layout.decode(data, str(pubkey)) for pubkey, data in accounts[:300]]
+    connection = MemcmpConnection(accounts)
+
+    for fields in (
+        None,
+        {'hadoMarket': markets[0]},
+        {'hadoMarket': str(markets[1]), 'pairType': PairType.LiquidityProvision},
+        {'bondingCurve.bondingType': 'xyk'},
+    ):
+        result = asyncio.run(get_specific_accounts('nftSwapPair', NEW_DEVNET_PROGRAM, connection, fields))
+        expected = [
+            account for account in decoded
+            if all(value_at(account, path) == str(value) if isinstance(value, Pubkey) else value_at(account, path) == value
+                   for path, value in (fields or {}).items())
+        ]
+        assert result == expected and expected
+        assert len(account_filters('nftSwapPair', fields)) == 1 + len(fields or {})
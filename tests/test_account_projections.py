@@ -0,0 +1,86 @@
+"""
+The dataSlice projections against the full decoder: decoding only the covered byte range gives the projected fields
+of the full decode, and projected scans request exactly that range.
+"""
+import asyncio
+import random
+from types import SimpleNamespace
+
+import pytest
+from solders.pubkey import Pubkey
+
+from ..common import NEW_DEVNET_PROGRAM
+from ..core.accounts import get_specific_accounts, get_accounts_by_address, PAIR_PRICING_FIELDS
+from ..core.layouts import get_account_layout, get_account_layouts, get_account_projection
+from .test_account_filters import random_accounts
+
+SAMPLES = 20
+
+
+def projected(account, fields):
+    return {**{field: account[field] for field in fields}, 'publicKey': account['publicKey']}
+
+
+@pytest.mark.parametrize('account_name', sorted(get_account_layouts()))
+def test_projections_match_the_full_decode(account_name):
+    layout = get_account_layout(account_name)
+    rng = random.Random(account_name)
+    names = list(layout.fields)
+    for data in random_accounts(account_name, SAMPLES, rng):
+        public_key = str(Pubkey(rng.randbytes(32)))
+        account = layout.decode(data, public_key)
+        fields = tuple(rng.sample(names, rng.randint(1, len(names))))
+        projection = get_account_projection(account_name, fields)
+        covered = [layout.field(field) for field in fields]
+        assert projection.offset == min(field_layout.offset for field_layout in covered)
+        assert projection.offset + projection.length == max(field_layout.offset + field_layout.size for field_layout in covered)
+        assert projection.decode(data[projection.offset:projection.offset + projection.length], public_key) == projected(account, fields)
+
+
+def test_invalid_projections_are_rejected():
+    with pytest.raises(ValueError):
+        get_account_projection('nftSwapPair', ())
+    with pytest.raises(ValueError):
+        get_account_projection('nftSwapPair', ('bondingCurve.delta',))
+    with pytest.raises(ValueError):
+        get_account_projection('nftSwapPair', ('noSuchField',))
+
+
+class SlicingConnection:
+    """Serves random nftSwapPairs, slicing their data the way an RPC node does."""
+
+    def __init__(self, count):
+        rng = random.Random(count)
+        self.accounts = {Pubkey(rng.randbytes(32)): data for data in random_accounts('nftSwapPair', count, rng)}
+        self.data_slices = []
+
+    def sliced(self, data, data_slice):
+        self.data_slices.append(data_slice and (data_slice.offset, data_slice.length))
+        return data[data_slice.offset:data_slice.offset + data_slice.length] if data_slice else data
+
+    async def get_program_accounts(self, program_id, encoding=None, data_slice=None, filters=None):
+        return SimpleNamespace(value=[
+            SimpleNamespace(pubkey=pubkey, account=SimpleNamespace(data=self.sliced(data, data_slice)))
+            for pubkey, data in self.accounts.items()
+        ])
+
+    async def get_multiple_accounts(self, addresses, encoding=None, data_slice=None):
+        return SimpleNamespace(value=[SimpleNamespace(data=self.sliced(self.accounts[address], data_slice)) for address in addresses])
+
+    def expected(self, fields):
+        layout = get_account_layout('nftSwapPair')
+        return [projected(layout.decode(data, str(pubkey)), fields) for pubkey, data in self.accounts.items()]
+
+
+def test_projected_scans_slice_the_covered_range():
+    connection = SlicingConnection(50)
+    projection = get_account_projection('nftSwapPair', PAIR_PRICING_FIELDS)
+
+    result = asyncio.run(get_specific_accounts('nftSwapPair', NEW_DEVNET_PROGRAM, connection, projection=PAIR_PRICING_FIELDS))
+    assert result == connection.expected(PAIR_PRICING_FIELDS)
+    assert set(connection.data_slices) == {(projection.offset, projection.length)}
+
+    connection.data_slices.clear()
+    result = asyncio.run(get_accounts_by_address('nftSwapPair', list(connection.accounts), connection, projection=PAIR_PRICING_FIELDS, chunk_size=7))
+    assert result == connection.expected(PAIR_PRICING_FIELDS)
+    assert set(connection.data_slices) == {(projection.offset, projection.length)}
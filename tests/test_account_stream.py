@@ -0,0 +1,46 @@
+"""
+iter_specific_accounts keeps at most `prefetch` getMultipleAccounts requests in flight.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from solders.keypair import Keypair
+
+from ..common import NEW_DEVNET_PROGRAM
+from ..core.accounts import iter_specific_accounts
+from ..core.layouts import get_account_layout
+
+
+class CountingConnection:
+    def __init__(self, account_count):
+        self.addresses = [Keypair().pubkey() for _ in range(account_count)]
+        layout = get_account_layout('nftPairBox')
+        self.data = layout.discriminator + bytes(layout.size - len(layout.discriminator))
+        self.in_flight = self.max_in_flight = 0
+
+    async def get_program_accounts(self, program_id, encoding=None, data_slice=None, filters=None):
+        return SimpleNamespace(value=[SimpleNamespace(pubkey=address) for address in self.addresses])
+
+    async def get_multiple_accounts(self, pubkeys, encoding=None, data_slice=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        return SimpleNamespace(value=[SimpleNamespace(data=self.data) for _ in pubkeys])
+
+
+@pytest.mark.parametrize('prefetch, max_in_flight', [(0, 1), (1, 1), (2, 2), (4, 4)])
+def test_prefetch_bounds_requests_in_flight(prefetch, max_in_flight):
+    connection = CountingConnection(25)
+
+    async def consume():
+        chunks = []
+        async for chunk in iter_specific_accounts('nftPairBox', NEW_DEVNET_PROGRAM, connection, chunk_size=3, prefetch=prefetch):
+            await asyncio.sleep(0.002)
+            chunks.append(chunk)
+        return chunks
+
+    chunks = asyncio.run(consume())
+    assert [len(chunk) for chunk in chunks] == [3] * 8 + [1]
+    assert connection.max_in_flight == max_in_flight
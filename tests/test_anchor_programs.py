@@ -0,0 +1,42 @@
+"""
+return_anchor_program shares one Program per (program_id, connection) and holds connections weakly.
+"""
+import gc
+
+from solana.rpc.async_api import AsyncClient
+from solders.keypair import Keypair
+
+from ..common import NEW_DEVNET_PROGRAM, return_anchor_program, invalidate_anchor_program, _ANCHOR_PROGRAMS
+
+
+def new_connection():
+    return AsyncClient('http://127.0.0.1:8899')
+
+
+def test_programs_are_shared_per_program_and_connection():
+    connection, other_connection = new_connection(), new_connection()
+    other_program_id = Keypair().pubkey()
+
+    program = return_anchor_program(NEW_DEVNET_PROGRAM, connection)
+    assert return_anchor_program(NEW_DEVNET_PROGRAM, connection) is program
+    assert return_anchor_program(NEW_DEVNET_PROGRAM, other_connection) is not program
+    assert return_anchor_program(other_program_id, connection) is not program
+    assert program.provider.connection._provider is connection._provider
+
+    assert invalidate_anchor_program(other_program_id, connection) == 1
+    assert return_anchor_program(NEW_DEVNET_PROGRAM, connection) is program
+    assert invalidate_anchor_program(connection=connection) == 1
+    assert return_anchor_program(NEW_DEVNET_PROGRAM, connection) is not program
+    assert invalidate_anchor_program(NEW_DEVNET_PROGRAM) == 2
+    assert connection not in _ANCHOR_PROGRAMS and other_connection not in _ANCHOR_PROGRAMS
+
+
+def test_programs_go_away_with_their_connection():
+    connection = new_connection()
+    return_anchor_program(NEW_DEVNET_PROGRAM, connection)
+    assert connection in _ANCHOR_PROGRAMS
+
+    registered = len(_ANCHOR_PROGRAMS)
+    del connection
+    gc.collect()
+    assert len(_ANCHOR_PROGRAMS) == registered - 1
@@ -0,0 +1,156 @@
+"""
+Property tests: the closed-form curve pricing against the original step-by-step loops, bit for bit.
+
+Run from the directory containing the hadeswap package:
+
+    python -m pytest hadeswap/tests
+"""
+import random
+
+import pytest
+
+from ..common import (
+    BondingCurveType, OrderType, calculate_next_spot_price, calculate_prices_array, calculate_prices_total,
+    get_sum_of_orders_series, _linear_closed_form_is_exact,
+)
+
+CURVES = [BondingCurveType.Linear, BondingCurveType.Exponential, BondingCurveType.XYK]
+ORDER_TYPES = [OrderType.Buy, OrderType.Sell]
+SAMPLES = 3000
+
+
+def loop_next_spot_price(order_type, spot_price, delta, bonding_curve_type, counter):
+    """calculate_next_spot_price as it was before the closed forms."""
+    if bonding_curve_type == BondingCurveType.Linear:
+        current_price = spot_price
+        target_counter = counter + (1 if order_type == OrderType.Buy else -1)
+        for _ in range(abs(target_counter)):
+            current_price = current_price + delta if target_counter >= 0 else current_price - delta
+        return current_price
+    return calculate_next_spot_price(order_type, spot_price, delta, bonding_curve_type, counter)
+
+
+def loop_sum_of_orders_series(amount_of_orders, order_type, spot_price, delta, bonding_curve_type, counter):
+    """get_sum_of_orders_series as it was before the closed forms."""
+    series_sum = 0
+    current_spot_price = spot_price
+    new_counter = counter
+    for _ in range(amount_of_orders):
+        series_sum += current_spot_price
+        current_spot_price = loop_next_spot_price(order_type, current_spot_price, delta, bonding_curve_type, new_counter)
+        new_counter = new_counter + 1 if order_type == OrderType.Buy else new_counter - 1
+    return series_sum
+
+
+def loop_prices_total(starting_spot_price, delta, amount, bonding_curve_type, order_type, counter):
+    """calculate_prices_array(...)['total'] with the step-by-step prices."""
+    new_counter = counter + 1 if order_type == OrderType.Sell else counter
+    prices = []
+    for _ in range(amount):
+        prices.append(loop_next_spot_price(order_type, starting_spot_price, delta, bonding_curve_type, new_counter))
+        new_counter = new_counter + 1 if order_type == OrderType.Buy else new_counter - 1
+    return sum(prices)
+
+
+def outcome(function, *args):
+    """Result of a call, or the type of the exception it raised."""
+    try:
+        return function(*args)
+    except (ZeroDivisionError, OverflowError) as error:
+        return type(error)
+
+
+def random_curve_inputs(rng, bonding_curve_type):
+    """Spot price, delta and counter as pairs store them, as ints or floats."""
+    if bonding_curve_type == BondingCurveType.Linear:
+        spot_price, delta, counter = rng.randint(0, 10 ** 9), rng.randint(0, 10 ** 6), rng.randint(-200, 200)
+    elif bonding_curve_type == BondingCurveType.Exponential:
+        spot_price, delta, counter = rng.randint(10 ** 6, 10 ** 9), rng.randint(0, 2000), rng.randint(-200, 200)
+    else:
+        spot_price, delta, counter = rng.randint(10 ** 6, 10 ** 9), rng.randint(1, 300), rng.randint(-50, 250)
+    if rng.random() < 0.5:
+        spot_price, delta = float(spot_price), float(delta)
+    return spot_price, delta, counter
+
+
+def assert_same(actual, expected):
+    assert actual == expected and type(actual) is type(expected)
+
+
+@pytest.mark.parametrize('order_type', ORDER_TYPES)
+def test_linear_next_spot_price_matches_loop(order_type):
+    rng = random.Random(1)
+    for _ in range(SAMPLES):
+        spot_price, delta, counter = random_curve_inputs(rng, BondingCurveType.Linear)
+        expected = loop_next_spot_price(order_type, spot_price, delta, BondingCurveType.Linear, counter)
+        actual = calculate_next_spot_price(order_type, spot_price, delta, BondingCurveType.Linear, counter)
+        assert_same(actual, expected)
+
+
+@pytest.mark.parametrize('bonding_curve_type', CURVES)
+@pytest.mark.parametrize('order_type', ORDER_TYPES)
+def test_sum_of_orders_series_matches_loop(bonding_curve_type, order_type):
+    rng = random.Random(2)
+    for _ in range(SAMPLES // 3):
+        spot_price, delta, counter = random_curve_inputs(rng, bonding_curve_type)
+        amount = rng.randint(0, 30)
+        args = (amount, order_type, spot_price, delta, bonding_curve_type, counter)
+        assert_same(outcome(get_sum_of_orders_series, *args), outcome(loop_sum_of_orders_series, *args))
+
+
+@pytest.mark.parametrize('bonding_curve_type', CURVES)
+@pytest.mark.parametrize('order_type', ORDER_TYPES)
+def test_prices_total_matches_loop(bonding_curve_type, order_type):
+    rng = random.Random(3)
+    for _ in range(SAMPLES):
+        spot_price, delta, counter = random_curve_inputs(rng, bonding_curve_type)
+        amount = rng.randint(0, 60)
+        args = (spot_price, delta, amount, bonding_curve_type, order_type, counter)
+        expected = outcome(loop_prices_total, *args)
+        assert_same(outcome(calculate_prices_total, *args), expected)
+        assert_same(outcome(lambda: calculate_prices_array(*args)['total']), expected)
+
+
+@pytest.mark.parametrize('spot_price, delta', [
+    (1.5e9 + 0.25, 2.5e5 + 0.5),   # fractional floats
+    (10 ** 9, 2.0e5),              # int spot price, float delta
+    (float(2 ** 53), 1.0),         # integral floats beyond 2**53
+    (123456789.0, 0.1),
+])
+@pytest.mark.parametrize('order_type', ORDER_TYPES)
+def test_linear_float_fallback_matches_loop(spot_price, delta, order_type):
+    rng = random.Random(4)
+    for _ in range(200):
+        counter, amount = rng.randint(-100, 100), rng.randint(0, 30)
+        assert not _linear_closed_form_is_exact(spot_price, delta, counter, abs(spot_price))
+        assert_same(
+            calculate_next_spot_price(order_type, spot_price, delta, BondingCurveType.Linear, counter),
+            loop_next_spot_price(order_type, spot_price, delta, BondingCurveType.Linear, counter),
+        )
+        series_args = (amount, order_type, spot_price, delta, BondingCurveType.Linear, counter)
+        assert_same(get_sum_of_orders_series(*series_args), loop_sum_of_orders_series(*series_args))
+        total_args = (spot_price, delta, amount, BondingCurveType.Linear, order_type, counter)
+        assert_same(calculate_prices_total(*total_args), loop_prices_total(*total_args))
+
+
+def test_closed_form_guard_rejects_inexact_inputs():
+    assert _linear_closed_form_is_exact(10 ** 30, 7, 5, 10 ** 40)
+    assert _linear_closed_form_is_exact(1e9, 1e5, 5, 2 ** 52)
+    assert not _linear_closed_form_is_exact(1e9, 1e5, 5, 2 ** 53)
+    assert not _linear_closed_form_is_exact(1e9 + 0.5, 1e5, 5, 0)
+    assert not _linear_closed_form_is_exact(10 ** 9, 1e5, 5, 0)
+    assert not _linear_closed_form_is_exact(10 ** 9, 10 ** 5, 5.0, 0)
+
+
+@pytest.mark.parametrize('order_type', ORDER_TYPES)
+def test_xyk_total_across_a_pole_raises_like_the_loop(order_type):
+    # delta == counter puts a zero denominator inside the range for buys; delta + 1 == counter for sells
+    counter = 40 if order_type == OrderType.Buy else 41
+    args = (1e9, 40.0, 5, BondingCurveType.XYK, order_type, counter)
+    assert outcome(loop_prices_total, *args) is ZeroDivisionError
+    assert outcome(calculate_prices_total, *args) is ZeroDivisionError
+
+
+def test_exponential_total_of_large_depth():
+    args = (1e9, 250.0, 5000, BondingCurveType.Exponential, OrderType.Sell, 100)
+    assert calculate_prices_total(*args) == loop_prices_total(*args)
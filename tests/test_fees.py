@@ -0,0 +1,81 @@
+"""
+Worked examples for all_in_quote: every expected amount is a literal, worked by hand below in lamports
+with each division truncated toward zero.
+"""
+import pytest
+
+from ..common import BondingCurveType, OrderType, PairType
+from ..core.fees import all_in_quote
+from ..core.quotes import pair_buy_price, pair_sell_price
+
+# 1% protocol fee, 20% of the LP fee goes to the protocol
+PROTOCOL_SETTINGS = {'protocolFee': 100, 'protocolFeeMultiplier': 2000}
+
+
+def make_pair(pair_type, base_spot_price, delta, fee, bonding_type=BondingCurveType.Linear, math_counter=0):
+    return {
+        'pairType': pair_type,
+        'baseSpotPrice': base_spot_price,
+        'bondingCurve': {'delta': delta, 'bondingType': bonding_type},
+        'mathCounter': math_counter,
+        'fee': fee,
+    }
+
+
+def test_buy_from_liquidity_pair():
+    # Prices 1.1 and 1.2 SOL. Per order: protocol 1% = 11M / 12M, LP 2% = 22M / 24M, of which 20% = 4.4M / 4.8M
+    # goes to the protocol, royalties 5% = 55M / 60M
+    pair = make_pair(PairType.LiquidityProvision, 1_000_000_000, 100_000_000, 200)
+    quote = all_in_quote(pair, 2, OrderType.Buy, PROTOCOL_SETTINGS, royalty_bps=500)
+    assert quote == {
+        'gross': 2_300_000_000,
+        'protocolFee': 32_200_000,
+        'lpFee': 36_800_000,
+        'royalties': 115_000_000,
+        'total': 2_484_000_000,
+        'prices': [1_100_000_000, 1_200_000_000],
+    }
+
+
+def test_sell_to_liquidity_pair():
+    # Prices 1.0 and 0.9 SOL. Per order: protocol 10M / 9M, LP 20M / 18M with a 4M / 3.6M share, royalties 50M / 45M
+    pair = make_pair(PairType.LiquidityProvision, 1_000_000_000, 100_000_000, 200)
+    quote = all_in_quote(pair, 2, OrderType.Sell, PROTOCOL_SETTINGS, royalty_bps=500)
+    assert quote == {
+        'gross': 1_900_000_000,
+        'protocolFee': 26_600_000,
+        'lpFee': 30_400_000,
+        'royalties': 95_000_000,
+        'total': 1_748_000_000,
+        'prices': [1_000_000_000, 900_000_000],
+    }
+
+
+def test_fees_truncate_per_order():
+    # 333333333 * 1.5% = 4999999.995 -> 4999999 and 333333333 * 3.33% = 11099999.99 -> 11099999, three times
+    pair = make_pair(PairType.NftForToken, 333_333_333, 0, 0)
+    quote = all_in_quote(pair, 3, OrderType.Buy, {'protocolFee': 150, 'protocolFeeMultiplier': 2000}, royalty_bps=333)
+    assert (quote['protocolFee'], quote['lpFee'], quote['royalties']) == (14_999_997, 0, 33_299_997)
+    assert quote['total'] == 999_999_999 + 14_999_997 + 33_299_997
+
+
+@pytest.mark.parametrize('pair_type', [PairType.TokenForNFT, PairType.NftForToken])
+def test_lp_fee_only_applies_to_liquidity_pairs(pair_type):
+    pair = make_pair(pair_type, 1_000_000_000, 100_000_000, 200)
+    order_type = OrderType.Sell if pair_type == PairType.TokenForNFT else OrderType.Buy
+    quote = all_in_quote(pair, 2, order_type, PROTOCOL_SETTINGS)
+    assert quote['lpFee'] == 0 and quote['royalties'] == 0
+    assert quote['protocolFee'] == sum(price // 100 for price in quote['prices'])
+
+
+@pytest.mark.parametrize('bonding_type, delta', [
+    (BondingCurveType.Linear, 12_345_678), (BondingCurveType.Exponential, 250), (BondingCurveType.XYK, 40),
+])
+@pytest.mark.parametrize('order_type', [OrderType.Buy, OrderType.Sell])
+def test_prices_follow_the_pair_ladder(bonding_type, delta, order_type):
+    pair = make_pair(PairType.LiquidityProvision, 1_000_000_000, delta, 100, bonding_type, math_counter=3)
+    price_of = pair_buy_price if order_type == OrderType.Buy else pair_sell_price
+    quote = all_in_quote(pair, 5, order_type, PROTOCOL_SETTINGS)
+    assert all(type(price) is int for price in quote['prices'])
+    # The float helpers drift from the lamport prices by a few lamports at most
+    assert all(abs(price - price_of(pair, unit)) <= 2 for unit, price in enumerate(quote['prices']))
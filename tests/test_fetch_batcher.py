@@ -0,0 +1,68 @@
+"""
+AccountFetchBatcher failures stay per key, and shared batchers go away with their connections.
+"""
+import asyncio
+import gc
+from types import SimpleNamespace
+
+import pytest
+from solders.keypair import Keypair
+
+from ..core.accounts import AccountFetchBatcher, get_account_fetch_batcher, _FETCH_BATCHERS
+from ..core.layouts import get_account_layout
+
+
+class FakeConnection:
+    def __init__(self, datas):
+        self.datas = datas
+
+    async def get_multiple_accounts(self, pubkeys, encoding=None):
+        return SimpleNamespace(value=[
+            None if self.datas[str(pubkey)] is None else SimpleNamespace(data=self.datas[str(pubkey)])
+            for pubkey in pubkeys
+        ])
+
+
+def test_decoding_errors_fail_only_their_own_future():
+    layout = get_account_layout('nftSwapPair')
+    good, short, missing = (str(Keypair().pubkey()) for _ in range(3))
+    connection = FakeConnection({
+        good: layout.discriminator + bytes(layout.size - len(layout.discriminator)),
+        short: layout.discriminator + b'\x00',
+        missing: None,
+    })
+
+    async def fetch_all():
+        batcher = AccountFetchBatcher(connection, window=0)
+        futures = [batcher.fetch('nftSwapPair', key) for key in (good, short, missing)]
+        return await asyncio.wait_for(asyncio.gather(*futures, return_exceptions=True), timeout=1)
+
+    pair, short_error, missing_error = asyncio.run(fetch_all())
+    assert pair['publicKey'] == good
+    assert isinstance(short_error, Exception)
+    assert isinstance(missing_error, ValueError)
+
+
+def test_rpc_error_fails_every_future_of_the_chunk():
+    class FailingConnection:
+        async def get_multiple_accounts(self, pubkeys, encoding=None):
+            raise ConnectionError('rpc down')
+
+    async def fetch_all():
+        batcher = AccountFetchBatcher(FailingConnection(), window=0)
+        futures = [batcher.fetch('nftSwapPair', Keypair().pubkey()) for _ in range(3)]
+        return await asyncio.wait_for(asyncio.gather(*futures, return_exceptions=True), timeout=1)
+
+    assert all(isinstance(error, ConnectionError) for error in asyncio.run(fetch_all()))
+
+
+def test_shared_batchers_do_not_outlive_their_connections():
+    connection = FakeConnection({})
+    batcher = get_account_fetch_batcher(connection)
+    assert get_account_fetch_batcher(connection) is batcher
+    assert connection in _FETCH_BATCHERS
+
+    del connection
+    gc.collect()
+    assert batcher.connection is None
+    assert len([key for key in _FETCH_BATCHERS.keys() if isinstance(key, FakeConnection)]) == 0
@@ -0,0 +1,70 @@
+"""
+The marshal IDL snapshot is only used while it matches the canonical JSON.
+"""
+import os
+
+import pytest
+
+from .. import idl
+
+
+@pytest.fixture
+def idl_files(tmp_path, monkeypatch):
+    json_path = tmp_path / '__hadeswap_idl.json'
+    json_path.write_text(idl.IDL_JSON_PATH.read_text(encoding='utf-8'), encoding='utf-8')
+    monkeypatch.setattr(idl, 'IDL_JSON_PATH', json_path)
+    monkeypatch.setattr(idl, 'IDL_SNAPSHOT_PATH', tmp_path / '__hadeswap_idl.marshal')
+
+    def reload():
+        idl.load_idl_json.cache_clear()
+        idl.load_idl.cache_clear()
+        return idl.load_idl()
+
+    yield json_path, reload
+    idl.load_idl_json.cache_clear()
+    idl.load_idl.cache_clear()
+
+
+def test_fresh_snapshot_is_used(idl_files, monkeypatch):
+    json_path, reload = idl_files
+    idl.build_idl_snapshot(idl.IDL_SNAPSHOT_PATH)
+    # A snapshot hit never parses the JSON
+    monkeypatch.setattr(idl.json, 'loads', None)
+    assert reload()['name'] == 'hadeswap'
+
+
+def edit_json(json_path, edited):
+    # Two writes within one filesystem timestamp tick can share an mtime, so date the edit explicitly
+    snapshot_mtime_ns = os.stat(idl.IDL_SNAPSHOT_PATH).st_mtime_ns
+    json_path.write_text(edited, encoding='utf-8')
+    os.utime(json_path, ns=(snapshot_mtime_ns + 10 ** 9, snapshot_mtime_ns + 10 ** 9))
+
+
+def test_snapshot_older_than_an_edit_of_the_same_size_is_stale(idl_files):
+    json_path, reload = idl_files
+    idl.build_idl_snapshot(idl.IDL_SNAPSHOT_PATH)
+    text = json_path.read_text(encoding='utf-8')
+    edited = text.replace('"hadeswap"', '"hadeswop"', 1)
+    assert len(edited) == len(text) and edited != text
+    edit_json(json_path, edited)
+    assert reload()['name'] == 'hadeswop'
+
+
+def test_snapshot_of_another_size_is_stale(idl_files):
+    json_path, reload = idl_files
+    text = json_path.read_text(encoding='utf-8')
+    json_path.write_text(text.replace('"hadeswap"', '"hadeswap_v2"', 1), encoding='utf-8')
+    idl.build_idl_snapshot(idl.IDL_SNAPSHOT_PATH)
+    # An older JSON restored with its original mtime, e.g. by a checkout or an install, is still detected
+    json_path.write_text(text, encoding='utf-8')
+    os.utime(json_path, ns=(0, 0))
+    assert reload()['name'] == 'hadeswap'
+
+
+def test_star_import_exports_the_public_api_only():
+    namespace = {}
+    exec(f'from {idl.__package__} import *', namespace)
+    assert namespace['HadeswapIDL']['name'] == 'hadeswap'
+    assert 'get_sum_of_orders_series' in namespace and 'generate_initialize_pair_instructions' in namespace
+    # Submodules and the names common.py imports are not part of it
+    assert not {'common', 'router', 'json', 'Pubkey', 'Program'} & set(namespace)
@@ -0,0 +1,112 @@
+"""
+The static instruction encoders against anchorpy's InstructionCoder: random arguments of every IDL instruction encode to the same bytes.
+"""
+import random
+
+import pytest
+from anchorpy.coder.instruction import InstructionCoder
+from anchorpy.program.namespace.types import _build_types
+from pyheck import snake
+from solders.pubkey import Pubkey
+
+from ..common import get_hadeswap_idl
+from ..core.instructions import get_instruction_encoders, get_instruction_encoder
+from ..idl import load_idl
+
+SAMPLES = 50
+INTEGER_BITS = {'u8': 8, 'u16': 16, 'u32': 32, 'u64': 64, 'u128': 128, 'i8': 8, 'i16': 16, 'i32': 32, 'i64': 64, 'i128': 128}
+
+
+class RandomArguments:
+    """Random values of IDL types, both as the static encoders take them and as anchorpy objects."""
+
+    def __init__(self, rng, types, anchorpy_types):
+        self.rng = rng
+        self.types = types
+        self.anchorpy_types = anchorpy_types
+
+    def value(self, idl_type):
+        """Return (encoder value, anchorpy value) of one random value."""
+        rng = self.rng
+        if idl_type == 'bool':
+            value = rng.random() < 0.5
+            return value, value
+        if isinstance(idl_type, str) and idl_type in INTEGER_BITS:
+            bits = INTEGER_BITS[idl_type]
+            value = rng.randrange(-2 ** (bits - 1), 2 ** (bits - 1)) if idl_type[0] == 'i' else rng.randrange(2 ** bits)
+            return value, value
+        if idl_type == 'publicKey':
+            value = Pubkey(rng.randbytes(32))
+            return value, value
+        if idl_type == 'string':
+            value = ''.join(rng.choice('abcdeé✓') for _ in range(rng.randrange(6)))
+            return value, value
+        if idl_type == 'bytes':
+            value = rng.randbytes(rng.randrange(6))
+            return value, value
+        if 'vec' in idl_type:
+            return self.values([idl_type['vec']] * rng.randrange(3))
+        if 'option' in idl_type:
+            return self.value(idl_type['option']) if rng.random() < 0.7 else (None, None)
+        if 'array' in idl_type:
+            item_type, length = idl_type['array']
+            if item_type == 'u8':
+                value = rng.randbytes(length)
+                return value, list(value)
+            return self.values([item_type] * length)
+        return self.defined(idl_type['defined'])
+
+    def values(self, idl_types):
+        pairs = [self.value(idl_type) for idl_type in idl_types]
+        return [ours for ours, _ in pairs], [theirs for _, theirs in pairs]
+
+    def fields(self, fields):
+        """Encoder dict with IDL field names and anchorpy keyword arguments with snake_case names."""
+        ours, theirs = {}, {}
+        for field in fields:
+            ours[field['name']], theirs[snake(field['name'])] = self.value(field['type'])
+        return ours, theirs
+
+    def defined(self, type_name):
+        defined = self.types[type_name]
+        anchorpy_type = self.anchorpy_types[type_name]
+        if defined['kind'] == 'struct':
+            ours, theirs = self.fields(defined['fields'])
+            return ours, anchorpy_type(**theirs)
+
+        variant = self.rng.choice(defined['variants'])
+        variant_name = variant['name']
+        constructor = getattr(anchorpy_type, variant_name)
+        if 'fields' not in variant:
+            # Every variant name form the encoders accept
+            return self.rng.choice([variant_name, variant_name.lower(), {variant_name: {}}]), constructor()
+        ours, theirs = self.values(variant['fields'])
+        return {variant_name[0].lower() + variant_name[1:]: ours}, constructor(tuple_data=tuple(theirs))
+
+
+@pytest.fixture(scope='module')
+def anchorpy_coder():
+    idl = get_hadeswap_idl()
+    return InstructionCoder(idl), _build_types(idl)
+
+
+@pytest.mark.parametrize('instruction_name', sorted(get_instruction_encoders()))
+def test_encoder_matches_anchorpy(anchorpy_coder, instruction_name):
+    coder, anchorpy_types = anchorpy_coder
+    idl = load_idl()
+    types = {idl_type['name']: idl_type['type'] for idl_type in idl['types']}
+    instruction, = [instruction for instruction in idl['instructions'] if instruction['name'] == instruction_name]
+    encoder = get_instruction_encoder(instruction_name)
+    arguments = RandomArguments(random.Random(instruction_name), types, anchorpy_types)
+
+    for _ in range(SAMPLES):
+        ours, theirs = arguments.fields(instruction['args'])
+        assert encoder.encode_data(ours) == coder.encode(snake(instruction_name), theirs)
+
+
+def test_accounts_follow_the_idl_order():
+    for instruction in load_idl()['instructions']:
+        encoder = get_instruction_encoder(instruction['name'])
+        assert encoder.accounts == tuple(
+            (account['name'], account['isSigner'], account['isMut']) for account in instruction['accounts']
+        )
@@ -0,0 +1,93 @@
+"""
+Golden vectors for the integer lamport pricing.
+
+Every expected value is a literal, evaluated from the curve formulas with fractions.Fraction
+(independently of core/lamports.py) and truncated toward zero at each division the way Rust
+u64/i64 integer division does: the per-step balance update of XYK, the single division of an
+exponential power. The comments show a few of them worked by hand. They pin the rounding of
+core/lamports.py; the float helpers of common.py must stay within a few lamports of them.
+"""
+import math
+
+import pytest
+
+from ..common import (
+    BondingCurveType, OrderType, calculate_next_spot_price, get_sum_of_orders_series,
+    derive_xyk_base_spot_price_from_current_spot_price,
+)
+from ..core.lamports import (
+    next_spot_price_lamports, sum_of_orders_series_lamports, prices_array_lamports, derive_xyk_base_spot_price_lamports,
+)
+
+LINEAR, EXPONENTIAL, XYK = BondingCurveType.Linear, BondingCurveType.Exponential, BondingCurveType.XYK
+BUY, SELL = OrderType.Buy, OrderType.Sell
+
+# (curve, order type, spot price, delta, counter, next spot price, sum of a 5-order series)
+GOLDEN_VECTORS = [
+    (LINEAR, BUY, 1_000_000_000, 50_000_000, 0, 1_050_000_000, 6_000_000_000),
+    (LINEAR, SELL, 1_000_000_000, 50_000_000, 0, 950_000_000, 4_000_000_000),
+    (LINEAR, BUY, 1_000_000_000, 50_000_000, -3, 900_000_000, 4_500_000_000),
+    (LINEAR, SELL, 1_000_000_000, 50_000_000, 5, 1_200_000_000, 6_500_000_000),
+    (LINEAR, BUY, 123_456_789, 1_234_567, 17, 145_678_995, 851_851_675),
+    (LINEAR, SELL, 123_456_789, 1_234_567, -4, 117_283_954, 543_209_925),
+    # 1e9 * 1.05, 1e9 * 1.05**2, 1e9 / 1.05 = 952380952.38, 1e9 / 1.05**2 = 907029478.46
+    (EXPONENTIAL, BUY, 1_000_000_000, 500, 0, 1_050_000_000, 6_176_615_266),
+    (EXPONENTIAL, BUY, 1_000_000_000, 500, 1, 1_102_500_000, 6_910_041_375),
+    (EXPONENTIAL, SELL, 1_000_000_000, 500, 0, 952_380_952, 4_176_347_199),
+    (EXPONENTIAL, SELL, 1_000_000_000, 500, -1, 907_029_478, 3_840_232_511),
+    (EXPONENTIAL, BUY, 1_234_567_891, 137, 7, 1_376_545_431, 8_020_151_475),
+    (EXPONENTIAL, SELL, 1_234_567_891, 137, -7, 1_107_233_980, 4_912_534_864),
+    (EXPONENTIAL, SELL, 1_234_567_891, 137, 3, 1_268_626_767, 6_343_835_330),
+    # Buy at counter 3: balance 1e10 + 3e10 / 8 = 1.375e10, / 7 = 1964285714.29
+    # Sell at counter 0: balance 1e10 - 1e10 / 12 = 9166666667 (truncated toward zero), / 13 = 705128205.15
+    (XYK, BUY, 1_000_000_000, 10, 0, 1_000_000_000, 8_757_385_359),
+    (XYK, BUY, 1_000_000_000, 10, 3, 1_964_285_714, 130_720_804_956),
+    (XYK, SELL, 1_000_000_000, 10, 0, 705_128_205, 2_456_855_998),
+    (XYK, SELL, 1_000_000_000, 10, -2, 523_809_523, 1_895_881_770),
+    (XYK, BUY, 987_654_321, 37, 12, 2_136_372_269, 56_313_345_423),
+    (XYK, SELL, 987_654_321, 37, 5, 1_166_926_029, 6_205_686_513),
+    (XYK, BUY, 987_654_321, 37, -6, 733_954_532, 3_159_516_985),
+]
+
+# (current spot price, delta, counter, base spot price): the buy price at `counter` mapped back to its base
+GOLDEN_XYK_BASES = [
+    (1_964_285_714, 10, 4, 999_999_999),
+    (2_136_372_269, 37, 13, 987_654_320),
+    (733_954_532, 37, -5, 987_654_320),
+    (1_500_000_000, 0, 7, 1_500_000_000),
+]
+
+
+@pytest.mark.parametrize('curve, order_type, spot_price, delta, counter, next_price, series_sum', GOLDEN_VECTORS)
+def test_golden_vectors(curve, order_type, spot_price, delta, counter, next_price, series_sum):
+    assert next_spot_price_lamports(order_type, spot_price, delta, curve, counter) == next_price
+    assert sum_of_orders_series_lamports(5, order_type, spot_price, delta, curve, counter) == series_sum
+
+    # Float helpers only differ by their missing truncations, under a lamport per price, compounded over the series
+    assert abs(calculate_next_spot_price(order_type, spot_price, delta, curve, counter) - next_price) < 1
+    assert abs(get_sum_of_orders_series(5, order_type, spot_price, delta, curve, counter) - series_sum) < 50
+
+
+@pytest.mark.parametrize('curve, order_type, spot_price, delta, counter, next_price, series_sum', GOLDEN_VECTORS)
+def test_prices_array_starts_at_the_next_price(curve, order_type, spot_price, delta, counter, next_price, series_sum):
+    # A sell ladder prices its first order at counter + 1
+    ladder_counter = counter if order_type == BUY else counter - 1
+    prices = prices_array_lamports(spot_price, delta, 3, curve, order_type, ladder_counter)
+    assert prices['array'][0] == next_price
+    assert prices['total'] == sum(prices['array'])
+
+
+@pytest.mark.parametrize('current_spot_price, delta, counter, base_spot_price', GOLDEN_XYK_BASES)
+def test_golden_xyk_base_spot_prices(current_spot_price, delta, counter, base_spot_price):
+    assert derive_xyk_base_spot_price_lamports(current_spot_price, delta, counter) == base_spot_price
+    assert math.isclose(
+        derive_xyk_base_spot_price_from_current_spot_price(current_spot_price, delta, counter), base_spot_price, abs_tol=1,
+    )
+
+
+@pytest.mark.parametrize('delta', [3, 10, 37])
+def test_xyk_base_spot_price_round_trip(delta):
+    base_spot_price = 1_000_000_000
+    for counter in range(-delta // 2, delta):
+        current_spot_price = next_spot_price_lamports(BUY, base_spot_price, delta, XYK, counter - 1)
+        assert abs(derive_xyk_base_spot_price_lamports(current_spot_price, delta, counter) - base_spot_price) <= delta
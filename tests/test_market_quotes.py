@@ -0,0 +1,121 @@
+"""
+The heap-based market quotes against a brute-force merge of every pair's full calculate_prices_array ladder.
+"""
+import random
+
+import pytest
+
+from ..common import BondingCurveType, OrderType, PairType, calculate_prices_array
+from ..core.quotes import quote_buy_from_pairs, quote_sell_to_pairs, quote_buy_for_budget, quote_sell_for_target
+
+MARKET = 'market'
+
+
+def random_pair(rng, index):
+    curve = rng.choice([BondingCurveType.Linear, BondingCurveType.Exponential, BondingCurveType.XYK])
+    if curve == BondingCurveType.Linear:
+        # Small deltas against few prices make equal prices across pairs, which exercises the tie-breaks
+        delta, counter = rng.choice([0, 10 ** 7, 3 * 10 ** 7]), rng.randint(-5, 5)
+    elif curve == BondingCurveType.Exponential:
+        delta, counter = rng.choice([0, 100, 750]), rng.randint(-5, 5)
+    else:
+        delta = rng.randint(60, 200)
+        counter = rng.randint(-10, delta // 2)
+    return {
+        'publicKey': f'pair{index}',
+        'hadoMarket': MARKET if rng.random() < 0.9 else 'other market',
+        'pairType': rng.choice([PairType.NftForToken, PairType.TokenForNFT, PairType.LiquidityProvision]),
+        'pairState': 'onMarketVirtual' if rng.random() < 0.9 else 'frozen',
+        'baseSpotPrice': rng.choice([10 ** 9, 2 * 10 ** 9]),
+        'bondingCurve': {'delta': delta, 'bondingType': curve},
+        'mathCounter': counter,
+        'nftsCount': rng.randint(0, 6),
+        'buyOrdersQuantity': rng.randint(0, 6),
+        'fundsSolOrTokenBalance': rng.randint(0, 10) * 10 ** 9,
+    }
+
+
+def on_market(pair, pair_types, quantity_key):
+    return (
+        pair['pairType'] in pair_types and pair['pairState'] == 'onMarketVirtual'
+        and pair['hadoMarket'] == MARKET and pair[quantity_key] > 0
+    )
+
+
+def ladder(pair, order_type, amount):
+    curve = pair['bondingCurve']
+    return calculate_prices_array(pair['baseSpotPrice'], curve['delta'], amount, curve['bondingType'], order_type, pair['mathCounter'])['array']
+
+
+def brute_force_asks(pairs):
+    """Every NFT for sale as (price, pair index, unit), cheapest first."""
+    eligible = [pair for pair in pairs if on_market(pair, (PairType.NftForToken, PairType.LiquidityProvision), 'nftsCount')]
+    return eligible, sorted(
+        (price, index, unit)
+        for index, pair in enumerate(eligible)
+        for unit, price in enumerate(ladder(pair, OrderType.Buy, pair['nftsCount']))
+    )
+
+
+def brute_force_bids(pairs):
+    """Every bid a pair can pay for as (-price, pair index, unit), highest first: a pair bids until its funds run out."""
+    eligible = [pair for pair in pairs if on_market(pair, (PairType.TokenForNFT, PairType.LiquidityProvision), 'buyOrdersQuantity')]
+    bids = []
+    for index, pair in enumerate(eligible):
+        spent = 0
+        for unit, price in enumerate(ladder(pair, OrderType.Sell, pair['buyOrdersQuantity'])):
+            if price <= 0 or spent + price > pair['fundsSolOrTokenBalance']:
+                break
+            spent += price
+            bids.append((-price, index, unit))
+    return eligible, sorted(bids)
+
+
+def fills_of(eligible, orders, sign=1):
+    return [{'pair': eligible[index]['publicKey'], 'unit': unit, 'price': sign * price} for price, index, unit in orders]
+
+
+def assert_totals(quote, extreme_key, extreme):
+    assert quote['filled'] == len(quote['fills'])
+    assert quote['total'] == sum(fill['price'] for fill in quote['fills'])
+    for pair, pair_fills in quote['byPair'].items():
+        prices = [fill['price'] for fill in quote['fills'] if fill['pair'] == pair]
+        assert pair_fills['amount'] == len(prices) and pair_fills['total'] == sum(prices)
+        assert pair_fills[extreme_key] == extreme(prices)
+
+
+@pytest.mark.parametrize('seed', range(30))
+def test_buy_quotes_match_brute_force(seed):
+    rng = random.Random(seed)
+    pairs = [random_pair(rng, index) for index in range(rng.randint(1, 12))]
+    eligible, asks = brute_force_asks(pairs)
+
+    for amount in (0, 1, 5, len(asks), len(asks) + 3):
+        quote = quote_buy_from_pairs(pairs, amount, MARKET)
+        assert quote['fills'] == fills_of(eligible, asks[:amount])
+        assert_totals(quote, 'maxPrice', max)
+
+    budget = rng.randint(0, 20) * 10 ** 9 / 2
+    affordable = 0
+    while affordable < len(asks) and sum(price for price, _, _ in asks[:affordable + 1]) <= budget:
+        affordable += 1
+    assert quote_buy_for_budget(pairs, budget, MARKET)['fills'] == fills_of(eligible, asks[:affordable])
+
+
+@pytest.mark.parametrize('seed', range(30))
+def test_sell_quotes_match_brute_force(seed):
+    rng = random.Random(seed)
+    pairs = [random_pair(rng, index) for index in range(rng.randint(1, 12))]
+    eligible, bids = brute_force_bids(pairs)
+
+    for amount in (0, 1, 5, len(bids), len(bids) + 3):
+        quote = quote_sell_to_pairs(pairs, amount, MARKET)
+        assert quote['fills'] == fills_of(eligible, bids[:amount], sign=-1)
+        assert_totals(quote, 'minPrice', min)
+
+    target = rng.randint(0, 20) * 10 ** 9 / 2
+    needed, raised = 0, 0
+    while needed < len(bids) and raised < target:
+        raised -= bids[needed][0]
+        needed += 1
+    assert quote_sell_for_target(pairs, target, MARKET)['fills'] == fills_of(eligible, bids[:needed], sign=-1)
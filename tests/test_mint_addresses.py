@@ -0,0 +1,58 @@
+"""
+derive_mint_addresses against the scalar derivation helpers of common.py, in-process and on an executor.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from solders.keypair import Keypair
+
+from ..common import find_associated_token_address, find_token_record_pda, get_metaplex_edition_pda, get_metaplex_metadata
+from ..core import addresses
+from ..core.addresses import derive_mint_addresses, MINT_ADDRESS_COLUMNS
+
+
+def scalar_addresses(mint, owner):
+    token_account = asyncio.run(find_associated_token_address(owner, mint))
+    return {
+        'metadata': get_metaplex_metadata(mint),
+        'edition': get_metaplex_edition_pda(mint),
+        'tokenAccount': token_account,
+        'tokenRecord': find_token_record_pda(mint, token_account),
+    }
+
+
+def assert_table_matches(table, mints, owners):
+    assert len(table) == len(mints)
+    assert tuple(table.columns) == MINT_ADDRESS_COLUMNS
+    for row, (mint, owner) in enumerate(zip(mints, owners)):
+        expected = scalar_addresses(mint, owner)
+        assert table.addresses_for(mint) == expected
+        assert {column: table.get(column, row) for column in MINT_ADDRESS_COLUMNS} == expected
+        assert table.raw('metadata', row) == bytes(expected['metadata'])
+
+
+def test_single_owner_in_process():
+    mints, owner = [Keypair().pubkey() for _ in range(7)], Keypair().pubkey()
+    table = derive_mint_addresses(mints, owner, chunk_size=3)
+    assert_table_matches(table, mints, [owner] * len(mints))
+
+
+def test_owner_per_mint_on_an_executor():
+    mints, owners = [Keypair().pubkey() for _ in range(9)], [Keypair().pubkey() for _ in range(9)]
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        table = derive_mint_addresses(mints, owners, chunk_size=2, executor=executor)
+    assert_table_matches(table, mints, owners)
+
+
+def test_process_pool(monkeypatch):
+    monkeypatch.setattr(addresses, 'MIN_PARALLEL_MINTS', 0)
+    mints, owner = [Keypair().pubkey() for _ in range(5)], Keypair().pubkey()
+    table = derive_mint_addresses(mints, owner, max_workers=2, chunk_size=2)
+    assert_table_matches(table, mints, [owner] * len(mints))
+
+
+def test_empty_and_mismatched_inputs():
+    assert len(derive_mint_addresses([], Keypair().pubkey())) == 0
+    with pytest.raises(ValueError):
+        derive_mint_addresses([Keypair().pubkey()] * 2, [Keypair().pubkey()])
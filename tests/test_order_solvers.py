@@ -0,0 +1,102 @@
+"""
+get_max_orders_for_budget and get_min_orders_for_target against a brute-force scan of every
+series length.
+"""
+import random
+
+import pytest
+
+from ..common import (
+    BondingCurveType, OrderType, calculate_next_spot_price, get_sum_of_orders_series,
+    get_max_orders_for_budget, get_min_orders_for_target,
+)
+
+LINEAR, EXPONENTIAL, XYK = BondingCurveType.Linear, BondingCurveType.Exponential, BondingCurveType.XYK
+BUY, SELL = OrderType.Buy, OrderType.Sell
+
+
+def brute_series_sums(order_type, spot_price, delta, curve, counter, max_orders):
+    """Sums of the first n orders, for every n whose prices are all positive and computable."""
+    prices = []
+    price = spot_price
+    while len(prices) < max_orders and price > 0:
+        prices.append(price)
+        try:
+            price = calculate_next_spot_price(order_type, price, delta, curve, counter)
+        except (ZeroDivisionError, OverflowError):
+            break
+        counter += 1 if order_type == BUY else -1
+    sums = [0]
+    for price in prices:
+        sums.append(sums[-1] + price)
+    return sums
+
+
+def brute_max_orders(budget, sums):
+    return max(amount for amount, amount_sum in enumerate(sums) if amount_sum <= budget)
+
+
+def brute_min_orders(target, sums):
+    if target <= 0:
+        return 0
+    return next((amount for amount, amount_sum in enumerate(sums) if amount_sum >= target), None)
+
+
+def random_curve(rng):
+    curve = rng.choice([LINEAR, EXPONENTIAL, XYK])
+    order_type = rng.choice([BUY, SELL])
+    spot_price = rng.choice([rng.randint(1, 10 ** 10), rng.uniform(0.01, 100.0)])
+    if curve == LINEAR:
+        delta = rng.choice([rng.randint(-10 ** 8, 10 ** 9), rng.uniform(-5.0, 5.0)])
+    elif curve == EXPONENTIAL:
+        delta = rng.choice([rng.randint(0, 5_000), rng.randint(-9_999, 0), 10 ** 6])
+    else:
+        delta = rng.randint(0, 40)
+    counter = rng.randint(-30, 30)
+    return order_type, spot_price, delta, curve, counter
+
+
+@pytest.mark.parametrize('seed', range(300))
+def test_solvers_match_brute_force(seed):
+    rng = random.Random(seed)
+    order_type, spot_price, delta, curve, counter = random_curve(rng)
+    max_orders = rng.randint(0, 60)
+    sums = brute_series_sums(order_type, spot_price, delta, curve, counter, max_orders)
+
+    # The loop helper agrees with the brute-force sums wherever it can evaluate the series
+    for amount, amount_sum in enumerate(sums):
+        try:
+            assert get_sum_of_orders_series(amount, order_type, spot_price, delta, curve, counter) == pytest.approx(amount_sum)
+        except (ZeroDivisionError, OverflowError):
+            pass
+
+    # Budgets and targets below, at and above every partial sum
+    amounts = {0, len(sums) - 1, rng.randrange(len(sums))}
+    limits = [-1, 0, sums[-1] * 2 + 1] + [sums[amount] + offset for amount in amounts for offset in (-1, 0, 1)]
+    for limit in limits:
+        assert get_max_orders_for_budget(
+            limit, order_type, spot_price, delta, curve, counter, max_orders=max_orders
+        ) == (brute_max_orders(limit, sums) if limit >= 0 else 0)
+        assert get_min_orders_for_target(
+            limit, order_type, spot_price, delta, curve, counter, max_orders=max_orders
+        ) == brute_min_orders(limit, sums)
+
+
+def test_linear_series_stops_where_prices_reach_zero():
+    # Sell prices 10, 8, 5, 1, then -4
+    assert brute_series_sums(SELL, 10, 1, LINEAR, -1, 10) == [0, 10, 18, 23, 24]
+    assert get_max_orders_for_budget(10 ** 6, SELL, 10, 1, LINEAR, -1, max_orders=10) == 4
+    assert get_min_orders_for_target(24, SELL, 10, 1, LINEAR, -1, max_orders=10) == 4
+    assert get_min_orders_for_target(25, SELL, 10, 1, LINEAR, -1, max_orders=10) is None
+
+
+def test_xyk_series_stops_at_the_pole():
+    # Buy prices 1e9, 1e9, 1.67e9, 5.56e9, 5.56e10, then the counter reaches delta + 1
+    assert len(brute_series_sums(BUY, 10 ** 9, 4, XYK, 0, 20)) == 6
+    assert get_max_orders_for_budget(float('inf'), BUY, 10 ** 9, 4, XYK, 0, max_orders=20) == 5
+
+
+def test_large_budgets_stay_cheap():
+    # Exponential sums are only accumulated up to the budget, not up to max_orders
+    assert get_max_orders_for_budget(10 ** 10, BUY, 10 ** 9, 500, EXPONENTIAL, 0, max_orders=10 ** 9) == 6
+    assert get_max_orders_for_budget(10 ** 30, BUY, 10 ** 9, 10 ** 6, LINEAR, 0, max_orders=10 ** 9) == 181_712_059
@@ -0,0 +1,101 @@
+"""
+MarketOrderBook kept up to date from on_accounts_change parser results.
+"""
+import random
+from collections import Counter
+
+from ..common import BondingCurveType, PairType
+from ..core.orderbook import MarketOrderBook
+
+HADO_MARKET = '9'.ljust(44, 'M')
+
+
+def make_pair(public_key, pair_type=PairType.LiquidityProvision, nfts_count=3, buy_orders_quantity=3):
+    return {
+        'publicKey': public_key,
+        'hadoMarket': HADO_MARKET,
+        'pairType': pair_type,
+        'pairState': 'onMarketVirtual',
+        'baseSpotPrice': 10 ** 9,
+        'bondingCurve': {'delta': 10 ** 7, 'bondingType': BondingCurveType.Linear},
+        'mathCounter': 0,
+        'nftsCount': nfts_count,
+        'buyOrdersQuantity': buy_orders_quantity,
+        'fundsSolOrTokenBalance': 10 ** 11,
+    }
+
+
+def empty_changes(**changes):
+    result = {
+        'hadoMarkets': [], 'nftSwapPairs': [], 'nftPairBoxes': [], 'classicValidationWhitelists': [],
+        'nftValidationAdapters': [], 'authorityAdapters': [], 'adapterWhitelists': [], 'protocolSettingsV1': [],
+        'protocolAdminMultisigs': [], 'liquidityProvisionOrders': [],
+    }
+    result.update(changes)
+    return result
+
+
+def total_quantity(levels):
+    return levels[-1][2] if levels else 0
+
+
+def test_close_event_removes_the_pair():
+    book = MarketOrderBook.from_pairs(HADO_MARKET, [make_pair('pairA'), make_pair('pairB')])
+    depth = book.depth()
+    assert (total_quantity(depth['bids']), total_quantity(depth['asks'])) == (6, 6)
+
+    # close_virtual_nft_swap_pair_parser reports the closed pair as a publicKey-only nftPairBoxes entry
+    assert book.apply_changes(empty_changes(nftPairBoxes=[{'publicKey': 'pairA'}])) == 1
+
+    depth = book.depth()
+    assert (total_quantity(depth['bids']), total_quantity(depth['asks'])) == (3, 3)
+    assert set(book.ladders) == {'pairB'}
+
+
+def test_removal_of_unknown_account_leaves_the_book_alone():
+    book = MarketOrderBook.from_pairs(HADO_MARKET, [make_pair('pairA')])
+    assert book.apply_changes(empty_changes(nftPairBoxes=[{'publicKey': 'someBox'}])) == 0
+    assert set(book.ladders) == {'pairA'}
+
+
+def test_pair_updates_still_apply():
+    book = MarketOrderBook.from_pairs(HADO_MARKET, [make_pair('pairA')])
+    changes = empty_changes(nftSwapPairs=[make_pair('pairA', nfts_count=1), make_pair('pairC', PairType.TokenForNFT)])
+    assert book.apply_changes(changes) == 2
+    depth = book.depth()
+    assert (total_quantity(depth['bids']), total_quantity(depth['asks'])) == (6, 1)
+
+
+def rebuilt_depth(book):
+    """The depth recomputed from scratch from the pairs' ladders: sorted levels and running totals."""
+    def side(index, reverse):
+        quantities = Counter(price for ladders in book.ladders.values() for price in ladders[index])
+        cumulative, levels = 0, []
+        for price, quantity in sorted(quantities.items(), reverse=reverse):
+            cumulative += quantity
+            levels.append((price, quantity, cumulative))
+        return levels
+    return {'bids': side(0, True), 'asks': side(1, False)}
+
+
+def test_incremental_depth_matches_a_rebuild():
+    rng = random.Random(7)
+    book = MarketOrderBook(HADO_MARKET, levels=6)
+    keys = [f'pair{index}' for index in range(12)]
+    for _ in range(400):
+        public_key = rng.choice(keys)
+        if rng.random() < 0.15:
+            book.remove_pair(public_key)
+        else:
+            pair = make_pair(
+                public_key, rng.choice([PairType.LiquidityProvision, PairType.TokenForNFT, PairType.NftForToken]),
+                nfts_count=rng.randint(0, 8), buy_orders_quantity=rng.randint(0, 8),
+            )
+            # A few distinct curves, so pairs share some price levels and not others
+            pair['baseSpotPrice'] = rng.choice([10 ** 9, 2 * 10 ** 9])
+            pair['mathCounter'] = rng.randint(-3, 3)
+            book.update_pair(pair)
+        assert book.depth() == rebuilt_depth(book)
+        depth = book.depth()
+        assert book.best_bid() == (depth['bids'][0][0] if depth['bids'] else None)
+        assert book.best_ask() == (depth['asks'][0][0] if depth['asks'] else None)
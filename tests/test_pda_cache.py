@@ -0,0 +1,104 @@
+"""
+PdaCache returns the addresses Pubkey.find_program_address derives and keeps only the most recently used ones;
+PdaStore persists them across restarts until its version changes.
+"""
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+
+from ..common import NEW_DEVNET_PROGRAM, PdaCache, PdaStore, PDA_CACHE, enable_pda_store, disable_pda_store
+
+
+def seeds_of(index):
+    return [b'pda', index.to_bytes(4, 'little')]
+
+
+def key_of(index):
+    return bytes(NEW_DEVNET_PROGRAM), tuple(seeds_of(index))
+
+
+def derived_entry(index):
+    return key_of(index), Pubkey.find_program_address(seeds_of(index), NEW_DEVNET_PROGRAM)
+
+
+def test_cached_addresses_match_the_derivation():
+    cache = PdaCache()
+    other_program = Keypair().pubkey()
+    for index in range(20):
+        assert cache.find_program_address(seeds_of(index), NEW_DEVNET_PROGRAM) == Pubkey.find_program_address(seeds_of(index), NEW_DEVNET_PROGRAM)
+        assert cache.find_program_address(seeds_of(index), NEW_DEVNET_PROGRAM) == Pubkey.find_program_address(seeds_of(index), NEW_DEVNET_PROGRAM)
+        assert cache.find_program_address(seeds_of(index), other_program) == Pubkey.find_program_address(seeds_of(index), other_program)
+    assert cache.stats()['hits'] == 20 and cache.stats()['misses'] == 40
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = PdaCache(maxsize=3)
+    for index in range(3):
+        cache.find_program_address(seeds_of(index), NEW_DEVNET_PROGRAM)
+    cache.find_program_address(seeds_of(0), NEW_DEVNET_PROGRAM)   # 1 is now the least recently used
+    cache.find_program_address(seeds_of(3), NEW_DEVNET_PROGRAM)
+
+    assert cache.stats()['size'] == 3
+    assert set(cache._entries) == {key_of(0), key_of(2), key_of(3)}
+    misses = cache.misses
+    cache.find_program_address(seeds_of(1), NEW_DEVNET_PROGRAM)
+    assert cache.misses == misses + 1
+
+
+def test_update_inserts_in_order_within_maxsize():
+    cache = PdaCache(maxsize=2)
+    entries = [derived_entry(index) for index in range(3)]
+    cache.update(entries)
+
+    assert list(cache._entries) == [key_of(1), key_of(2)]
+    assert cache.find_program_address(seeds_of(2), NEW_DEVNET_PROGRAM) == entries[2][1]
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 0
+
+
+def test_store_serves_addresses_after_a_restart(tmp_path):
+    store = PdaStore(tmp_path / 'pdas.sqlite3', version='1')
+    PdaCache(store=store).find_program_address(seeds_of(7), NEW_DEVNET_PROGRAM)
+    store.close()
+
+    cache = PdaCache(store=PdaStore(tmp_path / 'pdas.sqlite3', version='1'))
+    assert cache.find_program_address(seeds_of(7), NEW_DEVNET_PROGRAM) == derived_entry(7)[1]
+    assert cache.stats()['storeHits'] == 1
+    cache.store.close()
+
+
+def test_store_is_wiped_when_the_version_changes(tmp_path):
+    path = tmp_path / 'pdas.sqlite3'
+    store = PdaStore(path, version='1')
+    store.put(*derived_entry(1))
+    store.close()
+
+    store = PdaStore(path, version='1')
+    assert store.get(key_of(1)) == derived_entry(1)[1]
+    store.close()
+
+    store = PdaStore(path, version='2')
+    assert store.get(key_of(1)) is None and store.load() == []
+    store.close()
+
+    # Going back does not bring the entries back either
+    store = PdaStore(path, version='1')
+    assert store.get(key_of(1)) is None
+    store.close()
+
+
+def test_enable_pda_store_preloads_the_shared_cache(tmp_path):
+    path = tmp_path / 'pdas.sqlite3'
+    store = PdaStore(path, version='1')
+    for index in range(5):
+        store.put(*derived_entry(index))
+    store.close()
+
+    PDA_CACHE.clear()
+    try:
+        enable_pda_store(path, version='1', preload=True)
+        assert PDA_CACHE.stats()['size'] == 5
+        for index in range(5):
+            assert PDA_CACHE.find_program_address(seeds_of(index), NEW_DEVNET_PROGRAM) == derived_entry(index)[1]
+        assert PDA_CACHE.stats()['hits'] == 5 and PDA_CACHE.stats()['misses'] == 0
+    finally:
+        disable_pda_store()
+        PDA_CACHE.clear()
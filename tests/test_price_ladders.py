@@ -0,0 +1,90 @@
+"""
+The NumPy price ladders against calculate_prices_array, row by row.
+"""
+import random
+
+import pytest
+
+from ..common import BondingCurveType, OrderType, calculate_prices_array
+
+np = pytest.importorskip('numpy')
+
+from ..core.ladders import calculate_price_ladders, price_ladders_from_pairs  # noqa: E402
+
+CURVES = [BondingCurveType.Linear, BondingCurveType.Exponential, BondingCurveType.XYK]
+AMOUNT = 12
+
+
+def random_pairs(rng, count):
+    """(spot price, delta, curve, counter, order type) of pairs whose ladders stay clear of XYK poles."""
+    pairs = []
+    while len(pairs) < count:
+        curve, order_type = rng.choice(CURVES), rng.choice([OrderType.Buy, OrderType.Sell])
+        spot_price = rng.randint(10 ** 6, 10 ** 10)
+        if curve == BondingCurveType.Linear:
+            delta, counter = rng.randint(0, 10 ** 7), rng.randint(-100, 100)
+        elif curve == BondingCurveType.Exponential:
+            delta, counter = rng.randint(0, 2000), rng.randint(-100, 100)
+        else:
+            delta, counter = rng.randint(1, 300), rng.randint(-50, 250)
+        try:
+            calculate_prices_array(spot_price, delta, AMOUNT, curve, order_type, counter)
+        except ZeroDivisionError:
+            continue
+        pairs.append((spot_price, delta, curve, counter, order_type))
+    return pairs
+
+
+def ladders(pairs, **options):
+    spot_prices, deltas, curves, counters, order_types = zip(*pairs)
+    return calculate_price_ladders(spot_prices, deltas, curves, counters, order_types, AMOUNT, **options)
+
+
+def scalar_prices(pair):
+    spot_price, delta, curve, counter, order_type = pair
+    return calculate_prices_array(spot_price, delta, AMOUNT, curve, order_type, counter)['array']
+
+
+def test_exact_ladders_match_the_scalar_helper_bit_for_bit():
+    pairs = random_pairs(random.Random(1), 600)
+    result = ladders(pairs, exact=True)
+    assert result['prices'].shape == result['totals'].shape == (len(pairs), AMOUNT)
+    for row, pair in enumerate(pairs):
+        expected = scalar_prices(pair)
+        assert result['prices'][row].tolist() == expected
+        assert result['totals'][row].tolist() == np.cumsum(np.asarray(expected, dtype=np.float64)).tolist()
+
+
+def test_default_ladders_differ_only_in_exponential_rounding():
+    pairs = random_pairs(random.Random(2), 600)
+    result = ladders(pairs)
+    for row, pair in enumerate(pairs):
+        expected = scalar_prices(pair)
+        if pair[2] == BondingCurveType.Exponential:
+            assert np.allclose(result['prices'][row], expected, rtol=1e-12, atol=0)
+        else:
+            assert result['prices'][row].tolist() == expected
+
+
+def test_depths_cut_the_ladders():
+    pairs = random_pairs(random.Random(3), 3)
+    depths = [0, 4, AMOUNT]
+    result = ladders(pairs, depths=depths, exact=True)
+    for row, (pair, depth) in enumerate(zip(pairs, depths)):
+        expected = scalar_prices(pair)[:depth]
+        assert result['prices'][row, :depth].tolist() == expected
+        assert np.isnan(result['prices'][row, depth:]).all()
+        assert (result['totals'][row, depth:] == sum(expected)).all()
+
+
+def test_ladders_from_decoded_pairs():
+    pairs = [
+        {'baseSpotPrice': 10 ** 9, 'bondingCurve': {'delta': 10 ** 7, 'bondingType': BondingCurveType.Linear}, 'mathCounter': 2, 'nftsCount': 3},
+        {'baseSpotPrice': 10 ** 9, 'bondingCurve': {'delta': 40, 'bondingType': BondingCurveType.XYK}, 'mathCounter': 5, 'nftsCount': 20},
+    ]
+    result = price_ladders_from_pairs(pairs, OrderType.Buy, AMOUNT, depth_key='nftsCount')
+    for row, pair in enumerate(pairs):
+        expected = calculate_prices_array(
+            pair['baseSpotPrice'], pair['bondingCurve']['delta'], AMOUNT, pair['bondingCurve']['bondingType'], OrderType.Buy, pair['mathCounter'],
+        )['array'][:pair['nftsCount']]
+        assert result['prices'][row, :len(expected)].tolist() == expected
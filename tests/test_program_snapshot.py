@@ -0,0 +1,85 @@
+"""
+get_all_program_accounts: the account_types filter, per-type timeouts and the scan concurrency limit.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import base58
+import pytest
+from solders.keypair import Keypair
+
+from ..common import NEW_DEVNET_PROGRAM
+from ..core.accounts import get_all_program_accounts, PROGRAM_ACCOUNT_TYPES
+from ..core.layouts import get_account_layout, get_account_layouts
+
+
+def keyed_account(layout):
+    """An account of the layout's type: its own address after the discriminator, zeros (valid enums) after that."""
+    pubkey = Keypair().pubkey()
+    data = layout.discriminator + bytes(pubkey) + bytes(layout.size - len(layout.discriminator) - 32)
+    return SimpleNamespace(pubkey=pubkey, account=SimpleNamespace(data=data))
+
+
+class ProgramConnection:
+    """Serves two accounts of every type; scans of the types in `delays` take that many seconds."""
+
+    def __init__(self, delays=None):
+        self.delays = delays or {}
+        self.accounts = {
+            layout.discriminator: (account_type, [keyed_account(layout) for _ in range(2)])
+            for account_type, layout in get_account_layouts().items()
+        }
+        self.scanned = []
+        self.in_flight = self.max_in_flight = 0
+
+    async def get_program_accounts(self, program_id, encoding=None, data_slice=None, filters=None):
+        account_type, accounts = self.accounts[base58.b58decode(filters[0].bytes)]
+        self.scanned.append(account_type)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delays.get(account_type, 0.001))
+        self.in_flight -= 1
+        return SimpleNamespace(value=accounts)
+
+    def expected(self, account_type):
+        layout = get_account_layout(account_type)
+        return [layout.decode(keyed_account.account.data, str(keyed_account.pubkey)) for keyed_account in self.accounts[layout.discriminator][1]]
+
+
+def snapshot(connection, **options):
+    return asyncio.run(get_all_program_accounts(NEW_DEVNET_PROGRAM, connection, **options))
+
+
+def test_every_type_by_default():
+    connection = ProgramConnection()
+    result = snapshot(connection)
+    assert sorted(connection.scanned) == sorted(PROGRAM_ACCOUNT_TYPES)
+    assert result == {result_key: connection.expected(account_type) for account_type, result_key in PROGRAM_ACCOUNT_TYPES.items()}
+
+
+def test_account_types_restrict_the_scans():
+    connection = ProgramConnection()
+    result = snapshot(connection, account_types=['nftSwapPair', 'hadoMarket'])
+    assert sorted(connection.scanned) == ['hadoMarket', 'nftSwapPair']
+    assert result == {'nftSwapPairs': connection.expected('nftSwapPair'), 'hadoMarkets': connection.expected('hadoMarket')}
+
+    with pytest.raises(ValueError):
+        snapshot(ProgramConnection(), account_types=['nftSwapPairs'])
+
+
+def test_scans_respect_max_concurrency():
+    connection = ProgramConnection(delays={account_type: 0.01 for account_type in PROGRAM_ACCOUNT_TYPES})
+    snapshot(connection, max_concurrency=2)
+    assert len(connection.scanned) == len(PROGRAM_ACCOUNT_TYPES) and connection.max_in_flight == 2
+
+
+def test_per_type_timeouts():
+    delays = {'nftSwapPair': 0.2, 'nftPairBox': 0.05}
+    # Types without an entry have no timeout
+    result = snapshot(ProgramConnection(delays), account_types=['nftSwapPair', 'nftPairBox'], timeout={'nftPairBox': 1.0})
+    assert set(result) == {'nftSwapPairs', 'nftPairBoxes'}
+
+    with pytest.raises(asyncio.TimeoutError, match='nftSwapPair'):
+        snapshot(ProgramConnection(delays), account_types=['nftSwapPair', 'nftPairBox'], timeout={'nftSwapPair': 0.02, 'nftPairBox': 1.0})
+    with pytest.raises(asyncio.TimeoutError, match='nftPairBox'):
+        snapshot(ProgramConnection(delays), account_types=['nftPairBox'], timeout=0.02)
@@ -0,0 +1,86 @@
+"""
+The single-NFT buy and sell builders produce sendable transactions: a real compute budget
+instruction followed by the Hadeswap instruction, with the NFT's creators as remaining accounts.
+"""
+import asyncio
+import struct
+from types import SimpleNamespace
+
+from solders.compute_budget import set_compute_unit_limit
+from solders.keypair import Keypair
+
+from ..common import NEW_DEVNET_PROGRAM
+from ..core.router import (
+    buy_nft_from_pair, sell_nft_to_liquidity_pair, sell_nft_to_token_to_nft_pair, BUY_NFT_COMPUTE_UNITS, SELL_NFT_COMPUTE_UNITS,
+)
+
+
+def borsh_string(value: str) -> bytes:
+    return struct.pack('<I', len(value)) + value.encode()
+
+
+def metadata_bytes(mint, creator) -> bytes:
+    """Token Metadata account data up to its creators, which is all Metadata.from_bytes needs."""
+    return (
+        bytes([4]) + bytes(Keypair().pubkey()) + bytes(mint)
+        + borsh_string('NFT') + borsh_string('N') + borsh_string('https://example.invalid/nft.json')
+        + struct.pack('<H', 500)
+        + bytes([1]) + struct.pack('<I', 1) + bytes(creator) + bytes([1, 100])
+    )
+
+
+class MetadataConnection:
+    def __init__(self, data: bytes):
+        self.data = data
+        self.requests = []
+
+    async def get_multiple_accounts(self, pubkeys, encoding=None):
+        self.requests.append(list(pubkeys))
+        return SimpleNamespace(value=[SimpleNamespace(data=self.data) for _ in pubkeys])
+
+
+def run(builder, args, accounts):
+    mint, creator = Keypair().pubkey(), Keypair().pubkey()
+    connection = MetadataConnection(metadata_bytes(mint, creator))
+    sent = []
+
+    async def send_txn(transaction, signers):
+        sent.append((transaction, signers))
+
+    result = asyncio.run(builder(NEW_DEVNET_PROGRAM, connection, args, {**accounts, 'nftMint': mint}, send_txn))
+    assert len(connection.requests) == 1 and len(sent) == 1
+    return result, sent[0][0], creator
+
+
+def common_accounts():
+    return {'pair': Keypair().pubkey(), 'userPubkey': Keypair().pubkey(), 'protocolFeeReceiver': Keypair().pubkey()}
+
+
+def assert_budget_then_hadeswap(transaction, compute_units, creator):
+    budget, hadeswap = transaction.instructions
+    assert budget == set_compute_unit_limit(compute_units)
+    assert hadeswap.program_id == NEW_DEVNET_PROGRAM
+    assert hadeswap.accounts[-1].pubkey == creator and hadeswap.accounts[-1].is_writable
+
+
+def test_buy_nft_from_pair_transaction():
+    accounts = {
+        **common_accounts(), 'nftPairBox': Keypair().pubkey(), 'vaultNftTokenAccount': Keypair().pubkey(),
+        'assetReceiver': Keypair().pubkey(),
+    }
+    result, transaction, creator = run(buy_nft_from_pair, {'maxAmountToPay': 10 ** 9, 'skipFailed': False}, accounts)
+    assert_budget_then_hadeswap(transaction, BUY_NFT_COMPUTE_UNITS, creator)
+    assert result['signers'] == []
+
+
+def test_sell_nft_to_liquidity_pair_transaction():
+    accounts = {**common_accounts(), 'nftValidationAdapter': Keypair().pubkey()}
+    result, transaction, creator = run(sell_nft_to_liquidity_pair, {'minAmountToGet': 10 ** 9, 'skipFailed': False}, accounts)
+    assert_budget_then_hadeswap(transaction, SELL_NFT_COMPUTE_UNITS, creator)
+    assert result['account'] == result['signers'][0].pubkey()
+
+
+def test_sell_nft_to_token_to_nft_pair_transaction():
+    accounts = {**common_accounts(), 'nftValidationAdapter': Keypair().pubkey(), 'assetReceiver': Keypair().pubkey()}
+    result, transaction, creator = run(sell_nft_to_token_to_nft_pair, {'minAmountToGet': 10 ** 9, 'skipFailed': False}, accounts)
+    assert_budget_then_hadeswap(transaction, SELL_NFT_COMPUTE_UNITS, creator)
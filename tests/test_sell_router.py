@@ -0,0 +1,86 @@
+"""
+sweep_sell_to_pairs builds every sell with the validation adapter of its own pair.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from solders.keypair import Keypair
+
+from ..common import BondingCurveType, PairType, NEW_DEVNET_PROGRAM
+from ..core.quotes import quote_sell_to_pairs, assign_nfts_to_bids
+from ..core.router import sweep_sell_to_pairs
+
+
+class NoMetadataConnection:
+    async def get_multiple_accounts(self, pubkeys, encoding=None):
+        return SimpleNamespace(value=[None] * len(pubkeys))
+
+
+def new_key():
+    return str(Keypair().pubkey())
+
+
+def make_bid_pair(pair_type, base_spot_price):
+    return {
+        'publicKey': new_key(),
+        'hadoMarket': new_key(),
+        'pairType': pair_type,
+        'pairState': 'onMarketVirtual',
+        'baseSpotPrice': base_spot_price,
+        'bondingCurve': {'delta': 10 ** 7, 'bondingType': BondingCurveType.Linear},
+        'mathCounter': 0,
+        'nftsCount': 0,
+        'buyOrdersQuantity': 2,
+        'fundsSolOrTokenBalance': 10 ** 11,
+        'assetReceiver': new_key(),
+    }
+
+
+def sell(fills):
+    sent = []
+
+    async def send_txn(transaction, signers):
+        sent.append(transaction)
+
+    accounts = {'userPubkey': Keypair().pubkey(), 'protocolFeeReceiver': Keypair().pubkey()}
+    return asyncio.run(sweep_sell_to_pairs(NEW_DEVNET_PROGRAM, NoMetadataConnection(), fills, accounts, send_txn))
+
+
+def test_each_sell_uses_the_adapter_of_its_pair():
+    liquidity_pair = make_bid_pair(PairType.LiquidityProvision, 2 * 10 ** 9)
+    token_pair = make_bid_pair(PairType.TokenForNFT, 10 ** 9)
+    adapters = {liquidity_pair['publicKey']: new_key(), token_pair['publicKey']: new_key()}
+    adapter_v2 = new_key()
+
+    quote = quote_sell_to_pairs([liquidity_pair, token_pair], 4)
+    fills = assign_nfts_to_bids(
+        quote, [liquidity_pair, token_pair], [{'nftMint': new_key()} for _ in range(4)],
+        {
+            liquidity_pair['publicKey']: adapters[liquidity_pair['publicKey']],
+            token_pair['publicKey']: {'nftValidationAdapter': adapters[token_pair['publicKey']], 'nftValidationAdapterV2': adapter_v2},
+        },
+    )
+    assert {fill['pair'] for fill in fills} == set(adapters)
+
+    result = sell(fills)
+    sells = [
+        instruction for group in result['instructions'] for instruction in group
+        if instruction.program_id == NEW_DEVNET_PROGRAM
+    ]
+    assert len(sells) == 4
+    for fill, instruction in zip(fills, sells):
+        keys = [str(account.pubkey) for account in instruction.accounts]
+        own_adapter = adapters[fill['pair']]
+        other_adapter, = set(adapters.values()) - {own_adapter}
+        # The adapter directly follows the pair in both sell instructions' account lists
+        assert keys[keys.index(fill['pair']) + 1] == own_adapter
+        assert other_adapter not in keys
+        assert (adapter_v2 in keys) == (fill['pair'] == token_pair['publicKey'])
+
+
+def test_fill_without_adapter_is_rejected():
+    pair = make_bid_pair(PairType.TokenForNFT, 10 ** 9)
+    fills = assign_nfts_to_bids(quote_sell_to_pairs([pair], 1), [pair], [{'nftMint': new_key()}])
+    with pytest.raises(ValueError):
+        sell(fills)
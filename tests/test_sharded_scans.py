@@ -0,0 +1,56 @@
+"""
+get_all_program_accounts passes its shard options through to get_sharded_accounts.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from ..common import NEW_DEVNET_PROGRAM
+from ..core.accounts import get_all_program_accounts, DEFAULT_SCAN_SHARDS
+
+
+class RecordingConnection:
+    def __init__(self):
+        self.scans = []
+        self.in_flight = self.max_in_flight = 0
+
+    async def get_program_accounts(self, program_id, encoding=None, data_slice=None, filters=None):
+        self.scans.append(filters)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        return SimpleNamespace(value=[])
+
+
+def snapshot(**options):
+    connection = RecordingConnection()
+    result = asyncio.run(get_all_program_accounts(
+        NEW_DEVNET_PROGRAM, connection, account_types=['nftPairBox'], shard_fields={'nftPairBox': 'pair'}, **options
+    ))
+    assert result == {'nftPairBoxes': []}
+    return connection
+
+
+def test_shard_count_and_concurrency_are_passed_through():
+    connection = snapshot(shards=1, shard_concurrency=1)
+    assert len(connection.scans) == 1
+
+    connection = snapshot(shards=256, shard_concurrency=3)
+    assert len(connection.scans) == 256
+    assert connection.max_in_flight == 3
+
+
+def test_per_type_shard_options():
+    connection = snapshot(shards={'nftPairBox': 1})
+    assert len(connection.scans) == 1
+
+    connection = snapshot(shards={'nftSwapPair': 1}, shard_concurrency={'nftPairBox': 2})
+    assert len(connection.scans) == DEFAULT_SCAN_SHARDS
+    assert connection.max_in_flight == 2
+
+
+def test_invalid_shard_count_is_rejected():
+    with pytest.raises(ValueError):
+        snapshot(shards=100)
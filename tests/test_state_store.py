@@ -0,0 +1,99 @@
+"""
+StateStore index upkeep: after random upserts, moves and removals every index equals a brute-force rebuild from the
+accounts the store should hold.
+"""
+import random
+
+import pytest
+
+from ..core.accounts import PROGRAM_ACCOUNT_TYPES
+from ..core.state import StateStore
+
+MARKETS = [f'market{index}' for index in range(3)]
+MINTS = [f'mint{index}' for index in range(6)]
+
+
+def random_account(rng, result_key, public_key, pairs):
+    # A field besides 'publicKey' on every type: an entry with only 'publicKey' is a removal
+    account = {'publicKey': public_key, 'bump': rng.randrange(256)}
+    if result_key == 'nftSwapPairs':
+        account['hadoMarket'] = rng.choice(MARKETS)
+    elif result_key == 'nftPairBoxes':
+        account.update(pair=rng.choice(pairs), nftMint=rng.choice(MINTS), status=rng.choice(['active', 'closed']))
+    elif result_key == 'liquidityProvisionOrders':
+        account['nftSwapPair'] = rng.choice(pairs)
+    return account
+
+
+def group_by(accounts, field):
+    groups = {}
+    for account in accounts:
+        groups.setdefault(account[field], {})[account['publicKey']] = account
+    return groups
+
+
+def assert_matches_rebuild(store, expected):
+    """`expected` is pubkey -> (result key, account), what the store should hold."""
+    of_type = {result_key: [account for key, account in expected.values() if key == result_key] for result_key in PROGRAM_ACCOUNT_TYPES.values()}
+    assert store.accounts == {public_key: account for public_key, (_, account) in expected.items()}
+    assert store.account_types == {public_key: result_key for public_key, (result_key, _) in expected.items()}
+    assert store.by_type == {result_key: {account['publicKey']: account for account in accounts} for result_key, accounts in of_type.items()}
+    assert store.pairs_by_market == group_by(of_type['nftSwapPairs'], 'hadoMarket')
+    assert store.boxes_by_pair == group_by(of_type['nftPairBoxes'], 'pair')
+    assert store.box_by_mint == group_by(of_type['nftPairBoxes'], 'nftMint')
+    assert store.orders_by_pair == group_by(of_type['liquidityProvisionOrders'], 'nftSwapPair')
+    assert store.stats() == {result_key: len(accounts) for result_key, accounts in of_type.items()}
+
+    for market in MARKETS:
+        assert sorted(pair['publicKey'] for pair in store.market_pairs(market)) == sorted(
+            account['publicKey'] for account in of_type['nftSwapPairs'] if account['hadoMarket'] == market)
+    for mint in MINTS:
+        boxes = [account for account in of_type['nftPairBoxes'] if account['nftMint'] == mint]
+        box = store.nft_pair_box(mint)
+        if not boxes:
+            assert box is None
+        else:
+            assert box in boxes and (box['status'] == 'active' or all(other['status'] != 'active' for other in boxes))
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_indexes_match_a_rebuild(seed):
+    rng = random.Random(seed)
+    result_keys = list(PROGRAM_ACCOUNT_TYPES.values())
+    pairs = [f'pair{index}' for index in range(5)]
+    expected = {}
+
+    snapshot = {result_key: [] for result_key in result_keys}
+    for index in range(30):
+        result_key = rng.choice(result_keys)
+        account = random_account(rng, result_key, f'account{index}', pairs)
+        snapshot[result_key].append(account)
+        expected[account['publicKey']] = (result_key, account)
+    store = StateStore.from_snapshot(snapshot)
+    assert_matches_rebuild(store, expected)
+
+    for step in range(200):
+        roll = rng.random()
+        known = sorted(expected)
+        if roll < 0.4 or not known:
+            # A new account, or a known one moved to other related accounts (same type)
+            public_key = rng.choice(known) if known and rng.random() < 0.5 else f'new{step}'
+            result_key = expected[public_key][0] if public_key in expected else rng.choice(result_keys)
+            account = random_account(rng, result_key, public_key, pairs)
+            assert store.apply_changes({result_key: [account]}) == 1
+            expected[public_key] = (result_key, account)
+        elif roll < 0.7:
+            # Removal entry as close_virtual_nft_swap_pair_parser reports it, under any result key
+            public_key = rng.choice(known + ['unknown'])
+            assert store.apply_changes({rng.choice(result_keys): [{'publicKey': public_key}]}) == (public_key in expected)
+            expected.pop(public_key, None)
+        else:
+            public_key = rng.choice(known + ['unknown'])
+            assert store.remove(public_key) == (public_key in expected)
+            expected.pop(public_key, None)
+        assert_matches_rebuild(store, expected)
+
+
+def test_unknown_result_key_is_rejected():
+    with pytest.raises(ValueError):
+        StateStore().upsert('nftSwapPair', {'publicKey': 'pair', 'hadoMarket': 'market'})
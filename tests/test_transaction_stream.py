@@ -0,0 +1,81 @@
+"""
+on_accounts_change advances its cursor in signature order and reports every transaction it has parsed.
+"""
+import asyncio
+
+import pytest
+
+from ..common import NEW_DEVNET_PROGRAM
+from ..core import accounts
+from ..core.accounts import on_accounts_change
+
+INSTRUCTION_LOG = 'Program log: Instruction: Test'
+
+
+def transaction(signature, err=None):
+    return {'signature': signature, 'meta': {'err': err, 'logMessages': ['Program invoke', INSTRUCTION_LOG]}}
+
+
+class PollingConnection:
+    """Serves one batch of new signatures after `first`, then the newest signature `latest`."""
+
+    def __init__(self, first, batch, transactions, latest='latest', failing=None):
+        self.first, self.batch, self.transactions, self.latest, self.failing = first, batch, transactions, latest, failing
+        self.cursors = []
+        self.polled = asyncio.Event()
+
+    async def get_signatures_for_address(self, program_id, options, commitment):
+        if 'until' not in options:
+            return [{'signature': self.latest}]
+        self.cursors.append(options['until'])
+        if len(self.cursors) > 1:
+            self.polled.set()
+        return [{'signature': signature} for signature in self.batch] if options['until'] == self.first else []
+
+    async def get_parsed_transaction(self, signature, commitment):
+        if signature == self.failing:
+            raise ConnectionError('transaction fetch failed')
+        return self.transactions.get(signature)
+
+
+@pytest.fixture
+def test_parser(monkeypatch):
+    async def parse(transaction, program_id, connection):
+        # Later transactions finish first, the changes must still arrive in signature order
+        await asyncio.sleep(0.01 * (5 - int(transaction['signature'][-1])))
+        return {'signature': transaction['signature']}
+
+    monkeypatch.setitem(accounts.TRANSACTION_ACCOUNT_PARSERS, INSTRUCTION_LOG, parse)
+
+
+def follow(connection):
+    reported = []
+
+    async def callback(changes, instruction_log):
+        reported.append(changes['signature'])
+
+    async def main():
+        task = asyncio.ensure_future(on_accounts_change(NEW_DEVNET_PROGRAM, 0.01, 'sig0', connection, callback))
+        await asyncio.wait_for(connection.polled.wait(), 10)
+        task.cancel()
+
+    asyncio.run(main())
+    return reported
+
+
+def test_cursor_moves_past_failed_transactions_after_parsed_ones(test_parser):
+    # Newest first, as getSignaturesForAddress returns them: sig3 failed, sig4 was not found
+    connection = PollingConnection('sig0', ['sig4', 'sig3', 'sig2', 'sig1'], {
+        'sig1': transaction('sig1'), 'sig2': transaction('sig2'), 'sig3': transaction('sig3', err={'InstructionError': 0}),
+    })
+    assert follow(connection) == ['sig1', 'sig2']
+    assert connection.cursors[:2] == ['sig0', 'sig4']
+
+
+def test_parsed_transactions_are_reported_when_a_fetch_fails(test_parser):
+    connection = PollingConnection('sig0', ['sig3', 'sig2', 'sig1'], {
+        'sig1': transaction('sig1'), 'sig2': transaction('sig2'),
+    }, failing='sig3')
+    assert follow(connection) == ['sig1', 'sig2']
+    # The failure still resets the cursor to the newest signature
+    assert connection.cursors[:2] == ['sig0', 'latest']